@@ -1,10 +1,11 @@
 import atexit
+import os
 import signal
 
 from src.presentation.application import Application
 
 
-application = Application()
+application = Application(os.environ.get("NODE_TRANSPORT", "threaded"))
 
 
 def _stop_handler(sig=None, frame=None):  # pylint: disable=unused-argument
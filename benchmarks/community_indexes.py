@@ -0,0 +1,214 @@
+"""Query plans and durations of the community lookups, without and with the
+indexes of the version 2 of the community schema.
+
+The community holds 100k messages (1k ideas, 99k opinions) and 10k members.
+
+Run from the repository root: python -m benchmarks.community_indexes
+"""
+
+from contextlib import closing
+from datetime import datetime, timedelta
+import sqlite3
+import tempfile
+import timeit
+
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+from src.infrastructure.repositories.idea_repository import IdeaRepository
+from src.infrastructure.repositories.member_repository import MemberRepository
+from src.infrastructure.repositories.opinion_repository import OpinionRepository
+
+COMMUNITY_ID = "benchmark"
+IDEA_COUNT = 1_000
+OPINION_COUNT = 99_000
+MEMBER_COUNT = 10_000
+ITERATIONS = 20
+
+# Schema of the communities created before the indexes.
+UNINDEXED_SCHEMA = SqliteSchema(COMMUNITY_SCHEMA.migrations[:1])
+
+PLANNED_QUERIES = {
+    "get_opinions_by_parent": (
+        "SELECT * FROM messages WHERE parent_message = ?;",
+        ("idea-500",),
+    ),
+    "get_ideas_by_community": (
+        "SELECT * FROM messages WHERE parent_message IS NULL;",
+        (),
+    ),
+    "get_member_for_community (ip)": (
+        "SELECT * FROM nodes WHERE ip_address = ?;",
+        ("10.0.19.136",),
+    ),
+    "get_older_members_from_community": (
+        "SELECT * FROM nodes WHERE creation_date < ? ORDER BY creation_date ASC;",
+        ("2000-01-01T00:01:40",),
+    ),
+    "get_members_from_community (related)": (
+        "SELECT * FROM nodes WHERE relationship_id IS NOT NULL;",
+        (),
+    ),
+}
+
+
+class UnindexedIdeaRepository(IdeaRepository):
+    """Idea repository on the schema without indexes"""
+
+    SCHEMA = UNINDEXED_SCHEMA
+
+
+class UnindexedOpinionRepository(OpinionRepository):
+    """Opinion repository on the schema without indexes"""
+
+    SCHEMA = UNINDEXED_SCHEMA
+
+
+class UnindexedMemberRepository(MemberRepository):
+    """Member repository on the schema without indexes"""
+
+    SCHEMA = UNINDEXED_SCHEMA
+
+
+def populate(database_path: str):
+    """Creates the community database, without the indexes"""
+    connection_pool = SqliteConnectionPool()
+    UNINDEXED_SCHEMA.ensure_ready(connection_pool, database_path)
+    connection_pool.close()
+
+    start = datetime(2000, 1, 1)
+    with closing(sqlite3.connect(database_path)) as connection:
+        connection.executemany(
+            "INSERT INTO nodes VALUES (?, ?, ?, ?, NULL, ?);",
+            (
+                (
+                    f"member-{index}",
+                    f"10.0.{index // 256}.{index % 256}",
+                    1664,
+                    (start + timedelta(seconds=index)).isoformat(),
+                    ("parent" if index == 0 else "child" if index < 4 else None),
+                )
+                for index in range(MEMBER_COUNT)
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO messages VALUES (?, ?, ?, NULL, ?);",
+            (
+                (f"idea-{index}", "member-0", f"Idea {index}", start.isoformat())
+                for index in range(IDEA_COUNT)
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO messages VALUES (?, ?, ?, ?, ?);",
+            (
+                (
+                    f"opinion-{index}",
+                    f"member-{index % MEMBER_COUNT}",
+                    f"Opinion {index}",
+                    f"idea-{index % IDEA_COUNT}",
+                    start.isoformat(),
+                )
+                for index in range(OPINION_COUNT)
+            ),
+        )
+        connection.commit()
+
+
+def print_plans(database_path: str):
+    """Prints the query plan of each lookup"""
+    with closing(sqlite3.connect(database_path)) as connection:
+        for label, (query, parameters) in PLANNED_QUERIES.items():
+            plan = connection.execute(
+                f"EXPLAIN QUERY PLAN {query}", parameters
+            ).fetchall()
+            details = "; ".join(detail for _, _, _, detail in plan)
+            print(f"  {label:<38} {details}")
+
+
+def measure(label: str, lookup) -> float:
+    """Prints and returns the mean duration of a lookup, in milliseconds"""
+    lookup()
+    duration = timeit.timeit(lookup, number=ITERATIONS) / ITERATIONS * 1e3
+    print(f"  {label:<38} {duration:8.2f} ms/query")
+    return duration
+
+
+def measure_lookups(
+    idea_repository: IdeaRepository,
+    opinion_repository: OpinionRepository,
+    member_repository: MemberRepository,
+) -> list[float]:
+    """Measures every lookup with the given repositories"""
+    older_than = datetime(2000, 1, 1, 0, 1, 40)
+    return [
+        measure(
+            "get_opinions_by_parent",
+            lambda: opinion_repository.get_opinions_by_parent(COMMUNITY_ID, "idea-500"),
+        ),
+        measure(
+            "get_ideas_by_community",
+            lambda: idea_repository.get_ideas_by_community(COMMUNITY_ID),
+        ),
+        measure(
+            "get_member_for_community (ip)",
+            lambda: member_repository.get_member_for_community(
+                COMMUNITY_ID, ip_address="10.0.19.136"
+            ),
+        ),
+        measure(
+            "get_older_members_from_community",
+            lambda: member_repository.get_older_members_from_community(
+                COMMUNITY_ID, older_than
+            ),
+        ),
+        measure(
+            "get_members_from_community (related)",
+            lambda: member_repository.get_members_from_community(
+                COMMUNITY_ID, is_related=True
+            ),
+        ),
+    ]
+
+
+def main():
+    """Runs the benchmark"""
+    with tempfile.TemporaryDirectory() as base_path:
+        database_path = f"{base_path}/{COMMUNITY_ID}.sqlite"
+        populate(database_path)
+
+        results = {}
+        for name, repository_classes in {
+            "without indexes": (
+                UnindexedIdeaRepository,
+                UnindexedOpinionRepository,
+                UnindexedMemberRepository,
+            ),
+            "with indexes": (IdeaRepository, OpinionRepository, MemberRepository),
+        }.items():
+            connection_pool = SqliteConnectionPool()
+            repositories = [
+                repository_class(base_path, connection_pool)
+                for repository_class in repository_classes
+            ]
+            # The repositories migrate the database on their first use.
+            repositories[0].initialize_if_not_exists(COMMUNITY_ID)
+
+            print(f"{name}, query plans:")
+            print_plans(database_path)
+            print(f"{name}, durations:")
+            results[name] = measure_lookups(*repositories)
+            connection_pool.close()
+
+        speedups = [
+            before / after
+            for before, after in zip(
+                results["without indexes"], results["with indexes"]
+            )
+        ]
+        print("speedup: " + ", ".join(f"x{speedup:.1f}" for speedup in speedups))
+
+
+if __name__ == "__main__":
+    main()
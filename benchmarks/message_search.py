@@ -0,0 +1,142 @@
+"""Full-text search of the community messages at 1M messages.
+
+The messages are written on the version 3 of the community schema, before
+the full-text index, then indexed by batches as the server does after the
+migration. The durations of the migration, of the longest batch (the time
+the write lock is held) and of the searches are printed.
+
+Run from the repository root: python -m benchmarks.message_search
+"""
+
+from contextlib import closing
+import itertools
+import random
+import sqlite3
+import tempfile
+import time
+import timeit
+
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+from src.infrastructure.repositories.message_search_repository import (
+    MessageSearchRepository,
+)
+
+COMMUNITY_ID = "benchmark"
+MESSAGE_COUNT = 1_000_000
+IDEA_COUNT = 10_000
+VOCABULARY_SIZE = 20_000
+WORDS_PER_MESSAGE = 12
+BATCH_SIZE = 1000
+ITERATIONS = 20
+
+# Schema of the communities created before the full-text index.
+UNSEARCHABLE_SCHEMA = SqliteSchema(COMMUNITY_SCHEMA.migrations[:3])
+
+# The vocabulary follows a Zipf law: "mot00000" is in about one message out
+# of ten, "mot19999" in a few tens of messages. The words have the same length
+# so that a word is not the prefix of others.
+VOCABULARY = [f"mot{index:05}" for index in range(VOCABULARY_SIZE)]
+CUMULATIVE_WEIGHTS = list(
+    itertools.accumulate(1 / (index + 1) for index in range(VOCABULARY_SIZE))
+)
+
+SEARCHES = {
+    "rare word": "mot19999",
+    "uncommon word": "mot02000",
+    "common word": "mot00010",
+    "two words": "mot00010 mot02000",
+    "prefix": "mot0199",
+}
+
+
+def populate(database_path: str):
+    """Creates the community database, without the full-text index"""
+    connection_pool = SqliteConnectionPool()
+    UNSEARCHABLE_SCHEMA.ensure_ready(connection_pool, database_path)
+    connection_pool.close()
+
+    generator = random.Random(0)
+    with closing(sqlite3.connect(database_path)) as connection:
+        connection.executemany(
+            "INSERT INTO messages VALUES (?, ?, ?, ?, ?);",
+            (
+                (
+                    f"message-{index}",
+                    "member-0",
+                    " ".join(
+                        generator.choices(
+                            VOCABULARY,
+                            cum_weights=CUMULATIVE_WEIGHTS,
+                            k=WORDS_PER_MESSAGE,
+                        )
+                    ),
+                    None if index < IDEA_COUNT else f"message-{index % IDEA_COUNT}",
+                    "2000-01-01T00:00:00",
+                )
+                for index in range(MESSAGE_COUNT)
+            ),
+        )
+        connection.commit()
+
+
+def index(repository: MessageSearchRepository):
+    """Indexes the messages by batches, as the server does"""
+    start = time.perf_counter()
+    repository.initialize_if_not_exists(COMMUNITY_ID)
+    print(f"  migration                {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+    start = time.perf_counter()
+    longest = 0.0
+    remaining = True
+    while remaining:
+        batch_start = time.perf_counter()
+        remaining = repository.index_messages(COMMUNITY_ID, BATCH_SIZE)
+        longest = max(longest, time.perf_counter() - batch_start)
+    print(f"  indexing                 {time.perf_counter() - start:8.2f} s")
+    print(f"  longest batch            {longest * 1e3:8.2f} ms")
+
+
+def count_matches(database_path: str, text: str) -> int:
+    """Returns the number of messages matching the text"""
+    # pylint: disable-next=protected-access
+    expression = MessageSearchRepository._build_match_expression(text)
+    with closing(sqlite3.connect(database_path)) as connection:
+        return connection.execute(
+            "SELECT count(*) FROM messages_fts WHERE messages_fts MATCH ?;",
+            (expression,),
+        ).fetchone()[0]
+
+
+def measure(repository: MessageSearchRepository, database_path: str):
+    """Prints the mean duration of each search, for the first page"""
+    for label, text in SEARCHES.items():
+
+        def search(text=text):
+            return repository.search_messages(COMMUNITY_ID, text, 20)
+
+        matches = count_matches(database_path, text)
+        duration = timeit.timeit(search, number=ITERATIONS) / ITERATIONS * 1e3
+        print(f"  {label:<14} {matches:>7} matches {duration:8.2f} ms/query")
+
+
+def main():
+    """Runs the benchmark"""
+    with tempfile.TemporaryDirectory() as base_path:
+        database_path = f"{base_path}/{COMMUNITY_ID}.sqlite"
+        populate(database_path)
+
+        connection_pool = SqliteConnectionPool()
+        repository = MessageSearchRepository(base_path, connection_pool)
+        print(f"{MESSAGE_COUNT} messages, building the index:")
+        index(repository)
+        print("searches, first page of 20 results:")
+        measure(repository, database_path)
+        connection_pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Duration of the membership and community lookups done for every inbound
+message, read from SQLite and through the read-through cache.
+
+Run from the repository root: python -m benchmarks.repository_cache
+"""
+
+import tempfile
+import timeit
+
+from src.domain.entities.community import Community
+from src.domain.entities.member import Member
+from src.infrastructure.repositories.cached_community_repository import (
+    CachedCommunityRepository,
+)
+from src.infrastructure.repositories.cached_member_repository import (
+    CachedMemberRepository,
+)
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.community_repository import CommunityRepository
+from src.infrastructure.repositories.member_repository import MemberRepository
+
+COMMUNITY_ID = "benchmark"
+MEMBER_COUNT = 1_000
+ITERATIONS = 10_000
+
+
+def measure(label: str, lookup) -> float:
+    """Prints and returns the mean duration of a lookup, in microseconds"""
+    duration = timeit.timeit(lookup, number=ITERATIONS) / ITERATIONS * 1e6
+    print(f"  {label:<40} {duration:8.2f} us/lookup")
+    return duration
+
+
+def measure_lookups(
+    community_repository: CommunityRepository, member_repository: MemberRepository
+) -> list[float]:
+    """Measures the lookups of an inbound message"""
+    return [
+        measure(
+            "get_member_for_community (ip)",
+            lambda: member_repository.get_member_for_community(
+                COMMUNITY_ID, ip_address="10.0.1.244"
+            ),
+        ),
+        measure(
+            "get_community_encryption_key_path",
+            lambda: community_repository.get_community_encryption_key_path(
+                COMMUNITY_ID
+            ),
+        ),
+        measure(
+            "get_authentication_key_for_community",
+            lambda: community_repository.get_authentication_key_for_community(
+                COMMUNITY_ID
+            ),
+        ),
+    ]
+
+
+def main():
+    """Runs the benchmark"""
+    with tempfile.TemporaryDirectory() as base_path:
+        connection_pool = SqliteConnectionPool()
+        community_repository = CommunityRepository(base_path, connection_pool)
+        member_repository = MemberRepository(base_path, connection_pool)
+        community_repository.add_community(
+            Community(COMMUNITY_ID, "benchmark", "description"), "auth_key", "path"
+        )
+        member_repository.initialize_if_not_exists(COMMUNITY_ID)
+        member_repository.add_members_bulk(
+            COMMUNITY_ID,
+            [
+                Member(f"member-{index}", f"10.0.{index // 256}.{index % 256}", 1664)
+                for index in range(MEMBER_COUNT)
+            ],
+        )
+
+        print("sqlite:")
+        before = measure_lookups(community_repository, member_repository)
+        print("cached:")
+        cached_member_repository = CachedMemberRepository(member_repository)
+        after = measure_lookups(
+            CachedCommunityRepository(community_repository), cached_member_repository
+        )
+        speedups = [before / after for before, after in zip(before, after)]
+        print("speedup: " + ", ".join(f"x{speedup:.0f}" for speedup in speedups))
+        print(
+            f"member cache: {cached_member_repository.cache.hits} hits, "
+            f"{cached_member_repository.cache.misses} misses"
+        )
+
+        connection_pool.close()
+
+
+if __name__ == "__main__":
+    main()
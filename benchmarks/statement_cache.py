@@ -0,0 +1,190 @@
+"""Per-query overhead of the idea, opinion and member lookups.
+
+Compares the previous execution path (a new sqlite3 connection and a regex
+cleaning of the SQL text on every call), pooled connections still cleaning
+the SQL text on every call, and the current path (pooled connections and
+the statement registry).
+
+Run from the repository root: python -m benchmarks.statement_cache
+"""
+
+from datetime import datetime
+import re
+import sqlite3
+import tempfile
+import timeit
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+from src.infrastructure.repositories.idea_repository import IdeaRepository
+from src.infrastructure.repositories.common.sqlite_statement_registry import (
+    SqliteStatementRegistry,
+)
+from src.infrastructure.repositories.member_repository import MemberRepository
+from src.infrastructure.repositories.opinion_repository import OpinionRepository
+
+COMMUNITY_ID = "benchmark"
+ITERATIONS = 2000
+
+
+class PerCallConnectionMixin:
+    """Execution path used before the pool and the statement registry"""
+
+    def _query_cleaner(self, query: str) -> str:
+        """Clean query"""
+        query = query.strip()
+        query = query.replace("\n", " ")
+        query = query.replace("\t", " ")
+        query = re.sub(" +", " ", query)
+        return query
+
+    def _execute_query(
+        self, target_database: str, statement: str, parameters: tuple = ()
+    ) -> list:
+        """Execute a query on the target database"""
+        statement = self._query_cleaner(statement)
+
+        with sqlite3.connect(
+            f"{self.base_path}/{target_database}.sqlite"
+        ) as index_connection:
+            index_cursor = index_connection.cursor()
+            result = index_cursor.execute(statement, parameters)
+            return result.fetchall()
+
+
+class PerCallCleaningMixin:
+    """Pooled connections, but the SQL text is cleaned on every call"""
+
+    class STATEMENTS:  # pylint: disable=invalid-name
+        """Statement registry without cache"""
+
+        get = staticmethod(SqliteStatementRegistry.normalize)
+
+
+class PerCallCleaningIdeaRepository(PerCallCleaningMixin, IdeaRepository):
+    """Idea repository cleaning the SQL text on every call"""
+
+
+class PerCallCleaningOpinionRepository(PerCallCleaningMixin, OpinionRepository):
+    """Opinion repository cleaning the SQL text on every call"""
+
+
+class PerCallCleaningMemberRepository(PerCallCleaningMixin, MemberRepository):
+    """Member repository cleaning the SQL text on every call"""
+
+
+class PerCallIdeaRepository(PerCallConnectionMixin, IdeaRepository):
+    """Idea repository with the previous execution path"""
+
+
+class PerCallOpinionRepository(PerCallConnectionMixin, OpinionRepository):
+    """Opinion repository with the previous execution path"""
+
+
+class PerCallMemberRepository(PerCallConnectionMixin, MemberRepository):
+    """Member repository with the previous execution path"""
+
+
+def populate(base_path: str) -> tuple[Member, Idea]:
+    """Creates a community with a few members, ideas and opinions"""
+    member_repository = MemberRepository(base_path)
+    idea_repository = IdeaRepository(base_path, member_repository.connection_pool)
+    opinion_repository = OpinionRepository(base_path, member_repository.connection_pool)
+
+    members = [
+        Member(f"member-{index}", f"10.0.0.{index}", 1664, datetime.now())
+        for index in range(50)
+    ]
+    for member in members:
+        member_repository.add_member_to_community(COMMUNITY_ID, member)
+
+    ideas = [
+        Idea(f"idea-{index}", f"Idea number {index}", members[0], datetime.now())
+        for index in range(100)
+    ]
+    for idea in ideas:
+        idea_repository.add_idea_to_community(COMMUNITY_ID, idea)
+        for index in range(5):
+            opinion_repository.add_opinion_to_community(
+                COMMUNITY_ID,
+                Opinion(
+                    f"{idea.identifier}-opinion-{index}",
+                    f"Opinion number {index}",
+                    members[1],
+                    datetime.now(),
+                    idea,
+                ),
+            )
+
+    member_repository.connection_pool.close()
+    return members[-1], ideas[-1]
+
+
+def measure(label: str, lookup) -> float:
+    """Prints and returns the mean duration of a lookup, in microseconds"""
+    lookup()
+    duration = timeit.timeit(lookup, number=ITERATIONS) / ITERATIONS * 1e6
+    print(f"  {label:<32} {duration:8.1f} us/query")
+    return duration
+
+
+def main():
+    """Runs the benchmark"""
+    with tempfile.TemporaryDirectory() as base_path:
+        member, idea = populate(base_path)
+
+        implementations = {
+            "before": (
+                PerCallIdeaRepository(base_path),
+                PerCallOpinionRepository(base_path),
+                PerCallMemberRepository(base_path),
+            ),
+            "pooled, cleaning on every call": (
+                PerCallCleaningIdeaRepository(base_path),
+                PerCallCleaningOpinionRepository(base_path),
+                PerCallCleaningMemberRepository(base_path),
+            ),
+            "after": (
+                IdeaRepository(base_path),
+                OpinionRepository(base_path),
+                MemberRepository(base_path),
+            ),
+        }
+
+        results = {}
+        for name, repositories in implementations.items():
+            idea_repository, opinion_repository, member_repository = repositories
+            print(f"{name}:")
+            results[name] = [
+                measure(
+                    "get_idea_from_community",
+                    lambda: idea_repository.get_idea_from_community(
+                        COMMUNITY_ID, idea.identifier
+                    ),
+                ),
+                measure(
+                    "get_opinions_by_parent",
+                    lambda: opinion_repository.get_opinions_by_parent(
+                        COMMUNITY_ID, idea.identifier
+                    ),
+                ),
+                measure(
+                    "get_member_for_community",
+                    lambda: member_repository.get_member_for_community(
+                        COMMUNITY_ID, ip_address=member.ip_address
+                    ),
+                ),
+            ]
+            idea_repository.connection_pool.close()
+            opinion_repository.connection_pool.close()
+            member_repository.connection_pool.close()
+
+        speedups = [
+            before / after for before, after in zip(results["before"], results["after"])
+        ]
+        print("speedup: " + ", ".join(f"x{speedup:.1f}" for speedup in speedups))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Duration of a burst of inbound saves, committed one by one and through the
+write-behind queue.
+
+The burst holds 5k ideas saved by a single handler thread, as the message
+handler does when a peer relays a batch.
+
+Run from the repository root: python -m benchmarks.write_behind
+"""
+
+from concurrent.futures import wait
+from datetime import datetime
+import tempfile
+import time
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.idea_repository import IdeaRepository
+from src.infrastructure.repositories.member_repository import MemberRepository
+from src.infrastructure.repositories.opinion_repository import OpinionRepository
+from src.infrastructure.services.write_behind_queue import WriteBehindQueue
+
+COMMUNITY_ID = "benchmark"
+IDEA_COUNT = 5_000
+
+
+def build_ideas(prefix: str) -> list[Idea]:
+    """Builds the ideas of the burst"""
+    author = Member("member-0", "127.0.0.1", 1664)
+    return [
+        Idea(f"{prefix}-{index}", f"Idea {index}", author, datetime(2000, 1, 1))
+        for index in range(IDEA_COUNT)
+    ]
+
+
+def save_one_by_one(idea_repository: IdeaRepository) -> float:
+    """Commits each idea before saving the next one, returns the duration"""
+    ideas = build_ideas("single")
+    start = time.perf_counter()
+    for idea in ideas:
+        idea_repository.add_idea_to_community(COMMUNITY_ID, idea)
+    return time.perf_counter() - start
+
+
+def save_write_behind(queue: WriteBehindQueue) -> tuple[float, float]:
+    """Queues every idea then waits for the last commit.
+    Returns the time spent queuing and the time until everything is committed.
+    """
+    ideas = build_ideas("queued")
+    start = time.perf_counter()
+    futures = [queue.enqueue(COMMUNITY_ID, idea) for idea in ideas]
+    queued = time.perf_counter() - start
+    wait(futures)
+    return queued, time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark"""
+    with tempfile.TemporaryDirectory() as base_path:
+        connection_pool = SqliteConnectionPool()
+        member_repository = MemberRepository(base_path, connection_pool)
+        idea_repository = IdeaRepository(base_path, connection_pool)
+        opinion_repository = OpinionRepository(base_path, connection_pool)
+        idea_repository.initialize_if_not_exists(COMMUNITY_ID)
+
+        single = save_one_by_one(idea_repository)
+        print(
+            f"  one commit per idea   {single * 1e3:8.1f} ms "
+            f"({single / IDEA_COUNT * 1e6:6.1f} us/idea)"
+        )
+
+        queue = WriteBehindQueue(member_repository, idea_repository, opinion_repository)
+        queued, committed = save_write_behind(queue)
+        queue.close()
+        print(
+            f"  write-behind queue    {committed * 1e3:8.1f} ms "
+            f"({committed / IDEA_COUNT * 1e6:6.1f} us/idea, "
+            f"{queued / IDEA_COUNT * 1e6:.1f} us/idea for the handler)"
+        )
+        print(f"speedup: x{single / committed:.1f}")
+
+        connection_pool.close()
+
+
+if __name__ == "__main__":
+    main()
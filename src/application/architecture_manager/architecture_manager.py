@@ -1,5 +1,6 @@
 from src.application.interfaces.iarchitecture_manager import IArchitectureManager
 from src.domain.entities.member import Member
+from src.application.architecture_manager.share_outcome import ShareOutcome
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.application.interfaces.ishare_information import IShareInformation
 from src.application.architecture_manager.parent_connection import ParentConnection
@@ -20,10 +21,10 @@ class ArchitectureManager(IArchitectureManager):
         self,
         message: MessageDataclass,
         community_id: str,
-        excluded_auth_keys: list[str] = [],
-        excluded_ip_addresses: list[str] = [],
-    ):
-        self.share_information_usecase.execute(
+        excluded_auth_keys: list[str] | None = None,
+        excluded_ip_addresses: list[str] | None = None,
+    ) -> list[ShareOutcome]:
+        return self.share_information_usecase.execute(
             message, community_id, excluded_auth_keys, excluded_ip_addresses
         )
 
@@ -0,0 +1,129 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+import time
+
+from src.application.interfaces.iconnection_pool import IConnectionPool
+from src.application.interfaces.ioutbound_queue import IOutboundQueue
+from src.presentation.formatting.message_batch import MessageBatch
+from src.presentation.formatting.message_dataclass import MessageDataclass
+
+
+class OutboundQueue(IOutboundQueue):
+    """Per-peer queue of outgoing messages.
+
+    The first message queued for a peer opens a linger window; every message
+    queued for that peer until the window closes is sent with it, the
+    messages of a same community being packed into a single batch.
+    A peer is flushed early once max_batch_size messages are waiting.
+
+    A peer has at most one batch in flight, so its messages arrive in the
+    order they were queued: the messages queued meanwhile are sent once the
+    batch is done. Each message gets a future resolved with the seconds it
+    took to be sent, or with the error of the send.
+    """
+
+    def __init__(
+        self,
+        connection_pool: IConnectionPool,
+        linger: float = 0.02,
+        max_batch_size: int = 64,
+        max_workers: int = 16,
+    ):
+        self.connection_pool = connection_pool
+        self.linger = linger
+        self.max_batch_size = max_batch_size
+
+        self.pending: dict[
+            tuple[str, int], list[tuple[MessageDataclass, Future, float]]
+        ] = {}
+        self.deadlines: dict[tuple[str, int], float] = {}
+        self.in_flight: set[tuple[str, int]] = set()
+        self.condition = threading.Condition()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="outbound-queue"
+        )
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def enqueue(self, ip_address: str, port: int, message: MessageDataclass) -> Future:
+        peer = (ip_address, port)
+        future: Future = Future()
+        with self.condition:
+            if not self.running:
+                future.set_exception(RuntimeError("Outbound queue is closed"))
+                return future
+            messages = self.pending.setdefault(peer, [])
+            messages.append((message, future, time.monotonic()))
+            if len(messages) >= self.max_batch_size:
+                self._submit(peer)
+            elif len(messages) == 1:
+                self.deadlines[peer] = time.monotonic() + self.linger
+                self.condition.notify_all()
+        return future
+
+    def _run(self):
+        """Flushes the peers whose linger window is over"""
+        with self.condition:
+            while self.running:
+                now = time.monotonic()
+                for peer, deadline in list(self.deadlines.items()):
+                    if deadline <= now:
+                        self._submit(peer)
+                timeout = min(self.deadlines.values()) - now if self.deadlines else None
+                self.condition.wait(timeout)
+
+    def _submit(self, peer: tuple[str, int]):
+        """Hands the messages of a peer to the executor (lock must be held).
+        While a batch is in flight for the peer, they wait for it to be done.
+        """
+        self.deadlines.pop(peer, None)
+        if peer in self.in_flight or peer not in self.pending:
+            return
+        messages = self.pending.pop(peer)
+        self.in_flight.add(peer)
+        self.executor.submit(self._send, peer, messages)
+
+    def _send(
+        self,
+        peer: tuple[str, int],
+        messages: list[tuple[MessageDataclass, Future, float]],
+    ):
+        """Sends the coalesced messages to a peer, then the ones queued
+        meanwhile"""
+        error: Exception | None = None
+        try:
+            for message in MessageBatch.coalesce(
+                [message for message, _, _ in messages]
+            ):
+                self.connection_pool.send_message(*peer, message)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            error = err
+
+        sent_at = time.monotonic()
+        for _, future, queued_at in messages:
+            if error is None:
+                future.set_result(sent_at - queued_at)
+            else:
+                future.set_exception(error)
+
+        with self.condition:
+            self.in_flight.discard(peer)
+            self._submit(peer)
+            self.condition.notify_all()
+
+    def flush(self):
+        with self.condition:
+            for peer in list(self.pending):
+                self._submit(peer)
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            for peer in list(self.pending):
+                self._submit(peer)
+            self.condition.notify_all()
+            while self.in_flight:
+                self.condition.wait()
+        self.thread.join()
+        self.executor.shutdown(wait=True)
@@ -5,7 +5,9 @@ from src.application.interfaces.iparent_connection import IParentConnection
 from src.domain.entities.member import Member
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
-import src.presentation.network.client as client
+from src.application.interfaces.iclient_factory import IClientFactory
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.presentation.network.client_factory import ClientFactory
 
 
 class ParentConnection(IParentConnection):
@@ -16,10 +18,12 @@ class ParentConnection(IParentConnection):
         member_repository: IMemberRepository,
         message_formatter: IMessageFormatter,
         machine_service: IMachineService,
+        client_factory: IClientFactory | None = None,
     ):
         self.member_repository = member_repository
         self.message_formatter = message_formatter
         self.machine_service = machine_service
+        self.client_factory = client_factory or ClientFactory(message_formatter)
 
     def execute(self, community_id: str) -> Member | None:
         author = self.machine_service.get_current_user(community_id)
@@ -34,9 +38,9 @@ class ParentConnection(IParentConnection):
 
         parent_found: Member = None
         for member in reversed(members):
-            client_socket: client.Client = None
+            client_socket: IClientSocket = None
             try:
-                client_socket = client.Client(self.message_formatter)
+                client_socket = self.client_factory.create_client()
                 client_socket.connect_to_server(member.ip_address, member.port)
                 client_socket.send_message(message)
 
@@ -1,49 +1,168 @@
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import time
+
+from src.application.architecture_manager.share_outcome import ShareOutcome
+from src.application.architecture_manager.share_status import ShareStatus
 from src.application.interfaces.imachine_service import IMachineService
 from src.application.interfaces.imember_repository import IMemberRepository
 from src.application.interfaces.imessage_formatter import IMessageFormatter
 from src.application.interfaces.ishare_information import IShareInformation
+from src.domain.entities.member import Member
 from src.presentation.formatting.message_dataclass import MessageDataclass
-import src.presentation.network.client as client
+from src.application.interfaces.iconnection_pool import IConnectionPool
+from src.application.interfaces.ioutbound_queue import IOutboundQueue
+from src.presentation.formatting.message_batch import MessageBatch
+from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.client_factory import ClientFactory
+from src.presentation.network.connection_pool import ConnectionPool
 
 
 class ShareInformation(IShareInformation):
-    """Share an information to members of the community's architecture."""
+    """Share an information to members of the community's architecture.
+
+    The message is sent to every member in parallel. Each send is bounded by
+    the timeout of the pooled sockets (peer_timeout) and the whole relay by
+    deadline, so an unreachable member never delays the others.
+
+    With an outbound queue, the messages that can be batched are queued
+    instead, to be coalesced with the next messages to the same member; the
+    relay still waits, within the deadline, for each member's batch to be
+    sent to report how it went.
+    """
 
     def __init__(
         self,
         member_repository: IMemberRepository,
         message_formatter: IMessageFormatter,
         machine_service: IMachineService,
+        connection_pool: IConnectionPool | None = None,
+        peer_timeout: float = 2,
+        deadline: float = 5,
+        max_workers: int = 16,
+        outbound_queue: IOutboundQueue | None = None,
     ):
         self.member_repository = member_repository
         self.message_formatter = message_formatter
         self.machine_service = machine_service
+        self.connection_pool = connection_pool or ConnectionPool(
+            ClientFactory(message_formatter, timeout=peer_timeout)
+        )
+        self.deadline = deadline
+        self.outbound_queue = outbound_queue
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="share-information"
+        )
 
     def execute(
         self,
         message: MessageDataclass,
         community_id: str,
-        excluded_auth_keys: list[str] = [],
-        excluded_ip_addresses: list[str] = [],
-    ):
+        excluded_auth_keys: list[str] | None = None,
+        excluded_ip_addresses: list[str] | None = None,
+    ) -> list[ShareOutcome]:
         author = self.machine_service.get_current_user(community_id)
-        excluded_auth_keys.append(author.authentication_key)
-        excluded_ip_addresses.append(author.ip_address)
-        members = filter(
-            lambda member: member.authentication_key not in excluded_auth_keys
-            and member.ip_address not in excluded_ip_addresses,
-            self.member_repository.get_members_from_community(
+        excluded_auth_keys = [*(excluded_auth_keys or []), author.authentication_key]
+        excluded_ip_addresses = [*(excluded_ip_addresses or []), author.ip_address]
+        members = [
+            member
+            for member in self.member_repository.get_members_from_community(
                 community_id, is_related=True
-            ),
+            )
+            if member.authentication_key not in excluded_auth_keys
+            and member.ip_address not in excluded_ip_addresses
+        ]
+
+        if self.outbound_queue is not None and (
+            message.header in MessageBatch.BATCHABLE_HEADERS
+            or message.header == MessageHeader.BATCH
+        ):
+            return self._queue(members, message)
+
+        futures: list[tuple[Member, Future]] = [
+            (member, self.executor.submit(self._send_to_member, member, message))
+            for member in members
+        ]
+        wait([future for _, future in futures], timeout=self.deadline)
+
+        outcomes = []
+        for member, future in futures:
+            if future.done():
+                outcomes.append(future.result())
+            else:
+                future.cancel()
+                outcomes.append(
+                    ShareOutcome(
+                        member.authentication_key,
+                        member.ip_address,
+                        member.port,
+                        ShareStatus.TIMEOUT,
+                    )
+                )
+        return outcomes
+
+    def _queue(
+        self, members: list[Member], message: MessageDataclass
+    ) -> list[ShareOutcome]:
+        """Queues the message for each member and waits for the batches"""
+        futures: list[tuple[Member, Future]] = [
+            (
+                member,
+                self.outbound_queue.enqueue(member.ip_address, member.port, message),
+            )
+            for member in members
+        ]
+        wait([future for _, future in futures], timeout=self.deadline)
+
+        outcomes = []
+        for member, future in futures:
+            latency = None
+            if not future.done():
+                status = ShareStatus.TIMEOUT
+            elif future.exception() is not None:
+                status = self._get_failure_status(future.exception())
+            else:
+                status = ShareStatus.OK
+                latency = future.result()
+            outcomes.append(
+                ShareOutcome(
+                    member.authentication_key,
+                    member.ip_address,
+                    member.port,
+                    status,
+                    latency,
+                )
+            )
+        return outcomes
+
+    def _send_to_member(
+        self, member: Member, message: MessageDataclass
+    ) -> ShareOutcome:
+        """Sends the message to a member and reports how it went"""
+        start = time.monotonic()
+        try:
+            self.connection_pool.send_message(member.ip_address, member.port, message)
+            status = ShareStatus.OK
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            status = self._get_failure_status(err)
+
+        return ShareOutcome(
+            member.authentication_key,
+            member.ip_address,
+            member.port,
+            status,
+            time.monotonic() - start,
         )
-        for member in members:
-            client_socket: client.Client = None
-            try:
-                client_socket = client.Client(self.message_formatter)
-                client_socket.connect_to_server(member.ip_address, member.port)
-                client_socket.send_message(message)
-            except:
-                pass
-            finally:
-                if client_socket is not None:
-                    client_socket.close_connection()
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    @staticmethod
+    def _get_failure_status(error: BaseException) -> ShareStatus:
+        """Returns the status matching the error (or one of its causes)"""
+        while error is not None:
+            if isinstance(error, TimeoutError):
+                return ShareStatus.TIMEOUT
+            if isinstance(error, ConnectionRefusedError):
+                return ShareStatus.REFUSED
+            error = error.__cause__
+        return ShareStatus.ERROR
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from src.application.architecture_manager.share_status import ShareStatus
+
+
+@dataclass
+class ShareOutcome:
+    """Class to represent the result of a relay to a member"""
+
+    authentication_key: str
+    ip_address: str
+    port: int
+    status: ShareStatus
+    latency: float | None = None
@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class ShareStatus(StrEnum):
+    """Enum class to represent the outcome of a relay to a member"""
+
+    OK = "ok"
+    TIMEOUT = "timeout"
+    REFUSED = "refused"
+    ERROR = "error"
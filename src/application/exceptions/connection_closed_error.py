@@ -0,0 +1,10 @@
+from src.application.exceptions.socket_error import SocketError
+
+
+class ConnectionClosedError(SocketError):
+    """
+    Exception raised when the peer closed the connection between two messages.
+    """
+
+    def __str__(self):
+        return f"Connection closed: {self.inner_error}"
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from src.domain.entities.member import Member
+from src.application.architecture_manager.share_outcome import ShareOutcome
 from src.presentation.formatting.message_dataclass import MessageDataclass
 
 
@@ -12,11 +13,12 @@ class IArchitectureManager(ABC):
         self,
         message: MessageDataclass,
         community_id: str,
-        excluded_auth_keys: list[str] = [],
-        excluded_ip_addresses: list[str] = [],
-    ):
+        excluded_auth_keys: list[str] | None = None,
+        excluded_ip_addresses: list[str] | None = None,
+    ) -> list[ShareOutcome]:
         """Share a message to related members of architecture in a community
-        (except the author and specified excluded)."""
+        (except the author and specified excluded).
+        Returns the outcome of the relay to each member."""
 
     @abstractmethod
     def connect_to_parent(self, community_id: str) -> Member | None:
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from src.application.interfaces.iclient_socket import IClientSocket
+
+
+class IClientFactory(ABC):
+    """Interface for client socket factories"""
+
+    @abstractmethod
+    def create_client(self) -> IClientSocket:
+        """Create a client socket, not connected yet"""
@@ -22,6 +22,10 @@ class IClientSocket(ABC):
     ) -> tuple[str, tuple[str, int]] | tuple[MessageDataclass, tuple[str, int]]:
         """Receive message"""
 
+    @abstractmethod
+    def is_connected(self) -> bool:
+        """Check the connection is still open on both sides"""
+
     @abstractmethod
     def close_connection(self):
         """Close connection"""
@@ -5,8 +5,9 @@ class ICommunityService(ABC):
     """Interface for Community Service"""
 
     @abstractmethod
-    def get_community_symetric_key(self, community_id: str) -> str:
-        """Get community symetric key"""
+    def get_community_symetric_key(self, community_id: str) -> str | bytes:
+        """Get community symetric key (hex string, or decoded bytes when held
+        by a keyring)"""
 
     @abstractmethod
     def is_community_member(
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+
+
+class ICompressionService(ABC):
+    """Interface for compression service."""
+
+    @abstractmethod
+    def get_supported_codecs(self) -> list[str]:
+        """Returns the codecs this node can decompress, by order of preference."""
+
+    @abstractmethod
+    def compress(self, plaintext: str, codecs: list[str] | None = None) -> str:
+        """Compresses a text with the first accepted codec (all supported codecs
+        by default). Returns the text unchanged when compressing is not worth it."""
+
+    @abstractmethod
+    def decompress(self, text: str) -> str:
+        """Decompresses a text returned by compress."""
+
+    @abstractmethod
+    def compress_bytes(self, data: bytes, codecs: list[str] | None = None) -> str:
+        """Compresses binary data into a text (hexadecimal when not compressed)."""
+
+    @abstractmethod
+    def decompress_bytes(self, text: str) -> bytes:
+        """Decompresses a text returned by compress_bytes."""
+
+    @abstractmethod
+    def compress_binary(self, data: bytes, codecs: list[str] | None = None) -> bytes:
+        """Compresses binary data into a binary envelope starting with the codec."""
+
+    @abstractmethod
+    def decompress_binary(self, envelope: bytes) -> bytes:
+        """Decompresses an envelope returned by compress_binary."""
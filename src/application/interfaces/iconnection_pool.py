@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from src.presentation.formatting.message_dataclass import MessageDataclass
+
+
+class IConnectionPool(ABC):
+    """Interface for pools of outgoing connections"""
+
+    @abstractmethod
+    def send_message(self, ip_address: str, port: int, message: MessageDataclass):
+        """Send a message to a peer, reusing a warm connection when possible"""
+
+    @abstractmethod
+    def evict_idle_connections(self):
+        """Close the connections unused for too long"""
+
+    @abstractmethod
+    def close(self):
+        """Close every pooled connection"""
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
 
 class IFileService(ABC):
@@ -11,3 +12,17 @@ class IFileService(ABC):
     @abstractmethod
     def write_file(self, path: str, content: str | bytes) -> None:
         """Writes a file"""
+
+    @abstractmethod
+    def read_file_chunks(
+        self, path: str, chunk_size: int, offset: int = 0
+    ) -> Iterator[bytes]:
+        """Reads a binary file by chunks, from offset"""
+
+    @abstractmethod
+    def write_file_atomically(self, path: str, chunks: Iterable[bytes]) -> None:
+        """Writes chunks to a temporary file, then renames it to path"""
+
+    @abstractmethod
+    def remove_file(self, path: str) -> None:
+        """Removes a file, if it exists"""
@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from datetime import datetime
+
+from src.application.interfaces.idatetime_service import IDatetimeService
+
+
+class IHybridLogicalClock(IDatetimeService):
+    """Interface for clocks ordering the events of every node"""
+
+    @abstractmethod
+    def get_datetime(self) -> datetime:
+        """Returns the timestamp of a local event, after every previous one"""
+
+    @abstractmethod
+    def update(self, received: datetime) -> datetime:
+        """Merges the timestamp of a received event, returns the timestamp of
+        its receipt, after both the received event and every previous one
+        """
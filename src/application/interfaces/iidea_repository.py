@@ -13,10 +13,24 @@ class IIdeaRepository(ABC):
     def add_idea_to_community(self, community_id: str, idea: Idea) -> None:
         """Add an idea to a specific community"""
 
+    @abstractmethod
+    def add_ideas_bulk(self, community_id: str, ideas: list[Idea]) -> int:
+        """Add ideas to a specific community in a single transaction, ignoring
+        the ones already known. Returns the number of added ideas.
+        """
+
     @abstractmethod
     def get_ideas_by_community(self, community_id: str) -> list[Idea]:
         """Get ideas by community"""
 
+    @abstractmethod
+    def get_ideas_page(
+        self, community_id: str, page_size: int, after: Idea | None = None
+    ) -> list[Idea]:
+        """Get a page of ideas by community, ordered by creation date,
+        starting after the given idea
+        """
+
     @abstractmethod
     def get_idea_from_community(self, community_id: str, idea_id: str) -> Idea | None:
         """Get idea from community"""
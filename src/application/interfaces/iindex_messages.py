@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+
+class IIndexMessages(ABC):
+    """Interface to index the messages written before the full-text index"""
+
+    @abstractmethod
+    def execute(self) -> None:
+        """Index the messages of every community"""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop indexing after the current batch"""
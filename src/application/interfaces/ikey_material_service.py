@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+
+class IKeyMaterialService(ABC):
+    """Interface for the service providing the key pair of the node"""
+
+    @abstractmethod
+    def get_key_pair(self) -> tuple[str, str]:
+        """Get the public and private keys of the node, provisioning them
+        on first use"""
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class IKeyring(ABC):
+    """Interface for the keyring of the community symetric keys"""
+
+    @abstractmethod
+    def load(self):
+        """Load the keys of every known community"""
+
+    @abstractmethod
+    def get_key(self, community_id: str) -> bytes:
+        """Get the decoded symetric key of a community"""
+
+    @abstractmethod
+    def add_key(self, community_id: str, key: str):
+        """Add the symetric key (hex string) of a new community"""
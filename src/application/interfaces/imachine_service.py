@@ -25,3 +25,8 @@ class IMachineService(ABC):
     @abstractmethod
     def get_current_user(self, community_id: str | None = None) -> Member:
         """Gets the machine's current user"""
+
+    @abstractmethod
+    def invalidate(self, community_id: str | None = None):
+        """Forgets the cached identity of a community (of every community and
+        the IP address if not specified), to be read again on next use"""
@@ -21,6 +21,17 @@ class IMemberRepository(ABC):
     ) -> None:
         """Add a member to a specific community"""
 
+    @abstractmethod
+    def add_members_bulk(
+        self,
+        community_id: str,
+        members: list[Member],
+        relationship: Literal["parent", "child"] | None = None,
+    ) -> int:
+        """Add members to a specific community in a single transaction, ignoring
+        the ones already known. Returns the number of added members.
+        """
+
     @abstractmethod
     def clear_members_relationship(
         self,
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 
 from src.presentation.formatting.message_dataclass import MessageDataclass
-from src.presentation.network.client import Client
+from src.application.interfaces.iclient_socket import IClientSocket
 
 
 class IMessageHandler(ABC):
@@ -9,6 +9,6 @@ class IMessageHandler(ABC):
 
     @abstractmethod
     def handle_message(
-        self, sender: tuple[str, int], client: Client, message: MessageDataclass
+        self, sender: tuple[str, int], client: IClientSocket, message: MessageDataclass
     ):
         """Method to handle a message"""
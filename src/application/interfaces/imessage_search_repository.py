@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.opinion import Opinion
+
+
+class IMessageSearchRepository(ABC):
+    """Interface for the full-text search repository of the messages"""
+
+    @abstractmethod
+    def initialize_if_not_exists(self, target_database: str):
+        """Initialize the requirements"""
+
+    @abstractmethod
+    def search_messages(
+        self, community_id: str, text: str, limit: int, offset: int = 0
+    ) -> list[Idea | Opinion]:
+        """Get the ideas and opinions of a community matching the text,
+        the most relevant first
+        """
+
+    @abstractmethod
+    def index_messages(self, community_id: str, batch_size: int) -> bool:
+        """Index a batch of the messages written before the full-text index.
+        Returns whether messages remain to be indexed.
+        """
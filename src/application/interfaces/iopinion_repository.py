@@ -13,12 +13,38 @@ class IOpinionRepository(ABC):
     def add_opinion_to_community(self, community_id: str, opinion: Opinion) -> None:
         """Add an opinion to a specific community"""
 
+    @abstractmethod
+    def add_opinions_bulk(self, community_id: str, opinions: list[Opinion]) -> int:
+        """Add opinions to a specific community in a single transaction, ignoring
+        the ones already known. Returns the number of added opinions.
+        """
+
     @abstractmethod
     def get_opinions_by_parent(
         self, community_id: str, parent_id: str
     ) -> list[Opinion]:
         """Get opinions by parent"""
 
+    @abstractmethod
+    def get_opinions_page(
+        self,
+        community_id: str,
+        parent_id: str,
+        page_size: int,
+        after: Opinion | None = None,
+    ) -> list[Opinion]:
+        """Get a page of opinions by parent, ordered by creation date,
+        starting after the given opinion
+        """
+
+    @abstractmethod
+    def get_opinions_subtree(
+        self, community_id: str, idea_id: str, max_depth: int | None = None
+    ) -> list[Opinion]:
+        """Get the opinions of an idea down to max_depth levels (all of them
+        if not specified), ordered by creation date
+        """
+
     @abstractmethod
     def get_opinion_from_community(
         self, community_id: str, opinion_id: str
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+
+from src.presentation.formatting.message_dataclass import MessageDataclass
+
+
+class IOutboundQueue(ABC):
+    """Interface for queues of outgoing messages"""
+
+    @abstractmethod
+    def enqueue(self, ip_address: str, port: int, message: MessageDataclass) -> Future:
+        """Queue a message for a peer, to be sent with the next batch.
+        Returns a future resolved with the seconds it took to send the message,
+        or with the error of the send"""
+
+    @abstractmethod
+    def flush(self):
+        """Send every queued message now"""
+
+    @abstractmethod
+    def close(self):
+        """Send the queued messages and stop the queue"""
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.discussion import Discussion
+
+
+class IReadDiscussion(ABC):
+    """Interface to read the discussion of an idea"""
+
+    @abstractmethod
+    def execute(
+        self, community_id: str, idea_id: str, max_depth: int | None = None
+    ) -> Discussion:
+        """Read the opinions of an idea down to max_depth levels"""
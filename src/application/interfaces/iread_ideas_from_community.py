@@ -7,5 +7,10 @@ class IReadIdeasFromCommunity(ABC):
     """Interface for read ideas from community"""
 
     @abstractmethod
-    def execute(self, community_id: str) -> list[Idea]:
-        """Read ideas from community"""
+    def execute(
+        self,
+        community_id: str,
+        page_size: int | None = None,
+        after: Idea | None = None,
+    ) -> list[Idea]:
+        """Read ideas from community, by pages of page_size ideas if specified"""
@@ -7,5 +7,13 @@ class IReadOpinions(ABC):
     """Interface to read opinions of an idea or opinion"""
 
     @abstractmethod
-    def execute(self, community_id: str, idea_or_opinion_id: str) -> list[Opinion]:
-        """Read opinions of an idea or opinion"""
+    def execute(
+        self,
+        community_id: str,
+        idea_or_opinion_id: str,
+        page_size: int | None = None,
+        after: Opinion | None = None,
+    ) -> list[Opinion]:
+        """Read opinions of an idea or opinion, by pages of page_size opinions
+        if specified
+        """
@@ -5,5 +5,5 @@ class ISaveIdea(ABC):
     """Interface for the SaveIdea use case."""
 
     @abstractmethod
-    def execute(self, community_id: str, message: str) -> str:
+    def execute(self, community_id: str, message: str | bytes) -> str:
         """Save an idea."""
@@ -5,5 +5,5 @@ class ISaveMember(ABC):
     """Interface for the SaveMember use case."""
 
     @abstractmethod
-    def execute(self, community_id: str, message: str) -> str:
+    def execute(self, community_id: str, message: str | bytes) -> str:
         """Save a member."""
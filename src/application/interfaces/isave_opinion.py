@@ -5,5 +5,5 @@ class ISaveOpinion(ABC):
     """Interface for the SaveOpinion use case."""
 
     @abstractmethod
-    def execute(self, community_id: str, message: str) -> str:
+    def execute(self, community_id: str, message: str | bytes) -> str:
         """Save an opinion."""
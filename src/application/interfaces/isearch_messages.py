@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.opinion import Opinion
+
+
+class ISearchMessages(ABC):
+    """Interface to search the ideas and opinions of a community"""
+
+    @abstractmethod
+    def execute(
+        self, community_id: str, text: str, page_size: int, page: int = 0
+    ) -> list[Idea | Opinion]:
+        """Search a page of the messages matching the text, the most relevant
+        first
+        """
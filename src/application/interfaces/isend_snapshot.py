@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.presentation.formatting.message_dataclass import MessageDataclass
+
+
+class ISendSnapshot(ABC):
+    """Interface for sending the community database snapshots"""
+
+    @abstractmethod
+    def send_snapshot(
+        self,
+        client_socket: IClientSocket,
+        community_id: str,
+        symetric_key: str,
+        codecs: list[str],
+    ):
+        """Freezes the community database, then sends its manifest and chunks"""
+
+    @abstractmethod
+    def execute(self, client_socket: IClientSocket, message: MessageDataclass):
+        """Resumes the transfer of a snapshot from the requested chunk"""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from src.application.architecture_manager.share_outcome import ShareOutcome
 from src.presentation.formatting.message_dataclass import MessageDataclass
 
 
@@ -11,8 +12,13 @@ class IShareInformation(ABC):
         self,
         message: MessageDataclass,
         community_id: str,
-        excluded_auth_keys: list[str] = [],
-        excluded_ip_addresses: list[str] = [],
-    ):
+        excluded_auth_keys: list[str] | None = None,
+        excluded_ip_addresses: list[str] | None = None,
+    ) -> list[ShareOutcome]:
         """Share a message to related members of architecture in a community
-        (except the author and specified excluded)."""
+        (except the author and specified excluded).
+        Returns the outcome of the relay to each member."""
+
+    @abstractmethod
+    def close(self):
+        """Wait for the relays in progress and stop sharing"""
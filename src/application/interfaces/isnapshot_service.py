@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from src.domain.entities.snapshot import Snapshot
+
+
+class ISnapshotService(ABC):
+    """Interface for the community database snapshots"""
+
+    @abstractmethod
+    def create_snapshot(
+        self, community_id: str, sources: list[tuple[str, int]]
+    ) -> Snapshot:
+        """Freezes a copy of the community database"""
+
+    @abstractmethod
+    def get_snapshot(self, snapshot_id: str) -> Snapshot | None:
+        """Returns the snapshot, if it is still kept"""
+
+    @abstractmethod
+    def read_chunks(
+        self, snapshot: Snapshot, start_index: int = 0
+    ) -> Iterator[tuple[int, bytes]]:
+        """Yields the index and the content of the chunks, from start_index"""
+
+    @abstractmethod
+    def remove_snapshot(self, snapshot_id: str):
+        """Forgets the snapshot and removes its copy"""
@@ -2,16 +2,33 @@ from abc import ABC, abstractmethod
 
 
 class ISymetricEncryptionService(ABC):
-    """Interface for symetric encryption service."""
+    """Interface for symetric encryption service.
+
+    The keys are hex strings, or the decoded bytes held by a keyring.
+    """
 
     @abstractmethod
     def generate_key(self) -> str:
         """Generates ramdom symetric symetric key."""
 
     @abstractmethod
-    def encrypt(self, plaintext: str, key: str) -> tuple[str, str, str]:
+    def encrypt(self, plaintext: str, key: str | bytes) -> tuple[str, str, str]:
         """Encrypts plaintext using symetric key. Returns the nonce, tag and ciphertext."""
 
     @abstractmethod
-    def decrypt(self, ciphertext: str, key: str, tag: str, nonce: str) -> str:
+    def decrypt(self, ciphertext: str, key: str | bytes, tag: str, nonce: str) -> str:
         """Decrypts ciphertext using symetric key, tag and nonce. Returns the plaintext."""
+
+    @abstractmethod
+    def encrypt_bytes(
+        self, plaintext: bytes, key: str | bytes, associated_data: bytes = b""
+    ) -> bytes:
+        """Encrypts plaintext using symetric key. Returns a single envelope made of
+        the nonce, the tag and the ciphertext. The tag also authenticates the
+        associated data, which is not encrypted nor included in the envelope."""
+
+    @abstractmethod
+    def decrypt_bytes(
+        self, envelope: bytes, key: str | bytes, associated_data: bytes = b""
+    ) -> bytes:
+        """Decrypts an envelope returned by encrypt_bytes. Returns the plaintext."""
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+
+
+class IWriteBehindQueue(ABC):
+    """Interface for queues of rows saved by groups"""
+
+    @abstractmethod
+    def enqueue(self, community_id: str, row: Member | Idea | Opinion) -> Future:
+        """Queue a row to save with the next group, the future is done once
+        the row is committed
+        """
+
+    @abstractmethod
+    def flush(self, community_id: str | None = None):
+        """Commit the queued rows of a community (of all of them if not
+        specified) and wait until they are committed
+        """
+
+    @abstractmethod
+    def close(self):
+        """Commit the queued rows and stop the queue"""
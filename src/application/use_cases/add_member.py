@@ -11,6 +11,10 @@ from src.application.interfaces.iasymetric_encryption_service import (
 from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
+from src.application.interfaces.icompression_service import ICompressionService
+from src.application.interfaces.isend_snapshot import ISendSnapshot
+from src.application.interfaces.isnapshot_service import ISnapshotService
+from src.application.use_cases.send_snapshot import SendSnapshot
 from src.application.interfaces.iid_generator_service import IIdGeneratorService
 from src.application.interfaces.imachine_service import IMachineService
 from src.application.interfaces.ifile_service import IFileService
@@ -20,8 +24,11 @@ from src.application.interfaces.iadd_member import IAddMember
 from src.application.interfaces.iclient_socket import IClientSocket
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.message_frame import MessageFrame
 from src.application.interfaces.imessage_formatter import IMessageFormatter
-import src.presentation.network.client as client
+from src.application.interfaces.iclient_factory import IClientFactory
+from src.application.interfaces.iwrite_behind_queue import IWriteBehindQueue
+from src.presentation.network.client_factory import ClientFactory
 
 
 class AddMember(IAddMember):
@@ -41,6 +48,11 @@ class AddMember(IAddMember):
         message_formatter: IMessageFormatter,
         community_service: ICommunityService,
         architecture_manager: IArchitectureManager,
+        compression_service: ICompressionService,
+        snapshot_service: ISnapshotService,
+        client_factory: IClientFactory | None = None,
+        send_snapshot_usecase: ISendSnapshot | None = None,
+        write_behind_queue: IWriteBehindQueue | None = None,
     ):
         self.base_path = base_path
         self.asymetric_encryption_service = asymetric_encryption_service
@@ -54,11 +66,22 @@ class AddMember(IAddMember):
         self.message_formatter = message_formatter
         self.community_service = community_service
         self.architecture_manager = architecture_manager
+        self.client_factory = client_factory or ClientFactory(message_formatter)
+        self.compression_service = compression_service
+        self.snapshot_service = snapshot_service
+        self.write_behind_queue = write_behind_queue
+        self.send_snapshot_usecase = send_snapshot_usecase or SendSnapshot(
+            self.snapshot_service,
+            symetric_encryption_service,
+            community_service,
+            machine_service,
+            self.compression_service,
+        )
 
         self.public_key: str
         self.private_key: str
         self.guest_public_key: str
-        self.symetric_key: str
+        self.symetric_key: str | bytes
 
     def execute(self, community_id: str, ip_address: str, port: int):
         (
@@ -68,7 +91,7 @@ class AddMember(IAddMember):
 
         client_socket: IClientSocket = None
         try:
-            client_socket = client.Client(self.message_formatter)
+            client_socket = self.client_factory.create_client()
             self._connect_to_guest(client_socket, ip_address, port)
 
             self.guest_public_key = self._receive_public_key(client_socket)
@@ -91,11 +114,13 @@ class AddMember(IAddMember):
             self._send_community_symetric_key(client_socket)
 
             self._send_community_informations(client_socket, community_id)
-            self._receive_acknowledgement(client_socket)
-            self._send_community_database(client_socket, self.base_path, community_id)
-
+            capabilities = self._receive_acknowledgement(client_socket)
+            # The guest is a member from now on, even if the database transfer
+            # is interrupted and resumed later
             self._share_add_member_message(community_id, member)
 
+            self._send_community_database(client_socket, community_id, capabilities)
+
             return "Success!"
         except AuthentificationFailedError as error:
             self._send_reject_message(client_socket, error.inner_error)
@@ -156,8 +181,14 @@ class AddMember(IAddMember):
 
     def _send_community_symetric_key(self, client_socket: IClientSocket):
         """Send the symetric key to the new member"""
+        # The key is sent as a hex string, even when held decoded by a keyring
+        symetric_key = (
+            self.symetric_key.hex()
+            if isinstance(self.symetric_key, bytes)
+            else self.symetric_key
+        )
         encrypted_symetric_key = self.asymetric_encryption_service.encrypt(
-            self.symetric_key, self.guest_public_key
+            symetric_key, self.guest_public_key
         )
 
         client_socket.send_message(
@@ -179,23 +210,47 @@ class AddMember(IAddMember):
         message = f"{nonce},{tag},{encrypted_informations}"
         client_socket.send_message(MessageDataclass(MessageHeader.DATA, message))
 
-    def _receive_acknowledgement(self, client_socket: IClientSocket):
-        """Receive the acknowledgement"""
+    def _receive_acknowledgement(self, client_socket: IClientSocket) -> list[str]:
+        """Receive the acknowledgement, holding the capabilities of the guest
+        (binary payloads and accepted codecs)"""
         message, _ = client_socket.receive_message()
 
         if not message or message.header != MessageHeader.ACK:
             raise AuthentificationFailedError("No acknowledgement received")
 
+        return message.content.split(",") if message.content else []
+
     def _send_community_database(
-        self, client_socket: IClientSocket, base_path: str, community_id: str
+        self,
+        client_socket: IClientSocket,
+        community_id: str,
+        capabilities: list[str],
     ):
-        """Send the community database"""
-        database_path = f"{base_path}/{community_id}.sqlite"
+        """Send the community database, compressed with a codec accepted by the guest.
+        Guests reading binary payloads get a resumable snapshot, the others get
+        the legacy string form."""
+        # The snapshot must hold the rows received before the guest joined
+        if self.write_behind_queue is not None:
+            self.write_behind_queue.flush(community_id)
+
+        if MessageFrame.BINARY_CAPABILITY in capabilities:
+            self.send_snapshot_usecase.send_snapshot(
+                client_socket, community_id, self.symetric_key, capabilities
+            )
+            return
 
-        database = self.file_service.read_file(database_path, with_binary_format=True)
+        # The snapshot only gives a consistent copy: it is never resumed
+        snapshot = self.snapshot_service.create_snapshot(community_id, [])
+        try:
+            database = b"".join(
+                chunk for _, chunk in self.snapshot_service.read_chunks(snapshot)
+            )
+        finally:
+            self.snapshot_service.remove_snapshot(snapshot.identifier)
 
         nonce, tag, encrypted_database = self.symetric_encryption_service.encrypt(
-            database.hex(), self.symetric_key
+            self.compression_service.compress_bytes(database, capabilities),
+            self.symetric_key,
         )
 
         message = f"{nonce},{tag},{encrypted_database}"
@@ -207,13 +262,12 @@ class AddMember(IAddMember):
 
     def _share_add_member_message(self, community_id: str, member: Member):
         """Share the add member message"""
-        (nonce, tag, cipher) = self.symetric_encryption_service.encrypt(
-            member.to_str(), self.symetric_key
+        envelope = self.symetric_encryption_service.encrypt_bytes(
+            self.compression_service.compress_binary(member.to_str().encode()),
+            self.symetric_key,
         )
         message_dataclass = MessageDataclass(
-            MessageHeader.ADD_MEMBER,
-            f"{nonce},{tag},{cipher}",
-            community_id,
+            MessageHeader.ADD_MEMBER, envelope, community_id
         )
         self.architecture_manager.share_information(
             message_dataclass, community_id, [member.authentication_key]
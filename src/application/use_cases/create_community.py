@@ -10,6 +10,7 @@ from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
 from src.application.interfaces.ifile_service import IFileService
+from src.application.interfaces.ikeyring import IKeyring
 from src.domain.entities.community import Community
 from src.domain.entities.member import Member
 
@@ -29,6 +30,7 @@ class CreateCommunity(ICreateCommunity):
         machine_service: IMachineService,
         file_service: IFileService,
         datetime_service: IDatetimeService,
+        keyring: IKeyring | None = None,
     ):
         self.keys_folder_path = keys_folder_path
         self.community_repository = community_repository
@@ -40,6 +42,7 @@ class CreateCommunity(ICreateCommunity):
         self.machine_service = machine_service
         self.file_service = file_service
         self.datetime_service = datetime_service
+        self.keyring = keyring
 
     def execute(self, name: str, description: str) -> str:
         try:
@@ -86,6 +89,8 @@ class CreateCommunity(ICreateCommunity):
         key = self.encryption_service.generate_key()
         encryption_key_path = f"{self.keys_folder_path}/{community_id}.key"
         self.file_service.write_file(encryption_key_path, key)
+        if self.keyring is not None:
+            self.keyring.add_key(community_id, key)
         return encryption_key_path
 
     def _initialize_community_database(self, community_id: str) -> None:
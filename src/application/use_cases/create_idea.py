@@ -6,6 +6,7 @@ from src.application.interfaces.imachine_service import IMachineService
 from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
+from src.application.interfaces.icompression_service import ICompressionService
 from src.application.architecture_manager.architecture_manager import (
     ArchitectureManager,
 )
@@ -27,6 +28,7 @@ class CreateIdea(ICreateIdea):
         datetime_service: IDatetimeService,
         community_service: ICommunityService,
         architecture_manager: ArchitectureManager,
+        compression_service: ICompressionService,
     ):
         self.machine_service = machine_service
         self.id_generator_service = id_generator_service
@@ -35,6 +37,7 @@ class CreateIdea(ICreateIdea):
         self.datetime_service = datetime_service
         self.community_service = community_service
         self.architecture_manager = architecture_manager
+        self.compression_service = compression_service
 
     def execute(self, community_id: str, content: str) -> str:
         """Create an idea."""
@@ -57,13 +60,12 @@ class CreateIdea(ICreateIdea):
             )
             self.idea_repository.add_idea_to_community(community_id, idea)
 
-            (nonce, tag, cipher) = self.symetric_encryption_service.encrypt(
-                idea.to_str(), symetric_key
+            envelope = self.symetric_encryption_service.encrypt_bytes(
+                self.compression_service.compress_binary(idea.to_str().encode()),
+                symetric_key,
             )
             message_dataclass = MessageDataclass(
-                MessageHeader.CREATE_IDEA,
-                f"{nonce},{tag},{cipher}",
-                community_id,
+                MessageHeader.CREATE_IDEA, envelope, community_id
             )
             self.architecture_manager.share_information(message_dataclass, community_id)
 
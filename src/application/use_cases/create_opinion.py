@@ -8,6 +8,7 @@ from src.application.interfaces.iopinion_repository import IOpinionRepository
 from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
+from src.application.interfaces.icompression_service import ICompressionService
 from src.application.interfaces.icommunity_service import ICommunityService
 from src.domain.entities.opinion import Opinion
 from src.domain.exceptions.parent_not_found_error import ParentNotFoundError
@@ -28,6 +29,7 @@ class CreateOpinion(ICreateOpinion):
         datetime_service: IDatetimeService,
         community_service: ICommunityService,
         architecture_manager: IArchitectureManager,
+        compression_service: ICompressionService,
     ):
         self.machine_service = machine_service
         self.id_generator_service = id_generator_service
@@ -37,6 +39,7 @@ class CreateOpinion(ICreateOpinion):
         self.datetime_service = datetime_service
         self.community_service = community_service
         self.architecture_manager = architecture_manager
+        self.compression_service = compression_service
 
     def execute(self, community_id: str, idea_or_opinion_id: str, content: str) -> str:
         try:
@@ -68,13 +71,12 @@ class CreateOpinion(ICreateOpinion):
             )
             self.opinion_repository.add_opinion_to_community(community_id, opinion)
 
-            (nonce, tag, cipher) = self.symetric_encryption_service.encrypt(
-                opinion.to_str(), symetric_key
+            envelope = self.symetric_encryption_service.encrypt_bytes(
+                self.compression_service.compress_binary(opinion.to_str().encode()),
+                symetric_key,
             )
             message_dataclass = MessageDataclass(
-                MessageHeader.CREATE_OPINION,
-                f"{nonce},{tag},{cipher}",
-                community_id,
+                MessageHeader.CREATE_OPINION, envelope, community_id
             )
             self.architecture_manager.share_information(message_dataclass, community_id)
 
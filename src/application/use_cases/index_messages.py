@@ -0,0 +1,44 @@
+import threading
+
+from src.application.interfaces.iindex_messages import IIndexMessages
+from src.application.interfaces.icommunity_repository import ICommunityRepository
+from src.application.interfaces.imessage_search_repository import (
+    IMessageSearchRepository,
+)
+
+
+class IndexMessages(IIndexMessages):
+    """Use case to index the messages written before the full-text index.
+
+    The messages are indexed by batches, each in its own short transaction,
+    pausing between them so the writes of the server are not delayed. Meant
+    to run in a background thread.
+    """
+
+    def __init__(
+        self,
+        community_repository: ICommunityRepository,
+        message_search_repository: IMessageSearchRepository,
+        batch_size: int = 1000,
+        pause: float = 0.01,
+    ):
+        self.community_repository = community_repository
+        self.message_search_repository = message_search_repository
+        self.batch_size = batch_size
+        self.pause = pause
+        self.stopped = threading.Event()
+
+    def execute(self) -> None:
+        for community in self.community_repository.get_communities():
+            try:
+                while not self.stopped.is_set() and (
+                    self.message_search_repository.index_messages(
+                        community.identifier, self.batch_size
+                    )
+                ):
+                    self.stopped.wait(self.pause)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                print(f"Unable to index the messages of {community.identifier} : {err}")
+
+    def stop(self) -> None:
+        self.stopped.set()
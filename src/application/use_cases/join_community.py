@@ -1,3 +1,8 @@
+import hashlib
+import itertools
+import threading
+from typing import Iterator
+
 from src.application.interfaces.ijoin_community import IJoinCommunity
 from src.application.interfaces.imachine_service import IMachineService
 from src.application.interfaces.ifile_service import IFileService
@@ -10,17 +15,28 @@ from src.application.interfaces.iasymetric_encryption_service import (
 from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
+from src.application.exceptions.socket_error import SocketError
 from src.application.interfaces.iclient_socket import IClientSocket
+from src.application.interfaces.iclient_factory import IClientFactory
+from src.application.interfaces.icompression_service import ICompressionService
 from src.application.interfaces.icommunity_repository import ICommunityRepository
 from src.application.interfaces.imember_repository import IMemberRepository
+from src.application.interfaces.ikeyring import IKeyring
 from src.domain.entities.community import Community
+from src.domain.entities.snapshot import Snapshot
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.formatting.database_chunk import DatabaseChunk
+from src.presentation.formatting.message_formatter import MessageFormatter
+from src.presentation.network.client_factory import ClientFactory
+from src.presentation.network.message_frame import MessageFrame
 
 
 class JoinCommunity(IJoinCommunity):
     """Join a community with a member"""
 
+    MAX_RESUME_ATTEMPTS = 5
+
     def __init__(
         self,
         base_path: str,
@@ -31,6 +47,9 @@ class JoinCommunity(IJoinCommunity):
         file_service: IFileService,
         community_repository: ICommunityRepository,
         member_repository: IMemberRepository,
+        compression_service: ICompressionService,
+        client_factory: IClientFactory | None = None,
+        keyring: IKeyring | None = None,
     ):
         self.base_path = base_path
         self.keys_folder_path = keys_folder_path
@@ -40,39 +59,46 @@ class JoinCommunity(IJoinCommunity):
         self.file_service = file_service
         self.community_repository = community_repository
         self.member_repository = member_repository
+        self.compression_service = compression_service
+        self.client_factory = client_factory or ClientFactory(MessageFormatter())
+        self.keyring = keyring
 
-        self.public_key: str
-        self.private_key: str
-        self.member_public_key: str
-        self.symetric_key: str
+        # The handshake state is local to each join: concurrent invitations
+        # handled by the server workers only serialize their local writes,
+        # not their exchanges with the inviter.
+        self.lock = threading.Lock()
 
     def execute(self, client_socket: IClientSocket) -> str:
-        (
-            self.public_key,
-            self.private_key,
-        ) = self.machine_service.get_asymetric_key_pair()
+        public_key, private_key = self.machine_service.get_asymetric_key_pair()
 
         try:
-            self._send_public_key(client_socket)
-            self.member_public_key = self._receive_public_key(client_socket)
+            self._send_public_key(client_socket, public_key)
+            member_public_key = self._receive_public_key(client_socket)
 
-            auth_key = self._receive_auth_key(client_socket)
-            self._send_confirm_auth_key(client_socket, auth_key)
+            auth_key = self._receive_auth_key(client_socket, private_key)
+            self._send_confirm_auth_key(client_socket, auth_key, member_public_key)
 
-            self.symetric_key = self._receive_symetric_key(client_socket)
+            symetric_key = self._receive_symetric_key(client_socket, private_key)
 
             parent_auth_key, community = self._receive_community_informations(
-                client_socket
+                client_socket, symetric_key
             )
 
-            symetric_key_path = self._save_symetric_key(community.identifier)
-            self._save_community_informations(community, auth_key, symetric_key_path)
+            with self.lock:
+                symetric_key_path = self._save_symetric_key(
+                    community.identifier, symetric_key
+                )
+                self._save_community_informations(
+                    community, auth_key, symetric_key_path
+                )
             self._send_acknowledgement(client_socket)
 
-            community_database = self._receive_community_database(client_socket)
-            self._save_community_database(community.identifier, community_database)
+            self._receive_community_database(
+                client_socket, community.identifier, symetric_key
+            )
 
-            self._update_members_relationship(community.identifier, parent_auth_key)
+            with self.lock:
+                self._update_members_relationship(community.identifier, parent_auth_key)
 
             return "Success!"
         except Exception as error:
@@ -80,11 +106,9 @@ class JoinCommunity(IJoinCommunity):
         finally:
             client_socket.close_connection()
 
-    def _send_public_key(self, client_socket: IClientSocket) -> str:
+    def _send_public_key(self, client_socket: IClientSocket, public_key: str):
         """Response to the invitation"""
-        client_socket.send_message(
-            MessageDataclass(MessageHeader.DATA, self.public_key)
-        )
+        client_socket.send_message(MessageDataclass(MessageHeader.DATA, public_key))
 
     def _receive_public_key(self, client_socket: IClientSocket) -> str:
         """Receive the public key"""
@@ -95,28 +119,32 @@ class JoinCommunity(IJoinCommunity):
 
         return public_key_message.content
 
-    def _receive_auth_key(self, client_socket: IClientSocket) -> str:
+    def _receive_auth_key(self, client_socket: IClientSocket, private_key: str) -> str:
         """Receive the auth key"""
         encrypted_auth_key_message, _ = client_socket.receive_message()
         if not encrypted_auth_key_message or not encrypted_auth_key_message.content:
             raise AuthentificationFailedError("Authentification key not valid")
 
         decripted_auth_key = self.asymetric_encryption_service.decrypt(
-            encrypted_auth_key_message.content, self.private_key
+            encrypted_auth_key_message.content, private_key
         )
         return decripted_auth_key
 
-    def _send_confirm_auth_key(self, client_socket: IClientSocket, auth_key: str):
+    def _send_confirm_auth_key(
+        self, client_socket: IClientSocket, auth_key: str, member_public_key: str
+    ):
         """Send the auth key to the server"""
         reencripted_auth_key = self.asymetric_encryption_service.encrypt(
-            auth_key, self.member_public_key
+            auth_key, member_public_key
         )
 
         client_socket.send_message(
             MessageDataclass(MessageHeader.DATA, reencripted_auth_key)
         )
 
-    def _receive_symetric_key(self, client_socket: IClientSocket) -> str:
+    def _receive_symetric_key(
+        self, client_socket: IClientSocket, private_key: str
+    ) -> str:
         """Receive the symetric key"""
         encrypted_symetric_key_message, _ = client_socket.receive_message()
 
@@ -127,13 +155,13 @@ class JoinCommunity(IJoinCommunity):
             raise AuthentificationFailedError(encrypted_symetric_key_message.content)
 
         symetric_key = self.asymetric_encryption_service.decrypt(
-            encrypted_symetric_key_message.content, self.private_key
+            encrypted_symetric_key_message.content, private_key
         )
 
         return symetric_key
 
     def _receive_community_informations(
-        self, client_socket: IClientSocket
+        self, client_socket: IClientSocket, symetric_key: str
     ) -> tuple[str, Community]:
         """Receive the community informations"""
         informations_message, _ = client_socket.receive_message()
@@ -146,7 +174,7 @@ class JoinCommunity(IJoinCommunity):
         )
 
         community_informations = self.symetric_encryption_service.decrypt(
-            encr_community_informations, self.symetric_key, tag, nonce
+            encr_community_informations, symetric_key, tag, nonce
         )
 
         parent_auth_key, community_informations = community_informations.split(
@@ -155,10 +183,12 @@ class JoinCommunity(IJoinCommunity):
 
         return parent_auth_key, Community.from_str(community_informations)
 
-    def _save_symetric_key(self, community_id: str) -> str:
+    def _save_symetric_key(self, community_id: str, symetric_key: str) -> str:
         """Save the symetric key"""
         symetric_key_path = f"{self.keys_folder_path}/{community_id}.key"
-        self.file_service.write_file(symetric_key_path, self.symetric_key)
+        self.file_service.write_file(symetric_key_path, symetric_key)
+        if self.keyring is not None:
+            self.keyring.add_key(community_id, symetric_key)
 
         return symetric_key_path
 
@@ -173,29 +203,142 @@ class JoinCommunity(IJoinCommunity):
         )
 
     def _send_acknowledgement(self, client_socket: IClientSocket):
-        """Send acknowledgement"""
-        client_socket.send_message(MessageDataclass(MessageHeader.ACK))
+        """Send acknowledgement, with the capabilities used for the database
+        (binary payloads and accepted codecs)"""
+        capabilities = ",".join(
+            [MessageFrame.BINARY_CAPABILITY]
+            + self.compression_service.get_supported_codecs()
+        )
+        client_socket.send_message(MessageDataclass(MessageHeader.ACK, capabilities))
 
-    def _receive_community_database(self, client_socket: IClientSocket):
-        """Receive the community database"""
+    def _receive_community_database(
+        self, client_socket: IClientSocket, community_id: str, symetric_key: str
+    ):
+        """Receive and save the community database (snapshot or legacy string).
+        A snapshot is streamed, resumes included, to a temporary file that only
+        replaces the database once complete; a legacy database is written under
+        the lock once received."""
         database_message, _ = client_socket.receive_message()
 
         if not database_message:
             raise AuthentificationFailedError("No community database received")
 
+        community_database_path = f"{self.base_path}/{community_id}.sqlite"
+        if database_message.header == MessageHeader.SNAPSHOT:
+            snapshot = Snapshot.from_str(
+                self.symetric_encryption_service.decrypt_bytes(
+                    database_message.content, symetric_key
+                ).decode()
+            )
+            self.file_service.write_file_atomically(
+                community_database_path,
+                self._receive_snapshot(client_socket, snapshot, symetric_key),
+            )
+            return
+
         nonce, tag, encrypted_database = database_message.content.split(",", maxsplit=2)
 
         decrypted_database = self.symetric_encryption_service.decrypt(
-            encrypted_database, self.symetric_key, tag, nonce
+            encrypted_database, symetric_key, tag, nonce
         )
+        database = self.compression_service.decompress_bytes(decrypted_database)
+
+        with self.lock:
+            self.file_service.write_file(community_database_path, database)
+
+    def _receive_snapshot(
+        self, client_socket: IClientSocket, snapshot: Snapshot, symetric_key: str
+    ) -> Iterator[bytes]:
+        """Yields the verified chunks of the snapshot. When the transfer is
+        interrupted, it is resumed from one of the snapshot sources."""
+        digest = hashlib.sha256()
+        next_index = 0
+        connection = client_socket
+        sources = itertools.cycle(snapshot.sources)
+        attempts = 0
+        try:
+            while next_index < snapshot.chunk_count:
+                try:
+                    for chunk in self._read_snapshot_chunks(
+                        connection, snapshot, next_index, symetric_key
+                    ):
+                        digest.update(chunk)
+                        next_index += 1
+                        attempts = 0
+                        yield chunk
+                except SocketError as error:
+                    attempts += 1
+                    if attempts > self.MAX_RESUME_ATTEMPTS or not snapshot.sources:
+                        raise AuthentificationFailedError(
+                            f"Community database transfer interrupted: {error}"
+                        ) from error
+                    if connection is not client_socket:
+                        connection.close_connection()
+                    connection = self._resume_snapshot(
+                        next(sources), snapshot, next_index, symetric_key
+                    )
+        finally:
+            if connection is not client_socket:
+                connection.close_connection()
 
-        return decrypted_database
+        if digest.hexdigest() != snapshot.content_hash:
+            raise AuthentificationFailedError("Community database hash mismatch")
 
-    def _save_community_database(self, community_id: str, community_database: str):
-        """Save the community database"""
-        community_database_path = f"{self.base_path}/{community_id}.sqlite"
-        database_bytes = bytes.fromhex(community_database)
-        self.file_service.write_file(community_database_path, database_bytes)
+    def _read_snapshot_chunks(
+        self,
+        connection: IClientSocket,
+        snapshot: Snapshot,
+        start_index: int,
+        symetric_key: str,
+    ) -> Iterator[bytes]:
+        """Yields the decrypted chunks received on the connection, up to the last one"""
+        expected_index = start_index
+        while True:
+            message, _ = connection.receive_message()
+            if not message or message.header != MessageHeader.DATABASE_CHUNK:
+                reason = message.content if message else "no chunk received"
+                raise SocketError(reason)
+
+            index, is_last, header, envelope = DatabaseChunk.unpack(message.content)
+            if index != expected_index:
+                raise AuthentificationFailedError(f"Unexpected database chunk {index}")
+
+            yield self.compression_service.decompress_binary(
+                self.symetric_encryption_service.decrypt_bytes(
+                    envelope,
+                    symetric_key,
+                    DatabaseChunk.get_associated_data(snapshot.identifier, header),
+                )
+            )
+            if is_last:
+                return
+
+            expected_index += 1
+
+    def _resume_snapshot(
+        self,
+        source: tuple[str, int],
+        snapshot: Snapshot,
+        next_index: int,
+        symetric_key: str,
+    ) -> IClientSocket:
+        """Reconnect to a source of the snapshot and ask for the next chunks.
+        A failure to connect is reported by the read of the first chunk."""
+        connection = self.client_factory.create_client()
+        try:
+            connection.connect_to_server(*source)
+            request = self.symetric_encryption_service.encrypt_bytes(
+                f"{snapshot.identifier},{next_index}".encode(), symetric_key
+            )
+            connection.send_message(
+                MessageDataclass(
+                    MessageHeader.RESUME_SNAPSHOT, request, snapshot.community_id
+                )
+            )
+        except SocketError:
+            pass
+
+        return connection
 
     def _update_members_relationship(self, community_id: str, parent_auth_key: str):
         """Update the members relationship"""
@@ -0,0 +1,21 @@
+from src.application.interfaces.iread_discussion import IReadDiscussion
+from src.application.interfaces.iopinion_repository import IOpinionRepository
+from src.domain.entities.discussion import Discussion
+
+
+class ReadDiscussion(IReadDiscussion):
+    """Use case to read the whole discussion of an idea in a single query."""
+
+    def __init__(self, opinion_repository: IOpinionRepository):
+        self.opinion_repository = opinion_repository
+
+    def execute(
+        self, community_id: str, idea_id: str, max_depth: int | None = None
+    ) -> Discussion:
+        if max_depth is not None and max_depth <= 0:
+            raise ValueError("Maximum depth must be positive")
+
+        opinions = self.opinion_repository.get_opinions_subtree(
+            community_id, idea_id, max_depth
+        )
+        return Discussion(idea_id, opinions)
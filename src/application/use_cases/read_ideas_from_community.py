@@ -6,10 +6,24 @@ from src.domain.entities.idea import Idea
 
 
 class ReadIdeasFromCommunity(IReadIdeasFromCommunity):
-    """Use case to read ideas from community."""
+    """Use case to read ideas from community.
+
+    With a page size, the ideas are read by pages ordered by creation date,
+    each page starting after the last idea of the previous one.
+    """
 
     def __init__(self, idea_repository: IIdeaRepository):
         self.idea_repository = idea_repository
 
-    def execute(self, community_id: str) -> list[Idea]:
-        return self.idea_repository.get_ideas_by_community(community_id)
+    def execute(
+        self,
+        community_id: str,
+        page_size: int | None = None,
+        after: Idea | None = None,
+    ) -> list[Idea]:
+        if page_size is None:
+            return self.idea_repository.get_ideas_by_community(community_id)
+
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        return self.idea_repository.get_ideas_page(community_id, page_size, after)
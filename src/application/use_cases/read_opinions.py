@@ -4,12 +4,29 @@ from src.domain.entities.opinion import Opinion
 
 
 class ReadOpinions(IReadOpinions):
-    """Use case to read opinions from idea of opinion."""
+    """Use case to read opinions from idea of opinion.
+
+    With a page size, the opinions are read by pages ordered by creation date,
+    each page starting after the last opinion of the previous one.
+    """
 
     def __init__(self, opinion_repository: IOpinionRepository):
         self.opinion_repository = opinion_repository
 
-    def execute(self, community_id: str, idea_or_opinion_id: str) -> list[Opinion]:
-        return self.opinion_repository.get_opinions_by_parent(
-            community_id, idea_or_opinion_id
+    def execute(
+        self,
+        community_id: str,
+        idea_or_opinion_id: str,
+        page_size: int | None = None,
+        after: Opinion | None = None,
+    ) -> list[Opinion]:
+        if page_size is None:
+            return self.opinion_repository.get_opinions_by_parent(
+                community_id, idea_or_opinion_id
+            )
+
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        return self.opinion_repository.get_opinions_page(
+            community_id, idea_or_opinion_id, page_size, after
         )
@@ -4,36 +4,63 @@ from src.application.interfaces.isave_member import ISaveMember
 from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
+from src.application.interfaces.icompression_service import ICompressionService
+from src.application.interfaces.iwrite_behind_queue import IWriteBehindQueue
+from src.application.interfaces.ihybrid_logical_clock import IHybridLogicalClock
 from src.domain.entities.member import Member
 
 
 class SaveMember(ISaveMember):
-    """Use case for saving a member."""
+    """Use case for saving a member.
+
+    With a write-behind queue, the row is queued to be committed with the
+    next group instead of being committed before returning. With a clock,
+    the creation date of the saved row is merged into it.
+    """
 
     def __init__(
         self,
         member_repository: IMemberRepository,
         community_service: ICommunityService,
         symetric_encryption_service: ISymetricEncryptionService,
+        compression_service: ICompressionService,
+        write_behind_queue: IWriteBehindQueue | None = None,
+        clock: IHybridLogicalClock | None = None,
     ):
         self.member_repository = member_repository
         self.community_service = community_service
         self.symetric_encryption_service = symetric_encryption_service
+        self.compression_service = compression_service
+        self.write_behind_queue = write_behind_queue
+        self.clock = clock
 
-    def execute(self, community_id: str, message: str) -> str:
+    def execute(self, community_id: str, message: str | bytes) -> str:
         try:
-            nonce, tag, cipher_member = message.split(",", maxsplit=2)
-
             symetric_key = self.community_service.get_community_symetric_key(
                 community_id
             )
-            decrypted_member = self.symetric_encryption_service.decrypt(
-                cipher_member, symetric_key, tag, nonce
-            )
+            decrypted_member = self._decrypt(message, symetric_key)
 
             member = Member.from_str(decrypted_member)
 
-            self.member_repository.add_member_to_community(community_id, member)
+            if self.clock is not None:
+                self.clock.update(member.creation_date)
+            if self.write_behind_queue is not None:
+                self.write_behind_queue.enqueue(community_id, member)
+            else:
+                self.member_repository.add_member_to_community(community_id, member)
             return "Success!"
         except Exception as error:
             return str(error)
+
+    def _decrypt(self, message: str | bytes, symetric_key: str) -> str:
+        """Decrypts a binary envelope, or the legacy "nonce,tag,cipher" string"""
+        if isinstance(message, bytes):
+            return self.compression_service.decompress_binary(
+                self.symetric_encryption_service.decrypt_bytes(message, symetric_key)
+            ).decode()
+
+        nonce, tag, cipher_member = message.split(",", maxsplit=2)
+        return self.symetric_encryption_service.decrypt(
+            cipher_member, symetric_key, tag, nonce
+        )
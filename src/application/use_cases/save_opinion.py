@@ -4,32 +4,42 @@ from src.application.interfaces.isave_opinion import ISaveOpinion
 from src.application.interfaces.isymetric_encryption_service import (
     ISymetricEncryptionService,
 )
+from src.application.interfaces.icompression_service import ICompressionService
+from src.application.interfaces.iwrite_behind_queue import IWriteBehindQueue
+from src.application.interfaces.ihybrid_logical_clock import IHybridLogicalClock
 from src.domain.entities.opinion import Opinion
 
 
 class SaveOpinion(ISaveOpinion):
-    """Save an opinion."""
+    """Save an opinion.
+
+    With a write-behind queue, the row is queued to be committed with the
+    next group instead of being committed before returning. With a clock,
+    the creation date of the saved row is merged into it.
+    """
 
     def __init__(
         self,
         opinion_repository: IOpinionRepository,
         symetric_encryption_service: ISymetricEncryptionService,
         community_service: ICommunityService,
+        compression_service: ICompressionService,
+        write_behind_queue: IWriteBehindQueue | None = None,
+        clock: IHybridLogicalClock | None = None,
     ):
         self.opinion_repository = opinion_repository
         self.symetric_encryption_service = symetric_encryption_service
         self.community_service = community_service
+        self.compression_service = compression_service
+        self.write_behind_queue = write_behind_queue
+        self.clock = clock
 
-    def execute(self, community_id: str, message: str) -> str:
+    def execute(self, community_id: str, message: str | bytes) -> str:
         try:
-            nonce, tag, cipher_opinion = message.split(",", maxsplit=2)
-
             symetric_key = self.community_service.get_community_symetric_key(
                 community_id
             )
-            decrypted_opinion = self.symetric_encryption_service.decrypt(
-                cipher_opinion, symetric_key, tag, nonce
-            )
+            decrypted_opinion = self._decrypt(message, symetric_key)
 
             opinion = Opinion.from_str(decrypted_opinion)
             if not self.community_service.is_community_member(
@@ -39,7 +49,26 @@ class SaveOpinion(ISaveOpinion):
             if len(opinion.content) < Opinion.CONTENT_MIN_LENGTH:
                 raise ValueError("Content is too short.")
 
-            self.opinion_repository.add_opinion_to_community(community_id, opinion)
+            if self.clock is not None:
+                self.clock.update(opinion.creation_date)
+            if self.write_behind_queue is not None:
+                self.write_behind_queue.enqueue(community_id, opinion)
+            else:
+                self.opinion_repository.add_opinion_to_community(community_id, opinion)
             return "Success!"
         except Exception as error:
             return str(error)
+
+    def _decrypt(self, message: str | bytes, symetric_key: str) -> str:
+        """Decrypts a binary envelope, or the legacy "nonce,tag,cipher" string"""
+        if isinstance(message, bytes):
+            return self.compression_service.decompress_binary(
+                self.symetric_encryption_service.decrypt_bytes(message, symetric_key)
+            ).decode()
+
+        nonce, tag, cipher_opinion = message.split(",", maxsplit=2)
+        return self.compression_service.decompress(
+            self.symetric_encryption_service.decrypt(
+                cipher_opinion, symetric_key, tag, nonce
+            )
+        )
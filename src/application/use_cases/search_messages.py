@@ -0,0 +1,25 @@
+from src.application.interfaces.isearch_messages import ISearchMessages
+from src.application.interfaces.imessage_search_repository import (
+    IMessageSearchRepository,
+)
+from src.domain.entities.idea import Idea
+from src.domain.entities.opinion import Opinion
+
+
+class SearchMessages(ISearchMessages):
+    """Use case to search the ideas and opinions of a community."""
+
+    def __init__(self, message_search_repository: IMessageSearchRepository):
+        self.message_search_repository = message_search_repository
+
+    def execute(
+        self, community_id: str, text: str, page_size: int, page: int = 0
+    ) -> list[Idea | Opinion]:
+        if page_size <= 0:
+            raise ValueError("Page size must be positive")
+        if page < 0:
+            raise ValueError("Page must not be negative")
+
+        return self.message_search_repository.search_messages(
+            community_id, text, page_size, page * page_size
+        )
@@ -0,0 +1,116 @@
+from src.application.exceptions.message_error import MessageError
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.application.interfaces.icommunity_service import ICommunityService
+from src.application.interfaces.icompression_service import ICompressionService
+from src.application.interfaces.imachine_service import IMachineService
+from src.application.interfaces.isend_snapshot import ISendSnapshot
+from src.application.interfaces.isnapshot_service import ISnapshotService
+from src.application.interfaces.isymetric_encryption_service import (
+    ISymetricEncryptionService,
+)
+from src.domain.entities.snapshot import Snapshot
+from src.presentation.formatting.database_chunk import DatabaseChunk
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+
+
+class SendSnapshot(ISendSnapshot):
+    """Send a snapshot of the community database to a new member.
+
+    The snapshot is announced by an encrypted manifest (id, content hash,
+    chunk count and the nodes holding it), then sent by numbered chunks.
+    A new member whose transfer was interrupted reconnects to one of these
+    nodes with RESUME_SNAPSHOT and the index of the next chunk it needs.
+    """
+
+    def __init__(
+        self,
+        snapshot_service: ISnapshotService,
+        symetric_encryption_service: ISymetricEncryptionService,
+        community_service: ICommunityService,
+        machine_service: IMachineService,
+        compression_service: ICompressionService,
+    ):
+        self.snapshot_service = snapshot_service
+        self.symetric_encryption_service = symetric_encryption_service
+        self.community_service = community_service
+        self.machine_service = machine_service
+        self.compression_service = compression_service
+
+    def send_snapshot(
+        self,
+        client_socket: IClientSocket,
+        community_id: str,
+        symetric_key: str,
+        codecs: list[str],
+    ):
+        current_user = self.machine_service.get_current_user(community_id)
+        snapshot = self.snapshot_service.create_snapshot(
+            community_id, [(current_user.ip_address, current_user.port)]
+        )
+
+        manifest = self.symetric_encryption_service.encrypt_bytes(
+            snapshot.to_str().encode(), symetric_key
+        )
+        client_socket.send_message(MessageDataclass(MessageHeader.SNAPSHOT, manifest))
+
+        self._send_chunks(client_socket, snapshot, 0, symetric_key, codecs)
+
+    def execute(self, client_socket: IClientSocket, message: MessageDataclass):
+        try:
+            symetric_key = self.community_service.get_community_symetric_key(
+                message.community_id
+            )
+            snapshot, start_index = self._get_resumed_snapshot(message, symetric_key)
+            self._send_chunks(client_socket, snapshot, start_index, symetric_key)
+        except (MessageError, ValueError) as error:
+            client_socket.send_message(
+                MessageDataclass(MessageHeader.REJECT, str(error))
+            )
+        finally:
+            client_socket.close_connection()
+
+    def _get_resumed_snapshot(
+        self, message: MessageDataclass, symetric_key: str
+    ) -> tuple[Snapshot, int]:
+        """Returns the snapshot and the chunk index requested by a new member"""
+        if not isinstance(message.content, bytes):
+            raise MessageError("Invalid snapshot resume request")
+
+        snapshot_id, start_index = (
+            self.symetric_encryption_service.decrypt_bytes(
+                message.content, symetric_key
+            )
+            .decode()
+            .split(",", maxsplit=1)
+        )
+
+        snapshot = self.snapshot_service.get_snapshot(snapshot_id)
+        if snapshot is None or snapshot.community_id != message.community_id:
+            raise MessageError(f"Unknown snapshot {snapshot_id}")
+        if not 0 <= int(start_index) < snapshot.chunk_count:
+            raise MessageError(f"Invalid snapshot chunk {start_index}")
+
+        return snapshot, int(start_index)
+
+    def _send_chunks(
+        self,
+        client_socket: IClientSocket,
+        snapshot: Snapshot,
+        start_index: int,
+        symetric_key: str,
+        codecs: list[str] | None = None,
+    ):
+        """Send the chunks of the snapshot, from start_index"""
+        for index, chunk in self.snapshot_service.read_chunks(snapshot, start_index):
+            header = DatabaseChunk.pack_header(
+                index, is_last=index == snapshot.chunk_count - 1
+            )
+            envelope = self.symetric_encryption_service.encrypt_bytes(
+                self.compression_service.compress_binary(chunk, codecs),
+                symetric_key,
+                DatabaseChunk.get_associated_data(snapshot.identifier, header),
+            )
+            client_socket.send_message(
+                MessageDataclass(MessageHeader.DATABASE_CHUNK, header + envelope)
+            )
@@ -0,0 +1,29 @@
+from src.domain.entities.opinion import Opinion
+
+
+class Discussion:
+    """Opinions of an idea, at any depth, indexed by the identifier of their
+    parent so the tree can be navigated in memory.
+    """
+
+    def __init__(self, idea_id: str, opinions: list[Opinion] | None = None):
+        self.idea_id = idea_id
+        self.children: dict[str, list[Opinion]] = {}
+        for opinion in opinions or []:
+            self.add_opinion(opinion)
+
+    def __len__(self) -> int:
+        return sum(len(opinions) for opinions in self.children.values())
+
+    @staticmethod
+    def _get_parent_id(opinion: Opinion) -> str:
+        """Returns the identifier of the parent, which may be loaded or not"""
+        return getattr(opinion.parent, "identifier", opinion.parent)
+
+    def add_opinion(self, opinion: Opinion) -> None:
+        """Adds an opinion after the other opinions of its parent"""
+        self.children.setdefault(self._get_parent_id(opinion), []).append(opinion)
+
+    def get_opinions(self, parent_id: str) -> list[Opinion]:
+        """Returns the opinions of an idea or an opinion of the discussion"""
+        return self.children.get(parent_id, [])
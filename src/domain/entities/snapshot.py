@@ -0,0 +1,51 @@
+class Snapshot:
+    """Frozen copy of a community database, sent to a new member by chunks.
+
+    The sources are the nodes holding the snapshot, that a new member can
+    reconnect to in order to resume an interrupted transfer.
+    """
+
+    def __init__(
+        self,
+        identifier: str,
+        community_id: str,
+        content_hash: str,
+        chunk_count: int,
+        sources: list[tuple[str, int]] | None = None,
+    ):
+        self.identifier = identifier
+        self.community_id = community_id
+        self.content_hash = content_hash
+        self.chunk_count = chunk_count
+        self.sources = sources or []
+
+    def __eq__(self, __value: object) -> bool:
+        if not isinstance(__value, Snapshot):
+            return False
+        return self.identifier == __value.identifier
+
+    def to_str(self) -> str:
+        """Returns a string representation of the snapshot."""
+        sources = ";".join(f"{ip_address}:{port}" for ip_address, port in self.sources)
+        return f"{self.identifier},{self.community_id},{self.content_hash},{self.chunk_count},{sources}"
+
+    @classmethod
+    def from_str(cls, __value: str) -> "Snapshot":
+        """Returns an instance of the Snapshot class from a string."""
+        identifier, community_id, content_hash, chunk_count, sources = __value.split(
+            ",", maxsplit=4
+        )
+        return cls(
+            identifier,
+            community_id,
+            content_hash,
+            int(chunk_count),
+            [
+                (ip_address, int(port))
+                for ip_address, port in (
+                    source.rsplit(":", maxsplit=1)
+                    for source in sources.split(";")
+                    if source
+                )
+            ],
+        )
@@ -0,0 +1,53 @@
+from src.application.interfaces.icommunity_repository import ICommunityRepository
+from src.domain.entities.community import Community
+from src.infrastructure.repositories.common.lru_cache import LruCache
+
+
+class CachedCommunityRepository(ICommunityRepository):
+    """Read-through cache in front of a community repository.
+
+    The lookups of a community (the community itself, the authentication
+    key and the encryption key path) are read once then served from the
+    cache; adding a community invalidates its entries.
+    """
+
+    def __init__(self, repository: ICommunityRepository, max_entries: int = 256):
+        self.repository = repository
+        self.cache = LruCache(max_entries)
+
+    def initialize_if_not_exists(self, target_database: str):
+        self.repository.initialize_if_not_exists(target_database)
+
+    def add_community(
+        self, community: Community, member_auth_key: str, encryption_key_path: str
+    ) -> None:
+        try:
+            self.repository.add_community(
+                community, member_auth_key, encryption_key_path
+            )
+        finally:
+            self.cache.invalidate(community.identifier)
+
+    def get_community(self, community_id: str) -> None | Community:
+        return self.cache.get(
+            community_id,
+            "community",
+            lambda: self.repository.get_community(community_id),
+        )
+
+    def get_communities(self) -> list[Community]:
+        return self.repository.get_communities()
+
+    def get_authentication_key_for_community(self, community_id: str) -> str:
+        return self.cache.get(
+            community_id,
+            "authentication_key",
+            lambda: self.repository.get_authentication_key_for_community(community_id),
+        )
+
+    def get_community_encryption_key_path(self, community_id: str) -> str:
+        return self.cache.get(
+            community_id,
+            "encryption_key_path",
+            lambda: self.repository.get_community_encryption_key_path(community_id),
+        )
@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import Literal
+
+from src.application.interfaces.imember_repository import IMemberRepository
+from src.domain.entities.member import Member
+from src.infrastructure.repositories.common.lru_cache import LruCache
+
+
+class CachedMemberRepository(IMemberRepository):
+    """Read-through cache in front of a member repository.
+
+    The member lookups (by authentication key or ip address, unknown members
+    included) are served from the cache. Every write to the members of a
+    community, the inbound ADD_MEMBER saves included, invalidates the
+    entries of the community once it is done.
+    """
+
+    def __init__(self, repository: IMemberRepository, max_entries: int = 4096):
+        self.repository = repository
+        self.cache = LruCache(max_entries)
+
+    def initialize_if_not_exists(self, target_database: str):
+        self.repository.initialize_if_not_exists(target_database)
+
+    def add_member_to_community(
+        self,
+        community_id: str,
+        member: Member,
+        relationship: Literal["parent", "child"] | None = None,
+    ) -> None:
+        try:
+            self.repository.add_member_to_community(community_id, member, relationship)
+        finally:
+            self.cache.invalidate(community_id)
+
+    def add_members_bulk(
+        self,
+        community_id: str,
+        members: list[Member],
+        relationship: Literal["parent", "child"] | None = None,
+    ) -> int:
+        try:
+            return self.repository.add_members_bulk(community_id, members, relationship)
+        finally:
+            self.cache.invalidate(community_id)
+
+    def clear_members_relationship(
+        self,
+        community_id: str,
+    ) -> None:
+        try:
+            self.repository.clear_members_relationship(community_id)
+        finally:
+            self.cache.invalidate(community_id)
+
+    def update_member_relationship(
+        self,
+        community_id: str,
+        auth_key: str,
+        relationship: Literal["parent", "child"] | None,
+    ):
+        try:
+            self.repository.update_member_relationship(
+                community_id, auth_key, relationship
+            )
+        finally:
+            self.cache.invalidate(community_id)
+
+    def get_member_for_community(
+        self,
+        community_id: str,
+        member_auth_key: str | None = None,
+        ip_address: str | None = None,
+    ) -> Member | None:
+        return self.cache.get(
+            community_id,
+            (member_auth_key, ip_address),
+            lambda: self.repository.get_member_for_community(
+                community_id, member_auth_key, ip_address
+            ),
+        )
+
+    def get_members_from_community(
+        self, community_id: str, is_related: bool = False
+    ) -> list[Member]:
+        return self.repository.get_members_from_community(community_id, is_related)
+
+    def get_older_members_from_community(
+        self, community_id: str, date: datetime
+    ) -> list[Member]:
+        return self.repository.get_older_members_from_community(community_id, date)
@@ -0,0 +1,77 @@
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+
+# Schema of the community databases, shared by the member, idea and opinion
+# repositories. Version 1 is the schema created before versioning, so its
+# statements must stay idempotent. Version 2 indexes the columns filtered on
+# by the lookups (parent of a message, address and relationship of a member)
+# and the member creation date they are sorted on. Only the few related
+# members are indexed on their relationship. Version 3 extends the index on
+# the parent of a message with the creation date and identifier, the order
+# the messages are paginated in. Version 4 adds the full-text index of the
+# messages, kept up to date by triggers. The messages written before it are
+# indexed afterwards by batches, up to the rowid recorded in messages_fts_backlog,
+# so that migrating a large database does not hold the write lock for long.
+COMMUNITY_SCHEMA = SqliteSchema(
+    [
+        (
+            """CREATE TABLE IF NOT EXISTS nodes_relationships (
+                relationship_id TEXT CONSTRAINT nodes_relationships_pk PRIMARY KEY
+            );""",
+            """CREATE TABLE IF NOT EXISTS nodes (
+                authentication_key TEXT CONSTRAINT nodes_pk PRIMARY KEY,
+                ip_address TEXT NOT NULL,
+                port INTEGER NOT NULL,
+                creation_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+                last_connection_date DATE,
+                relationship_id TEXT CONSTRAINT nodes_fk REFERENCES nodes_relationships
+            );""",
+            """INSERT OR IGNORE INTO nodes_relationships (relationship_id)
+                VALUES ('parent'), ('child');""",
+            """CREATE TABLE IF NOT EXISTS messages (
+                identifier TEXT CONSTRAINT messages_pk PRIMARY KEY,
+                author TEXT NOT NULL REFERENCES nodes(authentication_key),
+                content TEXT NOT NULL,
+                parent_message TEXT REFERENCES messages(identifier) ON DELETE CASCADE,
+                creation_date DATETIME DEFAULT CURRENT_TIMESTAMP
+            );""",
+        ),
+        (
+            """CREATE INDEX IF NOT EXISTS messages_parent_message_idx
+                ON messages(parent_message);""",
+            """CREATE INDEX IF NOT EXISTS nodes_ip_address_idx
+                ON nodes(ip_address);""",
+            """CREATE INDEX IF NOT EXISTS nodes_creation_date_idx
+                ON nodes(creation_date);""",
+            """CREATE INDEX IF NOT EXISTS nodes_relationship_id_idx
+                ON nodes(relationship_id) WHERE relationship_id IS NOT NULL;""",
+        ),
+        (
+            """DROP INDEX IF EXISTS messages_parent_message_idx;""",
+            """CREATE INDEX IF NOT EXISTS messages_parent_creation_idx
+                ON messages(parent_message, creation_date, identifier);""",
+        ),
+        (
+            """CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+                USING fts5(content, tokenize = 'unicode61 remove_diacritics 2');""",
+            """CREATE TRIGGER IF NOT EXISTS messages_fts_insert
+                AFTER INSERT ON messages BEGIN
+                    INSERT INTO messages_fts(rowid, content)
+                        VALUES (new.rowid, new.content);
+                END;""",
+            """CREATE TRIGGER IF NOT EXISTS messages_fts_delete
+                AFTER DELETE ON messages BEGIN
+                    DELETE FROM messages_fts WHERE rowid = old.rowid;
+                END;""",
+            """CREATE TRIGGER IF NOT EXISTS messages_fts_update
+                AFTER UPDATE OF content ON messages BEGIN
+                    UPDATE messages_fts SET content = new.content
+                        WHERE rowid = old.rowid;
+                END;""",
+            """CREATE TABLE IF NOT EXISTS messages_fts_backlog (
+                last_rowid INTEGER NOT NULL
+            );""",
+            """INSERT INTO messages_fts_backlog (last_rowid)
+                SELECT max(rowid) FROM messages HAVING max(rowid) IS NOT NULL;""",
+        ),
+    ]
+)
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+import threading
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class LruCache:
+    """Size-bounded cache of the values read from a repository.
+
+    The entries are grouped by namespace (the community id) so that a write
+    invalidates every entry of its community at once. Each invalidation
+    bumps the generation of the namespace: a value loaded while the
+    namespace was invalidated is returned but not kept, since it may have
+    been read before the write.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple[str, Hashable], object] = OrderedDict()
+        self.namespaces: dict[str, set[Hashable]] = {}
+        self.generations: dict[str, int] = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, namespace: str, key: Hashable, loader: Callable[[], T]) -> T:
+        """Returns the cached value, or loads and keeps it"""
+        with self.lock:
+            value = self.entries.get((namespace, key), _MISSING)
+            if value is not _MISSING:
+                self.entries.move_to_end((namespace, key))
+                self.hits += 1
+                return value
+            self.misses += 1
+            generation = self._get_generation(namespace)
+
+        value = loader()
+
+        with self.lock:
+            if self._get_generation(namespace) == generation:
+                self._put(namespace, key, value)
+        return value
+
+    def _get_generation(self, namespace: str) -> tuple[int, int]:
+        """Returns the generation of the cache and of the namespace"""
+        return self.generation, self.generations.get(namespace, 0)
+
+    def _put(self, namespace: str, key: Hashable, value: object):
+        """Keeps the value, evicting the least recently used entries"""
+        self.entries[(namespace, key)] = value
+        self.entries.move_to_end((namespace, key))
+        self.namespaces.setdefault(namespace, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            (evicted_namespace, evicted_key), _ = self.entries.popitem(last=False)
+            keys = self.namespaces[evicted_namespace]
+            keys.discard(evicted_key)
+            if not keys:
+                del self.namespaces[evicted_namespace]
+
+    def invalidate(self, namespace: str):
+        """Drops the entries of the namespace"""
+        with self.lock:
+            self.generations[namespace] = self.generations.get(namespace, 0) + 1
+            for key in self.namespaces.pop(namespace, ()):
+                del self.entries[(namespace, key)]
+
+    def clear(self):
+        """Drops every entry"""
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.namespaces.clear()
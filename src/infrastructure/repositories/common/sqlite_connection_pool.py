@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+import sqlite3
+import threading
+from typing import Iterator
+
+
+class SqliteConnectionPool:
+    """Pool of sqlite connections, kept open per database file.
+
+    Connections are opened in WAL mode, so readers (the menus) do not wait
+    for the writers (the server workers) and a commit does not rewrite the
+    database file. A connection is checked out by one thread at a time, at
+    most max_connections per database.
+    """
+
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL;",
+        "PRAGMA synchronous=NORMAL;",
+        "PRAGMA cache_size=-8192;",
+    )
+
+    def __init__(self, max_connections: int = 4, timeout: float = 5):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.idle_connections: dict[str, list[sqlite3.Connection]] = {}
+        self.semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self.lock = threading.Lock()
+        self.closed = False
+
+    @contextmanager
+    def connection(self, database_path: str) -> Iterator[sqlite3.Connection]:
+        """Checks out a connection to the database, rolled back on error"""
+        with self._get_semaphore(database_path):
+            connection = self._checkout(database_path)
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                self._release(database_path, connection)
+
+    def close(self):
+        """Closes the idle connections; the others are closed when released"""
+        with self.lock:
+            self.closed = True
+            connections = [
+                connection
+                for idle_connections in self.idle_connections.values()
+                for connection in idle_connections
+            ]
+            self.idle_connections.clear()
+
+        for connection in connections:
+            connection.close()
+
+    def _get_semaphore(self, database_path: str) -> threading.BoundedSemaphore:
+        """Returns the semaphore bounding the connections to the database"""
+        with self.lock:
+            if database_path not in self.semaphores:
+                self.semaphores[database_path] = threading.BoundedSemaphore(
+                    self.max_connections
+                )
+            return self.semaphores[database_path]
+
+    def _checkout(self, database_path: str) -> sqlite3.Connection:
+        """Returns an idle connection to the database, or a new one"""
+        with self.lock:
+            idle_connections = self.idle_connections.get(database_path)
+            if idle_connections:
+                return idle_connections.pop()
+
+        connection = sqlite3.connect(
+            database_path, timeout=self.timeout, check_same_thread=False
+        )
+        for pragma in self.PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    def _release(self, database_path: str, connection: sqlite3.Connection):
+        """Gives the connection back to the pool"""
+        with self.lock:
+            if not self.closed:
+                self.idle_connections.setdefault(database_path, []).append(connection)
+                return
+
+        connection.close()
@@ -1,44 +1,77 @@
 from abc import ABC
-import re
-import sqlite3
+
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+from src.infrastructure.repositories.common.sqlite_statement_registry import (
+    SqliteStatementRegistry,
+)
 
 
 class SqliteRepository(ABC):
     """Base class for all sqlite repositories"""
 
-    def __init__(self, base_path: str):
+    # Schema of the target databases, migrated before their first statement.
+    SCHEMA: SqliteSchema | None = None
+
+    # Normalized statements, shared by every repository.
+    STATEMENTS = SqliteStatementRegistry()
+
+    def __init__(
+        self, base_path: str, connection_pool: SqliteConnectionPool | None = None
+    ):
         self.base_path = base_path
+        self.connection_pool = connection_pool or SqliteConnectionPool()
+
+    def _get_database_path(self, target_database: str) -> str:
+        """Returns the path of the target database"""
+        return f"{self.base_path}/{target_database}.sqlite"
 
-    def _query_cleaner(self, query: str) -> str:
-        """Clean query"""
-        query = query.strip()
-        query = query.replace("\n", " ")
-        query = query.replace("\t", " ")
-        query = re.sub(" +", " ", query)
-        return query
+    def _ensure_schema(self, target_database: str) -> None:
+        """Migrates the target database to the latest schema, once per process"""
+        if self.SCHEMA is not None:
+            self.SCHEMA.ensure_ready(
+                self.connection_pool, self._get_database_path(target_database)
+            )
 
     def _execute_statement(
         self, target_database: str, statement: str, parameters: tuple = ()
     ) -> None:
         """Execute a statement on the target database"""
-        statement = self._query_cleaner(statement)
+        statement = self.STATEMENTS.get(statement)
+        self._ensure_schema(target_database)
 
-        with sqlite3.connect(
-            f"{self.base_path}/{target_database}.sqlite"
-        ) as index_connection:
-            index_cursor = index_connection.cursor()
-            index_cursor.execute(statement, parameters)
-            index_connection.commit()
+        with self.connection_pool.connection(
+            self._get_database_path(target_database)
+        ) as connection:
+            connection.execute(statement, parameters)
+            connection.commit()
+
+    def _execute_many(
+        self, target_database: str, statement: str, parameters: list[tuple]
+    ) -> int:
+        """Execute a statement for each parameters in a single transaction.
+        Returns the number of modified rows.
+        """
+        statement = self.STATEMENTS.get(statement)
+        self._ensure_schema(target_database)
+
+        with self.connection_pool.connection(
+            self._get_database_path(target_database)
+        ) as connection:
+            cursor = connection.executemany(statement, parameters)
+            connection.commit()
+            return cursor.rowcount
 
     def _execute_query(
         self, target_database: str, statement: str, parameters: tuple = ()
     ) -> list:
         """Execute a query on the target database"""
-        statement = self._query_cleaner(statement)
-
-        with sqlite3.connect(
-            f"{self.base_path}/{target_database}.sqlite"
-        ) as index_connection:
-            index_cursor = index_connection.cursor()
-            result = index_cursor.execute(statement, parameters)
-            return result.fetchall()
+        statement = self.STATEMENTS.get(statement)
+        self._ensure_schema(target_database)
+
+        with self.connection_pool.connection(
+            self._get_database_path(target_database)
+        ) as connection:
+            return connection.execute(statement, parameters).fetchall()
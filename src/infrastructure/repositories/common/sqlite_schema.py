@@ -0,0 +1,51 @@
+import threading
+
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+
+
+class SqliteSchema:
+    """Versioned schema of a kind of sqlite database.
+
+    Each migration is a list of statements bringing a database from its
+    position in the list to the next version; the version of a database is
+    kept in its user_version pragma. Migrations are part of the database
+    format: never edit them, only append.
+
+    A database is migrated the first time it is used by the process, then
+    remembered as ready, so the next statements run without any check.
+    """
+
+    def __init__(self, migrations: list[tuple[str, ...]]):
+        self.migrations = migrations
+        self.ready_databases: set[str] = set()
+        self.lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """Returns the latest version of the schema"""
+        return len(self.migrations)
+
+    def ensure_ready(self, connection_pool: SqliteConnectionPool, database_path: str):
+        """Migrates the database to the latest version, once per process"""
+        if database_path in self.ready_databases:
+            return
+
+        with self.lock:
+            if database_path in self.ready_databases:
+                return
+
+            with connection_pool.connection(database_path) as connection:
+                # The write lock is taken before reading the version, so
+                # another process cannot migrate the database at the same time.
+                connection.execute("BEGIN IMMEDIATE;")
+                (version,) = connection.execute("PRAGMA user_version;").fetchone()
+                for migration in self.migrations[version:]:
+                    for statement in migration:
+                        connection.execute(statement)
+                if version < self.version:
+                    connection.execute(f"PRAGMA user_version = {self.version};")
+                connection.commit()
+
+            self.ready_databases.add(database_path)
@@ -0,0 +1,38 @@
+import re
+import threading
+
+
+class SqliteStatementRegistry:
+    """Normalized SQL texts, keyed by the text written in the repositories.
+
+    A statement is normalized (stripped, whitespace collapsed) the first
+    time it is executed; the next executions only look it up. The same
+    normalized text is then passed to sqlite3 each time, so the statement
+    cache of the pooled connections reuses the compiled statement.
+    """
+
+    def __init__(self, max_statements: int = 512):
+        self.max_statements = max_statements
+        self.statements: dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def get(self, statement: str) -> str:
+        """Returns the normalized text of the statement"""
+        normalized_statement = self.statements.get(statement)
+        if normalized_statement is not None:
+            return normalized_statement
+
+        normalized_statement = self.normalize(statement)
+        with self.lock:
+            # Statements built at runtime are normalized, but not kept forever.
+            if len(self.statements) < self.max_statements:
+                self.statements[statement] = normalized_statement
+        return normalized_statement
+
+    @staticmethod
+    def normalize(statement: str) -> str:
+        """Returns the statement on one line, without repeated spaces"""
+        statement = statement.strip()
+        statement = statement.replace("\n", " ")
+        statement = statement.replace("\t", " ")
+        return re.sub(" +", " ", statement)
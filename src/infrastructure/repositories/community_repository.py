@@ -1,7 +1,11 @@
 from datetime import datetime
 import sqlite3
 
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
 from src.infrastructure.repositories.common.sqlite_repository import SqliteRepository
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
 from src.application.exceptions.community_already_exists_error import (
     CommunityAlreadyExistsError,
 )
@@ -14,22 +18,29 @@ class CommunityRepository(ICommunityRepository, SqliteRepository):
 
     index_database = "index"
 
-    def __init__(self, base_path: str):
-        super().__init__(base_path)
+    SCHEMA = SqliteSchema(
+        [
+            (
+                """CREATE TABLE IF NOT EXISTS communities (
+                    identifier TEXT CONSTRAINT communities_pk PRIMARY KEY ,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    creation_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    auth_key TEXT NOT NULL,
+                    encryption_key_path TEXT NOT NULL
+                );""",
+            ),
+        ]
+    )
+
+    def __init__(
+        self, base_path: str, connection_pool: SqliteConnectionPool | None = None
+    ):
+        super().__init__(base_path, connection_pool)
         self.initialize_if_not_exists(CommunityRepository.index_database)
 
     def initialize_if_not_exists(self, target_database: str):
-        self._execute_statement(
-            target_database,
-            """CREATE TABLE IF NOT EXISTS communities (
-                identifier TEXT CONSTRAINT communities_pk PRIMARY KEY ,
-                name TEXT NOT NULL,
-                description TEXT,
-                creation_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                auth_key TEXT NOT NULL,
-                encryption_key_path TEXT NOT NULL
-            );""",
-        )
+        self._ensure_schema(target_database)
 
     def add_community(
         self, community: Community, member_auth_key: str, encryption_key_path: str
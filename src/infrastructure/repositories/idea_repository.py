@@ -1,4 +1,5 @@
 from datetime import datetime
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
 from src.infrastructure.repositories.common.sqlite_repository import SqliteRepository
 from src.application.interfaces.iidea_repository import IIdeaRepository
 from src.domain.entities.idea import Idea
@@ -7,42 +8,60 @@ from src.domain.entities.idea import Idea
 class IdeaRepository(IIdeaRepository, SqliteRepository):
     """Idea repository"""
 
+    SCHEMA = COMMUNITY_SCHEMA
+
     def initialize_if_not_exists(self, target_database: str) -> None:
-        self._execute_statement(
-            target_database,
-            """CREATE TABLE IF NOT EXISTS messages (
-                identifier TEXT CONSTRAINT messages_pk PRIMARY KEY,
-                author TEXT NOT NULL REFERENCES nodes(authentication_key),
-                content TEXT NOT NULL,
-                parent_message TEXT REFERENCES messages(identifier) ON DELETE CASCADE,
-                creation_date DATETIME DEFAULT CURRENT_TIMESTAMP
-            );""",
-        )
+        self._ensure_schema(target_database)
 
-    def add_idea_to_community(self, community_id: str, idea: Idea) -> None:
-        self.initialize_if_not_exists(community_id)
+    INSERT_STATEMENT = """INSERT {}INTO messages(
+        identifier,
+        content,
+        creation_date,
+        author,
+        parent_message
+    ) VALUES (?, ?, ?, ?, ?);"""
 
+    @staticmethod
+    def _to_row(idea: Idea) -> tuple:
+        """Validates the idea and returns its row"""
         if len(idea.content) < Idea.CONTENT_MIN_LENGTH:
             raise ValueError(
                 f"Content must be at least {Idea.CONTENT_MIN_LENGTH} characters long."
             )
 
-        self._execute_statement(
-            community_id,
-            """INSERT INTO messages(
+        return (
+            idea.identifier,
+            idea.content,
+            str(idea.creation_date),
+            idea.author.authentication_key,
+            None,
+        )
+
+    @staticmethod
+    def _build_ideas_list(result: list) -> list[Idea]:
+        """Build an idea list from result"""
+        return [
+            Idea(
                 identifier,
                 content,
-                creation_date,
                 author,
-                parent_message
-            ) VALUES (?, ?, ?, ?, ?);""",
-            (
-                idea.identifier,
-                idea.content,
-                str(idea.creation_date),
-                idea.author.authentication_key,
-                None,
-            ),
+                datetime.fromisoformat(creation_date),
+            )
+            for identifier, content, creation_date, author in result
+        ]
+
+    def add_idea_to_community(self, community_id: str, idea: Idea) -> None:
+        self._execute_statement(
+            community_id, self.INSERT_STATEMENT.format(""), self._to_row(idea)
+        )
+
+    def add_ideas_bulk(self, community_id: str, ideas: list[Idea]) -> int:
+        rows = [self._to_row(idea) for idea in ideas]
+        if len(rows) == 0:
+            return 0
+
+        return self._execute_many(
+            community_id, self.INSERT_STATEMENT.format("OR IGNORE "), rows
         )
 
     def get_ideas_by_community(self, community_id: str) -> list[Idea]:
@@ -57,15 +76,33 @@ class IdeaRepository(IIdeaRepository, SqliteRepository):
             WHERE parent_message IS NULL;""",
         )
 
-        return [
-            Idea(
+        return self._build_ideas_list(result)
+
+    def get_ideas_page(
+        self, community_id: str, page_size: int, after: Idea | None = None
+    ) -> list[Idea]:
+        condition, parameters = "", ()
+        if after is not None:
+            condition = " AND (creation_date, identifier) > (?, ?)"
+            parameters = (str(after.creation_date), after.identifier)
+
+        result = self._execute_query(
+            community_id,
+            """SELECT
                 identifier,
                 content,
-                author,
-                datetime.fromisoformat(creation_date),
-            )
-            for identifier, content, creation_date, author in result
-        ]
+                creation_date,
+                author
+            FROM messages
+            WHERE parent_message IS NULL"""
+            + condition
+            + """
+            ORDER BY creation_date, identifier
+            LIMIT ?;""",
+            (*parameters, page_size),
+        )
+
+        return self._build_ideas_list(result)
 
     def get_idea_from_community(self, community_id: str, idea_id: str) -> Idea | None:
         result = self._execute_query(
@@ -2,6 +2,7 @@ from datetime import datetime
 import sqlite3
 from typing import Literal
 
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
 from src.infrastructure.repositories.common.sqlite_repository import SqliteRepository
 from src.application.exceptions.member_already_exists_error import (
     MemberAlreadyExistsError,
@@ -13,30 +14,10 @@ from src.domain.entities.member import Member
 class MemberRepository(IMemberRepository, SqliteRepository):
     """Sqlite implementation of the member repository class"""
 
+    SCHEMA = COMMUNITY_SCHEMA
+
     def initialize_if_not_exists(self, target_database: str):
-        self._execute_statement(
-            target_database,
-            """CREATE TABLE IF NOT EXISTS nodes_relationships (
-                relationship_id TEXT CONSTRAINT nodes_relationships_pk PRIMARY KEY
-            );""",
-        )
-        self._execute_statement(
-            target_database,
-            """CREATE TABLE IF NOT EXISTS nodes (
-                authentication_key TEXT CONSTRAINT nodes_pk PRIMARY KEY,
-                ip_address TEXT NOT NULL,
-                port INTEGER NOT NULL,
-                creation_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-                last_connection_date DATE,
-                relationship_id TEXT CONSTRAINT nodes_fk REFERENCES nodes_relationships
-            );""",
-        )
-        self._execute_statement(
-            target_database,
-            """INSERT OR IGNORE INTO nodes_relationships (relationship_id)
-                VALUES ('parent'), ('child');
-            """,
-        )
+        self._ensure_schema(target_database)
 
     def _build_members_list(self, result: list) -> list[Member]:
         """Build a member list from result"""
@@ -64,48 +45,68 @@ class MemberRepository(IMemberRepository, SqliteRepository):
 
         return members
 
+    INSERT_STATEMENT = """INSERT {}INTO nodes (
+        authentication_key,
+        ip_address,
+        port,
+        creation_date,
+        last_connection_date,
+        relationship_id
+    ) VALUES (?, ?, ?, ?, ?, ?);"""
+
+    @staticmethod
+    def _to_row(
+        member: Member, relationship: Literal["parent", "child"] | None
+    ) -> tuple:
+        """Returns the row of the member"""
+        return (
+            member.authentication_key,
+            member.ip_address,
+            member.port,
+            member.creation_date.isoformat(),
+            (
+                member.last_connection_date.isoformat()
+                if member.last_connection_date is not None
+                else None
+            ),
+            relationship,
+        )
+
     def add_member_to_community(
         self,
         community_id: str,
         member: Member,
         relationship: Literal["parent", "child"] | None = None,
     ) -> None:
-        self.initialize_if_not_exists(community_id)
-
         try:
             self._execute_statement(
                 community_id,
-                """INSERT INTO nodes (
-                    authentication_key,
-                    ip_address,
-                    port,
-                    creation_date,
-                    last_connection_date,
-                    relationship_id
-                ) VALUES (?, ?, ?, ?, ?, ?);""",
-                (
-                    member.authentication_key,
-                    member.ip_address,
-                    member.port,
-                    member.creation_date.isoformat(),
-                    (
-                        member.last_connection_date.isoformat()
-                        if member.last_connection_date is not None
-                        else None
-                    ),
-                    relationship,
-                ),
+                self.INSERT_STATEMENT.format(""),
+                self._to_row(member, relationship),
             )
         except sqlite3.IntegrityError as error:
             if "UNIQUE constraint failed: nodes.authentication_key" in str(error):
                 raise MemberAlreadyExistsError(error) from error
 
+    def add_members_bulk(
+        self,
+        community_id: str,
+        members: list[Member],
+        relationship: Literal["parent", "child"] | None = None,
+    ) -> int:
+        if len(members) == 0:
+            return 0
+
+        return self._execute_many(
+            community_id,
+            self.INSERT_STATEMENT.format("OR IGNORE "),
+            [self._to_row(member, relationship) for member in members],
+        )
+
     def clear_members_relationship(
         self,
         community_id: str,
     ) -> None:
-        self.initialize_if_not_exists(community_id)
-
         self._execute_statement(
             community_id,
             """UPDATE nodes SET relationship_id = NULL;""",
@@ -117,8 +118,6 @@ class MemberRepository(IMemberRepository, SqliteRepository):
         auth_key: str,
         relationship: Literal["parent", "child"] | None,
     ) -> None:
-        self.initialize_if_not_exists(community_id)
-
         self._execute_statement(
             community_id,
             """UPDATE nodes
@@ -133,8 +132,6 @@ class MemberRepository(IMemberRepository, SqliteRepository):
         member_auth_key: str | None = None,
         ip_address: str | None = None,
     ) -> Member | None:
-        self.initialize_if_not_exists(community_id)
-
         if member_auth_key is None and ip_address is None:
             raise ValueError("Either member_auth_key or ip_address must be specified")
 
@@ -173,7 +170,6 @@ class MemberRepository(IMemberRepository, SqliteRepository):
         self, community_id: str, is_related: bool = False
     ) -> list[Member]:
         """Get all members from a community."""
-        self.initialize_if_not_exists(community_id)
 
         statement = """SELECT
             authentication_key,
@@ -195,8 +191,6 @@ class MemberRepository(IMemberRepository, SqliteRepository):
     def get_older_members_from_community(
         self, community_id: str, date: datetime
     ) -> list[Member]:
-        self.initialize_if_not_exists(community_id)
-
         result = self._execute_query(
             community_id,
             """SELECT
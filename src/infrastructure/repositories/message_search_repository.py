@@ -0,0 +1,129 @@
+from datetime import datetime
+import re
+
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
+from src.infrastructure.repositories.common.sqlite_repository import SqliteRepository
+from src.application.interfaces.imessage_search_repository import (
+    IMessageSearchRepository,
+)
+from src.domain.entities.idea import Idea
+from src.domain.entities.opinion import Opinion
+
+
+class MessageSearchRepository(IMessageSearchRepository, SqliteRepository):
+    """Full-text search of the messages, backed by the FTS5 index.
+
+    Ranking every match of a common word takes as long as the matches are
+    many, so only the most recent matches (MAX_RANKED_MATCHES) are ranked:
+    a search keeps a bounded duration whatever the size of the community.
+    """
+
+    SCHEMA = COMMUNITY_SCHEMA
+
+    MAX_RANKED_MATCHES = 1000
+
+    WORD_PATTERN = re.compile(r"\w+")
+
+    def initialize_if_not_exists(self, target_database: str):
+        self._ensure_schema(target_database)
+
+    @classmethod
+    def _build_match_expression(cls, text: str) -> str | None:
+        """Builds the FTS5 expression matching every word of the text,
+        the last one being a prefix
+        """
+        words = cls.WORD_PATTERN.findall(text)
+        if len(words) == 0:
+            return None
+
+        return " ".join(f'"{word}"' for word in words) + "*"
+
+    def search_messages(
+        self, community_id: str, text: str, limit: int, offset: int = 0
+    ) -> list[Idea | Opinion]:
+        expression = self._build_match_expression(text)
+        if expression is None:
+            return []
+
+        result = self._execute_query(
+            community_id,
+            """SELECT
+                messages.identifier,
+                messages.content,
+                messages.creation_date,
+                messages.author,
+                messages.parent_message
+            FROM (
+                SELECT rowid, rank FROM messages_fts
+                WHERE messages_fts MATCH ?
+                ORDER BY rowid DESC
+                LIMIT ?
+            ) AS matches
+            JOIN messages ON messages.rowid = matches.rowid
+            ORDER BY matches.rank
+            LIMIT ? OFFSET ?;""",
+            (expression, self.MAX_RANKED_MATCHES, limit, offset),
+        )
+
+        return [
+            (
+                Idea(identifier, content, author, datetime.fromisoformat(creation_date))
+                if parent_message is None
+                else Opinion(
+                    identifier,
+                    content,
+                    author,
+                    datetime.fromisoformat(creation_date),
+                    parent_message,
+                )
+            )
+            for identifier, content, creation_date, author, parent_message in result
+        ]
+
+    def index_messages(self, community_id: str, batch_size: int) -> bool:
+        self._ensure_schema(community_id)
+
+        # The backlog is indexed from the most recent messages, each batch in
+        # its own short transaction.
+        with self.connection_pool.connection(
+            self._get_database_path(community_id)
+        ) as connection:
+            backlog = connection.execute(
+                "SELECT last_rowid FROM messages_fts_backlog;"
+            ).fetchone()
+            if backlog is None:
+                return False
+
+            lowest = connection.execute(
+                self.STATEMENTS.get(
+                    """SELECT rowid FROM messages
+                    WHERE rowid <= ?
+                    ORDER BY rowid DESC
+                    LIMIT 1 OFFSET ?;"""
+                ),
+                (backlog[0], batch_size - 1),
+            ).fetchone()
+            # Messages inserted since the migration may reuse a rowid of the
+            # backlog, they are already indexed by the trigger.
+            connection.execute(
+                self.STATEMENTS.get(
+                    """INSERT INTO messages_fts(rowid, content)
+                    SELECT rowid, content FROM messages
+                    WHERE rowid BETWEEN ? AND ?
+                    AND NOT EXISTS (
+                        SELECT 1 FROM messages_fts
+                        WHERE messages_fts.rowid = messages.rowid
+                    );"""
+                ),
+                (lowest[0] if lowest is not None else -(1 << 63), backlog[0]),
+            )
+            if lowest is None:
+                connection.execute("DELETE FROM messages_fts_backlog;")
+            else:
+                connection.execute(
+                    "UPDATE messages_fts_backlog SET last_rowid = ?;",
+                    (lowest[0] - 1,),
+                )
+            connection.commit()
+
+        return lowest is not None
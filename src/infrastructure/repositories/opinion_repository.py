@@ -1,4 +1,5 @@
 from datetime import datetime
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
 from src.infrastructure.repositories.common.sqlite_repository import SqliteRepository
 from src.application.interfaces.iopinion_repository import IOpinionRepository
 from src.domain.entities.opinion import Opinion
@@ -7,42 +8,61 @@ from src.domain.entities.opinion import Opinion
 class OpinionRepository(IOpinionRepository, SqliteRepository):
     """Opinion repository"""
 
+    SCHEMA = COMMUNITY_SCHEMA
+
     def initialize_if_not_exists(self, target_database: str):
-        self._execute_statement(
-            target_database,
-            """CREATE TABLE IF NOT EXISTS messages (
-                identifier TEXT CONSTRAINT messages_pk PRIMARY KEY,
-                author TEXT NOT NULL REFERENCES nodes(authentication_key),
-                content TEXT NOT NULL,
-                parent_message TEXT REFERENCES messages(identifier) ON DELETE CASCADE,
-                creation_date DATETIME DEFAULT CURRENT_TIMESTAMP
-            );""",
-        )
+        self._ensure_schema(target_database)
 
-    def add_opinion_to_community(self, community_id: str, opinion: Opinion) -> None:
-        self.initialize_if_not_exists(community_id)
+    INSERT_STATEMENT = """INSERT {}INTO messages(
+        identifier,
+        content,
+        creation_date,
+        author,
+        parent_message
+    ) VALUES (?, ?, ?, ?, ?);"""
 
+    @staticmethod
+    def _to_row(opinion: Opinion) -> tuple:
+        """Validates the opinion and returns its row"""
         if len(opinion.content) < Opinion.CONTENT_MIN_LENGTH:
             raise ValueError(
                 f"Opinion content must be at least {Opinion.CONTENT_MIN_LENGTH} characters long."
             )
 
-        self._execute_statement(
-            community_id,
-            """INSERT INTO messages(
+        return (
+            opinion.identifier,
+            opinion.content,
+            str(opinion.creation_date),
+            opinion.author.authentication_key,
+            opinion.parent.identifier,
+        )
+
+    @staticmethod
+    def _build_opinions_list(result: list) -> list[Opinion]:
+        """Build an opinion list from result"""
+        return [
+            Opinion(
                 identifier,
                 content,
-                creation_date,
                 author,
-                parent_message
-            ) VALUES (?, ?, ?, ?, ?);""",
-            (
-                opinion.identifier,
-                opinion.content,
-                str(opinion.creation_date),
-                opinion.author.authentication_key,
-                opinion.parent.identifier,
-            ),
+                datetime.fromisoformat(creation_date),
+                parent_message,
+            )
+            for identifier, content, creation_date, author, parent_message in result
+        ]
+
+    def add_opinion_to_community(self, community_id: str, opinion: Opinion) -> None:
+        self._execute_statement(
+            community_id, self.INSERT_STATEMENT.format(""), self._to_row(opinion)
+        )
+
+    def add_opinions_bulk(self, community_id: str, opinions: list[Opinion]) -> int:
+        rows = [self._to_row(opinion) for opinion in opinions]
+        if len(rows) == 0:
+            return 0
+
+        return self._execute_many(
+            community_id, self.INSERT_STATEMENT.format("OR IGNORE "), rows
         )
 
     def get_opinions_by_parent(
@@ -61,16 +81,85 @@ class OpinionRepository(IOpinionRepository, SqliteRepository):
             (parent_id,),
         )
 
-        return [
-            Opinion(
+        return self._build_opinions_list(result)
+
+    def get_opinions_page(
+        self,
+        community_id: str,
+        parent_id: str,
+        page_size: int,
+        after: Opinion | None = None,
+    ) -> list[Opinion]:
+        condition, parameters = "", ()
+        if after is not None:
+            condition = " AND (creation_date, identifier) > (?, ?)"
+            parameters = (str(after.creation_date), after.identifier)
+
+        result = self._execute_query(
+            community_id,
+            """SELECT
                 identifier,
                 content,
+                creation_date,
+                author,
+                parent_message
+            FROM messages
+            WHERE parent_message = ?"""
+            + condition
+            + """
+            ORDER BY creation_date, identifier
+            LIMIT ?;""",
+            (parent_id, *parameters, page_size),
+        )
+
+        return self._build_opinions_list(result)
+
+    def get_opinions_subtree(
+        self, community_id: str, idea_id: str, max_depth: int | None = None
+    ) -> list[Opinion]:
+        result = self._execute_query(
+            community_id,
+            """WITH RECURSIVE subtree(
+                identifier,
+                content,
+                creation_date,
                 author,
-                datetime.fromisoformat(creation_date),
                 parent_message,
+                depth
+            ) AS (
+                SELECT
+                    identifier,
+                    content,
+                    creation_date,
+                    author,
+                    parent_message,
+                    1
+                FROM messages
+                WHERE parent_message = ?
+                UNION ALL
+                SELECT
+                    messages.identifier,
+                    messages.content,
+                    messages.creation_date,
+                    messages.author,
+                    messages.parent_message,
+                    subtree.depth + 1
+                FROM messages
+                JOIN subtree ON messages.parent_message = subtree.identifier
+                WHERE ? IS NULL OR subtree.depth < ?
             )
-            for identifier, content, creation_date, author, parent_message in result
-        ]
+            SELECT
+                identifier,
+                content,
+                creation_date,
+                author,
+                parent_message
+            FROM subtree
+            ORDER BY creation_date, identifier;""",
+            (idea_id, max_depth, max_depth),
+        )
+
+        return self._build_opinions_list(result)
 
     def get_opinion_from_community(
         self, community_id: str, opinion_id: str
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+import hashlib
+import threading
 from typing import Literal
 import rsa.key
 import rsa.pkcs1
@@ -9,7 +12,17 @@ from src.application.interfaces.iasymetric_encryption_service import (
 
 
 class AsymetricEncryptionService(IAsymetricEncryptionService):
-    """Asymetric Encryption Service"""
+    """Asymetric Encryption Service.
+
+    Parsing a PEM key is far slower than using it, so the parsed keys (the
+    private key of the node and the public keys of the peers) are kept by
+    fingerprint, up to max_keys of the most recently used.
+    """
+
+    def __init__(self, max_keys: int = 256):
+        self.max_keys = max_keys
+        self.keys: OrderedDict[tuple[str, str], PublicKey | PrivateKey] = OrderedDict()
+        self.lock = threading.Lock()
 
     def generate_keys(self) -> tuple[str, str]:
         public_key, private_key = rsa.key.newkeys(2048)
@@ -49,9 +62,27 @@ class AsymetricEncryptionService(IAsymetricEncryptionService):
     def _convert_to_key(
         self, key_string: str, key_type: Literal["public", "private"]
     ) -> PublicKey | PrivateKey:
-        """Convert string to key object"""
+        """Convert string to key object, parsed once per fingerprint"""
         key_bytes = key_string.encode()
+        fingerprint = (key_type, self.get_fingerprint(key_bytes))
+        with self.lock:
+            key = self.keys.get(fingerprint)
+            if key is not None:
+                self.keys.move_to_end(fingerprint)
+                return key
 
         if key_type == "public":
-            return PublicKey.load_pkcs1(key_bytes)
-        return PrivateKey.load_pkcs1(key_bytes)
+            key = PublicKey.load_pkcs1(key_bytes)
+        else:
+            key = PrivateKey.load_pkcs1(key_bytes)
+
+        with self.lock:
+            self.keys[fingerprint] = key
+            if len(self.keys) > self.max_keys:
+                self.keys.popitem(last=False)
+        return key
+
+    @staticmethod
+    def get_fingerprint(key_bytes: bytes) -> str:
+        """Returns the SHA-256 fingerprint of a PEM key"""
+        return hashlib.sha256(key_bytes).hexdigest()
@@ -2,22 +2,32 @@ from src.application.interfaces.icommunity_service import ICommunityService
 from src.application.interfaces.icommunity_repository import ICommunityRepository
 from src.application.interfaces.ifile_service import IFileService
 from src.application.interfaces.imember_repository import IMemberRepository
+from src.application.interfaces.ikeyring import IKeyring
 
 
 class CommunityService(ICommunityService):
-    """Manager for Community"""
+    """Manager for Community.
+
+    With a keyring, the symetric keys are served decoded from memory instead
+    of being read from their files.
+    """
 
     def __init__(
         self,
         community_repository: ICommunityRepository,
         member_repository: IMemberRepository,
         file_service: IFileService,
+        keyring: IKeyring | None = None,
     ):
         self.community_repository = community_repository
         self.member_repository = member_repository
         self.file_service = file_service
+        self.keyring = keyring
+
+    def get_community_symetric_key(self, community_id: str) -> str | bytes:
+        if self.keyring is not None:
+            return self.keyring.get_key(community_id)
 
-    def get_community_symetric_key(self, community_id: str) -> str:
         symetric_key_path = self.community_repository.get_community_encryption_key_path(
             community_id
         )
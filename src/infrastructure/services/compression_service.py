@@ -0,0 +1,113 @@
+import base64
+import binascii
+import lzma
+import zlib
+
+from src.application.interfaces.icompression_service import ICompressionService
+
+
+class CompressionService(ICompressionService):
+    """Compression service.
+
+    A compressed text is "<codec>:<base64 data>". Any other text is left as
+    is by decompress, so payloads of nodes that do not compress still work.
+    The binary form is a codec byte (0 when not compressed) followed by the
+    data. Payloads shorter than threshold are never compressed.
+    """
+
+    CODECS = {
+        "lzma": (
+            lambda data: lzma.compress(data, preset=6),
+            lzma.decompress,
+        ),
+        "zlib": (
+            lambda data: zlib.compress(data, level=6),
+            zlib.decompress,
+        ),
+    }
+
+    # Codes are part of the protocol: never renumber, only append.
+    BINARY_CODES = {None: 0, "lzma": 1, "zlib": 2}
+    BINARY_CODECS = {code: codec for codec, code in BINARY_CODES.items()}
+
+    def __init__(self, threshold: int = 512):
+        self.threshold = threshold
+
+    def get_supported_codecs(self) -> list[str]:
+        return list(self.CODECS)
+
+    def compress(self, plaintext: str, codecs: list[str] | None = None) -> str:
+        data = plaintext.encode()
+        compressed = self._compress(data, codecs, len(plaintext))
+        return compressed if compressed is not None else plaintext
+
+    def decompress(self, text: str) -> str:
+        data = self._decompress(text)
+        return data.decode() if data is not None else text
+
+    def compress_bytes(self, data: bytes, codecs: list[str] | None = None) -> str:
+        compressed = self._compress(data, codecs, 2 * len(data))
+        return compressed if compressed is not None else data.hex()
+
+    def decompress_bytes(self, text: str) -> bytes:
+        data = self._decompress(text)
+        return data if data is not None else bytes.fromhex(text)
+
+    def compress_binary(self, data: bytes, codecs: list[str] | None = None) -> bytes:
+        codec = self._get_codec(data, codecs)
+        if codec is not None:
+            compress, _ = self.CODECS[codec]
+            compressed = compress(data)
+            if len(compressed) < len(data):
+                return bytes((self.BINARY_CODES[codec],)) + compressed
+
+        return bytes((self.BINARY_CODES[None],)) + data
+
+    def decompress_binary(self, envelope: bytes) -> bytes:
+        if not envelope or envelope[0] not in self.BINARY_CODECS:
+            raise ValueError("Invalid compression envelope")
+
+        codec = self.BINARY_CODECS[envelope[0]]
+        if codec is None:
+            return envelope[1:]
+
+        _, decompress = self.CODECS[codec]
+        try:
+            return decompress(envelope[1:])
+        except (lzma.LZMAError, zlib.error) as err:
+            raise ValueError(f"Invalid {codec} payload: {err}") from err
+
+    def _get_codec(self, data: bytes, codecs: list[str] | None) -> str | None:
+        """Returns the preferred codec accepted for the data, if worth compressing"""
+        if len(data) < self.threshold:
+            return None
+
+        accepted = self.get_supported_codecs() if codecs is None else codecs
+        return next((codec for codec in self.CODECS if codec in accepted), None)
+
+    def _compress(
+        self, data: bytes, codecs: list[str] | None, uncompressed_length: int
+    ) -> str | None:
+        """Returns the compressed text, or None if it would not be shorter
+        than the uncompressed text"""
+        codec = self._get_codec(data, codecs)
+        if codec is None:
+            return None
+
+        compress, _ = self.CODECS[codec]
+        encoded = base64.b64encode(compress(data)).decode()
+        if len(encoded) + len(codec) + 1 >= uncompressed_length:
+            return None
+        return f"{codec}:{encoded}"
+
+    def _decompress(self, text: str) -> bytes | None:
+        """Returns the decompressed data, or None if the text is not compressed"""
+        codec, separator, encoded = text.partition(":")
+        if not separator or codec not in self.CODECS:
+            return None
+
+        _, decompress = self.CODECS[codec]
+        try:
+            return decompress(base64.b64decode(encoded, validate=True))
+        except (binascii.Error, lzma.LZMAError, zlib.error) as err:
+            raise ValueError(f"Invalid {codec} payload: {err}") from err
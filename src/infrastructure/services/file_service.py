@@ -1,4 +1,6 @@
 import os
+import tempfile
+from typing import Iterable, Iterator
 
 from src.application.interfaces.ifile_service import IFileService
 
@@ -20,3 +22,36 @@ class FileService(IFileService):
 
         with open(path, open_format) as file:
             file.write(content)
+
+    def read_file_chunks(
+        self, path: str, chunk_size: int, offset: int = 0
+    ) -> Iterator[bytes]:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"File {path} not found")
+
+        with open(path, "rb") as file:
+            file.seek(offset)
+            while chunk := file.read(chunk_size):
+                yield chunk
+
+    def write_file_atomically(self, path: str, chunks: Iterable[bytes]) -> None:
+        directory, name = os.path.split(path)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            prefix=f".{name}.", suffix=".tmp", dir=directory or "."
+        )
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def remove_file(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
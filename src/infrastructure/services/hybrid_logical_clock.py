@@ -0,0 +1,59 @@
+import datetime
+import threading
+
+from src.application.interfaces.idatetime_service import IDatetimeService
+from src.application.interfaces.ihybrid_logical_clock import IHybridLogicalClock
+
+
+class HybridLogicalClock(IHybridLogicalClock):
+    """Hybrid logical clock on top of a physical clock.
+
+    A timestamp is the physical time, unless the clock already gave (or
+    received) a later one: it is then one microsecond after it. The
+    logical part is folded into the microseconds so that the timestamps
+    stay datetimes, ordered as they are stored. Timestamps received too far
+    ahead of the physical time (max_offset) are not merged, so a peer with
+    a wrong clock cannot drag the clock forward.
+    """
+
+    RESOLUTION = datetime.timedelta(microseconds=1)
+
+    def __init__(
+        self,
+        physical_clock: IDatetimeService,
+        max_offset: datetime.timedelta = datetime.timedelta(minutes=1),
+    ):
+        self.physical_clock = physical_clock
+        self.max_offset = max_offset
+        self.last: datetime.datetime | None = None
+        self.lock = threading.Lock()
+
+    def get_datetime(self) -> datetime.datetime:
+        physical = self._to_utc(self.physical_clock.get_datetime())
+        with self.lock:
+            return self._advance(physical)
+
+    def update(self, received: datetime.datetime) -> datetime.datetime:
+        physical = self._to_utc(self.physical_clock.get_datetime())
+        received = self._to_utc(received)
+        with self.lock:
+            if received - physical <= self.max_offset and (
+                self.last is None or received > self.last
+            ):
+                self.last = received
+            return self._advance(physical)
+
+    def _advance(self, timestamp: datetime.datetime) -> datetime.datetime:
+        """Moves the clock to the timestamp, or just after the last one"""
+        if self.last is None or timestamp > self.last:
+            self.last = timestamp
+        else:
+            self.last += self.RESOLUTION
+        return self.last
+
+    @staticmethod
+    def _to_utc(timestamp: datetime.datetime) -> datetime.datetime:
+        """Returns the timestamp in UTC, naive timestamps being in UTC"""
+        if timestamp.tzinfo is None:
+            return timestamp.replace(tzinfo=datetime.UTC)
+        return timestamp.astimezone(datetime.UTC)
@@ -0,0 +1,52 @@
+import threading
+
+from src.application.interfaces.iasymetric_encryption_service import (
+    IAsymetricEncryptionService,
+)
+from src.application.interfaces.ifile_service import IFileService
+from src.application.interfaces.ikey_material_service import IKeyMaterialService
+
+
+class KeyMaterialService(IKeyMaterialService):
+    """Provides the key pair of the node.
+
+    The key pair is read from its files, or generated and saved, only once:
+    the callers arriving while it is provisioned wait for it instead of
+    generating another pair. It is then served from memory.
+    """
+
+    def __init__(
+        self,
+        base_path: str,
+        encryption_service: IAsymetricEncryptionService,
+        file_service: IFileService,
+    ):
+        self.base_path = base_path
+        self.encryption_service = encryption_service
+        self.file_service = file_service
+        self.key_pair: tuple[str, str] | None = None
+        self.lock = threading.Lock()
+
+    def get_key_pair(self) -> tuple[str, str]:
+        key_pair = self.key_pair
+        if key_pair is not None:
+            return key_pair
+
+        with self.lock:
+            if self.key_pair is None:
+                self.key_pair = self._provision_key_pair()
+            return self.key_pair
+
+    def _provision_key_pair(self) -> tuple[str, str]:
+        """Reads the key pair from its files, or generates and saves it"""
+        public_key_file = f"{self.base_path}/encryption_key.pub"
+        private_key_file = f"{self.base_path}/encryption_key"
+
+        try:
+            public_key = self.file_service.read_file(public_key_file)
+            private_key = self.file_service.read_file(private_key_file)
+        except FileNotFoundError:
+            public_key, private_key = self.encryption_service.generate_keys()
+            self.file_service.write_file(public_key_file, public_key)
+            self.file_service.write_file(private_key_file, private_key)
+        return public_key, private_key
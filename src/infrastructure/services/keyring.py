@@ -0,0 +1,47 @@
+import threading
+
+from src.application.interfaces.icommunity_repository import ICommunityRepository
+from src.application.interfaces.ifile_service import IFileService
+from src.application.interfaces.ikeyring import IKeyring
+
+
+class Keyring(IKeyring):
+    """In-memory keyring of the community symetric keys.
+
+    The keys are read from their files and decoded once, at startup (load)
+    or on first use, then served from memory. The communities created or
+    joined afterwards add their key when it is saved.
+    """
+
+    def __init__(
+        self, community_repository: ICommunityRepository, file_service: IFileService
+    ):
+        self.community_repository = community_repository
+        self.file_service = file_service
+        self.keys: dict[str, bytes] = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        for community in self.community_repository.get_communities():
+            try:
+                self.get_key(community.identifier)
+            except (OSError, ValueError) as error:
+                print(f"Key of community {community.identifier} not loaded: {error}")
+
+    def get_key(self, community_id: str) -> bytes:
+        key = self.keys.get(community_id)
+        if key is not None:
+            return key
+
+        key_path = self.community_repository.get_community_encryption_key_path(
+            community_id
+        )
+        if key_path is None:
+            raise ValueError(f"Unknown community {community_id}")
+        key = bytes.fromhex(self.file_service.read_file(key_path))
+        with self.lock:
+            return self.keys.setdefault(community_id, key)
+
+    def add_key(self, community_id: str, key: str):
+        with self.lock:
+            self.keys[community_id] = bytes.fromhex(key)
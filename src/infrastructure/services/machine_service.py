@@ -1,4 +1,6 @@
 import socket
+import threading
+import time
 
 from src.application.interfaces.idatetime_service import IDatetimeService
 from src.application.interfaces.imachine_service import IMachineService
@@ -8,11 +10,21 @@ from src.application.interfaces.iasymetric_encryption_service import (
     IAsymetricEncryptionService,
 )
 from src.application.interfaces.ifile_service import IFileService
+from src.application.interfaces.ikey_material_service import IKeyMaterialService
+from src.infrastructure.services.key_material_service import KeyMaterialService
 from src.domain.entities.member import Member
 
 
 class MachineService(IMachineService):
-    """Class to get machine information"""
+    """Class to get machine information.
+
+    The identity of the machine is kept in memory. The IP address is probed
+    once, then refreshed in the background every ip_refresh_interval
+    seconds, or as soon as the network interfaces change. The
+    authentication key of a community is read once. invalidate() forgets
+    them, to be read again on next use. The key pair comes from the key
+    material service, which provisions it once.
+    """
 
     def __init__(
         self,
@@ -22,6 +34,9 @@ class MachineService(IMachineService):
         encryption_service: IAsymetricEncryptionService,
         file_service: IFileService,
         datetime_service: IDatetimeService,
+        ip_refresh_interval: float = 60,
+        interfaces_check_interval: float = 5,
+        key_material_service: IKeyMaterialService | None = None,
     ):
         self.base_path = base_path
         self.community_repository = community_repository
@@ -29,8 +44,33 @@ class MachineService(IMachineService):
         self.encryption_service = encryption_service
         self.file_service = file_service
         self.datetime_service = datetime_service
+        self.ip_refresh_interval = ip_refresh_interval
+        self.interfaces_check_interval = interfaces_check_interval
+        self.key_material_service = key_material_service or KeyMaterialService(
+            base_path, encryption_service, file_service
+        )
+
+        self.ip_address: str | None = None
+        self.auth_keys: dict[str, str] = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.watcher: threading.Thread | None = None
 
     def get_ip_address(self) -> str:
+        ip_address = self.ip_address
+        if ip_address is not None:
+            return ip_address
+
+        with self.lock:
+            if self.ip_address is None:
+                self.ip_address = self._probe_ip_address()
+            if self.watcher is None:
+                self.watcher = threading.Thread(target=self._watch, daemon=True)
+                self.watcher.start()
+            return self.ip_address
+
+    def _probe_ip_address(self) -> str:
+        """Returns the address of the interface used to reach the internet"""
         dns_socket: socket.socket | None = None
         try:
             dns_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -45,22 +85,19 @@ class MachineService(IMachineService):
     def get_auth_key(self, community_id: str | None = None) -> str:
         if community_id is None:
             return self.id_generator_service.generate()
-        return self.community_repository.get_authentication_key_for_community(
-            community_id
-        )
 
-    def get_asymetric_key_pair(self) -> tuple[str, str]:
-        public_key_file = f"{self.base_path}/encryption_key.pub"
-        private_key_file = f"{self.base_path}/encryption_key"
+        auth_key = self.auth_keys.get(community_id)
+        if auth_key is None:
+            auth_key = self.community_repository.get_authentication_key_for_community(
+                community_id
+            )
+            # The key of a community not joined yet is not kept
+            if auth_key is not None:
+                self.auth_keys[community_id] = auth_key
+        return auth_key
 
-        try:
-            public_key = self.file_service.read_file(public_key_file)
-            private_key = self.file_service.read_file(private_key_file)
-        except FileNotFoundError:
-            public_key, private_key = self.encryption_service.generate_keys()
-            self.file_service.write_file(public_key_file, public_key)
-            self.file_service.write_file(private_key_file, private_key)
-        return public_key, private_key
+    def get_asymetric_key_pair(self) -> tuple[str, str]:
+        return self.key_material_service.get_key_pair()
 
     def get_port(self) -> int:
         return 1664
@@ -72,3 +109,43 @@ class MachineService(IMachineService):
             self.get_port(),
             self.datetime_service.get_datetime(),
         )
+
+    def invalidate(self, community_id: str | None = None):
+        with self.lock:
+            if community_id is None:
+                self.auth_keys.clear()
+                self.ip_address = None
+            else:
+                self.auth_keys.pop(community_id, None)
+
+    def _watch(self):
+        """Refreshes the IP address on a timer or when the interfaces change"""
+        interfaces = self._get_interfaces()
+        refreshed_at = time.monotonic()
+        while not self.stopped.wait(self.interfaces_check_interval):
+            current_interfaces = self._get_interfaces()
+            if (
+                current_interfaces == interfaces
+                and time.monotonic() - refreshed_at < self.ip_refresh_interval
+            ):
+                continue
+
+            interfaces = current_interfaces
+            refreshed_at = time.monotonic()
+            ip_address = self._probe_ip_address()
+            with self.lock:
+                self.ip_address = ip_address
+
+    @staticmethod
+    def _get_interfaces() -> frozenset[tuple[int, str]]:
+        """Returns the network interfaces of the machine"""
+        try:
+            return frozenset(socket.if_nameindex())
+        except OSError:
+            return frozenset()
+
+    def stop(self):
+        """Stops refreshing the IP address"""
+        self.stopped.set()
+        if self.watcher is not None:
+            self.watcher.join()
@@ -1,19 +1,126 @@
 import datetime
+import threading
+import time
 import ntplib
 
 from src.application.interfaces.idatetime_service import IDatetimeService
 
 
 class NtpDatetimeService(IDatetimeService):
-    """Datetime service that uses NTP server"""
+    """Datetime service synchronized with an NTP server.
 
-    def __init__(self, ntp_server: str = "pool.ntp.org"):
+    A background thread measures the offset between the NTP clock and
+    time.monotonic_ns() at start, then every refresh_interval seconds
+    (retry_interval after a failure). The timestamps are the monotonic
+    clock plus the cached offset, so they never wait for the network and
+    never jump with the system clock. Until the NTP server answers, the
+    offset comes from the system clock.
+    """
+
+    def __init__(
+        self,
+        ntp_server: str = "pool.ntp.org",
+        ntp_port: int | str = "ntp",
+        refresh_interval: float = 1024,
+        retry_interval: float = 30,
+        timeout: float = 5,
+    ):
         self.ntp_server = ntp_server
+        self.ntp_port = ntp_port
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.timeout = timeout
         self.client = ntplib.NTPClient()
 
+        self.offset_ns = time.time_ns() - time.monotonic_ns()
+        # Monotonic time of the last synchronization
+        self.synchronized_at: int | None = None
+        # Last synchronization with the current server, to measure the drift
+        self.reference: tuple[int, int] | None = None
+        self.drift: float | None = None
+        self.lock = threading.Lock()
+
+        self.first_refresh = threading.Event()
+        self.wake = threading.Event()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
     def get_datetime(self) -> datetime.datetime:
+        # Only the first calls wait, for the first answer of the server
+        self.first_refresh.wait(self.timeout)
+        seconds, nanoseconds = divmod(time.monotonic_ns() + self.offset_ns, 10**9)
+        return datetime.datetime.fromtimestamp(
+            seconds, datetime.UTC
+        ) + datetime.timedelta(microseconds=nanoseconds // 1000)
+
+    def get_staleness(self) -> float | None:
+        """Returns the seconds elapsed since the last synchronization,
+        None if the server never answered"""
+        synchronized_at = self.synchronized_at
+        if synchronized_at is None:
+            return None
+        return (time.monotonic_ns() - synchronized_at) / 1e9
+
+    def get_drift(self) -> float | None:
+        """Returns the drift of the monotonic clock from the NTP clock, in
+        parts per million, measured between the last two synchronizations"""
+        return self.drift
+
+    def set_ntp_server(self, ntp_server: str, ntp_port: int | str = "ntp"):
+        """Uses another NTP server, synchronized with right away"""
+        with self.lock:
+            self.ntp_server = ntp_server
+            self.ntp_port = ntp_port
+            self.reference = None
+        self.wake.set()
+
+    def refresh(self) -> bool:
+        """Measures the offset with the NTP server. Returns whether it answered"""
+        with self.lock:
+            ntp_server, ntp_port = self.ntp_server, self.ntp_port
         try:
-            response = self.client.request(self.ntp_server)
-            return datetime.datetime.fromtimestamp(response.tx_time, datetime.UTC)
-        except Exception:
-            return datetime.datetime.fromisoformat("1970-01-01T00:00:01+00:00")
+            response = self.client.request(
+                ntp_server, port=ntp_port, timeout=self.timeout
+            )
+            received_at = time.monotonic_ns()
+            offset_ns = round((response.dest_time + response.offset) * 1e9)
+        except (ntplib.NTPException, OSError):
+            return False
+        offset_ns -= received_at
+
+        with self.lock:
+            if (ntp_server, ntp_port) != (self.ntp_server, self.ntp_port):
+                # The server was swapped during the request
+                return False
+            if self.reference is not None:
+                reference_at, reference_offset_ns = self.reference
+                if received_at > reference_at:
+                    self.drift = (
+                        (offset_ns - reference_offset_ns)
+                        / (received_at - reference_at)
+                        * 1e6
+                    )
+            self.reference = (received_at, offset_ns)
+            self.offset_ns = offset_ns
+            self.synchronized_at = received_at
+        return True
+
+    def _run(self):
+        """Refreshes the offset until the service is stopped"""
+        while self.running:
+            try:
+                refreshed = self.refresh()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                # A malformed answer must not stop the refreshes
+                print(f"Unable to refresh the NTP offset : {err}")
+                refreshed = False
+            self.first_refresh.set()
+            self.wake.wait(self.refresh_interval if refreshed else self.retry_interval)
+            self.wake.clear()
+
+    def stop(self):
+        """Stops refreshing the offset"""
+        self.running = False
+        self.wake.set()
+        self.thread.join()
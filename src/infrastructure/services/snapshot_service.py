@@ -0,0 +1,126 @@
+from contextlib import closing
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterator
+
+from src.application.interfaces.ifile_service import IFileService
+from src.application.interfaces.iid_generator_service import IIdGeneratorService
+from src.application.interfaces.isnapshot_service import ISnapshotService
+from src.domain.entities.snapshot import Snapshot
+from src.infrastructure.services.uuid_generator_service import UuidGeneratorService
+
+
+class SnapshotService(ISnapshotService):
+    """Keeps the snapshots of the community databases in base_path/snapshots
+    (created by the application).
+
+    A snapshot is a consistent copy of the database, taken with the sqlite
+    backup API. It is kept for retention seconds, so that an interrupted transfer
+    can be resumed on the same content; expired snapshots are removed when a
+    new one is created.
+    """
+
+    CHUNK_SIZE = 1 << 18
+
+    def __init__(
+        self,
+        base_path: str,
+        file_service: IFileService,
+        id_generator: IIdGeneratorService | None = None,
+        retention: float = 3600,
+    ):
+        self.base_path = base_path
+        self.file_service = file_service
+        self.id_generator = id_generator or UuidGeneratorService()
+        self.retention = retention
+        self.snapshots: dict[str, tuple[Snapshot, float]] = {}
+        self.lock = threading.Lock()
+
+    def create_snapshot(
+        self, community_id: str, sources: list[tuple[str, int]]
+    ) -> Snapshot:
+        self._remove_expired_snapshots()
+
+        snapshot_id = self.id_generator.generate()
+        snapshot_path = self._get_path(snapshot_id)
+        try:
+            self._backup_database(
+                f"{self.base_path}/{community_id}.sqlite", snapshot_path
+            )
+        except BaseException:
+            self.file_service.remove_file(snapshot_path)
+            raise
+
+        digest = hashlib.sha256()
+        chunk_count = 0
+        for chunk in self.file_service.read_file_chunks(snapshot_path, self.CHUNK_SIZE):
+            digest.update(chunk)
+            chunk_count += 1
+
+        # An empty database is still sent as one (empty) chunk.
+        snapshot = Snapshot(
+            snapshot_id, community_id, digest.hexdigest(), max(chunk_count, 1), sources
+        )
+        with self.lock:
+            self.snapshots[snapshot_id] = (snapshot, time.monotonic() + self.retention)
+        return snapshot
+
+    def get_snapshot(self, snapshot_id: str) -> Snapshot | None:
+        self._remove_expired_snapshots()
+        with self.lock:
+            snapshot, _ = self.snapshots.get(snapshot_id, (None, None))
+        return snapshot
+
+    def read_chunks(
+        self, snapshot: Snapshot, start_index: int = 0
+    ) -> Iterator[tuple[int, bytes]]:
+        chunks = iter(
+            self.file_service.read_file_chunks(
+                self._get_path(snapshot.identifier),
+                self.CHUNK_SIZE,
+                offset=start_index * self.CHUNK_SIZE,
+            )
+        )
+        for index in range(start_index, snapshot.chunk_count):
+            yield index, next(chunks, b"")
+
+    def remove_snapshot(self, snapshot_id: str):
+        with self.lock:
+            self.snapshots.pop(snapshot_id, None)
+        self.file_service.remove_file(self._get_path(snapshot_id))
+
+    @staticmethod
+    def _backup_database(database_path: str, snapshot_path: str):
+        """Copies the database with the sqlite backup API, which reads the
+        committed content (WAL included) even while the database is in use"""
+        if not os.path.exists(database_path):
+            raise FileNotFoundError(f"File {database_path} not found")
+
+        with closing(sqlite3.connect(database_path)) as source, closing(
+            sqlite3.connect(snapshot_path)
+        ) as destination:
+            source.backup(destination)
+            # The snapshot is sent as a single file, without a WAL next to it.
+            destination.execute("PRAGMA journal_mode=DELETE;")
+
+    def _get_path(self, snapshot_id: str) -> str:
+        """Returns the path of the snapshot file"""
+        return f"{self.base_path}/snapshots/{snapshot_id}.sqlite"
+
+    def _remove_expired_snapshots(self):
+        """Removes the snapshots kept for longer than the retention"""
+        now = time.monotonic()
+        with self.lock:
+            expired = [
+                snapshot_id
+                for snapshot_id, (_, expiration) in self.snapshots.items()
+                if expiration <= now
+            ]
+            for snapshot_id in expired:
+                del self.snapshots[snapshot_id]
+
+        for snapshot_id in expired:
+            self.file_service.remove_file(self._get_path(snapshot_id))
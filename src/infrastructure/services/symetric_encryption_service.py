@@ -9,18 +9,18 @@ from src.application.interfaces.isymetric_encryption_service import (
 class SymetricEncryptionService(ISymetricEncryptionService):
     """Symetric Encryption Service"""
 
+    NONCE_SIZE = 16
+    TAG_SIZE = 16
+
     def generate_key(self) -> str:
         bytes_key = Crypto.Random.get_random_bytes(32)
         return bytes.hex(bytes_key)
 
-    def encrypt(self, plaintext: str, key: str) -> tuple[str, str, str]:
+    def encrypt(self, plaintext: str, key: str | bytes) -> tuple[str, str, str]:
         if plaintext is None or plaintext.strip() == "":
             raise ValueError("Plaintext cannot be empty", plaintext)
 
-        if key is None or key.strip() == "":
-            raise ValueError("Key cannot be empty", key)
-
-        bytes_key = bytes.fromhex(key)
+        bytes_key = self._get_key_bytes(key)
         plaintext_bytes = plaintext.encode()
         cipher = Crypto.Cipher.AES.new(bytes_key, Crypto.Cipher.AES.MODE_EAX)
 
@@ -28,12 +28,11 @@ class SymetricEncryptionService(ISymetricEncryptionService):
 
         return (cipher.nonce.hex(), tag.hex(), ciphertext.hex())
 
-    def decrypt(self, ciphertext: str, key: str, tag: str, nonce: str) -> str:
+    def decrypt(self, ciphertext: str, key: str | bytes, tag: str, nonce: str) -> str:
         if ciphertext is None or ciphertext.strip() == "":
             raise ValueError("Ciphertext cannot be empty", ciphertext)
 
-        if key is None or key.strip() == "":
-            raise ValueError("Key cannot be empty", key)
+        bytes_key = self._get_key_bytes(key)
 
         if tag is None or tag.strip() == "":
             raise ValueError("Tag cannot be empty", tag)
@@ -41,7 +40,6 @@ class SymetricEncryptionService(ISymetricEncryptionService):
         if nonce is None or nonce.strip() == "":
             raise ValueError("Nonce cannot be empty", nonce)
 
-        bytes_key = bytes.fromhex(key)
         bytes_ciphertext = bytes.fromhex(ciphertext)
         bytes_tag = bytes.fromhex(tag)
         bytes_nonce = bytes.fromhex(nonce)
@@ -53,3 +51,56 @@ class SymetricEncryptionService(ISymetricEncryptionService):
         plaintext_bytes = cipher.decrypt_and_verify(bytes_ciphertext, bytes_tag)
 
         return plaintext_bytes.decode()
+
+    def encrypt_bytes(
+        self, plaintext: bytes, key: str | bytes, associated_data: bytes = b""
+    ) -> bytes:
+        if not plaintext:
+            raise ValueError("Plaintext cannot be empty", plaintext)
+
+        bytes_key = self._get_key_bytes(key)
+
+        cipher = Crypto.Cipher.AES.new(
+            bytes_key, Crypto.Cipher.AES.MODE_EAX, nonce=self._new_nonce()
+        )
+        cipher.update(associated_data)
+
+        ciphertext, tag = cipher.encrypt_and_digest(plaintext)
+
+        return b"".join((cipher.nonce, tag, ciphertext))
+
+    def decrypt_bytes(
+        self, envelope: bytes, key: str | bytes, associated_data: bytes = b""
+    ) -> bytes:
+        if envelope is None or len(envelope) <= self.NONCE_SIZE + self.TAG_SIZE:
+            raise ValueError("Envelope is too short", envelope)
+
+        bytes_key = self._get_key_bytes(key)
+
+        envelope_view = memoryview(envelope)
+        nonce = envelope_view[: self.NONCE_SIZE]
+        tag = envelope_view[self.NONCE_SIZE : self.NONCE_SIZE + self.TAG_SIZE]
+        ciphertext = envelope_view[self.NONCE_SIZE + self.TAG_SIZE :]
+
+        cipher = Crypto.Cipher.AES.new(
+            bytes_key, Crypto.Cipher.AES.MODE_EAX, nonce=bytes(nonce)
+        )
+        cipher.update(associated_data)
+
+        return cipher.decrypt_and_verify(ciphertext, tag)
+
+    @staticmethod
+    def _get_key_bytes(key: str | bytes) -> bytes:
+        """Returns the key as bytes, decoding the hex strings"""
+        if isinstance(key, bytes):
+            if not key:
+                raise ValueError("Key cannot be empty", key)
+            return key
+
+        if key is None or key.strip() == "":
+            raise ValueError("Key cannot be empty", key)
+        return bytes.fromhex(key)
+
+    def _new_nonce(self) -> bytes:
+        """Returns a random nonce of the envelope size"""
+        return Crypto.Random.get_random_bytes(self.NONCE_SIZE)
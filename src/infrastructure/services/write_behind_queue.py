@@ -0,0 +1,139 @@
+from concurrent.futures import Future, wait
+import threading
+import time
+
+from src.application.interfaces.iidea_repository import IIdeaRepository
+from src.application.interfaces.imember_repository import IMemberRepository
+from src.application.interfaces.iopinion_repository import IOpinionRepository
+from src.application.interfaces.iwrite_behind_queue import IWriteBehindQueue
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+
+
+class WriteBehindQueue(IWriteBehindQueue):
+    """Per-community queue of the rows to save, committed by groups.
+
+    The first row queued for a community opens a linger window; the rows
+    queued until the window closes are committed together with the bulk
+    inserts (members, then ideas, then opinions), so a burst costs a few
+    commits instead of one per row. A community is committed early once
+    max_batch_size rows are waiting. If a group fails, its rows are saved
+    one by one so that only the faulty rows fail.
+    """
+
+    def __init__(
+        self,
+        member_repository: IMemberRepository,
+        idea_repository: IIdeaRepository,
+        opinion_repository: IOpinionRepository,
+        linger: float = 0.005,
+        max_batch_size: int = 256,
+    ):
+        self.member_repository = member_repository
+        self.idea_repository = idea_repository
+        self.opinion_repository = opinion_repository
+        self.linger = linger
+        self.max_batch_size = max_batch_size
+
+        self.pending: dict[str, list[tuple[Member | Idea | Opinion, Future]]] = {}
+        self.deadlines: dict[str, float] = {}
+        # Futures of the rows being committed, per community
+        self.committing: dict[str, list[Future]] = {}
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def enqueue(self, community_id: str, row: Member | Idea | Opinion) -> Future:
+        future = Future()
+        with self.condition:
+            if not self.running:
+                raise RuntimeError("The write-behind queue is closed")
+            rows = self.pending.setdefault(community_id, [])
+            rows.append((row, future))
+            if len(rows) >= self.max_batch_size:
+                self.deadlines[community_id] = 0
+                self.condition.notify()
+            elif len(rows) == 1:
+                self.deadlines[community_id] = time.monotonic() + self.linger
+                self.condition.notify()
+        return future
+
+    def _run(self):
+        """Commits the communities whose linger window is over"""
+        with self.condition:
+            while self.running or self.pending:
+                now = time.monotonic()
+                community_id = next(
+                    (
+                        community_id
+                        for community_id, deadline in self.deadlines.items()
+                        if deadline <= now or not self.running
+                    ),
+                    None,
+                )
+                if community_id is None:
+                    timeout = (
+                        min(self.deadlines.values()) - now if self.deadlines else None
+                    )
+                    self.condition.wait(timeout)
+                    continue
+
+                rows = self.pending.pop(community_id)
+                del self.deadlines[community_id]
+                self.committing[community_id] = [future for _, future in rows]
+                self.condition.release()
+                try:
+                    self._commit(community_id, rows)
+                finally:
+                    self.condition.acquire()
+                    del self.committing[community_id]
+
+    def _commit(
+        self, community_id: str, rows: list[tuple[Member | Idea | Opinion, Future]]
+    ):
+        """Saves a group of rows of a community, then resolves their futures"""
+        groups = [
+            (self.member_repository.add_members_bulk, Member),
+            (self.idea_repository.add_ideas_bulk, Idea),
+            (self.opinion_repository.add_opinions_bulk, Opinion),
+        ]
+        for add_bulk, row_type in groups:
+            group = [(row, future) for row, future in rows if type(row) is row_type]
+            if not group:
+                continue
+            try:
+                add_bulk(community_id, [row for row, _ in group])
+                for _, future in group:
+                    future.set_result(None)
+            except Exception:  # pylint: disable=broad-exception-caught
+                for row, future in group:
+                    try:
+                        add_bulk(community_id, [row])
+                        future.set_result(None)
+                    except Exception as err:  # pylint: disable=broad-exception-caught
+                        print(f"Unable to save a row of {community_id} : {err}")
+                        future.set_exception(err)
+
+    def flush(self, community_id: str | None = None):
+        with self.condition:
+            community_ids = (
+                list(self.pending.keys() | self.committing.keys())
+                if community_id is None
+                else [community_id]
+            )
+            futures = []
+            for identifier in community_ids:
+                futures += [future for _, future in self.pending.get(identifier, [])]
+                futures += self.committing.get(identifier, [])
+                if identifier in self.deadlines:
+                    self.deadlines[identifier] = 0
+            self.condition.notify()
+        wait(futures)
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join()
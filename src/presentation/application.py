@@ -1,14 +1,29 @@
 import os
 import threading
+from typing import Literal
 from src.application.architecture_manager.parent_connection import ParentConnection
 from src.application.architecture_manager.share_information import ShareInformation
+from src.application.architecture_manager.outbound_queue import OutboundQueue
 from src.application.use_cases.save_member import SaveMember
 
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
 from src.infrastructure.repositories.community_repository import CommunityRepository
 from src.infrastructure.repositories.member_repository import MemberRepository
+from src.infrastructure.repositories.cached_community_repository import (
+    CachedCommunityRepository,
+)
+from src.infrastructure.repositories.cached_member_repository import (
+    CachedMemberRepository,
+)
 from src.infrastructure.repositories.idea_repository import IdeaRepository
 from src.infrastructure.repositories.opinion_repository import OpinionRepository
+from src.infrastructure.repositories.message_search_repository import (
+    MessageSearchRepository,
+)
 from src.infrastructure.services.ntp_datetime_service import NtpDatetimeService
+from src.infrastructure.services.hybrid_logical_clock import HybridLogicalClock
 from src.infrastructure.services.uuid_generator_service import UuidGeneratorService
 from src.infrastructure.services.machine_service import MachineService
 from src.infrastructure.services.asymetric_encryption_service import (
@@ -18,12 +33,20 @@ from src.infrastructure.services.symetric_encryption_service import (
     SymetricEncryptionService,
 )
 from src.infrastructure.services.file_service import FileService
+from src.infrastructure.services.compression_service import CompressionService
+from src.infrastructure.services.snapshot_service import SnapshotService
+from src.infrastructure.services.keyring import Keyring
+from src.infrastructure.services.key_material_service import KeyMaterialService
+from src.infrastructure.services.write_behind_queue import WriteBehindQueue
 from src.application.use_cases.create_community import CreateCommunity
 from src.application.use_cases.add_member import AddMember
 from src.application.use_cases.join_community import JoinCommunity
+from src.application.use_cases.send_snapshot import SendSnapshot
 from src.application.use_cases.read_communities import ReadCommunities
 from src.application.use_cases.read_ideas_from_community import ReadIdeasFromCommunity
-from src.application.use_cases.read_opinions import ReadOpinions
+from src.application.use_cases.read_discussion import ReadDiscussion
+from src.application.use_cases.search_messages import SearchMessages
+from src.application.use_cases.index_messages import IndexMessages
 from src.application.use_cases.create_idea import CreateIdea
 from src.application.use_cases.create_opinion import CreateOpinion
 from src.application.use_cases.save_idea import SaveIdea
@@ -35,6 +58,11 @@ from src.infrastructure.services.community_service import CommunityService
 from src.presentation.formatting.message_formatter import MessageFormatter
 from src.presentation.handler.message_handler import MessageHandler
 from src.presentation.network.server import Server
+from src.presentation.network.async_server import AsyncServer
+from src.presentation.network.client_factory import ClientFactory
+from src.presentation.network.async_client_factory import AsyncClientFactory
+from src.presentation.network.event_loop import EventLoop
+from src.presentation.network.connection_pool import ConnectionPool
 from src.presentation.views.menus.main_menu import MainMenu
 
 
@@ -42,26 +70,65 @@ class Application:
     """The application's entry point."""
 
     stopped: bool = False
+    server_thread: threading.Thread | None = None
     threads: list[threading.Thread] = []
 
-    def __init__(self):
+    def __init__(self, transport: Literal["threaded", "asyncio"] = "threaded"):
         base_path = os.path.join(os.getcwd(), "data")
         os.makedirs(base_path, exist_ok=True)
         keys_path = os.path.join(base_path, "keys")
         os.makedirs(keys_path, exist_ok=True)
+        os.makedirs(os.path.join(base_path, "snapshots"), exist_ok=True)
 
-        self.community_repository = CommunityRepository(base_path)
-        self.member_repository = MemberRepository(base_path)
-        self.idea_repository = IdeaRepository(base_path)
-        self.opinion_repository = OpinionRepository(base_path)
+        self.sqlite_connection_pool = SqliteConnectionPool()
+        # Every write goes through the cached repositories, which invalidate
+        # their entries.
+        self.community_repository = CachedCommunityRepository(
+            CommunityRepository(base_path, self.sqlite_connection_pool)
+        )
+        self.member_repository = CachedMemberRepository(
+            MemberRepository(base_path, self.sqlite_connection_pool)
+        )
+        self.idea_repository = IdeaRepository(base_path, self.sqlite_connection_pool)
+        self.opinion_repository = OpinionRepository(
+            base_path, self.sqlite_connection_pool
+        )
+        self.message_search_repository = MessageSearchRepository(
+            base_path, self.sqlite_connection_pool
+        )
+        self.write_behind_queue = WriteBehindQueue(
+            self.member_repository, self.idea_repository, self.opinion_repository
+        )
 
         self.message_formatter = MessageFormatter()
 
-        self.datetime_service = NtpDatetimeService()
+        self.event_loop: EventLoop | None = None
+        if transport == "asyncio":
+            self.event_loop = EventLoop()
+            self.client_factory = AsyncClientFactory(
+                self.message_formatter, self.event_loop
+            )
+            relay_client_factory = AsyncClientFactory(
+                self.message_formatter, self.event_loop, timeout=2
+            )
+        else:
+            self.client_factory = ClientFactory(self.message_formatter)
+            relay_client_factory = ClientFactory(self.message_formatter, timeout=2)
+        self.connection_pool = ConnectionPool(relay_client_factory)
+        self.outbound_queue = OutboundQueue(self.connection_pool, linger=0.02)
+
+        # The timestamps of the local events come from the hybrid logical
+        # clock, which the received messages advance.
+        self.ntp_datetime_service = NtpDatetimeService()
+        self.datetime_service = HybridLogicalClock(self.ntp_datetime_service)
         self.id_generator = UuidGeneratorService()
         self.file_service = FileService()
+        self.compression_service = CompressionService()
         self.asymetric_encryption_service = AsymetricEncryptionService()
         self.symetric_encryption_service = SymetricEncryptionService()
+        self.key_material_service = KeyMaterialService(
+            base_path, self.asymetric_encryption_service, self.file_service
+        )
         self.machine_service = MachineService(
             base_path,
             self.community_repository,
@@ -69,16 +136,34 @@ class Application:
             self.asymetric_encryption_service,
             self.file_service,
             self.datetime_service,
+            key_material_service=self.key_material_service,
         )
+        self.keyring = Keyring(self.community_repository, self.file_service)
+        self.keyring.load()
         self.community_service = CommunityService(
-            self.community_repository, self.member_repository, self.file_service
+            self.community_repository,
+            self.member_repository,
+            self.file_service,
+            self.keyring,
+        )
+        self.snapshot_service = SnapshotService(
+            base_path, self.file_service, self.id_generator
         )
 
         self.share_information_usecase = ShareInformation(
-            self.member_repository, self.message_formatter, self.machine_service
+            self.member_repository,
+            self.message_formatter,
+            self.machine_service,
+            self.connection_pool,
+            peer_timeout=2,
+            deadline=5,
+            outbound_queue=self.outbound_queue,
         )
         self.parent_connection_usecase = ParentConnection(
-            self.member_repository, self.message_formatter, self.machine_service
+            self.member_repository,
+            self.message_formatter,
+            self.machine_service,
+            self.client_factory,
         )
         self.architecture_manager = ArchitectureManager(
             self.share_information_usecase, self.parent_connection_usecase
@@ -95,6 +180,14 @@ class Application:
             self.machine_service,
             self.file_service,
             self.datetime_service,
+            self.keyring,
+        )
+        self.send_snapshot_usecase = SendSnapshot(
+            self.snapshot_service,
+            self.symetric_encryption_service,
+            self.community_service,
+            self.machine_service,
+            self.compression_service,
         )
         self.add_member_usecase = AddMember(
             base_path,
@@ -109,6 +202,11 @@ class Application:
             self.message_formatter,
             self.community_service,
             self.architecture_manager,
+            self.compression_service,
+            self.snapshot_service,
+            self.client_factory,
+            self.send_snapshot_usecase,
+            self.write_behind_queue,
         )
         self.join_community_usecase = JoinCommunity(
             base_path,
@@ -119,12 +217,19 @@ class Application:
             self.file_service,
             self.community_repository,
             self.member_repository,
+            self.compression_service,
+            self.client_factory,
+            self.keyring,
         )
         self.read_communities_usecase = ReadCommunities(self.community_repository)
         self.read_ideas_from_community_usecase = ReadIdeasFromCommunity(
             self.idea_repository
         )
-        self.read_opinions_usecase = ReadOpinions(self.opinion_repository)
+        self.read_discussion_usecase = ReadDiscussion(self.opinion_repository)
+        self.search_messages_usecase = SearchMessages(self.message_search_repository)
+        self.index_messages_usecase = IndexMessages(
+            self.community_repository, self.message_search_repository
+        )
         self.create_idea_usecase = CreateIdea(
             self.machine_service,
             self.id_generator,
@@ -133,6 +238,7 @@ class Application:
             self.datetime_service,
             self.community_service,
             self.architecture_manager,
+            self.compression_service,
         )
         self.create_opinion_usecase = CreateOpinion(
             self.machine_service,
@@ -143,21 +249,31 @@ class Application:
             self.datetime_service,
             self.community_service,
             self.architecture_manager,
+            self.compression_service,
         )
         self.save_member_usecase = SaveMember(
             self.member_repository,
             self.community_service,
             self.symetric_encryption_service,
+            self.compression_service,
+            self.write_behind_queue,
+            self.datetime_service,
         )
         self.save_idea_usecase = SaveIdea(
             self.idea_repository,
             self.symetric_encryption_service,
             self.community_service,
+            self.compression_service,
+            self.write_behind_queue,
+            self.datetime_service,
         )
         self.save_opinion_usecase = SaveOpinion(
             self.opinion_repository,
             self.symetric_encryption_service,
             self.community_service,
+            self.compression_service,
+            self.write_behind_queue,
+            self.datetime_service,
         )
 
         self.message_handler = MessageHandler(
@@ -167,32 +283,55 @@ class Application:
             self.save_member_usecase,
             self.save_idea_usecase,
             self.save_opinion_usecase,
+            self.send_snapshot_usecase,
+            self.write_behind_queue,
         )
 
-        self.server_socket = Server(
-            self.machine_service.get_port(),
-            self.message_handler,
-            self.message_formatter,
-        )
+        if self.event_loop is not None:
+            self.server_socket = AsyncServer(
+                self.machine_service.get_port(),
+                self.message_handler,
+                self.message_formatter,
+                self.event_loop,
+                max_workers=16,
+                max_pending_connections=128,
+            )
+        else:
+            self.server_socket = Server(
+                self.machine_service.get_port(),
+                self.message_handler,
+                self.message_formatter,
+                max_workers=16,
+                max_pending_connections=128,
+            )
 
     def run(self):
         """Configures the dependencies and runs the application."""
-        server_thread = threading.Thread(target=self.server_socket.run, daemon=True)
-        self.threads.append(server_thread)
-        server_thread.start()
+        self.server_thread = threading.Thread(
+            target=self.server_socket.run, daemon=True
+        )
+        self.server_thread.start()
 
+        # An invitation received during the generation waits for these keys
         gen_keys_thread = threading.Thread(
-            target=self.machine_service.get_asymetric_key_pair
+            target=self.key_material_service.get_key_pair
         )
         self.threads.append(gen_keys_thread)
         gen_keys_thread.start()
 
+        index_messages_thread = threading.Thread(
+            target=self.index_messages_usecase.execute, daemon=True
+        )
+        self.threads.append(index_messages_thread)
+        index_messages_thread.start()
+
         MainMenu(
             self.create_community_usecase,
             self.add_member_usecase,
             self.read_communities_usecase,
             self.read_ideas_from_community_usecase,
-            self.read_opinions_usecase,
+            self.read_discussion_usecase,
+            self.search_messages_usecase,
             self.create_idea_usecase,
             self.create_opinion_usecase,
             self.machine_service,
@@ -202,7 +341,21 @@ class Application:
         """Stops the application."""
         if not self.stopped:
             self.stopped = True
+            self.index_messages_usecase.stop()
+            # The connections being handled still save and relay messages:
+            # the queues and the database are closed once they are done.
             self.server_socket.stop()
+            if self.server_thread is not None:
+                self.server_thread.join()
+            self.share_information_usecase.close()
+            self.outbound_queue.close()
+            self.connection_pool.close()
+            self.write_behind_queue.close()
+            self.ntp_datetime_service.stop()
+            self.machine_service.stop()
             for thread in self.threads:
                 if thread.is_alive():
                     thread.join()
+            self.sqlite_connection_pool.close()
+            if self.event_loop is not None:
+                self.event_loop.stop()
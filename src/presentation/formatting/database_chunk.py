@@ -0,0 +1,42 @@
+import struct
+
+from src.application.exceptions.message_error import MessageError
+
+
+class DatabaseChunk:
+    """Content of a DATABASE_CHUNK message.
+
+    A chunk is a header (chunk index and flags) followed by the encrypted
+    envelope of the chunk. The snapshot id and the header are authenticated
+    with the envelope, so chunks cannot be reordered or mixed between
+    snapshots, and the stream cannot be cut short without the receiver
+    noticing the missing last chunk.
+    """
+
+    HEADER = struct.Struct("!IB")
+    IS_LAST = 0b1
+
+    @staticmethod
+    def pack_header(index: int, is_last: bool) -> bytes:
+        """Returns the header of a chunk"""
+        return DatabaseChunk.HEADER.pack(index, DatabaseChunk.IS_LAST if is_last else 0)
+
+    @staticmethod
+    def unpack(content: bytes) -> tuple[int, bool, bytes, bytes]:
+        """Returns the index, the last chunk flag, the header and the envelope"""
+        if not isinstance(content, bytes) or len(content) <= DatabaseChunk.HEADER.size:
+            raise MessageError("Invalid database chunk")
+
+        header = content[: DatabaseChunk.HEADER.size]
+        index, flags = DatabaseChunk.HEADER.unpack(header)
+        return (
+            index,
+            bool(flags & DatabaseChunk.IS_LAST),
+            header,
+            content[DatabaseChunk.HEADER.size :],
+        )
+
+    @staticmethod
+    def get_associated_data(snapshot_id: str, header: bytes) -> bytes:
+        """Returns the data authenticated with the envelope of a chunk"""
+        return snapshot_id.encode() + header
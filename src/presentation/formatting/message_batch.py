@@ -0,0 +1,95 @@
+from src.application.exceptions.message_error import MessageError
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.message_frame import MessageFrame
+
+
+class MessageBatch:
+    """Pack several messages of a community into a single BATCH message.
+
+    The content of a batch is the concatenation of the frames of its
+    messages, without their community id: it is carried once, by the
+    batch itself.
+    """
+
+    BATCHABLE_HEADERS = (
+        MessageHeader.ADD_MEMBER,
+        MessageHeader.CREATE_IDEA,
+        MessageHeader.CREATE_OPINION,
+    )
+
+    @staticmethod
+    def pack(messages: list[MessageDataclass]) -> MessageDataclass:
+        """Pack messages of the same community into a batch"""
+        community_id = messages[0].community_id
+        for message in messages:
+            if message.header not in MessageBatch.BATCHABLE_HEADERS:
+                raise MessageError(f"Message {message.header} cannot be batched")
+            if message.community_id != community_id:
+                raise MessageError("Batched messages must share their community")
+
+        content = b"".join(
+            MessageFrame.encode(MessageDataclass(message.header, message.content))
+            for message in messages
+        )
+        return MessageDataclass(MessageHeader.BATCH, content, community_id)
+
+    @staticmethod
+    def unpack(batch: MessageDataclass) -> list[MessageDataclass]:
+        """Unpack the messages of a batch"""
+        if not isinstance(batch.content, bytes) or not batch.content:
+            raise MessageError("Invalid batch content")
+
+        content = memoryview(batch.content)
+        prefix_size = MessageFrame.PREFIX.size
+        messages: list[MessageDataclass] = []
+        position = 0
+        while position < len(content):
+            if position + prefix_size > len(content):
+                raise MessageError("Truncated batch content")
+            (
+                code,
+                flags,
+                community_id_length,
+                payload_length,
+            ) = MessageFrame.decode_prefix(content[position : position + prefix_size])
+            position += prefix_size
+            body_length = community_id_length + payload_length
+            if position + body_length > len(content):
+                raise MessageError("Truncated batch content")
+            message = MessageFrame.decode_body(
+                code,
+                flags,
+                community_id_length,
+                content[position : position + body_length],
+            )
+            position += body_length
+
+            if (
+                not isinstance(message, MessageDataclass)
+                or message.header not in MessageBatch.BATCHABLE_HEADERS
+            ):
+                raise MessageError(f"Message {message} cannot be batched")
+            message.community_id = batch.community_id
+            messages.append(message)
+
+        return messages
+
+    @staticmethod
+    def coalesce(messages: list[MessageDataclass]) -> list[MessageDataclass]:
+        """Merge the messages of each community into one message, keeping
+        their order. Batches are flattened so they can be merged too."""
+        by_community: dict[str | None, list[MessageDataclass]] = {}
+        for message in messages:
+            if message.header == MessageHeader.BATCH:
+                unpacked = MessageBatch.unpack(message)
+            else:
+                unpacked = [message]
+            by_community.setdefault(message.community_id, []).extend(unpacked)
+
+        return [
+            community_messages[0]
+            if len(community_messages) == 1
+            else MessageBatch.pack(community_messages)
+            for community_messages in by_community.values()
+        ]
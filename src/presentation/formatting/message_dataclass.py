@@ -8,5 +8,5 @@ class MessageDataclass:
     """Class to represent a message object"""
 
     header: MessageHeader
-    content: str | None = None
+    content: str | bytes | None = None
     community_id: str | None = None
@@ -8,6 +8,8 @@ class MessageFormatter(IMessageFormatter):
     """Class to format and parse message objects"""
 
     def format(self, message: MessageDataclass) -> str:
+        if isinstance(message.content, bytes):
+            raise MessageError("Binary content can only be sent in a frame")
         if message.header in MessageHeader.__members__:
             if message.community_id is None:
                 return f"{message.header}|{message.content}"
@@ -16,3 +16,7 @@ class MessageHeader(StrEnum):
     PONG = "PONG"
     REJECT = "REJECT"
     REQUEST_PARENT = "REQUEST_PARENT"
+    BATCH = "BATCH"
+    DATABASE_CHUNK = "DATABASE_CHUNK"
+    SNAPSHOT = "SNAPSHOT"
+    RESUME_SNAPSHOT = "RESUME_SNAPSHOT"
@@ -4,15 +4,23 @@ from src.application.interfaces.imessage_handler import IMessageHandler
 from src.application.interfaces.isave_idea import ISaveIdea
 from src.application.interfaces.isave_member import ISaveMember
 from src.application.interfaces.isave_opinion import ISaveOpinion
+from src.application.interfaces.isend_snapshot import ISendSnapshot
+from src.application.interfaces.iwrite_behind_queue import IWriteBehindQueue
+from src.presentation.formatting.message_batch import MessageBatch
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
 from src.application.exceptions.message_error import MessageError
 from src.application.interfaces.ijoin_community import IJoinCommunity
-from src.presentation.network.client import Client
+from src.application.interfaces.iclient_socket import IClientSocket
 
 
 class MessageHandler(IMessageHandler):
-    """Class to execute an action based on the message"""
+    """Class to execute an action based on the message.
+
+    With a write-behind queue, the saved rows are committed by groups. The
+    handler only waits for them after saving a member, since the next
+    messages of the community are checked against its members.
+    """
 
     def __init__(
         self,
@@ -22,6 +30,8 @@ class MessageHandler(IMessageHandler):
         save_member_usecase: ISaveMember,
         save_idea_usecase: ISaveIdea,
         save_opinion_usecase: ISaveOpinion,
+        send_snapshot_usecase: ISendSnapshot | None = None,
+        write_behind_queue: IWriteBehindQueue | None = None,
     ):
         self.community_service = community_service
         self.architecture_manager = architecture_manager
@@ -29,9 +39,11 @@ class MessageHandler(IMessageHandler):
         self.save_member_usecase = save_member_usecase
         self.save_idea_usecase = save_idea_usecase
         self.save_opinion_usecase = save_opinion_usecase
+        self.send_snapshot_usecase = send_snapshot_usecase
+        self.write_behind_queue = write_behind_queue
 
     def handle_message(
-        self, sender: tuple[str, int], client: Client, message: MessageDataclass
+        self, sender: tuple[str, int], client: IClientSocket, message: MessageDataclass
     ):
         if message.header != MessageHeader.INVITATION:
             if not self.community_service.is_community_member(
@@ -44,10 +56,19 @@ class MessageHandler(IMessageHandler):
                 self.join_community_usecase.execute(client)
             case MessageHeader.ADD_MEMBER:
                 self.save_member_usecase.execute(message.community_id, message.content)
+                self._wait_for_saves(message.community_id)
             case MessageHeader.CREATE_IDEA:
                 self.save_idea_usecase.execute(message.community_id, message.content)
             case MessageHeader.CREATE_OPINION:
                 self.save_opinion_usecase.execute(message.community_id, message.content)
+            case MessageHeader.BATCH:
+                self._handle_batch(sender, message)
+                return
+            case MessageHeader.RESUME_SNAPSHOT:
+                if self.send_snapshot_usecase is None:
+                    raise MessageError("Snapshots are not served by this node.")
+                self.send_snapshot_usecase.execute(client, message)
+                return
             case MessageHeader.PING:
                 client.send_message(MessageDataclass(MessageHeader.PONG))
                 client.close_connection()
@@ -58,3 +79,42 @@ class MessageHandler(IMessageHandler):
             self.architecture_manager.share_information(
                 message, message.community_id, excluded_ip_addresses=[sender[0]]
             )
+
+    def _wait_for_saves(self, community_id: str):
+        """Waits until the saved rows of the community are committed"""
+        if self.write_behind_queue is not None:
+            self.write_behind_queue.flush(community_id)
+
+    def _handle_batch(self, sender: tuple[str, int], batch: MessageDataclass):
+        """Applies the messages of a batch, then relays the applied ones"""
+        applied: list[MessageDataclass] = []
+        errors: list[Exception] = []
+        for message in MessageBatch.unpack(batch):
+            try:
+                match message.header:
+                    case MessageHeader.ADD_MEMBER:
+                        self.save_member_usecase.execute(
+                            message.community_id, message.content
+                        )
+                        self._wait_for_saves(message.community_id)
+                    case MessageHeader.CREATE_IDEA:
+                        self.save_idea_usecase.execute(
+                            message.community_id, message.content
+                        )
+                    case MessageHeader.CREATE_OPINION:
+                        self.save_opinion_usecase.execute(
+                            message.community_id, message.content
+                        )
+                applied.append(message)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                errors.append(err)
+
+        if applied:
+            relayed = batch if not errors else MessageBatch.pack(applied)
+            self.architecture_manager.share_information(
+                relayed, batch.community_id, excluded_ip_addresses=[sender[0]]
+            )
+        if errors:
+            raise MessageError(
+                f"{len(errors)} message(s) of the batch failed: {errors[0]}"
+            )
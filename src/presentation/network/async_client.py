@@ -0,0 +1,131 @@
+import asyncio
+from src.application.exceptions.message_error import MessageError
+
+from src.application.exceptions.socket_error import SocketError
+from src.application.exceptions.connection_closed_error import (
+    ConnectionClosedError,
+)
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.application.interfaces.imessage_formatter import IMessageFormatter
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.network.event_loop import EventLoop
+from src.presentation.network.message_frame import MessageFrame
+
+
+class AsyncClient(IClientSocket):
+    """Client socket backed by asyncio streams.
+
+    The streams live on the shared event loop; the blocking methods of
+    IClientSocket submit the I/O to the loop and wait for it.
+    """
+
+    def __init__(
+        self,
+        message_formatter: IMessageFormatter,
+        event_loop: EventLoop,
+        reader: asyncio.StreamReader | None = None,
+        writer: asyncio.StreamWriter | None = None,
+        timeout: float | None = None,
+    ):
+        self.message_formatter = message_formatter
+        self.event_loop = event_loop
+        self.reader = reader
+        self.writer = writer
+        self.timeout = timeout
+
+    def connect_to_server(self, ip_adress: str, port: int):
+        try:
+            self.reader, self.writer = self.event_loop.run_coroutine(
+                asyncio.wait_for(asyncio.open_connection(ip_adress, port), self.timeout)
+            )
+        except (OSError, asyncio.TimeoutError) as err:
+            raise SocketError(f"Unable to connect to server :{err}") from err
+
+    def send_message(
+        self,
+        message: str | MessageDataclass,
+        ip_address: str | None = None,
+        port: int | None = None,
+    ):
+        frame = MessageFrame.encode(message)
+        self.event_loop.run_coroutine(self.write_frame(frame))
+
+    def receive_message(
+        self,
+    ) -> tuple[str, tuple[str, int]] | tuple[MessageDataclass, tuple[str, int]]:
+        message = self.event_loop.run_coroutine(self.read_message())
+        return message, self.get_peer_address()
+
+    async def write_frame(self, frame: bytes):
+        """Writes a frame on the stream"""
+        if self.writer is None:
+            raise SocketError("Not connected")
+        try:
+            self.writer.write(frame)
+            await asyncio.wait_for(self.writer.drain(), self.timeout)
+        except (OSError, asyncio.TimeoutError) as err:
+            raise SocketError(f"Unable to send message :{err}") from err
+
+    async def read_message(self) -> str | MessageDataclass:
+        """Reads a whole frame from the stream and decodes it"""
+        if self.reader is None:
+            raise SocketError("Not connected")
+        try:
+            return await asyncio.wait_for(self._read_frame(), self.timeout)
+        except asyncio.IncompleteReadError as err:
+            raise SocketError("Connection closed by peer") from err
+        except (OSError, asyncio.TimeoutError) as err:
+            raise SocketError(f"Unable to receive message :{err}") from err
+
+    async def _read_frame(self) -> str | MessageDataclass:
+        """Reads the prefix then the body of a frame"""
+        try:
+            prefix = await self.reader.readexactly(MessageFrame.PREFIX.size)
+        except asyncio.IncompleteReadError as err:
+            if not err.partial:
+                raise ConnectionClosedError("Connection closed by peer") from err
+            raise
+        code, flags, community_id_length, payload_length = MessageFrame.decode_prefix(
+            prefix
+        )
+        body = await self.reader.readexactly(community_id_length + payload_length)
+        message = MessageFrame.decode_body(code, flags, community_id_length, body)
+
+        if isinstance(message, str):
+            try:
+                message = self.message_formatter.parse(message)
+            except MessageError:
+                pass
+
+        return message
+
+    def get_peer_address(self) -> tuple[str, int] | None:
+        """Returns the address of the connected peer"""
+        if self.writer is None:
+            return None
+        return self.writer.get_extra_info("peername")
+
+    async def close(self):
+        """Closes the stream"""
+        if self.writer is None:
+            return
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+
+    def is_connected(self) -> bool:
+        return (
+            self.writer is not None
+            and not self.writer.is_closing()
+            and not self.reader.at_eof()
+        )
+
+    def close_connection(self):
+        if self.writer is None:
+            return
+        if self.event_loop.is_loop_thread():
+            self.writer.close()
+        else:
+            self.event_loop.run_coroutine(self.close())
@@ -0,0 +1,24 @@
+from src.application.interfaces.iclient_factory import IClientFactory
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.application.interfaces.imessage_formatter import IMessageFormatter
+from src.presentation.network.async_client import AsyncClient
+from src.presentation.network.event_loop import EventLoop
+
+
+class AsyncClientFactory(IClientFactory):
+    """Factory of client sockets running on the shared event loop"""
+
+    def __init__(
+        self,
+        message_formatter: IMessageFormatter,
+        event_loop: EventLoop,
+        timeout: float | None = 30,
+    ):
+        self.message_formatter = message_formatter
+        self.event_loop = event_loop
+        self.timeout = timeout
+
+    def create_client(self) -> IClientSocket:
+        return AsyncClient(
+            self.message_formatter, self.event_loop, timeout=self.timeout
+        )
@@ -0,0 +1,168 @@
+import asyncio
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.application.exceptions.message_error import MessageError
+
+from src.application.exceptions.socket_error import SocketError
+from src.application.exceptions.connection_closed_error import (
+    ConnectionClosedError,
+)
+from src.application.interfaces.iserver_socket import IServerSocket
+from src.application.interfaces.imessage_handler import IMessageHandler
+from src.application.interfaces.imessage_formatter import IMessageFormatter
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.network.async_client import AsyncClient
+from src.presentation.network.event_loop import EventLoop
+from src.presentation.network.server_metrics import ServerMetrics
+
+
+class AsyncServer(IServerSocket):
+    """Server backed by asyncio streams.
+
+    Connections are accepted and read on the shared event loop, so an idle
+    or slow peer does not hold a thread. Once a message is fully read, the
+    message handler (which uses blocking repositories and services) runs in
+    a bounded executor.
+
+    A connection may carry several messages: it is read until the peer
+    closes it or stays idle for keep_alive_timeout seconds.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        message_handler: IMessageHandler,
+        message_formatter: IMessageFormatter,
+        event_loop: EventLoop,
+        max_workers: int = 16,
+        max_pending_connections: int = 128,
+        connection_timeout: float | None = 30,
+        keep_alive_timeout: float = 10,
+    ):
+        super().__init__()
+        self.port = port
+        self.message_handler = message_handler
+        self.message_formatter = message_formatter
+        self.event_loop = event_loop
+        self.max_workers = max_workers
+        self.max_pending_connections = max_pending_connections
+        self.connection_timeout = connection_timeout
+        self.keep_alive_timeout = keep_alive_timeout
+
+        self.executor = ThreadPoolExecutor(max_workers)
+        self.handlers_semaphore: asyncio.Semaphore | None = None
+        self.server: asyncio.Server | None = None
+        self.connections: set[asyncio.Task] = set()
+        self.stop_event = threading.Event()
+        self.metrics = ServerMetrics()
+        self.running = False
+
+    def run(self):
+        try:
+            self.server = self.event_loop.run_coroutine(self._start())
+        except OSError as err:
+            raise SocketError(f"Unable to run server :{err}") from err
+
+        self.running = True
+        self.stop_event.wait()
+
+        self.event_loop.run_coroutine(self._close())
+        self.executor.shutdown(wait=True)
+
+    async def _start(self) -> asyncio.Server:
+        """Starts listening on the event loop"""
+        self.handlers_semaphore = asyncio.Semaphore(self.max_workers)
+        return await asyncio.start_server(
+            self._handle_connection,
+            host="0.0.0.0",
+            port=self.port,
+            backlog=self.max_pending_connections,
+        )
+
+    async def _close(self):
+        """Stops listening and closes the kept-alive connections"""
+        self.server.close()
+        for connection_task in self.connections:
+            connection_task.cancel()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Reads the messages of a connection and handles them"""
+        self.metrics.accepted += 1
+        self.connections.add(asyncio.current_task())
+        connection = AsyncClient(
+            self.message_formatter,
+            self.event_loop,
+            reader,
+            writer,
+            self.connection_timeout,
+        )
+        sender = connection.get_peer_address()
+        try:
+            message = await connection.read_message()
+            while True:
+                if not isinstance(message, MessageDataclass):
+                    raise MessageError(f"Invalid received message : {message}")
+                await self._run_handler(sender, connection, message)
+                self.metrics.handled += 1
+
+                if writer.is_closing():
+                    break
+                try:
+                    message = await asyncio.wait_for(
+                        connection.read_message(), self.keep_alive_timeout
+                    )
+                except (ConnectionClosedError, asyncio.TimeoutError):
+                    break
+        except (MessageError, SocketError) as err:
+            self.metrics.failed += 1
+            print(err)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self.metrics.failed += 1
+            print(f"Unexpected error while handling {sender} : {err}")
+        finally:
+            self.connections.discard(asyncio.current_task())
+            await connection.close()
+
+    async def _run_handler(
+        self,
+        sender: tuple[str, int],
+        connection: AsyncClient,
+        message: MessageDataclass,
+    ):
+        """Runs the message handler in the executor"""
+        waiting = True
+        self.metrics.queue_depth += 1
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self.metrics.queue_depth
+        )
+        try:
+            async with self.handlers_semaphore:
+                waiting = False
+                self.metrics.queue_depth -= 1
+                await asyncio.get_running_loop().run_in_executor(
+                    self.executor,
+                    self.message_handler.handle_message,
+                    sender,
+                    connection,
+                    message,
+                )
+        finally:
+            if waiting:
+                self.metrics.queue_depth -= 1
+
+    def get_metrics(self) -> ServerMetrics:
+        """Returns a snapshot of the server metrics"""
+        return dataclasses.replace(self.metrics)
+
+    def _is_running(self) -> bool:
+        """Returns if the server is running"""
+        return self.running
+
+    def stop(self):
+        self.running = False
+        self.stop_event.set()
@@ -1,18 +1,25 @@
+import select
 import socket
 from src.application.exceptions.message_error import MessageError
 
 from src.application.exceptions.socket_error import SocketError
+from src.application.exceptions.connection_closed_error import (
+    ConnectionClosedError,
+)
 from src.application.interfaces.iclient_socket import IClientSocket
 from src.application.interfaces.imessage_formatter import IMessageFormatter
 from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.network.message_frame import MessageFrame
 
 
 class Client(IClientSocket):
     "Client socket class"
-    BUFFER_SIZE = 2048
 
     def __init__(
-        self, message_formatter: IMessageFormatter, client_socket: socket.socket = None
+        self,
+        message_formatter: IMessageFormatter,
+        client_socket: socket.socket = None,
+        timeout: float | None = None,
     ):
         self.message_formatter = message_formatter
         try:
@@ -20,6 +27,7 @@ class Client(IClientSocket):
                 self.client_socket = client_socket
             else:
                 self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.client_socket.settimeout(timeout)
         except socket.error as err:
             raise SocketError(f"Unable to create socket :{err}") from err
 
@@ -36,37 +44,71 @@ class Client(IClientSocket):
         port: int | None = None,
     ):
         has_target_data = ip_address is not None and port is not None
-        if isinstance(message, MessageDataclass):
-            message_to_send = self.message_formatter.format(message)
-        else:
-            message_to_send = message
+        frame = MessageFrame.encode(message)
         try:
-            while len(message_to_send) > 0:
-                encoded_chunk = message_to_send[: Client.BUFFER_SIZE].encode()
-                if has_target_data:
-                    self.client_socket.sendto(encoded_chunk, (ip_address, port))
-                else:
-                    self.client_socket.send(encoded_chunk)
-                message_to_send = message_to_send[Client.BUFFER_SIZE :]
+            if has_target_data:
+                frame_view = memoryview(frame)
+                while len(frame_view) > 0:
+                    sent = self.client_socket.sendto(frame_view, (ip_address, port))
+                    frame_view = frame_view[sent:]
+            else:
+                self.client_socket.sendall(frame)
         except socket.error as err:
             raise SocketError(f"Unable to send message :{err}") from err
 
     def receive_message(
         self,
     ) -> tuple[str, tuple[str, int]] | tuple[MessageDataclass, tuple[str, int]]:
-        message, sender = self.client_socket.recvfrom(Client.BUFFER_SIZE)
-        decoded_message = message.decode()
-        if len(message) == Client.BUFFER_SIZE:
-            while message:
-                message, _ = self.client_socket.recvfrom(Client.BUFFER_SIZE)
-                decoded_message = decoded_message + message.decode()
+        prefix = self._receive_exactly(MessageFrame.PREFIX.size, is_frame_start=True)
+        code, flags, community_id_length, payload_length = MessageFrame.decode_prefix(
+            prefix
+        )
+        body = self._receive_exactly(community_id_length + payload_length)
+        message = MessageFrame.decode_body(code, flags, community_id_length, body)
+
+        if isinstance(message, str):
+            try:
+                message = self.message_formatter.parse(message)
+            except MessageError:
+                pass
 
+        return message, self._get_peer_address()
+
+    def _receive_exactly(self, size: int, is_frame_start: bool = False) -> bytearray:
+        """Receive exactly size bytes into a preallocated buffer"""
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
         try:
-            decoded_message = self.message_formatter.parse(decoded_message)
-        except MessageError:
-            pass
+            while received < size:
+                count = self.client_socket.recv_into(view[received:], size - received)
+                if count == 0 and is_frame_start and received == 0:
+                    raise ConnectionClosedError("Connection closed by peer")
+                if count == 0:
+                    raise SocketError("Connection closed by peer")
+                received += count
+        except socket.error as err:
+            raise SocketError(f"Unable to receive message :{err}") from err
 
-        return decoded_message, sender
+        return buffer
+
+    def _get_peer_address(self) -> tuple[str, int] | None:
+        """Returns the address of the connected peer"""
+        try:
+            return self.client_socket.getpeername()
+        except socket.error:
+            return None
+
+    def is_connected(self) -> bool:
+        if self.client_socket.fileno() == -1:
+            return False
+        try:
+            # Nothing is expected on an idle connection: being readable means
+            # the peer closed it (or reset it).
+            readable, _, _ = select.select([self.client_socket], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
 
     def close_connection(self):
         self.client_socket.close()
@@ -0,0 +1,17 @@
+from src.application.interfaces.iclient_factory import IClientFactory
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.application.interfaces.imessage_formatter import IMessageFormatter
+import src.presentation.network.client as client
+
+
+class ClientFactory(IClientFactory):
+    """Factory of blocking client sockets"""
+
+    def __init__(
+        self, message_formatter: IMessageFormatter, timeout: float | None = 30
+    ):
+        self.message_formatter = message_formatter
+        self.timeout = timeout
+
+    def create_client(self) -> IClientSocket:
+        return client.Client(self.message_formatter, timeout=self.timeout)
@@ -0,0 +1,134 @@
+import threading
+import time
+
+from src.application.exceptions.socket_error import SocketError
+from src.application.interfaces.iclient_factory import IClientFactory
+from src.application.interfaces.iclient_socket import IClientSocket
+from src.application.interfaces.iconnection_pool import IConnectionPool
+from src.presentation.formatting.message_dataclass import MessageDataclass
+
+
+class ConnectionPool(IConnectionPool):
+    """Pool of warm connections to peers, keyed by (ip address, port).
+
+    At most max_connections_per_peer idle connections are kept per peer.
+    A connection unused for idle_timeout seconds, or closed by the peer,
+    is dropped instead of being reused. The idle timeout must stay below
+    the keep-alive timeout of the servers, so a connection is never reused
+    right when the peer is closing it.
+    """
+
+    def __init__(
+        self,
+        client_factory: IClientFactory,
+        max_connections_per_peer: int = 2,
+        idle_timeout: float = 5,
+    ):
+        self.client_factory = client_factory
+        self.max_connections_per_peer = max_connections_per_peer
+        self.idle_timeout = idle_timeout
+
+        self.idle_connections: dict[
+            tuple[str, int], list[tuple[IClientSocket, float]]
+        ] = {}
+        self.lock = threading.Lock()
+        self.last_eviction = time.monotonic()
+
+    def send_message(self, ip_address: str, port: int, message: MessageDataclass):
+        peer = (ip_address, port)
+        client_socket = self._acquire(peer)
+        if client_socket is not None:
+            try:
+                client_socket.send_message(message)
+                self._release(peer, client_socket)
+                return
+            except SocketError:
+                client_socket.close_connection()
+
+        client_socket = self._connect(peer)
+        try:
+            client_socket.send_message(message)
+        except Exception:
+            client_socket.close_connection()
+            raise
+        self._release(peer, client_socket)
+
+    def _acquire(self, peer: tuple[str, int]) -> IClientSocket | None:
+        """Takes a warm connection to the peer out of the pool"""
+        now = time.monotonic()
+        expired: list[IClientSocket] = []
+        found: IClientSocket | None = None
+        with self.lock:
+            connections = self.idle_connections.get(peer, [])
+            while connections and found is None:
+                client_socket, last_used = connections.pop()
+                if now - last_used < self.idle_timeout and client_socket.is_connected():
+                    found = client_socket
+                else:
+                    expired.append(client_socket)
+
+        for client_socket in expired:
+            client_socket.close_connection()
+        self._evict_if_due(now)
+        return found
+
+    def _connect(self, peer: tuple[str, int]) -> IClientSocket:
+        """Opens a new connection to the peer"""
+        client_socket = self.client_factory.create_client()
+        try:
+            client_socket.connect_to_server(*peer)
+        except Exception:
+            client_socket.close_connection()
+            raise
+        return client_socket
+
+    def _release(self, peer: tuple[str, int], client_socket: IClientSocket):
+        """Puts a connection back into the pool, or closes it if the pool is full"""
+        with self.lock:
+            connections = self.idle_connections.setdefault(peer, [])
+            if len(connections) < self.max_connections_per_peer:
+                connections.append((client_socket, time.monotonic()))
+                return
+
+        client_socket.close_connection()
+
+    def _evict_if_due(self, now: float):
+        """Evicts the idle connections at most once per idle timeout"""
+        if now - self.last_eviction >= self.idle_timeout:
+            self.evict_idle_connections()
+
+    def evict_idle_connections(self):
+        now = time.monotonic()
+        expired: list[IClientSocket] = []
+        with self.lock:
+            self.last_eviction = now
+            for peer, connections in list(self.idle_connections.items()):
+                kept = [
+                    (client_socket, last_used)
+                    for client_socket, last_used in connections
+                    if now - last_used < self.idle_timeout
+                ]
+                expired.extend(
+                    client_socket
+                    for client_socket, last_used in connections
+                    if now - last_used >= self.idle_timeout
+                )
+                if kept:
+                    self.idle_connections[peer] = kept
+                else:
+                    del self.idle_connections[peer]
+
+        for client_socket in expired:
+            client_socket.close_connection()
+
+    def close(self):
+        with self.lock:
+            connections = [
+                client_socket
+                for peer_connections in self.idle_connections.values()
+                for client_socket, _ in peer_connections
+            ]
+            self.idle_connections.clear()
+
+        for client_socket in connections:
+            client_socket.close_connection()
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from typing import Any, Coroutine
+
+
+class EventLoop:
+    """Asyncio event loop running in a dedicated thread.
+
+    The asyncio sockets all live on this loop; blocking code submits
+    coroutines to it and waits for their result.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.lock = threading.Lock()
+        self.started = False
+
+    def _run(self):
+        """Runs the loop until it is stopped"""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def start(self):
+        """Starts the loop thread if it is not started yet"""
+        with self.lock:
+            if not self.started:
+                self.started = True
+                self.thread.start()
+
+    def is_loop_thread(self) -> bool:
+        """Returns if the caller runs on the loop thread"""
+        return threading.current_thread() is self.thread
+
+    def run_coroutine(
+        self, coroutine: Coroutine[Any, Any, Any], timeout: float | None = None
+    ) -> Any:
+        """Runs a coroutine on the loop and waits for its result"""
+        if self.is_loop_thread():
+            coroutine.close()
+            raise RuntimeError("Cannot wait for a coroutine from the loop thread")
+
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self):
+        """Stops the loop and waits for its thread"""
+        with self.lock:
+            if not self.started or self.loop.is_closed():
+                return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
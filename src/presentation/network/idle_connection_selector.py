@@ -0,0 +1,147 @@
+import selectors
+import socket
+import threading
+import time
+from typing import Callable
+
+
+class IdleConnectionSelector:
+    """Watches the idle kept-alive connections of a server.
+
+    A worker done with a message parks its connection here instead of
+    waiting for the next one. A single thread selects over the parked
+    connections: a connection that becomes readable is handed back through
+    on_readable, one idle for keep_alive_timeout seconds is closed.
+    """
+
+    def __init__(
+        self,
+        on_readable: Callable[[socket.socket, tuple[str, int]], None],
+        keep_alive_timeout: float,
+    ):
+        self.on_readable = on_readable
+        self.keep_alive_timeout = keep_alive_timeout
+
+        self.parked: list[tuple[socket.socket, tuple[str, int]]] = []
+        self.lock = threading.Lock()
+        self.running = False
+        self.selector: selectors.BaseSelector | None = None
+        self.wake_reader: socket.socket | None = None
+        self.wake_writer: socket.socket | None = None
+        self.thread: threading.Thread | None = None
+
+    def start(self):
+        """Starts watching the parked connections"""
+        self.selector = selectors.DefaultSelector()
+        self.wake_reader, self.wake_writer = socket.socketpair()
+        self.wake_reader.setblocking(False)
+        self.wake_writer.setblocking(False)
+        self.selector.register(self.wake_reader, selectors.EVENT_READ)
+
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def park(self, client_socket: socket.socket, sender: tuple[str, int]) -> bool:
+        """Hands an idle connection over.
+        Returns False if the selector is stopped: the connection is not taken.
+        """
+        with self.lock:
+            if not self.running:
+                return False
+            self.parked.append((client_socket, sender))
+        self._wake()
+        return True
+
+    def _wake(self):
+        """Interrupts the select of the watching thread"""
+        try:
+            self.wake_writer.send(b"\0")
+        except OSError:
+            # A wake-up is already pending, or the selector is closing
+            pass
+
+    def _run(self):
+        """Selects over the parked connections until the selector is stopped"""
+        while self.running:
+            self._register_parked()
+            for key, _ in self.selector.select(self._get_select_timeout()):
+                if key.fileobj is self.wake_reader:
+                    self._drain_wake()
+                    continue
+                self.selector.unregister(key.fileobj)
+                sender, _ = key.data
+                self.on_readable(key.fileobj, sender)
+            self._close_expired()
+
+        self._close_all()
+
+    def _register_parked(self):
+        """Registers the connections parked since the last select"""
+        with self.lock:
+            parked, self.parked = self.parked, []
+
+        deadline = time.monotonic() + self.keep_alive_timeout
+        for client_socket, sender in parked:
+            try:
+                self.selector.register(
+                    client_socket, selectors.EVENT_READ, (sender, deadline)
+                )
+            except (KeyError, ValueError, OSError):
+                client_socket.close()
+
+    def _get_select_timeout(self) -> float | None:
+        """Returns the time left before the next connection expires"""
+        deadlines = [
+            key.data[1]
+            for key in self.selector.get_map().values()
+            if key.fileobj is not self.wake_reader
+        ]
+        if not deadlines:
+            return None
+        return max(min(deadlines) - time.monotonic(), 0)
+
+    def _drain_wake(self):
+        """Empties the wake-up socket"""
+        try:
+            while self.wake_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _close_expired(self):
+        """Closes the connections idle for keep_alive_timeout seconds"""
+        now = time.monotonic()
+        expired = [
+            key.fileobj
+            for key in self.selector.get_map().values()
+            if key.fileobj is not self.wake_reader and key.data[1] <= now
+        ]
+        for client_socket in expired:
+            self.selector.unregister(client_socket)
+            client_socket.close()
+
+    def _close_all(self):
+        """Closes every parked connection and the selector"""
+        with self.lock:
+            parked, self.parked = self.parked, []
+        registered = [
+            key.fileobj
+            for key in self.selector.get_map().values()
+            if key.fileobj is not self.wake_reader
+        ]
+        for client_socket in [*registered, *(sock for sock, _ in parked)]:
+            client_socket.close()
+
+        self.selector.close()
+        self.wake_reader.close()
+        self.wake_writer.close()
+
+    def stop(self):
+        """Stops watching and closes the parked connections"""
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+        self._wake()
+        self.thread.join()
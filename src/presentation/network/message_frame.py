@@ -0,0 +1,127 @@
+import struct
+
+from src.application.exceptions.message_error import MessageError
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+
+
+class MessageFrame:
+    """Binary frame used to carry a message on the wire.
+
+    A frame is made of a fixed size prefix followed by the community id
+    and the payload. The prefix holds the header code, the presence flags,
+    the community id length and the payload length, so the receiver knows
+    exactly how many bytes to read before the message is complete.
+
+    A bytes content is carried as is (HAS_BINARY_CONTENT) and decoded back
+    to bytes; a str content is carried in UTF-8.
+    """
+
+    PREFIX = struct.Struct("!BBHI")
+    MAX_PAYLOAD_SIZE = 1 << 30
+    MAX_COMMUNITY_ID_SIZE = (1 << 16) - 1
+
+    RAW_CODE = 0
+    HAS_COMMUNITY_ID = 0b01
+    HAS_CONTENT = 0b10
+    HAS_BINARY_CONTENT = 0b100
+
+    # Advertised by the nodes able to read binary payloads.
+    BINARY_CAPABILITY = "binary"
+
+    # Codes are part of the protocol: never renumber, only append.
+    HEADER_CODES = {
+        MessageHeader.ACK: 1,
+        MessageHeader.ACCEPT: 2,
+        MessageHeader.ADD_MEMBER: 3,
+        MessageHeader.CREATE_IDEA: 4,
+        MessageHeader.CREATE_OPINION: 5,
+        MessageHeader.DATA: 6,
+        MessageHeader.DATABASE: 7,
+        MessageHeader.INVITATION: 8,
+        MessageHeader.PING: 9,
+        MessageHeader.PONG: 10,
+        MessageHeader.REJECT: 11,
+        MessageHeader.REQUEST_PARENT: 12,
+        MessageHeader.BATCH: 13,
+        MessageHeader.DATABASE_CHUNK: 14,
+        MessageHeader.SNAPSHOT: 15,
+        MessageHeader.RESUME_SNAPSHOT: 16,
+    }
+    HEADERS = {code: header for header, code in HEADER_CODES.items()}
+
+    @staticmethod
+    def encode(message: MessageDataclass | str) -> bytes:
+        """Encode a message (or a raw string) into a frame"""
+        if isinstance(message, MessageDataclass):
+            if message.header not in MessageFrame.HEADER_CODES:
+                raise MessageError("Invalid message header")
+            code = MessageFrame.HEADER_CODES[message.header]
+            community_id, content = message.community_id, message.content
+        else:
+            code, community_id, content = MessageFrame.RAW_CODE, None, message
+
+        flags = 0
+        community_id_bytes = b""
+        if community_id is not None:
+            flags |= MessageFrame.HAS_COMMUNITY_ID
+            community_id_bytes = community_id.encode()
+        payload = b""
+        if isinstance(content, bytes):
+            flags |= MessageFrame.HAS_CONTENT | MessageFrame.HAS_BINARY_CONTENT
+            payload = content
+        elif content is not None:
+            flags |= MessageFrame.HAS_CONTENT
+            payload = content.encode()
+
+        if len(community_id_bytes) > MessageFrame.MAX_COMMUNITY_ID_SIZE:
+            raise MessageError("Message community id is too long")
+        if len(payload) > MessageFrame.MAX_PAYLOAD_SIZE:
+            raise MessageError("Message payload is too large")
+
+        prefix = MessageFrame.PREFIX.pack(
+            code, flags, len(community_id_bytes), len(payload)
+        )
+        return b"".join((prefix, community_id_bytes, payload))
+
+    @staticmethod
+    def decode_prefix(
+        prefix: bytes | bytearray | memoryview,
+    ) -> tuple[int, int, int, int]:
+        """Decode a frame prefix.
+        Returns the header code, the flags, the community id length and the payload length.
+        """
+        code, flags, community_id_length, payload_length = MessageFrame.PREFIX.unpack(
+            prefix
+        )
+        if code != MessageFrame.RAW_CODE and code not in MessageFrame.HEADERS:
+            raise MessageError(f"Unknown header code {code}")
+        if payload_length > MessageFrame.MAX_PAYLOAD_SIZE:
+            raise MessageError("Message payload is too large")
+
+        return code, flags, community_id_length, payload_length
+
+    @staticmethod
+    def decode_body(
+        code: int, flags: int, community_id_length: int, body: bytes | bytearray
+    ) -> MessageDataclass | str:
+        """Decode the body of a frame (community id followed by the payload)"""
+        body_view = memoryview(body)
+        try:
+            community_id = (
+                str(body_view[:community_id_length], "utf-8")
+                if flags & MessageFrame.HAS_COMMUNITY_ID
+                else None
+            )
+            content: str | bytes | None = None
+            if flags & MessageFrame.HAS_BINARY_CONTENT:
+                content = bytes(body_view[community_id_length:])
+            elif flags & MessageFrame.HAS_CONTENT:
+                content = str(body_view[community_id_length:], "utf-8")
+        except UnicodeDecodeError as err:
+            raise MessageError(f"Invalid message encoding :{err}") from err
+
+        if code == MessageFrame.RAW_CODE:
+            return content or ""
+
+        return MessageDataclass(MessageFrame.HEADERS[code], content, community_id)
@@ -1,27 +1,65 @@
+import dataclasses
+import queue
+import select
 import socket
+import threading
 from src.application.exceptions.message_error import MessageError
 
 from src.application.exceptions.socket_error import SocketError
+from src.application.exceptions.connection_closed_error import (
+    ConnectionClosedError,
+)
 from src.application.interfaces.iserver_socket import IServerSocket
 from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.network.idle_connection_selector import (
+    IdleConnectionSelector,
+)
+from src.presentation.network.server_metrics import ServerMetrics
 import src.presentation.network.client as client
 from src.application.interfaces.imessage_handler import IMessageHandler
 from src.application.interfaces.imessage_formatter import IMessageFormatter
 
 
 class Server(IServerSocket):
-    """Server class"""
+    """Server class
+
+    With max_workers set to 0, connections are handled one after another in
+    the accepting thread. Otherwise, accepted connections are put in a bounded
+    queue consumed by a pool of worker threads; connections arriving while
+    the queue is full are rejected.
+
+    A connection may carry several messages: it is read until the peer
+    closes it or stays idle for keep_alive_timeout seconds. With workers,
+    an idle connection does not hold its worker: it is parked in a selector
+    and queued again once the peer sends its next message.
+    """
 
     def __init__(
         self,
         port: int,
         message_handler: IMessageHandler,
         message_formatter: IMessageFormatter,
+        max_workers: int = 0,
+        max_pending_connections: int = 64,
+        connection_timeout: float | None = 30,
+        keep_alive_timeout: float = 10,
     ):
         super().__init__()
         self.port = port
         self.message_handler = message_handler
         self.message_formatter = message_formatter
+        self.max_workers = max_workers
+        self.max_pending_connections = max_pending_connections
+        self.connection_timeout = connection_timeout
+        self.keep_alive_timeout = keep_alive_timeout
+
+        self.pending_connections: queue.Queue = queue.Queue(max_pending_connections)
+        self.workers: list[threading.Thread] = []
+        self.idle_connections = IdleConnectionSelector(
+            self._dispatch_connection, keep_alive_timeout
+        )
+        self.metrics = ServerMetrics()
+        self.metrics_lock = threading.Lock()
 
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -33,28 +71,122 @@ class Server(IServerSocket):
         try:
             self.server_socket.settimeout(1)
             self.server_socket.bind(("", self.port))
-            self.server_socket.listen(5)
+            self.server_socket.listen(self.max_pending_connections)
         except socket.error as err:
             raise SocketError(f"Unable to run server :{err}") from err
 
         self.running = True
+        if self.max_workers > 0:
+            self.idle_connections.start()
+        self._start_workers()
         while self._is_running():
             try:
                 client_socket, sender = self.server_socket.accept()
-                client_socket = client.Client(self.message_formatter, client_socket)
-                message, _ = client_socket.receive_message()
-                if not isinstance(message, MessageDataclass):
-                    client_socket.close_connection()
-                    raise MessageError(f"Invalid received message : {message}")
-                self.message_handler.handle_message(sender, client_socket, message)
-
-                client_socket.close_connection()
+                self._increment_metric("accepted")
+                client_socket.settimeout(self.connection_timeout)
+                self._dispatch_connection(client_socket, sender)
             except socket.timeout:
                 pass
-            except MessageError as err:
-                print(err)
 
         self.server_socket.close()
+        self.idle_connections.stop()
+        self._stop_workers()
+
+    def _dispatch_connection(
+        self, client_socket: socket.socket, sender: tuple[str, int]
+    ):
+        """Handles the connection inline or hands it over to the workers"""
+        if self.max_workers <= 0:
+            self._handle_connection(client_socket, sender)
+            return
+
+        try:
+            self.pending_connections.put_nowait((client_socket, sender))
+        except queue.Full:
+            self._increment_metric("rejected")
+            client_socket.close()
+            return
+
+        with self.metrics_lock:
+            self.metrics.max_queue_depth = max(
+                self.metrics.max_queue_depth, self.pending_connections.qsize()
+            )
+
+    def _handle_connection(self, client_socket: socket.socket, sender: tuple[str, int]):
+        """Reads the messages of a connection and handles them"""
+        connection = client.Client(self.message_formatter, client_socket)
+        is_idle = False
+        try:
+            while True:
+                try:
+                    message, _ = connection.receive_message()
+                except ConnectionClosedError:
+                    break
+                if not isinstance(message, MessageDataclass):
+                    raise MessageError(f"Invalid received message : {message}")
+                self.message_handler.handle_message(sender, connection, message)
+                self._increment_metric("handled")
+
+                if client_socket.fileno() == -1:
+                    # Closed by the handler
+                    break
+                if not self._wait_for_next_message(client_socket):
+                    is_idle = True
+                    break
+        except (MessageError, SocketError) as err:
+            self._increment_metric("failed")
+            print(err)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self._increment_metric("failed")
+            print(f"Unexpected error while handling {sender} : {err}")
+        finally:
+            if not (is_idle and self.idle_connections.park(client_socket, sender)):
+                connection.close_connection()
+
+    def _wait_for_next_message(self, client_socket: socket.socket) -> bool:
+        """Checks whether the peer sent another message on the connection.
+        Handled inline, the connection is waited for keep_alive_timeout
+        seconds; with workers, it is only checked, an idle one being parked.
+        Returns False if the connection is idle.
+        """
+        timeout = self.keep_alive_timeout if self.max_workers <= 0 else 0
+        readable, _, _ = select.select([client_socket], [], [], timeout)
+        return len(readable) > 0
+
+    def _start_workers(self):
+        """Starts the worker threads"""
+        for _ in range(max(self.max_workers, 0)):
+            worker = threading.Thread(target=self._work, daemon=True)
+            self.workers.append(worker)
+            worker.start()
+
+    def _work(self):
+        """Handles queued connections until a stop marker is received"""
+        while True:
+            pending_connection = self.pending_connections.get()
+            if pending_connection is None:
+                return
+            self._handle_connection(*pending_connection)
+
+    def _stop_workers(self):
+        """Lets the workers handle the queued connections, then stops them"""
+        for _ in self.workers:
+            self.pending_connections.put(None)
+        for worker in self.workers:
+            worker.join()
+        self.workers.clear()
+
+    def _increment_metric(self, name: str):
+        """Increments a counter of the metrics"""
+        with self.metrics_lock:
+            setattr(self.metrics, name, getattr(self.metrics, name) + 1)
+
+    def get_metrics(self) -> ServerMetrics:
+        """Returns a snapshot of the server metrics"""
+        with self.metrics_lock:
+            return dataclasses.replace(
+                self.metrics, queue_depth=self.pending_connections.qsize()
+            )
 
     def _is_running(self) -> bool:
         """Returns if the server is running"""
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ServerMetrics:
+    """Class to represent the activity counters of a server"""
+
+    accepted: int = 0
+    handled: int = 0
+    failed: int = 0
+    rejected: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
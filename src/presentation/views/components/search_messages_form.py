@@ -0,0 +1,29 @@
+from typing import Callable
+
+from consolemenu.prompt_utils import UserQuit
+
+from src.presentation.views.generics.form import Form
+from src.presentation.views.generics.menu import Menu
+
+
+class SearchMessagesForm(Form):
+    """Form to enter the text to search in a community"""
+
+    def __init__(self, parent_menu: Menu, search: Callable[[str], None]):
+        super().__init__(parent_menu)
+        self.search = search
+
+    def execute(self):
+        """Executes the interaction with the user"""
+        try:
+            is_valid = False
+            while not is_valid:
+                text = self._prompt_user("Que recherchez-vous", enable_quit=True)
+
+                is_valid = len(text.strip()) > 0
+                if not is_valid:
+                    self._print_error("La recherche ne peut pas être vide.")
+
+            self.search(text)
+        except UserQuit:
+            pass
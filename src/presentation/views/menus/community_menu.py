@@ -4,6 +4,7 @@ from src.application.interfaces.icreate_idea import ICreateIdea
 from src.application.interfaces.icreate_opinion import ICreateOpinion
 from src.presentation.views.components.create_idea_form import CreateIdeaForm
 from src.presentation.views.menus.read_ideas_menu import ReadIdeasMenu
+from src.presentation.views.menus.search_messages_menu import SearchMessagesMenu
 from src.presentation.views.components.add_member_form import AddMemberForm
 from src.presentation.views.generics.submenu import SubMenu
 from src.domain.entities.community import Community
@@ -12,7 +13,8 @@ from src.application.interfaces.iread_communities import IReadCommunities
 from src.application.interfaces.iread_ideas_from_community import (
     IReadIdeasFromCommunity,
 )
-from src.application.interfaces.iread_opinions import IReadOpinions
+from src.application.interfaces.iread_discussion import IReadDiscussion
+from src.application.interfaces.isearch_messages import ISearchMessages
 from src.application.interfaces.imachine_service import IMachineService
 
 
@@ -25,7 +27,8 @@ class CommunityMenu(SubMenu):
         add_member_usecase: IAddMember,
         read_communities_usecase: IReadCommunities,
         read_ideas_from_community_usecase: IReadIdeasFromCommunity,
-        read_opinions_usecase: IReadOpinions,
+        read_discussion_usecase: IReadDiscussion,
+        search_messages_usecase: ISearchMessages,
         create_idea_usecase: ICreateIdea,
         create_opinion_usecase: ICreateOpinion,
         machine_service: IMachineService,
@@ -36,7 +39,8 @@ class CommunityMenu(SubMenu):
         self.add_member_usecase = add_member_usecase
         self.read_communities_usecase = read_communities_usecase
         self.read_ideas_from_community_usecase = read_ideas_from_community_usecase
-        self.read_opinions_usecase = read_opinions_usecase
+        self.read_discussion_usecase = read_discussion_usecase
+        self.search_messages_usecase = search_messages_usecase
         self.create_idea_usecase = create_idea_usecase
         self.create_opinion_usecase = create_opinion_usecase
         self.machine_service = machine_service
@@ -56,7 +60,17 @@ class CommunityMenu(SubMenu):
             ReadIdeasMenu(
                 self.community,
                 self.read_ideas_from_community_usecase,
-                self.read_opinions_usecase,
+                self.read_discussion_usecase,
+                self.create_opinion_usecase,
+            ),
+            self,
+        )
+        self.search_item = SubmenuItem(
+            "Rechercher dans la communauté",
+            SearchMessagesMenu(
+                self.community,
+                self.search_messages_usecase,
+                self.read_discussion_usecase,
                 self.create_opinion_usecase,
             ),
             self,
@@ -70,4 +84,6 @@ class CommunityMenu(SubMenu):
             self.append_item(self.create_idea_item)
         if self.community_item not in self.items:
             self.append_item(self.community_item)
+        if self.search_item not in self.items:
+            self.append_item(self.search_item)
         super().draw()
@@ -9,7 +9,8 @@ from src.application.interfaces.iread_communities import IReadCommunities
 from src.application.interfaces.iread_ideas_from_community import (
     IReadIdeasFromCommunity,
 )
-from src.application.interfaces.iread_opinions import IReadOpinions
+from src.application.interfaces.iread_discussion import IReadDiscussion
+from src.application.interfaces.isearch_messages import ISearchMessages
 from src.application.interfaces.imachine_service import IMachineService
 from src.presentation.views.components.create_community_form import CreateCommunityForm
 from src.presentation.views.menus.select_community_menu import SelectCommunityMenu
@@ -24,7 +25,8 @@ class MainMenu(Menu):
         add_member_usecase: IAddMember,
         read_communities_usecase: IReadCommunities,
         read_ideas_from_community_usecase: IReadIdeasFromCommunity,
-        read_opinions_usecase: IReadOpinions,
+        read_discussion_usecase: IReadDiscussion,
+        search_messages_usecase: ISearchMessages,
         create_idea_usecase: ICreateIdea,
         create_opinion_usecase: ICreateOpinion,
         machine_service: IMachineService,
@@ -40,7 +42,8 @@ class MainMenu(Menu):
             add_member_usecase,
             read_communities_usecase,
             read_ideas_from_community_usecase,
-            read_opinions_usecase,
+            read_discussion_usecase,
+            search_messages_usecase,
             create_idea_usecase,
             create_opinion_usecase,
             machine_service,
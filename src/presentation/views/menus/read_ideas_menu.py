@@ -1,10 +1,10 @@
-from consolemenu.items import SubmenuItem
+from consolemenu.items import FunctionItem, SubmenuItem
 from src.application.interfaces.icreate_opinion import ICreateOpinion
 
 from src.application.interfaces.iread_ideas_from_community import (
     IReadIdeasFromCommunity,
 )
-from src.application.interfaces.iread_opinions import IReadOpinions
+from src.application.interfaces.iread_discussion import IReadDiscussion
 from src.presentation.views.menus.read_opinions_menu import ReadOpinionsMenu
 from src.presentation.views.generics.submenu import SubMenu
 from src.domain.entities.community import Community
@@ -12,29 +12,51 @@ from src.domain.entities.idea import Idea
 
 
 class ReadIdeasMenu(SubMenu):
-    """The menu that displays the ideas of a community."""
+    """The menu that displays the ideas of a community, by pages."""
+
+    PAGE_SIZE = 20
 
     def __init__(
         self,
         community: Community,
         read_ideas_usecase: IReadIdeasFromCommunity,
-        read_opinions_usecase: IReadOpinions,
+        read_discussion_usecase: IReadDiscussion,
         create_opinion_usecase: ICreateOpinion,
     ):
         super().__init__(f'Les idées de la communauté "{community.name}"')
 
         self.community = community
         self.read_ideas_usecase = read_ideas_usecase
-        self.read_opinions_usecase = read_opinions_usecase
+        self.read_discussion_usecase = read_discussion_usecase
         self.create_opinion_usecase = create_opinion_usecase
+        # Last idea before each visited page, None for the first one
+        self.pages: list[Idea | None] = [None]
+
+    def start(self, show_exit_option: bool | None = None):
+        """Shows the first page whenever the menu is opened"""
+        self.pages = [None]
+        super().start(show_exit_option)
 
     def draw(self):
-        """Creates the menu with the ideas and shows it"""
+        """Creates the menu with the ideas of the current page and shows it"""
         self.items.clear()
 
-        ideas = self.read_ideas_usecase.execute(self.community.identifier)
-        for idea in ideas:
+        # One more idea is read to know whether there is a next page
+        ideas = self.read_ideas_usecase.execute(
+            self.community.identifier, self.PAGE_SIZE + 1, self.pages[-1]
+        )
+        for idea in ideas[: self.PAGE_SIZE]:
             self._add_idea_item(idea)
+        if len(self.pages) > 1:
+            self.append_item(FunctionItem("Idées précédentes", self.pages.pop))
+        if len(ideas) > self.PAGE_SIZE:
+            self.append_item(
+                FunctionItem(
+                    "Idées suivantes",
+                    self.pages.append,
+                    [ideas[self.PAGE_SIZE - 1]],
+                )
+            )
         self.add_exit()
 
         super().draw()
@@ -44,7 +66,7 @@ class ReadIdeasMenu(SubMenu):
         submenu = ReadOpinionsMenu(
             self.community,
             idea,
-            self.read_opinions_usecase,
+            self.read_discussion_usecase,
             self.create_opinion_usecase,
         )
         item = SubmenuItem(idea.content, submenu, self)
@@ -4,20 +4,29 @@ from src.presentation.views.components.create_opinion_form import CreateOpinionF
 
 from src.presentation.views.generics.submenu import SubMenu
 from src.domain.entities.community import Community
+from src.domain.entities.discussion import Discussion
 from src.domain.entities.idea import Idea
 from src.domain.entities.opinion import Opinion
-from src.application.interfaces.iread_opinions import IReadOpinions
+from src.application.interfaces.iread_discussion import IReadDiscussion
 
 
 class ReadOpinionsMenu(SubMenu):
-    """The menu that displays the opinions of an idea or an opinion."""
+    """The menu that displays the opinions of an idea or an opinion, by pages.
+
+    The menu of an idea reads its whole discussion at once, which the menus
+    of its opinions navigate without reading the database again. Posting an
+    opinion discards the discussion, to be read again on the next draw.
+    """
+
+    PAGE_SIZE = 20
 
     def __init__(
         self,
         community: Community,
         parent_: Idea | Opinion,
-        read_opinions_usecase: IReadOpinions,
+        read_discussion_usecase: IReadDiscussion,
         create_opinion_usecase: ICreateOpinion,
+        idea_menu: "ReadOpinionsMenu | None" = None,
     ):
         super().__init__(self._get_menu_title(parent_))
 
@@ -26,11 +35,15 @@ class ReadOpinionsMenu(SubMenu):
         # so it's named parent_
         self.parent_ = parent_
         self.community = community
-        self.read_opinions_usecase = read_opinions_usecase
+        self.read_discussion_usecase = read_discussion_usecase
         self.create_opinion_usecase = create_opinion_usecase
         self.create_opinion_form = CreateOpinionForm(
             self, self.community, self.parent_, self.create_opinion_usecase
         )
+        # The menu of the idea holds the discussion shared by the submenus
+        self.idea_menu = idea_menu or self
+        self.discussion: Discussion | None = None
+        self.page = 0
 
     def _get_menu_title(self, parent_: Idea | Opinion) -> str:
         """Builds the menu title"""
@@ -38,24 +51,56 @@ class ReadOpinionsMenu(SubMenu):
         name = '"' + parent_.content + '"'
         return f"Les prises de position de {title} {name}"
 
+    def start(self, show_exit_option: bool | None = None):
+        """Shows the first page whenever the menu is opened"""
+        self.page = 0
+        if self.idea_menu is self:
+            self.discussion = None
+        super().start(show_exit_option)
+
+    def _get_discussion(self) -> Discussion:
+        """Returns the discussion of the idea, reading it if needed"""
+        idea_menu = self.idea_menu
+        if idea_menu.discussion is None:
+            idea_menu.discussion = self.read_discussion_usecase.execute(
+                self.community.identifier, idea_menu.parent_.identifier
+            )
+        return idea_menu.discussion
+
     def draw(self):
-        """Creates the menu with the opinions and shows it"""
+        """Creates the menu with the opinions of the current page and shows it"""
         self.items.clear()
 
         self._add_form_item()
-        opinions = self.read_opinions_usecase.execute(
-            self.community.identifier, self.parent_.identifier
-        )
-        for opinion in opinions:
+        opinions = self._get_discussion().get_opinions(self.parent_.identifier)
+        start = self.page * self.PAGE_SIZE
+        for opinion in opinions[start : start + self.PAGE_SIZE]:
             self._add_opinion_item(opinion)
+        if self.page > 0:
+            self.append_item(
+                FunctionItem("Prises de position précédentes", self._change_page, [-1])
+            )
+        if len(opinions) > start + self.PAGE_SIZE:
+            self.append_item(
+                FunctionItem("Prises de position suivantes", self._change_page, [1])
+            )
         self.add_exit()
 
         super().draw()
 
+    def _change_page(self, offset: int):
+        """Moves to another page"""
+        self.page += offset
+
+    def _create_opinion(self):
+        """Shows the form to create an opinion and discards the discussion"""
+        self.create_opinion_form.execute()
+        self.idea_menu.discussion = None
+
     def _add_form_item(self):
         """Adds an item to create an opinion"""
         create_opinion_item = FunctionItem(
-            "Poster une prise de position", self.create_opinion_form.execute
+            "Poster une prise de position", self._create_opinion
         )
         self.append_item(create_opinion_item)
 
@@ -64,8 +109,9 @@ class ReadOpinionsMenu(SubMenu):
         submenu = ReadOpinionsMenu(
             self.community,
             opinion,
-            self.read_opinions_usecase,
+            self.read_discussion_usecase,
             self.create_opinion_usecase,
+            self.idea_menu,
         )
         item = SubmenuItem(opinion.content, submenu, self)
         self.append_item(item)
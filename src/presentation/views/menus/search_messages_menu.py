@@ -0,0 +1,88 @@
+from consolemenu.items import FunctionItem, SubmenuItem
+
+from src.application.interfaces.icreate_opinion import ICreateOpinion
+from src.application.interfaces.iread_discussion import IReadDiscussion
+from src.application.interfaces.isearch_messages import ISearchMessages
+from src.presentation.views.components.search_messages_form import SearchMessagesForm
+from src.presentation.views.menus.read_opinions_menu import ReadOpinionsMenu
+from src.presentation.views.generics.submenu import SubMenu
+from src.domain.entities.community import Community
+from src.domain.entities.idea import Idea
+from src.domain.entities.opinion import Opinion
+
+
+class SearchMessagesMenu(SubMenu):
+    """The menu that searches the ideas and opinions of a community and
+    displays the results, the most relevant first, by pages.
+    """
+
+    PAGE_SIZE = 20
+
+    def __init__(
+        self,
+        community: Community,
+        search_messages_usecase: ISearchMessages,
+        read_discussion_usecase: IReadDiscussion,
+        create_opinion_usecase: ICreateOpinion,
+    ):
+        super().__init__(f'Rechercher dans la communauté "{community.name}"')
+
+        self.community = community
+        self.search_messages_usecase = search_messages_usecase
+        self.read_discussion_usecase = read_discussion_usecase
+        self.create_opinion_usecase = create_opinion_usecase
+        self.search_item = FunctionItem(
+            "Nouvelle recherche", SearchMessagesForm(self, self._search).execute
+        )
+        self.text: str | None = None
+        self.page = 0
+
+    def start(self, show_exit_option: bool | None = None):
+        """Starts a new search whenever the menu is opened"""
+        self._search(None)
+        super().start(show_exit_option)
+
+    def _search(self, text: str | None):
+        """Shows the first page of the results of a search"""
+        self.text = text
+        self.page = 0
+        self.subtitle = None if text is None else f'Résultats pour "{text}"'
+
+    def draw(self):
+        """Creates the menu with the results of the current page and shows it"""
+        self.items.clear()
+
+        self.append_item(self.search_item)
+        if self.text is not None:
+            messages = self.search_messages_usecase.execute(
+                self.community.identifier, self.text, self.PAGE_SIZE, self.page
+            )
+            for message in messages:
+                self._add_message_item(message)
+            if self.page > 0:
+                self.append_item(
+                    FunctionItem("Résultats précédents", self._change_page, [-1])
+                )
+            if len(messages) == self.PAGE_SIZE:
+                self.append_item(
+                    FunctionItem("Résultats suivants", self._change_page, [1])
+                )
+        self.add_exit()
+
+        super().draw()
+
+    def _change_page(self, offset: int):
+        """Moves to another page"""
+        self.page += offset
+
+    def _add_message_item(self, message: Idea | Opinion):
+        """Adds an item opening the opinions of a message to the menu"""
+        kind = "Idée" if isinstance(message, Idea) else "Prise de position"
+        submenu = ReadOpinionsMenu(
+            self.community,
+            message,
+            self.read_discussion_usecase,
+            self.create_opinion_usecase,
+        )
+        item = SubmenuItem(f"{kind} : {message.content}", submenu, self)
+        self.append_item(item)
@@ -10,7 +10,8 @@ from src.application.interfaces.iread_communities import IReadCommunities
 from src.application.interfaces.iread_ideas_from_community import (
     IReadIdeasFromCommunity,
 )
-from src.application.interfaces.iread_opinions import IReadOpinions
+from src.application.interfaces.iread_discussion import IReadDiscussion
+from src.application.interfaces.isearch_messages import ISearchMessages
 from src.application.interfaces.imachine_service import IMachineService
 
 
@@ -22,7 +23,8 @@ class SelectCommunityMenu(SubMenu):
         add_member_usecase: IAddMember,
         read_communities_usecase: IReadCommunities,
         read_ideas_from_community_usecase: IReadIdeasFromCommunity,
-        read_opinions_usecase: IReadOpinions,
+        read_discussion_usecase: IReadDiscussion,
+        search_messages_usecase: ISearchMessages,
         create_idea_usecase: ICreateIdea,
         create_opinion_usecase: ICreateOpinion,
         machine_service: IMachineService,
@@ -32,7 +34,8 @@ class SelectCommunityMenu(SubMenu):
         self.add_member_usecase = add_member_usecase
         self.read_communities_usecase = read_communities_usecase
         self.read_ideas_from_community_usecase = read_ideas_from_community_usecase
-        self.read_opinions_usecase = read_opinions_usecase
+        self.read_discussion_usecase = read_discussion_usecase
+        self.search_messages_usecase = search_messages_usecase
         self.create_idea_usecase = create_idea_usecase
         self.create_opinion_usecase = create_opinion_usecase
         self.machine_service = machine_service
@@ -54,7 +57,8 @@ class SelectCommunityMenu(SubMenu):
             self.add_member_usecase,
             self.read_ideas_from_community_usecase,
             self.read_ideas_from_community_usecase,
-            self.read_opinions_usecase,
+            self.read_discussion_usecase,
+            self.search_messages_usecase,
             self.create_idea_usecase,
             self.create_opinion_usecase,
             self.machine_service,
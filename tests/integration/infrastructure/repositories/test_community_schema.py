@@ -0,0 +1,79 @@
+from contextlib import closing
+import sqlite3
+import pytest
+
+from src.domain.entities.member import Member
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+from src.infrastructure.repositories.member_repository import MemberRepository
+
+
+class TestCommunitySchema:
+    """Test suite for the schema of the community databases"""
+
+    @pytest.fixture(scope="function", autouse=True, name="temp_folder")
+    def create_temporary_testfolder(
+        self, tmp_path_factory: pytest.TempPathFactory
+    ) -> str:
+        """Create a temporary folder for the test."""
+        return str(tmp_path_factory.mktemp("test_community_schema", True))
+
+    def test_migrate_unindexed_community(self, temp_folder: str):
+        """Validates that a community created before the indexes gets them"""
+        database_path = f"{temp_folder}/1234.sqlite"
+        connection_pool = SqliteConnectionPool()
+        SqliteSchema(COMMUNITY_SCHEMA.migrations[:1]).ensure_ready(
+            connection_pool, database_path
+        )
+        repository = MemberRepository(temp_folder, connection_pool)
+        repository.add_member_to_community("1234", Member("abc", "127.0.0.1", 1024))
+
+        member = repository.get_member_for_community("1234", ip_address="127.0.0.1")
+        connection_pool.close()
+
+        assert member.authentication_key == "abc"
+        with closing(sqlite3.connect(database_path)) as connection:
+            (version,) = connection.execute("PRAGMA user_version;").fetchone()
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM nodes WHERE ip_address = ?;",
+                ("127.0.0.1",),
+            ).fetchall()
+        assert version == COMMUNITY_SCHEMA.version
+        assert "nodes_ip_address_idx" in plan[0][3]
+
+    @pytest.mark.parametrize(
+        "query, index",
+        [
+            (
+                "SELECT * FROM messages WHERE parent_message = 'idea';",
+                "messages_parent_creation_idx",
+            ),
+            (
+                "SELECT * FROM messages WHERE parent_message IS NULL;",
+                "messages_parent_creation_idx",
+            ),
+            (
+                "SELECT * FROM nodes WHERE creation_date < '2000' "
+                "ORDER BY creation_date ASC;",
+                "nodes_creation_date_idx",
+            ),
+            (
+                "SELECT * FROM nodes WHERE relationship_id IS NOT NULL;",
+                "nodes_relationship_id_idx",
+            ),
+        ],
+    )
+    def test_lookups_use_indexes(self, temp_folder: str, query: str, index: str):
+        """Validates that the lookups search the indexes"""
+        database_path = f"{temp_folder}/1234.sqlite"
+        connection_pool = SqliteConnectionPool()
+        COMMUNITY_SCHEMA.ensure_ready(connection_pool, database_path)
+        connection_pool.close()
+
+        with closing(sqlite3.connect(database_path)) as connection:
+            plan = connection.execute(f"EXPLAIN QUERY PLAN {query}").fetchall()
+
+        assert index in plan[0][3]
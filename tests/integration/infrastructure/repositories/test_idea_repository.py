@@ -1,3 +1,4 @@
+from datetime import datetime
 import os
 import pytest
 
@@ -77,3 +78,56 @@ class TestIdeaRrepository:
         result = repository.get_idea_from_community(community_id, "2")
 
         assert result is None
+
+    def test_add_ideas_bulk(self, author: Member, temp_folder: str):
+        """Validates that ideas are added at once, ignoring the known ones"""
+        community_id = "1234"
+        repository = IdeaRepository(temp_folder)
+        repository.add_idea_to_community(
+            community_id, Idea("1", "A first idea", author)
+        )
+        ideas = [Idea(str(index), f"Idea number {index}", author) for index in range(5)]
+
+        result = repository.add_ideas_bulk(community_id, ideas)
+
+        assert result == 4
+        stored = repository.get_ideas_by_community(community_id)
+        assert sorted(idea.identifier for idea in stored) == ["0", "1", "2", "3", "4"]
+        assert repository.get_idea_from_community(community_id, "1").content == (
+            "A first idea"
+        )
+
+    def test_add_ideas_bulk_with_invalid_content(
+        self, author: Member, temp_folder: str
+    ):
+        """An invalid idea should reject the whole bulk"""
+        community_id = "1234"
+        repository = IdeaRepository(temp_folder)
+        ideas = [Idea("1", "A first idea", author), Idea("2", "c", author)]
+
+        with pytest.raises(ValueError):
+            repository.add_ideas_bulk(community_id, ideas)
+
+        assert repository.get_ideas_by_community(community_id) == []
+
+    def test_get_ideas_page(self, author: Member, temp_folder: str):
+        """Validates that the ideas are paginated by creation date"""
+        community_id = "1234"
+        repository = IdeaRepository(temp_folder)
+        ideas = [
+            Idea(str(9 - index), f"Idea number {index}", author, datetime(2024, 1, 1))
+            for index in range(3)
+        ] + [
+            Idea(str(index), f"Idea number {index}", author, datetime(2024, 1, 2))
+            for index in range(3, 5)
+        ]
+        repository.add_ideas_bulk(community_id, ideas)
+
+        first_page = repository.get_ideas_page(community_id, 2)
+        second_page = repository.get_ideas_page(community_id, 2, first_page[-1])
+        last_page = repository.get_ideas_page(community_id, 2, second_page[-1])
+
+        assert [idea.identifier for idea in first_page] == ["7", "8"]
+        assert [idea.identifier for idea in second_page] == ["9", "3"]
+        assert [idea.identifier for idea in last_page] == ["4"]
+        assert repository.get_ideas_page(community_id, 2, last_page[-1]) == []
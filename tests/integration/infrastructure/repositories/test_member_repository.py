@@ -309,3 +309,22 @@ class TestMemberRepository:
             assert (
                 actual_members[i].creation_date >= actual_members[i - 1].creation_date
             )
+
+    def test_add_members_bulk(self, temp_folder, member: Member):
+        """Validates that members are added at once, ignoring the known ones"""
+        community_id = "1234"
+        repository = MemberRepository(temp_folder)
+        repository.add_member_to_community(community_id, member)
+        members = [member] + [
+            Member(f"key{index}", f"127.0.0.{index}", 1024) for index in range(3)
+        ]
+
+        result = repository.add_members_bulk(community_id, members, "child")
+
+        assert result == 3
+        related = repository.get_members_from_community(community_id, is_related=True)
+        assert sorted(value.authentication_key for value in related) == [
+            "key0",
+            "key1",
+            "key2",
+        ]
@@ -0,0 +1,158 @@
+from datetime import datetime
+import pytest
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+from src.infrastructure.repositories.common.community_schema import COMMUNITY_SCHEMA
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+from src.infrastructure.repositories.idea_repository import IdeaRepository
+from src.infrastructure.repositories.message_search_repository import (
+    MessageSearchRepository,
+)
+from src.infrastructure.repositories.opinion_repository import OpinionRepository
+
+
+class TestMessageSearchRepository:
+    """Test suite for the MessageSearchRepository class"""
+
+    @pytest.fixture(scope="function", autouse=True, name="temp_folder")
+    def create_temporary_testfolder(
+        self, tmp_path_factory: pytest.TempPathFactory
+    ) -> str:
+        """Create a temporary folder for the test."""
+        return str(tmp_path_factory.mktemp("test_message_search_repository", True))
+
+    @pytest.fixture(scope="function", autouse=True, name="author")
+    def fixture_member(self):
+        """Fixture for the author of the messages."""
+        return Member("1234", "name", 1024)
+
+    def test_search_messages(self, author: Member, temp_folder: str):
+        """Validates that the ideas and opinions matching every word are found"""
+        community_id = "1234"
+        idea = Idea("1", "Un vélo pour chaque étudiant", author, datetime.now())
+        IdeaRepository(temp_folder).add_idea_to_community(community_id, idea)
+        OpinionRepository(temp_folder).add_opinions_bulk(
+            community_id,
+            [
+                Opinion("2", "Les vélos coûtent cher", author, datetime.now(), idea),
+                Opinion("3", "Plutôt des trottinettes", author, datetime.now(), idea),
+            ],
+        )
+        repository = MessageSearchRepository(temp_folder)
+
+        result = repository.search_messages(community_id, "velo", 10)
+        no_result = repository.search_messages(community_id, "velo trottinette", 10)
+
+        assert {message.identifier for message in result} == {"1", "2"}
+        assert isinstance(
+            next(message for message in result if message.identifier == "1"), Idea
+        )
+        assert isinstance(
+            next(message for message in result if message.identifier == "2"), Opinion
+        )
+        assert no_result == []
+
+    def test_search_messages_ranked(self, author: Member, temp_folder: str):
+        """Validates that the most relevant messages come first, by pages"""
+        community_id = "1234"
+        IdeaRepository(temp_folder).add_ideas_bulk(
+            community_id,
+            [
+                Idea("1", "Des arbres dans la cour et un banc", author),
+                Idea("2", "Des arbres, des arbres et encore des arbres", author),
+                Idea("3", "Planter des arbres", author),
+            ],
+        )
+        repository = MessageSearchRepository(temp_folder)
+
+        first_page = repository.search_messages(community_id, "arbres", 2)
+        last_page = repository.search_messages(community_id, "arbres", 2, 2)
+
+        assert [message.identifier for message in first_page] == ["2", "3"]
+        assert [message.identifier for message in last_page] == ["1"]
+
+    def test_search_messages_ranks_most_recent_matches(
+        self, author: Member, temp_folder: str
+    ):
+        """Validates that only the most recent matches are ranked"""
+        community_id = "1234"
+        IdeaRepository(temp_folder).add_ideas_bulk(
+            community_id,
+            [Idea(str(index), f"Idea {index}", author) for index in range(5)],
+        )
+        repository = MessageSearchRepository(temp_folder)
+        repository.MAX_RANKED_MATCHES = 2
+
+        result = repository.search_messages(community_id, "idea", 10)
+
+        assert sorted(message.identifier for message in result) == ["3", "4"]
+
+    @pytest.mark.parametrize("text", ["", "  ", '"*()'])
+    def test_search_messages_without_words(
+        self, author: Member, temp_folder: str, text: str
+    ):
+        """Validates that a text without any word matches nothing"""
+        community_id = "1234"
+        IdeaRepository(temp_folder).add_idea_to_community(
+            community_id, Idea("1", "An idea", author)
+        )
+
+        result = MessageSearchRepository(temp_folder).search_messages(
+            community_id, text, 10
+        )
+
+        assert result == []
+
+    def test_index_messages_written_before_the_index(
+        self, author: Member, temp_folder: str
+    ):
+        """Validates that the messages of a database migrated to the full-text
+        index are indexed by batches
+        """
+        community_id = "1234"
+        connection_pool = SqliteConnectionPool()
+        SqliteSchema(COMMUNITY_SCHEMA.migrations[:3]).ensure_ready(
+            connection_pool, f"{temp_folder}/{community_id}.sqlite"
+        )
+        with connection_pool.connection(
+            f"{temp_folder}/{community_id}.sqlite"
+        ) as connection:
+            connection.executemany(
+                """INSERT INTO messages(identifier, content, author)
+                VALUES (?, ?, ?);""",
+                [(str(index), f"Idea {index}", "1234") for index in range(5)],
+            )
+            connection.commit()
+        repository = MessageSearchRepository(temp_folder, connection_pool)
+        IdeaRepository(temp_folder, connection_pool).add_idea_to_community(
+            community_id, Idea("5", "Idea 5", author)
+        )
+
+        assert len(repository.search_messages(community_id, "idea", 10)) == 1
+        assert repository.index_messages(community_id, 2)
+        assert len(repository.search_messages(community_id, "idea", 10)) == 3
+        assert repository.index_messages(community_id, 2)
+        assert not repository.index_messages(community_id, 2)
+        assert not repository.index_messages(community_id, 2)
+        result = repository.search_messages(community_id, "idea", 10)
+        connection_pool.close()
+
+        assert sorted(message.identifier for message in result) == [
+            "0",
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+        ]
+
+    def test_index_messages_of_new_database(self, temp_folder: str):
+        """Validates that there is nothing to index in a new database"""
+        repository = MessageSearchRepository(temp_folder)
+
+        assert not repository.index_messages("1234", 100)
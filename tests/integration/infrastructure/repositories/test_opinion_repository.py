@@ -101,3 +101,74 @@ class TestOpinionRrepository:
         result = opinion_repository.get_opinion_from_community(community_id, "3")
 
         assert result is None
+
+    def test_add_opinions_bulk(self, author, temp_folder):
+        """Validates that opinions are added at once, ignoring the known ones"""
+        community_id = "1234"
+        idea = Idea("1", "An idea", author, datetime.now())
+        opinions = [
+            Opinion(str(index), f"Opinion {index}", author, datetime.now(), idea)
+            for index in range(2, 6)
+        ]
+        idea_repository = IdeaRepository(temp_folder)
+        opinion_repository = OpinionRepository(temp_folder)
+        idea_repository.add_idea_to_community(community_id, idea)
+        opinion_repository.add_opinion_to_community(community_id, opinions[0])
+
+        result = opinion_repository.add_opinions_bulk(community_id, opinions)
+
+        assert result == 3
+        stored = opinion_repository.get_opinions_by_parent(
+            community_id, idea.identifier
+        )
+        assert sorted(opinion.identifier for opinion in stored) == ["2", "3", "4", "5"]
+
+    def test_get_opinions_page(self, author, temp_folder):
+        """Validates that the opinions are paginated by creation date"""
+        community_id = "1234"
+        idea = Idea("1", "An idea", author, datetime(2024, 1, 1))
+        other_idea = Idea("9", "Another idea", author, datetime(2024, 1, 1))
+        opinions = [
+            Opinion(str(index), f"Opinion {index}", author, datetime(2024, 1, 2), idea)
+            for index in range(2, 5)
+        ] + [Opinion("5", "Opinion 5", author, datetime(2024, 1, 2), other_idea)]
+        idea_repository = IdeaRepository(temp_folder)
+        opinion_repository = OpinionRepository(temp_folder)
+        idea_repository.add_ideas_bulk(community_id, [idea, other_idea])
+        opinion_repository.add_opinions_bulk(community_id, opinions)
+
+        first_page = opinion_repository.get_opinions_page(community_id, "1", 2)
+        last_page = opinion_repository.get_opinions_page(
+            community_id, "1", 2, first_page[-1]
+        )
+
+        assert [opinion.identifier for opinion in first_page] == ["2", "3"]
+        assert [opinion.identifier for opinion in last_page] == ["4"]
+
+    @pytest.mark.parametrize(
+        "max_depth, expected", [(None, ["2", "3", "4", "5"]), (1, ["2", "3"])]
+    )
+    def test_get_opinions_subtree(self, author, temp_folder, max_depth, expected):
+        """Validates that the opinions of an idea are read at any depth"""
+        community_id = "1234"
+        idea = Idea("1", "An idea", author, datetime(2024, 1, 1))
+        other_idea = Idea("9", "Another idea", author, datetime(2024, 1, 1))
+        opinion = Opinion("2", "Opinion 2", author, datetime(2024, 1, 2), idea)
+        reply = Opinion("4", "Opinion 4", author, datetime(2024, 1, 4), opinion)
+        opinions = [
+            opinion,
+            Opinion("3", "Opinion 3", author, datetime(2024, 1, 3), idea),
+            reply,
+            Opinion("5", "Opinion 5", author, datetime(2024, 1, 5), reply),
+            Opinion("6", "Opinion 6", author, datetime(2024, 1, 2), other_idea),
+        ]
+        idea_repository = IdeaRepository(temp_folder)
+        opinion_repository = OpinionRepository(temp_folder)
+        idea_repository.add_ideas_bulk(community_id, [idea, other_idea])
+        opinion_repository.add_opinions_bulk(community_id, opinions)
+
+        result = opinion_repository.get_opinions_subtree(
+            community_id, idea.identifier, max_depth
+        )
+
+        assert [opinion.identifier for opinion in result] == expected
@@ -0,0 +1,94 @@
+import sqlite3
+import threading
+import pytest
+
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+
+
+class TestSqliteConnectionPool:
+    """Test suite for the SqliteConnectionPool class"""
+
+    @pytest.fixture(scope="function", autouse=True, name="database_path")
+    def create_database_path(self, tmp_path_factory: pytest.TempPathFactory) -> str:
+        """Create the path of the test database."""
+        temp_folder = tmp_path_factory.mktemp("test_sqlite_connection_pool", True)
+        return f"{temp_folder}/test.sqlite"
+
+    @pytest.fixture(scope="function", autouse=True, name="connection_pool")
+    def create_connection_pool(self):
+        """Create the connection pool, closed after the test."""
+        connection_pool = SqliteConnectionPool(max_connections=2)
+        yield connection_pool
+        connection_pool.close()
+
+    def test_wal_mode(self, connection_pool: SqliteConnectionPool, database_path):
+        """Validates that the connections are opened in WAL mode"""
+        with connection_pool.connection(database_path) as connection:
+            (journal_mode,) = connection.execute("PRAGMA journal_mode;").fetchone()
+
+        assert journal_mode == "wal"
+
+    def test_connection_reused(
+        self, connection_pool: SqliteConnectionPool, database_path
+    ):
+        """Validates that a released connection is checked out again"""
+        with connection_pool.connection(database_path) as connection:
+            first_connection = connection
+        with connection_pool.connection(database_path) as connection:
+            second_connection = connection
+
+        assert first_connection is second_connection
+
+    def test_rollback_on_error(
+        self, connection_pool: SqliteConnectionPool, database_path
+    ):
+        """Validates that the changes are rolled back when the statement fails"""
+        with connection_pool.connection(database_path) as connection:
+            connection.execute("CREATE TABLE items (name TEXT);")
+            connection.commit()
+
+        with pytest.raises(ValueError):
+            with connection_pool.connection(database_path) as connection:
+                connection.execute("INSERT INTO items VALUES ('item');")
+                raise ValueError("failure")
+
+        with connection_pool.connection(database_path) as connection:
+            assert connection.execute("SELECT * FROM items;").fetchall() == []
+
+    def test_connections_bounded(
+        self, connection_pool: SqliteConnectionPool, database_path
+    ):
+        """Validates that at most max_connections are checked out at once"""
+        checked_out = []
+        peak = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(4)
+
+        def use_connection():
+            barrier.wait()
+            with connection_pool.connection(database_path) as connection:
+                with lock:
+                    checked_out.append(connection)
+                    peak.append(len(checked_out))
+                connection.execute("SELECT 1;").fetchall()
+                with lock:
+                    checked_out.remove(connection)
+
+        threads = [threading.Thread(target=use_connection) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 2
+
+    def test_close(self, connection_pool: SqliteConnectionPool, database_path):
+        """Validates that the connections released after close are closed"""
+        with connection_pool.connection(database_path) as connection:
+            connection_pool.close()
+
+        assert connection_pool.idle_connections == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1;")
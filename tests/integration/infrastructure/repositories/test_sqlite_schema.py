@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+import sqlite3
+import pytest
+
+from src.infrastructure.repositories.common.sqlite_connection_pool import (
+    SqliteConnectionPool,
+)
+from src.infrastructure.repositories.common.sqlite_schema import SqliteSchema
+
+
+class TestSqliteSchema:
+    """Test suite for the SqliteSchema class"""
+
+    @pytest.fixture(scope="function", autouse=True, name="database_path")
+    def create_database_path(self, tmp_path_factory: pytest.TempPathFactory) -> str:
+        """Create the path of the test database."""
+        temp_folder = tmp_path_factory.mktemp("test_sqlite_schema", True)
+        return f"{temp_folder}/test.sqlite"
+
+    @pytest.fixture(scope="function", autouse=True, name="connection_pool")
+    def create_connection_pool(self):
+        """Create the connection pool, closed after the test."""
+        connection_pool = SqliteConnectionPool()
+        yield connection_pool
+        connection_pool.close()
+
+    @staticmethod
+    def _query(connection_pool: SqliteConnectionPool, database_path, query: str):
+        """Run a query on the test database"""
+        with connection_pool.connection(database_path) as connection:
+            return connection.execute(query).fetchall()
+
+    def test_migrate_new_database(
+        self, connection_pool: SqliteConnectionPool, database_path
+    ):
+        """Validates that a new database gets every migration"""
+        schema = SqliteSchema(
+            [
+                ("CREATE TABLE items (name TEXT);",),
+                ("ALTER TABLE items ADD COLUMN size INTEGER;",),
+            ]
+        )
+
+        schema.ensure_ready(connection_pool, database_path)
+
+        assert self._query(connection_pool, database_path, "PRAGMA user_version;") == [
+            (2,)
+        ]
+        assert (
+            self._query(connection_pool, database_path, "SELECT name, size FROM items;")
+            == []
+        )
+
+    def test_migrate_from_older_version(
+        self, connection_pool: SqliteConnectionPool, database_path
+    ):
+        """Validates that only the pending migrations are applied"""
+        SqliteSchema([("CREATE TABLE items (name TEXT);",)]).ensure_ready(
+            connection_pool, database_path
+        )
+        schema = SqliteSchema(
+            [
+                ("CREATE TABLE items (name TEXT);",),
+                ("ALTER TABLE items ADD COLUMN size INTEGER;",),
+            ]
+        )
+
+        schema.ensure_ready(connection_pool, database_path)
+
+        assert self._query(connection_pool, database_path, "PRAGMA user_version;") == [
+            (2,)
+        ]
+
+    def test_ready_database_not_checked_again(self, database_path):
+        """Validates that a ready database is not opened again"""
+        connection_pool = MagicMock()
+        connection = connection_pool.connection.return_value.__enter__.return_value
+        connection.execute.return_value.fetchone.return_value = (1,)
+        schema = SqliteSchema([("CREATE TABLE items (name TEXT);",)])
+
+        schema.ensure_ready(connection_pool, database_path)
+        schema.ensure_ready(connection_pool, database_path)
+
+        connection_pool.connection.assert_called_once_with(database_path)
+
+    def test_failed_migration_rolled_back(
+        self, connection_pool: SqliteConnectionPool, database_path
+    ):
+        """Validates that a failed migration leaves the database unchanged"""
+        schema = SqliteSchema(
+            [("CREATE TABLE items (name TEXT);", "INVALID STATEMENT;")]
+        )
+
+        with pytest.raises(sqlite3.OperationalError):
+            schema.ensure_ready(connection_pool, database_path)
+
+        assert database_path not in schema.ready_databases
+        assert self._query(connection_pool, database_path, "PRAGMA user_version;") == [
+            (0,)
+        ]
+        assert (
+            self._query(
+                connection_pool,
+                database_path,
+                "SELECT name FROM sqlite_master WHERE name = 'items';",
+            )
+            == []
+        )
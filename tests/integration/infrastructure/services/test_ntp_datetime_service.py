@@ -0,0 +1,82 @@
+from datetime import UTC, datetime, timedelta
+import socket
+import threading
+import time
+import ntplib
+import pytest
+
+from src.infrastructure.services.ntp_datetime_service import NtpDatetimeService
+
+
+class LocalNtpServer:
+    """NTP server on the loopback, answering with the system time shifted"""
+
+    def __init__(self, shift: float):
+        self.shift = shift
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """Answers the requests until the socket is closed"""
+        while True:
+            try:
+                data, address = self.socket.recvfrom(256)
+            except OSError:
+                return
+            request = ntplib.NTPPacket()
+            request.from_data(data)
+            now = ntplib.system_to_ntp_time(time.time() + self.shift)
+            response = ntplib.NTPPacket(version=request.version, mode=4)
+            response.stratum = 1
+            response.orig_timestamp = request.tx_timestamp
+            response.recv_timestamp = now
+            response.tx_timestamp = now
+            self.socket.sendto(response.to_data(), address)
+
+    def close(self):
+        """Stops the server"""
+        self.socket.close()
+
+
+class TestNtpDatetimeService:
+    """Test class for NtpDatetimeService with a local NTP server"""
+
+    @pytest.fixture(scope="function", name="ntp_server")
+    def create_ntp_server(self):
+        """Create a local NTP server one day ahead"""
+        ntp_server = LocalNtpServer(timedelta(days=1).total_seconds())
+        yield ntp_server
+        ntp_server.close()
+
+    def test_get_datetime(self, ntp_server: LocalNtpServer):
+        """Test the timestamps follow the NTP server"""
+        datetime_service = NtpDatetimeService("127.0.0.1", ntp_server.port, timeout=1)
+
+        ntp_datetime = datetime_service.get_datetime()
+
+        datetime_service.stop()
+        expected = datetime.now(UTC) + timedelta(days=1)
+        assert abs(ntp_datetime - expected) < timedelta(seconds=1)
+        assert datetime_service.get_staleness() is not None
+
+    def test_set_ntp_server(self, ntp_server: LocalNtpServer):
+        """Test the timestamps follow the server swapped in"""
+        other_ntp_server = LocalNtpServer(timedelta(days=2).total_seconds())
+        datetime_service = NtpDatetimeService("127.0.0.1", ntp_server.port, timeout=1)
+        datetime_service.get_datetime()
+
+        datetime_service.set_ntp_server("127.0.0.1", other_ntp_server.port)
+        deadline = time.monotonic() + 5
+        while (
+            datetime_service.get_datetime() - datetime.now(UTC) < timedelta(days=1.5)
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+
+        datetime_service.stop()
+        other_ntp_server.close()
+        expected = datetime.now(UTC) + timedelta(days=2)
+        assert abs(datetime_service.get_datetime() - expected) < timedelta(seconds=1)
@@ -0,0 +1,152 @@
+from unittest import mock
+from unittest.mock import MagicMock
+import threading
+import time
+import pytest
+
+from src.application.architecture_manager.outbound_queue import OutboundQueue
+from src.presentation.formatting.message_batch import MessageBatch
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+
+
+class TestOutboundQueue:
+    """Test class for OutboundQueue"""
+
+    @pytest.fixture(scope="function", autouse=True, name="outbound_queue")
+    def create_outbound_queue(self):
+        """Create an OutboundQueue whose linger never ends by itself"""
+        outbound_queue = OutboundQueue(MagicMock(), linger=60, max_batch_size=3)
+        yield outbound_queue
+        outbound_queue.close()
+
+    def test_flush_coalesces_messages(self, outbound_queue: OutboundQueue):
+        """Test the messages queued for a peer are sent as one batch"""
+        messages = [
+            MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id"),
+            MessageDataclass(MessageHeader.CREATE_OPINION, "opinion", "id"),
+        ]
+        for message in messages:
+            outbound_queue.enqueue("127.0.0.1", 1664, message)
+
+        outbound_queue.close()
+
+        outbound_queue.connection_pool.send_message.assert_called_once_with(
+            "127.0.0.1", 1664, MessageBatch.pack(messages)
+        )
+
+    def test_single_message_not_batched(self, outbound_queue: OutboundQueue):
+        """Test a lone message is sent as is"""
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+        outbound_queue.enqueue("127.0.0.1", 1664, message)
+
+        outbound_queue.close()
+
+        outbound_queue.connection_pool.send_message.assert_called_once_with(
+            "127.0.0.1", 1664, message
+        )
+
+    def test_queues_are_per_peer(self, outbound_queue: OutboundQueue):
+        """Test messages to different peers are not mixed"""
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+        outbound_queue.enqueue("127.0.0.1", 1664, message)
+        outbound_queue.enqueue("127.0.0.2", 1664, message)
+
+        outbound_queue.close()
+
+        outbound_queue.connection_pool.send_message.assert_has_calls(
+            [
+                mock.call("127.0.0.1", 1664, message),
+                mock.call("127.0.0.2", 1664, message),
+            ],
+            any_order=True,
+        )
+
+    def test_full_batch_sent_early(self, outbound_queue: OutboundQueue):
+        """Test a peer is flushed once max_batch_size messages are waiting"""
+        sent = threading.Event()
+        outbound_queue.connection_pool.send_message.side_effect = lambda *_: sent.set()
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+
+        for _ in range(outbound_queue.max_batch_size):
+            outbound_queue.enqueue("127.0.0.1", 1664, message)
+
+        assert sent.wait(5)
+        assert not outbound_queue.pending
+
+    @mock.patch("src.application.interfaces.iconnection_pool", name="connection_pool")
+    def test_linger_window(self, connection_pool: MagicMock):
+        """Test queued messages are sent once the linger window is over"""
+        sent = threading.Event()
+        connection_pool.send_message.side_effect = lambda *_: sent.set()
+        outbound_queue = OutboundQueue(connection_pool, linger=0.01)
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+
+        outbound_queue.enqueue("127.0.0.1", 1664, message)
+
+        assert sent.wait(5)
+        outbound_queue.close()
+        connection_pool.send_message.assert_called_once_with("127.0.0.1", 1664, message)
+
+    def test_send_error_reported(self, outbound_queue: OutboundQueue):
+        """Test an unreachable peer does not stop the queue and fails its
+        messages"""
+        error = ConnectionRefusedError()
+        outbound_queue.connection_pool.send_message.side_effect = error
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+        futures = [
+            outbound_queue.enqueue("127.0.0.1", 1664, message),
+            outbound_queue.enqueue("127.0.0.2", 1664, message),
+        ]
+
+        outbound_queue.close()
+
+        assert outbound_queue.connection_pool.send_message.call_count == 2
+        assert [future.exception() for future in futures] == [error, error]
+
+    def test_sent_messages_resolved(self, outbound_queue: OutboundQueue):
+        """Test the futures of the sent messages give the time to send them"""
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+        futures = [outbound_queue.enqueue("127.0.0.1", 1664, message) for _ in range(2)]
+
+        outbound_queue.flush()
+
+        assert all(future.result(5) >= 0 for future in futures)
+
+    def test_enqueue_after_close(self, outbound_queue: OutboundQueue):
+        """Test a message queued once the queue is closed is failed"""
+        outbound_queue.close()
+
+        future = outbound_queue.enqueue(
+            "127.0.0.1", 1664, MessageDataclass(MessageHeader.CREATE_IDEA, "idea")
+        )
+
+        assert isinstance(future.exception(), RuntimeError)
+        outbound_queue.connection_pool.send_message.assert_not_called()
+
+    def test_one_batch_in_flight_per_peer(self, outbound_queue: OutboundQueue):
+        """Test the batches of a peer are sent one after another, in order"""
+        release = threading.Event()
+        sending = threading.Event()
+        sent: list[MessageDataclass] = []
+
+        def send_message(_ip_address, _port, message):
+            sending.set()
+            release.wait(5)
+            sent.append(message)
+
+        outbound_queue.connection_pool.send_message.side_effect = send_message
+        member = MessageDataclass(MessageHeader.ADD_MEMBER, "member", "id")
+        idea = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+
+        outbound_queue.enqueue("127.0.0.1", 1664, member)
+        outbound_queue.flush()
+        assert sending.wait(5)
+        future = outbound_queue.enqueue("127.0.0.1", 1664, idea)
+        outbound_queue.flush()
+        time.sleep(0.05)
+
+        assert outbound_queue.connection_pool.send_message.call_count == 1
+        release.set()
+        future.result(5)
+        assert sent == [member, idea]
@@ -1,7 +1,13 @@
+from concurrent.futures import Future
 from unittest import mock
 from unittest.mock import MagicMock
+import socket
+import time
 import pytest
 
+from src.application.architecture_manager.share_outcome import ShareOutcome
+from src.application.architecture_manager.share_status import ShareStatus
+from src.application.exceptions.socket_error import SocketError
 from src.domain.entities.member import Member
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
@@ -77,7 +83,7 @@ class TestShareInformation:
 
         mock_client.connect_to_server.assert_called()
         mock_client.send_message.assert_called()
-        mock_client.close_connection.assert_called()
+        mock_client.close_connection.assert_not_called()
 
     @mock.patch("src.presentation.network.client.Client", name="mock_client")
     def test_share_send_message_count(
@@ -199,3 +205,287 @@ class TestShareInformation:
         share_information.execute(message, community_id)
 
         mock_client.send_message.assert_not_called()
+
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_share_reuses_connections(
+        self, mock_client: MagicMock, share_information: ShareInformation
+    ):
+        """Test a second share reuses the warm connections."""
+        mock_client.return_value = mock_client
+        mock_client.is_connected.return_value = True
+        members = [
+            Member("abc", "127.0.0.1", 0),
+            Member("abc2", "127.0.0.2", 0),
+            Member("abc3", "127.0.0.3", 0),
+        ]
+
+        community_id = "community_id"
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "content", community_id)
+
+        share_information.member_repository.get_members_from_community.return_value = (
+            members
+        )
+        share_information.machine_service.get_current_user.return_value = members[0]
+
+        share_information.execute(message, community_id)
+        share_information.execute(message, community_id)
+
+        assert mock_client.connect_to_server.call_count == 2
+        assert mock_client.send_message.call_count == 4
+
+    @mock.patch(
+        "src.application.interfaces.imember_repository", name="member_repository"
+    )
+    @mock.patch(
+        "src.application.interfaces.imessage_formatter", name="message_formatter"
+    )
+    @mock.patch("src.application.interfaces.imachine_service", name="machine_service")
+    @mock.patch("src.application.interfaces.iconnection_pool", name="connection_pool")
+    def test_share_with_connection_pool(
+        self,
+        connection_pool: MagicMock,
+        machine_service: MagicMock,
+        message_formatter: MagicMock,
+        member_repository: MagicMock,
+    ):
+        """Test messages are sent through the given connection pool."""
+        share_information = ShareInformation(
+            member_repository, message_formatter, machine_service, connection_pool
+        )
+        members = [Member("abc", "127.0.0.1", 0), Member("abc2", "127.0.0.2", 1)]
+        community_id = "community_id"
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "content", community_id)
+        member_repository.get_members_from_community.return_value = members
+        machine_service.get_current_user.return_value = members[0]
+
+        share_information.execute(message, community_id)
+
+        connection_pool.send_message.assert_called_once_with("127.0.0.2", 1, message)
+
+    @mock.patch(
+        "src.application.interfaces.imember_repository", name="member_repository"
+    )
+    @mock.patch(
+        "src.application.interfaces.imessage_formatter", name="message_formatter"
+    )
+    @mock.patch("src.application.interfaces.imachine_service", name="machine_service")
+    @mock.patch("src.application.interfaces.iconnection_pool", name="connection_pool")
+    def test_share_outcomes(
+        self,
+        connection_pool: MagicMock,
+        machine_service: MagicMock,
+        message_formatter: MagicMock,
+        member_repository: MagicMock,
+    ):
+        """Test the outcome of each relay is reported."""
+        share_information = ShareInformation(
+            member_repository, message_formatter, machine_service, connection_pool
+        )
+        members = [
+            Member("abc", "127.0.0.1", 0),
+            Member("abc2", "127.0.0.2", 1),
+            Member("abc3", "127.0.0.3", 2),
+            Member("abc4", "127.0.0.4", 3),
+            Member("abc5", "127.0.0.5", 4),
+        ]
+        errors = {
+            "127.0.0.3": SocketError("Refused"),
+            "127.0.0.4": SocketError("Timed out"),
+            "127.0.0.5": SocketError("Unreachable"),
+        }
+        errors["127.0.0.3"].__cause__ = ConnectionRefusedError()
+        errors["127.0.0.4"].__cause__ = socket.timeout()
+        errors["127.0.0.5"].__cause__ = OSError()
+
+        def send_message(ip_address, *_):
+            if ip_address in errors:
+                raise errors[ip_address]
+
+        connection_pool.send_message.side_effect = send_message
+        community_id = "community_id"
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "content", community_id)
+        member_repository.get_members_from_community.return_value = members
+        machine_service.get_current_user.return_value = members[0]
+
+        outcomes = share_information.execute(message, community_id)
+
+        assert [outcome.authentication_key for outcome in outcomes] == [
+            "abc2",
+            "abc3",
+            "abc4",
+            "abc5",
+        ]
+        assert [outcome.status for outcome in outcomes] == [
+            ShareStatus.OK,
+            ShareStatus.REFUSED,
+            ShareStatus.TIMEOUT,
+            ShareStatus.ERROR,
+        ]
+        assert all(outcome.latency is not None for outcome in outcomes)
+
+    @mock.patch(
+        "src.application.interfaces.imember_repository", name="member_repository"
+    )
+    @mock.patch(
+        "src.application.interfaces.imessage_formatter", name="message_formatter"
+    )
+    @mock.patch("src.application.interfaces.imachine_service", name="machine_service")
+    @mock.patch("src.application.interfaces.iconnection_pool", name="connection_pool")
+    def test_share_deadline(
+        self,
+        connection_pool: MagicMock,
+        machine_service: MagicMock,
+        message_formatter: MagicMock,
+        member_repository: MagicMock,
+    ):
+        """Test slow members do not delay the others past the deadline."""
+        share_information = ShareInformation(
+            member_repository,
+            message_formatter,
+            machine_service,
+            connection_pool,
+            deadline=0.2,
+        )
+        members = [
+            Member("abc", "127.0.0.1", 0),
+            Member("abc2", "127.0.0.2", 1),
+            Member("abc3", "127.0.0.3", 2),
+            Member("abc4", "127.0.0.4", 3),
+        ]
+
+        def send_message(ip_address, *_):
+            if ip_address != "127.0.0.2":
+                time.sleep(1)
+
+        connection_pool.send_message.side_effect = send_message
+        community_id = "community_id"
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "content", community_id)
+        member_repository.get_members_from_community.return_value = members
+        machine_service.get_current_user.return_value = members[0]
+
+        start = time.monotonic()
+        outcomes = share_information.execute(message, community_id)
+
+        assert time.monotonic() - start < 0.9
+        assert [outcome.status for outcome in outcomes] == [
+            ShareStatus.OK,
+            ShareStatus.TIMEOUT,
+            ShareStatus.TIMEOUT,
+        ]
+
+    def test_share_keeps_excluded_lists(self, share_information: ShareInformation):
+        """Test the excluded lists of the caller are left untouched."""
+        members = [Member("abc", "127.0.0.1", 0)]
+        share_information.member_repository.get_members_from_community.return_value = (
+            members
+        )
+        share_information.machine_service.get_current_user.return_value = members[0]
+        excluded_auth_keys = ["abc2"]
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "content", "id")
+
+        share_information.execute(message, "id", excluded_auth_keys)
+        share_information.execute(message, "id")
+
+        assert excluded_auth_keys == ["abc2"]
+
+    @mock.patch(
+        "src.application.interfaces.imember_repository", name="member_repository"
+    )
+    @mock.patch(
+        "src.application.interfaces.imessage_formatter", name="message_formatter"
+    )
+    @mock.patch("src.application.interfaces.imachine_service", name="machine_service")
+    @mock.patch("src.application.interfaces.iconnection_pool", name="connection_pool")
+    @mock.patch("src.application.interfaces.ioutbound_queue", name="outbound_queue")
+    def test_share_with_outbound_queue(
+        self,
+        outbound_queue: MagicMock,
+        connection_pool: MagicMock,
+        machine_service: MagicMock,
+        message_formatter: MagicMock,
+        member_repository: MagicMock,
+    ):
+        """Test batchable messages are queued and the others sent directly."""
+        share_information = ShareInformation(
+            member_repository,
+            message_formatter,
+            machine_service,
+            connection_pool,
+            outbound_queue=outbound_queue,
+        )
+        members = [Member("abc", "127.0.0.1", 0), Member("abc2", "127.0.0.2", 1)]
+        member_repository.get_members_from_community.return_value = members
+        machine_service.get_current_user.return_value = members[0]
+        idea = MessageDataclass(MessageHeader.CREATE_IDEA, "content", "id")
+        ping = MessageDataclass(MessageHeader.PING, None, "id")
+        sent: Future = Future()
+        sent.set_result(0.01)
+        outbound_queue.enqueue.return_value = sent
+
+        outcomes = share_information.execute(idea, "id")
+        share_information.execute(ping, "id")
+
+        assert outcomes == [ShareOutcome("abc2", "127.0.0.2", 1, ShareStatus.OK, 0.01)]
+        outbound_queue.enqueue.assert_called_once_with("127.0.0.2", 1, idea)
+        connection_pool.send_message.assert_called_once_with("127.0.0.2", 1, ping)
+
+    @mock.patch(
+        "src.application.interfaces.imember_repository", name="member_repository"
+    )
+    @mock.patch(
+        "src.application.interfaces.imessage_formatter", name="message_formatter"
+    )
+    @mock.patch("src.application.interfaces.imachine_service", name="machine_service")
+    @mock.patch("src.application.interfaces.ioutbound_queue", name="outbound_queue")
+    def test_share_queued_outcomes(
+        self,
+        outbound_queue: MagicMock,
+        machine_service: MagicMock,
+        message_formatter: MagicMock,
+        member_repository: MagicMock,
+    ):
+        """Test the outcome of each queued relay is reported"""
+        share_information = ShareInformation(
+            member_repository,
+            message_formatter,
+            machine_service,
+            MagicMock(),
+            deadline=0.05,
+            outbound_queue=outbound_queue,
+        )
+        members = [
+            Member("author", "127.0.0.1", 0),
+            Member("refused", "127.0.0.2", 0),
+            Member("error", "127.0.0.3", 0),
+            Member("slow", "127.0.0.4", 0),
+        ]
+        member_repository.get_members_from_community.return_value = members
+        machine_service.get_current_user.return_value = members[0]
+        refused: Future = Future()
+        refused.set_exception(SocketError("refused"))
+        refused.exception().__cause__ = ConnectionRefusedError()
+        failed: Future = Future()
+        failed.set_exception(ValueError())
+        outbound_queue.enqueue.side_effect = [refused, failed, Future()]
+
+        outcomes = share_information.execute(
+            MessageDataclass(MessageHeader.CREATE_IDEA, "content", "id"), "id"
+        )
+
+        assert [outcome.status for outcome in outcomes] == [
+            ShareStatus.REFUSED,
+            ShareStatus.ERROR,
+            ShareStatus.TIMEOUT,
+        ]
+        assert all(outcome.latency is None for outcome in outcomes)
+
+    def test_close_waits_for_relays(self, share_information: ShareInformation):
+        """Test closing waits for the relays in progress then stops sharing"""
+        started = time.monotonic()
+        share_information.executor.submit(time.sleep, 0.1)
+
+        share_information.close()
+
+        assert time.monotonic() - started >= 0.1
+        with pytest.raises(RuntimeError):
+            share_information.executor.submit(time.sleep, 0)
@@ -2,6 +2,7 @@ import pytest
 from src.application.exceptions.authentification_failed_error import (
     AuthentificationFailedError,
 )
+from src.application.exceptions.connection_closed_error import ConnectionClosedError
 from src.application.exceptions.community_already_exists_error import (
     CommunityAlreadyExistsError,
 )
@@ -28,6 +29,7 @@ class TestApplicationExceptions:
         [
             AuthentificationFailedError(message),
             CommunityAlreadyExistsError(message),
+            ConnectionClosedError(message),
             IdeaAlreadyExistsError(message),
             MemberAlreadyExistsError(message),
             MessageError(message),
@@ -44,6 +46,7 @@ class TestApplicationExceptions:
         [
             AuthentificationFailedError(message),
             CommunityAlreadyExistsError(message),
+            ConnectionClosedError(message),
             IdeaAlreadyExistsError(message),
             MemberAlreadyExistsError(message),
             MessageError(message),
@@ -60,6 +63,7 @@ class TestApplicationExceptions:
         [
             AuthentificationFailedError(message),
             CommunityAlreadyExistsError(message),
+            ConnectionClosedError(message),
             IdeaAlreadyExistsError(message),
             MemberAlreadyExistsError(message),
             MessageError(message),
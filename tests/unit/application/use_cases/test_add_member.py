@@ -3,9 +3,11 @@ from unittest.mock import MagicMock
 from datetime import datetime
 import pytest
 
+from src.application.exceptions.socket_error import SocketError
 from src.domain.entities.community import Community
 from src.domain.entities.member import Member
 from src.application.use_cases.add_member import AddMember
+from src.infrastructure.services.compression_service import CompressionService
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
 
@@ -81,9 +83,12 @@ class TestAddMember:
             "private_key",
         )
         machine_service.get_auth_key.return_value = "auth_key"
-        file_service.read_file.return_value = b"community_database"
         datetime_service.get_datetime.return_value = datetime(1970, 1, 1, 00, 00, 00)
         community_service.get_community_symetric_key.return_value = "symetric_key"
+        snapshot_service = MagicMock()
+        snapshot_service.read_chunks.side_effect = lambda _: iter(
+            [(0, b"community_"), (1, b"database")]
+        )
         return AddMember(
             "base_path",
             uuid_generator,
@@ -97,6 +102,8 @@ class TestAddMember:
             message_formatter,
             community_service,
             architecture_manager,
+            CompressionService(),
+            snapshot_service,
         )
 
     @mock.patch("src.presentation.network.client.Client", name="mock_client")
@@ -372,6 +379,31 @@ class TestAddMember:
             "symetric_key", "public_key"
         )
 
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_encrypt_symetric_key_from_keyring(
+        self,
+        mock_client: MagicMock,
+        add_member_usecase: AddMember,
+    ):
+        """Method to test that a key held decoded by a keyring is sent as a
+        hex string"""
+        guest = tuple(["127.0.0.1", 1111])
+        mock_client.receive_message.side_effect = [
+            tuple([MessageDataclass(MessageHeader.DATA, "public_key"), guest]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_auth_code"), guest]),
+            tuple([MessageDataclass(MessageHeader.ACK), guest]),
+        ]
+        mock_client.return_value = mock_client
+        add_member_usecase.community_service.get_community_symetric_key.return_value = (
+            b"\x6b\x65\x79"
+        )
+
+        add_member_usecase.execute("abc", "127.0.0.1", 1234)
+
+        add_member_usecase.asymetric_encryption_service.encrypt.assert_any_call(
+            "6b6579", "public_key"
+        )
+
     @mock.patch("src.presentation.network.client.Client", name="mock_client")
     def test_send_symetric_key(
         self,
@@ -564,11 +596,13 @@ class TestAddMember:
         ]
         mock_client.return_value = mock_client
 
-        database_path = "base_path/abc.sqlite"
         add_member_usecase.execute("abc", "127.0.0.1", 1234)
 
-        add_member_usecase.file_service.read_file.assert_any_call(
-            database_path, with_binary_format=True
+        add_member_usecase.snapshot_service.create_snapshot.assert_called_once_with(
+            "abc", []
+        )
+        add_member_usecase.snapshot_service.remove_snapshot.assert_called_once_with(
+            add_member_usecase.snapshot_service.create_snapshot.return_value.identifier
         )
 
     @mock.patch("src.presentation.network.client.Client", name="mock_client")
@@ -593,6 +627,117 @@ class TestAddMember:
             "symetric_key",
         )
 
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_encrypt_compressed_community_database(
+        self,
+        mock_client: MagicMock,
+        add_member_usecase: AddMember,
+    ):
+        """Method to test that the database is compressed with a codec of the guest"""
+        guest = tuple(["127.0.0.1", 1111])
+        mock_client.receive_message.side_effect = [
+            tuple([MessageDataclass(MessageHeader.DATA, "public_key"), guest]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_auth_code"), guest]),
+            tuple([MessageDataclass(MessageHeader.ACK, "zlib"), guest]),
+        ]
+        mock_client.return_value = mock_client
+        database = bytes(4096)
+        add_member_usecase.snapshot_service.read_chunks.side_effect = lambda _: iter(
+            [(0, database)]
+        )
+
+        add_member_usecase.execute("abc", "127.0.0.1", 1234)
+
+        (
+            plaintext,
+            _,
+        ) = add_member_usecase.symetric_encryption_service.encrypt.call_args_list[
+            1
+        ].args
+        assert plaintext.startswith("zlib:")
+        assert (
+            add_member_usecase.compression_service.decompress_bytes(plaintext)
+            == database
+        )
+
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_send_community_database_snapshot(
+        self,
+        mock_client: MagicMock,
+        add_member_usecase: AddMember,
+    ):
+        """Method to test that a snapshot of the database is sent when the guest
+        reads binary payloads"""
+        guest = tuple(["127.0.0.1", 1111])
+        mock_client.receive_message.side_effect = [
+            tuple([MessageDataclass(MessageHeader.DATA, "public_key"), guest]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_auth_code"), guest]),
+            tuple([MessageDataclass(MessageHeader.ACK, "binary,zlib"), guest]),
+        ]
+        mock_client.return_value = mock_client
+        add_member_usecase.send_snapshot_usecase = MagicMock()
+
+        add_member_usecase.execute("abc", "127.0.0.1", 1234)
+
+        add_member_usecase.send_snapshot_usecase.send_snapshot.assert_called_once_with(
+            mock_client, "abc", "symetric_key", ["binary", "zlib"]
+        )
+        add_member_usecase.snapshot_service.create_snapshot.assert_not_called()
+
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_share_add_member_when_snapshot_interrupted(
+        self,
+        mock_client: MagicMock,
+        add_member_usecase: AddMember,
+    ):
+        """Method to test that the new member is relayed even if the transfer
+        of the database breaks"""
+        guest = tuple(["127.0.0.1", 1111])
+        mock_client.receive_message.side_effect = [
+            tuple([MessageDataclass(MessageHeader.DATA, "public_key"), guest]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_auth_code"), guest]),
+            tuple([MessageDataclass(MessageHeader.ACK, "binary,zlib"), guest]),
+        ]
+        mock_client.return_value = mock_client
+        add_member_usecase.send_snapshot_usecase = MagicMock()
+        add_member_usecase.send_snapshot_usecase.send_snapshot.side_effect = (
+            SocketError("Connection reset")
+        )
+
+        result = add_member_usecase.execute("abc", "127.0.0.1", 1234)
+
+        assert result != "Success!"
+        add_member_usecase.architecture_manager.share_information.assert_called_once()
+        (
+            message,
+            community_id,
+            excluded,
+        ) = add_member_usecase.architecture_manager.share_information.call_args.args
+        assert message.header == MessageHeader.ADD_MEMBER
+        assert community_id == "abc"
+        assert excluded == [add_member_usecase.uuid_generator.generate.return_value]
+
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_send_community_database_after_saves(
+        self,
+        mock_client: MagicMock,
+        add_member_usecase: AddMember,
+    ):
+        """Method to test that the queued saves of the community are committed
+        before its database is sent"""
+        guest = tuple(["127.0.0.1", 1111])
+        mock_client.receive_message.side_effect = [
+            tuple([MessageDataclass(MessageHeader.DATA, "public_key"), guest]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_auth_code"), guest]),
+            tuple([MessageDataclass(MessageHeader.ACK), guest]),
+        ]
+        mock_client.return_value = mock_client
+        add_member_usecase.write_behind_queue = MagicMock()
+
+        add_member_usecase.execute("abc", "127.0.0.1", 1234)
+
+        add_member_usecase.write_behind_queue.flush.assert_called_once_with("abc")
+
     @mock.patch("src.presentation.network.client.Client", name="mock_client")
     def test_send_community_database(
         self,
@@ -687,8 +832,8 @@ class TestAddMember:
 
         add_member_usecase.execute("abc", ip_address, port)
 
-        add_member_usecase.symetric_encryption_service.encrypt.assert_any_call(
-            "auth_code,127.0.0.1,1664,1970-01-01T00:00:00,None",
+        add_member_usecase.symetric_encryption_service.encrypt_bytes.assert_any_call(
+            b"\x00auth_code,127.0.0.1,1664,1970-01-01T00:00:00,None",
             "symetric_key",
         )
 
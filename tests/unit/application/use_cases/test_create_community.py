@@ -128,6 +128,21 @@ class TestCreateCommunity:
 
         create_community_mocks.file_service.write_file.assert_called_once()
 
+    def test_create_community_should_add_symetric_key_to_keyring(
+        self,
+        create_community_mocks: CreateCommunity,
+    ):
+        """Creating a new community should add its key to the keyring."""
+        create_community_mocks.keyring = MagicMock()
+        create_community_mocks.encryption_service.generate_key.return_value = "key"
+
+        create_community_mocks.execute("Test Community", "description")
+
+        community_id = create_community_mocks.id_generator_service.generate.return_value
+        create_community_mocks.keyring.add_key.assert_called_once_with(
+            community_id, "key"
+        )
+
     def test_create_community_initialize_db(
         self,
         create_community_mocks: CreateCommunity,
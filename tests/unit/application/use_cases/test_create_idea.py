@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.create_idea import CreateIdea
+from src.infrastructure.services.compression_service import CompressionService
 
 
 class TestCreateIdea:
@@ -55,6 +56,7 @@ class TestCreateIdea:
             datetime_service_mock,
             community_service,
             architecture_manager,
+            CompressionService(),
         )
 
     def test_create_idea_calls_repository(
@@ -84,7 +86,7 @@ class TestCreateIdea:
 
         create_idea_usecase.execute("1", "content")
 
-        create_idea_usecase.symetric_encryption_service.encrypt.assert_called()
+        create_idea_usecase.symetric_encryption_service.encrypt_bytes.assert_called()
 
     def test_success_output(
         self,
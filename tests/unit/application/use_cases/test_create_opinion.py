@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.create_opinion import CreateOpinion
+from src.infrastructure.services.compression_service import CompressionService
 from src.domain.entities.idea import Idea
 from src.domain.entities.member import Member
 from src.domain.entities.opinion import Opinion
@@ -69,6 +70,7 @@ class TestCreateOpinion:
             datetime_service_mock,
             community_service,
             architecture_manager,
+            CompressionService(),
         )
 
     @pytest.fixture(scope="function", autouse=True, name="idea")
@@ -117,7 +119,7 @@ class TestCreateOpinion:
         """Creating an opinion should call the symetric encryption method"""
         create_opinion_usecase.execute("1", "1", "content")
 
-        create_opinion_usecase.symetric_encryption_service.encrypt.assert_called()
+        create_opinion_usecase.symetric_encryption_service.encrypt_bytes.assert_called()
 
     def test_create_opinion_reads_symetric_key_file(
         self,
@@ -0,0 +1,64 @@
+from unittest import mock
+from unittest.mock import MagicMock, call
+
+from src.domain.entities.community import Community
+from src.application.use_cases.index_messages import IndexMessages
+
+
+class TestIndexMessages:
+    """Unit test for the use case of indexing the messages of the communities."""
+
+    @mock.patch(
+        "src.application.interfaces.imessage_search_repository",
+        name="message_search_repository",
+    )
+    @mock.patch(
+        "src.application.interfaces.icommunity_repository",
+        name="community_repository",
+    )
+    def test_index_messages(
+        self, community_repository: MagicMock, message_search_repository: MagicMock
+    ):
+        """Test the messages of every community are indexed by batches."""
+        community_repository.get_communities.return_value = [
+            Community("1", "name", "desc"),
+            Community("2", "name", "desc"),
+        ]
+        message_search_repository.index_messages.side_effect = [
+            True,
+            False,
+            Exception("Database is locked"),
+        ]
+        use_case = IndexMessages(
+            community_repository, message_search_repository, 100, 0
+        )
+
+        use_case.execute()
+
+        assert message_search_repository.index_messages.call_args_list == [
+            call("1", 100),
+            call("1", 100),
+            call("2", 100),
+        ]
+
+    @mock.patch(
+        "src.application.interfaces.imessage_search_repository",
+        name="message_search_repository",
+    )
+    @mock.patch(
+        "src.application.interfaces.icommunity_repository",
+        name="community_repository",
+    )
+    def test_stop(
+        self, community_repository: MagicMock, message_search_repository: MagicMock
+    ):
+        """Test nothing is indexed once stopped."""
+        community_repository.get_communities.return_value = [
+            Community("1", "name", "desc")
+        ]
+        use_case = IndexMessages(community_repository, message_search_repository)
+
+        use_case.stop()
+        use_case.execute()
+
+        message_search_repository.index_messages.assert_not_called()
@@ -1,8 +1,13 @@
+import hashlib
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
 
+from src.application.exceptions.socket_error import SocketError
 from src.application.use_cases.join_community import JoinCommunity
+from src.infrastructure.services.compression_service import CompressionService
+from src.domain.entities.snapshot import Snapshot
+from src.presentation.formatting.database_chunk import DatabaseChunk
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
 
@@ -68,6 +73,7 @@ class TestJoinCommunity:
             file_service,
             community_repository,
             member_repository,
+            CompressionService(),
         )
 
     @pytest.fixture(scope="function", autouse=True, name="mock_client")
@@ -248,6 +254,18 @@ class TestJoinCommunity:
             "keys_folder_path/id.key", "symetric_key"
         )
 
+    def test_save_symetric_key_to_keyring(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that the symetric key is added to the keyring"""
+        join_community_use_case.keyring = MagicMock()
+
+        join_community_use_case.execute(mock_client)
+
+        join_community_use_case.keyring.add_key.assert_called_once_with(
+            "id", "symetric_key"
+        )
+
     def test_save_community_informations(
         self, mock_client: MagicMock, join_community_use_case: JoinCommunity
     ):
@@ -262,7 +280,7 @@ class TestJoinCommunity:
         """Test that the acknowledgement is sent"""
         join_community_use_case.execute(mock_client)
 
-        message = MessageDataclass(MessageHeader.ACK)
+        message = MessageDataclass(MessageHeader.ACK, "binary,lzma,zlib")
         mock_client.send_message.assert_any_call(message)
 
     def test_received_community_database_failed(
@@ -312,6 +330,222 @@ class TestJoinCommunity:
             "base_path/id.sqlite", b"decrypted_database"
         )
 
+    def test_database_received_without_lock(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that other joins are not blocked while the database is received"""
+        messages = list(mock_client.receive_message.side_effect)
+        locked_while_receiving = []
+
+        def receive_message():
+            locked_while_receiving.append(join_community_use_case.lock.locked())
+            return messages.pop(0)
+
+        mock_client.receive_message.side_effect = receive_message
+
+        result = join_community_use_case.execute(mock_client)
+
+        assert result == "Success!"
+        assert not any(locked_while_receiving)
+
+    def test_save_compressed_community_database(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that a compressed community database is decompressed"""
+        join_community_use_case.symetric_encryption_service.decrypt.side_effect = [
+            "auth_key,id,name,description,2023-01-01T00:00:00",
+            "zlib:eJxLSSxJTEosTo1Pzs8rSc0rAQA2zgaQ",
+        ]
+
+        join_community_use_case.execute(mock_client)
+
+        join_community_use_case.file_service.write_file.assert_any_call(
+            "base_path/id.sqlite", b"database_content"
+        )
+
+    def _receive_snapshot(
+        self,
+        mock_client: MagicMock,
+        join_community_use_case: JoinCommunity,
+        chunks: list[bytes],
+        *chunk_messages: MessageDataclass | None,
+        content_hash: str | None = None,
+    ) -> Snapshot:
+        """Set the messages received by the client, ending with a snapshot"""
+        snapshot = Snapshot(
+            "snapshot_id",
+            "id",
+            content_hash or hashlib.sha256(b"".join(chunks)).hexdigest(),
+            len(chunks),
+            [("10.0.0.1", 1234)],
+        )
+        member = tuple(["127.0.0.1", 1111])
+        mock_client.receive_message.side_effect = [
+            tuple([MessageDataclass(MessageHeader.DATA, "public_key"), member]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_auth_key"), member]),
+            tuple([MessageDataclass(MessageHeader.DATA, "encr_symetric_key"), member]),
+            tuple(
+                [
+                    MessageDataclass(
+                        MessageHeader.DATA,
+                        "nonce,tag,encr_community_informations",
+                    ),
+                    member,
+                ]
+            ),
+            tuple([MessageDataclass(MessageHeader.SNAPSHOT, b"manifest"), member]),
+            *[tuple([message, member]) for message in chunk_messages],
+        ]
+
+        def decrypt_bytes(envelope: bytes, _key: str, _associated_data=b""):
+            if envelope == b"manifest":
+                return snapshot.to_str().encode()
+            return b"\x00" + chunks[int(envelope.removeprefix(b"envelope_"))]
+
+        join_community_use_case.symetric_encryption_service.decrypt_bytes.side_effect = (
+            decrypt_bytes
+        )
+        return snapshot
+
+    @staticmethod
+    def _database_chunk(index: int, is_last: bool) -> MessageDataclass:
+        """Create a database chunk message"""
+        header = DatabaseChunk.pack_header(index, is_last)
+        return MessageDataclass(
+            MessageHeader.DATABASE_CHUNK, header + f"envelope_{index}".encode()
+        )
+
+    @staticmethod
+    def _record_written_database(join_community_use_case: JoinCommunity) -> list:
+        """Make the file service consume the chunks, and record what is written"""
+        written = []
+        join_community_use_case.file_service.write_file_atomically.side_effect = (
+            lambda path, chunks: written.append((path, b"".join(chunks)))
+        )
+        return written
+
+    def test_save_snapshot(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that a snapshot is verified and saved atomically"""
+        self._receive_snapshot(
+            mock_client,
+            join_community_use_case,
+            [b"first", b"second"],
+            self._database_chunk(0, is_last=False),
+            self._database_chunk(1, is_last=True),
+        )
+        written = self._record_written_database(join_community_use_case)
+
+        result = join_community_use_case.execute(mock_client)
+
+        assert result == "Success!"
+        assert written == [("base_path/id.sqlite", b"firstsecond")]
+        join_community_use_case.symetric_encryption_service.decrypt_bytes.assert_any_call(
+            b"envelope_1",
+            "symetric_key",
+            b"snapshot_id" + DatabaseChunk.pack_header(1, True),
+        )
+
+    def test_snapshot_out_of_order(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that a chunk received out of order fails the join"""
+        self._receive_snapshot(
+            mock_client,
+            join_community_use_case,
+            [b"first", b"second", b"third"],
+            self._database_chunk(0, is_last=False),
+            self._database_chunk(2, is_last=True),
+        )
+        self._record_written_database(join_community_use_case)
+
+        result = join_community_use_case.execute(mock_client)
+
+        assert "Unexpected database chunk 2" in result
+        join_community_use_case.member_repository.update_member_relationship.assert_not_called()
+
+    def test_snapshot_hash_mismatch(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that a snapshot whose content does not match its hash is rejected"""
+        self._receive_snapshot(
+            mock_client,
+            join_community_use_case,
+            [b"first"],
+            self._database_chunk(0, is_last=True),
+            content_hash="other_hash",
+        )
+        written = self._record_written_database(join_community_use_case)
+
+        result = join_community_use_case.execute(mock_client)
+
+        assert "Community database hash mismatch" in result
+        assert not written
+
+    def test_resume_interrupted_snapshot(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that an interrupted snapshot is resumed from the next chunk"""
+        self._receive_snapshot(
+            mock_client,
+            join_community_use_case,
+            [b"first", b"second"],
+            self._database_chunk(0, is_last=False),
+            None,
+        )
+        written = self._record_written_database(join_community_use_case)
+        resumed_client = MagicMock()
+        resumed_client.receive_message.return_value = (
+            self._database_chunk(1, is_last=True),
+            ("10.0.0.1", 1234),
+        )
+        join_community_use_case.client_factory = MagicMock()
+        join_community_use_case.client_factory.create_client.return_value = (
+            resumed_client
+        )
+        encrypt_bytes = (
+            join_community_use_case.symetric_encryption_service.encrypt_bytes
+        )
+        encrypt_bytes.return_value = b"resume_request"
+
+        result = join_community_use_case.execute(mock_client)
+
+        assert result == "Success!"
+        assert written == [("base_path/id.sqlite", b"firstsecond")]
+        encrypt_bytes.assert_called_once_with(b"snapshot_id,1", "symetric_key")
+        resumed_client.connect_to_server.assert_called_once_with("10.0.0.1", 1234)
+        resumed_client.send_message.assert_called_once_with(
+            MessageDataclass(MessageHeader.RESUME_SNAPSHOT, b"resume_request", "id")
+        )
+        resumed_client.close_connection.assert_called_once()
+
+    def test_resume_snapshot_attempts_exhausted(
+        self, mock_client: MagicMock, join_community_use_case: JoinCommunity
+    ):
+        """Test that the join fails when the snapshot cannot be resumed"""
+        self._receive_snapshot(
+            mock_client,
+            join_community_use_case,
+            [b"first", b"second"],
+            self._database_chunk(0, is_last=False),
+            None,
+        )
+        self._record_written_database(join_community_use_case)
+        join_community_use_case.client_factory = MagicMock()
+        resumed_client = join_community_use_case.client_factory.create_client()
+        resumed_client.connect_to_server.side_effect = SocketError("unreachable")
+        resumed_client.receive_message.side_effect = SocketError("not connected")
+
+        result = join_community_use_case.execute(mock_client)
+
+        assert "Community database transfer interrupted" in result
+        assert (
+            resumed_client.connect_to_server.call_count
+            == JoinCommunity.MAX_RESUME_ATTEMPTS
+        )
+        join_community_use_case.member_repository.update_member_relationship.assert_not_called()
+
     def test_update_member_relationships(
         self, mock_client: MagicMock, join_community_use_case: JoinCommunity
     ):
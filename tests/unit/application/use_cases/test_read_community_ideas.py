@@ -42,3 +42,27 @@ class TestReadIdeasFromCommunity:
 
         idea_repository.get_ideas_by_community.assert_called_once_with("1234")
         assert result == [idea_1, idea_2, idea_3]
+
+    @mock.patch("src.application.interfaces.iidea_repository", name="idea_repository")
+    def test_get_ideas_page(self, idea_repository: MagicMock, author: Member):
+        """Test reading a page of the ideas of a community."""
+        idea_1 = Idea(1, "Text", author, datetime.now())
+        idea_2 = Idea(2, "Text", author, datetime.now())
+        idea_repository.get_ideas_page.return_value = [idea_2]
+        use_case = ReadIdeasFromCommunity(idea_repository)
+
+        result = use_case.execute("1234", 10, idea_1)
+
+        idea_repository.get_ideas_page.assert_called_once_with("1234", 10, idea_1)
+        idea_repository.get_ideas_by_community.assert_not_called()
+        assert result == [idea_2]
+
+    @mock.patch("src.application.interfaces.iidea_repository", name="idea_repository")
+    def test_get_ideas_page_with_invalid_size(self, idea_repository: MagicMock):
+        """Test reading an empty page of ideas fails."""
+        use_case = ReadIdeasFromCommunity(idea_repository)
+
+        with pytest.raises(ValueError):
+            use_case.execute("1234", 0)
+
+        idea_repository.get_ideas_page.assert_not_called()
@@ -0,0 +1,46 @@
+from unittest import mock
+from unittest.mock import MagicMock
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+from src.application.use_cases.read_discussion import ReadDiscussion
+
+
+class TestReadDiscussion:
+    """Unit test for the use case of reading the discussion of an idea."""
+
+    @mock.patch(
+        "src.application.interfaces.iopinion_repository", name="opinion_repository"
+    )
+    def test_read_discussion(self, opinion_repository: MagicMock):
+        """Test the subtree of the idea is read in a single call."""
+        author = Member("1234", "name", 1024)
+        opinion = Opinion("2", "Text", author, datetime.now(), "1")
+        child_opinion = Opinion("3", "Text", author, datetime.now(), "2")
+        opinion_repository.get_opinions_subtree.return_value = [
+            opinion,
+            child_opinion,
+        ]
+
+        use_case = ReadDiscussion(opinion_repository)
+        result = use_case.execute("1234", "1", 2)
+
+        opinion_repository.get_opinions_subtree.assert_called_once_with("1234", "1", 2)
+        assert result.idea_id == "1"
+        assert result.get_opinions("1") == [opinion]
+        assert result.get_opinions("2") == [child_opinion]
+
+    @mock.patch(
+        "src.application.interfaces.iopinion_repository", name="opinion_repository"
+    )
+    def test_read_discussion_with_invalid_depth(self, opinion_repository: MagicMock):
+        """Test reading a discussion without any level fails."""
+        use_case = ReadDiscussion(opinion_repository)
+
+        with pytest.raises(ValueError):
+            use_case.execute("1234", "1", 0)
+
+        opinion_repository.get_opinions_subtree.assert_not_called()
@@ -97,3 +97,35 @@ class TestReadOpinions:
             "1234", opinion.identifier
         )
         assert result == [child_opinion_1, child_opinion_2]
+
+    @mock.patch(
+        "src.application.interfaces.iopinion_repository", name="opinion_repository"
+    )
+    def test_get_opinions_page(self, opinion_repository: MagicMock, idea: Idea):
+        """Test reading a page of the opinions of an idea."""
+        opinion_1 = Opinion(2, "Text", idea.author, datetime.now(), idea)
+        opinion_2 = Opinion(3, "Text", idea.author, datetime.now(), idea)
+        opinion_repository.get_opinions_page.return_value = [opinion_2]
+
+        use_case = ReadOpinions(opinion_repository)
+        result = use_case.execute("1234", idea.identifier, 10, opinion_1)
+
+        opinion_repository.get_opinions_page.assert_called_once_with(
+            "1234", idea.identifier, 10, opinion_1
+        )
+        opinion_repository.get_opinions_by_parent.assert_not_called()
+        assert result == [opinion_2]
+
+    @mock.patch(
+        "src.application.interfaces.iopinion_repository", name="opinion_repository"
+    )
+    def test_get_opinions_page_with_invalid_size(
+        self, opinion_repository: MagicMock, idea: Idea
+    ):
+        """Test reading an empty page of opinions fails."""
+        use_case = ReadOpinions(opinion_repository)
+
+        with pytest.raises(ValueError):
+            use_case.execute("1234", idea.identifier, -1)
+
+        opinion_repository.get_opinions_page.assert_not_called()
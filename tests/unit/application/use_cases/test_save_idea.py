@@ -1,8 +1,10 @@
+from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.save_idea import SaveIdea
+from src.infrastructure.services.compression_service import CompressionService
 
 
 class TestSaveIdea:
@@ -52,6 +54,7 @@ class TestSaveIdea:
             idea_repository,
             symetric_encryption_service,
             community_service,
+            CompressionService(),
         )
 
     def test_save_idea_successful(self, save_idea: SaveIdea):
@@ -92,6 +95,26 @@ class TestSaveIdea:
 
         symetric_encryption_service.decrypt.assert_called_once()
 
+    def test_save_binary_idea(
+        self,
+        symetric_encryption_service: MagicMock,
+        idea_repository: MagicMock,
+        save_idea: SaveIdea,
+    ):
+        """Test saving an idea received as a binary envelope."""
+        symetric_encryption_service.decrypt_bytes.return_value = (
+            b"\x00identifier,content,author_id,1970-01-01T00:00:00"
+        )
+
+        result = save_idea.execute("community_id", b"envelope")
+
+        assert result == "Success!"
+        symetric_encryption_service.decrypt_bytes.assert_called_once_with(
+            b"envelope", "symetric_key"
+        )
+        symetric_encryption_service.decrypt.assert_not_called()
+        idea_repository.add_idea_to_community.assert_called_once()
+
     def test_is_community_member(
         self,
         community_service: MagicMock,
@@ -126,3 +149,26 @@ class TestSaveIdea:
         result = save_idea.execute("community_id", "nonce,tag,cipher_idea")
 
         assert result != "Success!"
+
+    def test_save_idea_with_write_behind_queue(
+        self, idea_repository: MagicMock, save_idea: SaveIdea
+    ):
+        """Test an idea is queued when there is a write-behind queue."""
+        save_idea.write_behind_queue = MagicMock()
+
+        result = save_idea.execute("community_id", "nonce,tag,cipher_idea")
+
+        assert result == "Success!"
+        idea_repository.add_idea_to_community.assert_not_called()
+        save_idea.write_behind_queue.enqueue.assert_called_once()
+        community_id, idea = save_idea.write_behind_queue.enqueue.call_args.args
+        assert community_id == "community_id"
+        assert idea.identifier == "identifier"
+
+    def test_save_idea_merges_clock(self, save_idea: SaveIdea):
+        """Test the creation date of the idea is merged into the clock."""
+        save_idea.clock = MagicMock()
+
+        save_idea.execute("community_id", "nonce,tag,cipher_idea")
+
+        save_idea.clock.update.assert_called_once_with(datetime(1970, 1, 1))
@@ -1,8 +1,10 @@
+from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.save_member import SaveMember
+from src.infrastructure.services.compression_service import CompressionService
 
 
 class TestSaveMember:
@@ -33,6 +35,7 @@ class TestSaveMember:
             mock_member_repository,
             mock_community_service,
             mock_symetric_encryption_service,
+            CompressionService(),
         )
 
     def test_save_member_successful(
@@ -81,3 +84,27 @@ class TestSaveMember:
         save_member.execute("community_id", "nonce,tag,cipher_member")
 
         save_member.member_repository.add_member_to_community.assert_called_once()
+
+    def test_save_member_with_write_behind_queue(
+        self,
+        save_member: SaveMember,
+    ):
+        """Test a member is queued when there is a write-behind queue."""
+        save_member.write_behind_queue = MagicMock()
+
+        result = save_member.execute("community_id", "nonce,tag,cipher_member")
+
+        assert result == "Success!"
+        save_member.member_repository.add_member_to_community.assert_not_called()
+        save_member.write_behind_queue.enqueue.assert_called_once()
+
+    def test_save_member_merges_clock(
+        self,
+        save_member: SaveMember,
+    ):
+        """Test the creation date of the member is merged into the clock."""
+        save_member.clock = MagicMock()
+
+        save_member.execute("community_id", "nonce,tag,cipher_member")
+
+        save_member.clock.update.assert_called_once_with(datetime(1970, 1, 1))
@@ -1,8 +1,10 @@
+from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
 
 from src.application.use_cases.save_opinion import SaveOpinion
+from src.infrastructure.services.compression_service import CompressionService
 
 
 class TestSaveOpinion:
@@ -54,6 +56,7 @@ class TestSaveOpinion:
             opinion_repository,
             symetric_encryption_service,
             community_service,
+            CompressionService(),
         )
 
     def test_save_opinion_successful(self, save_opinion: SaveOpinion):
@@ -131,3 +134,23 @@ class TestSaveOpinion:
         assert result != "Success!"
         assert result == "Content is too short."
         save_opinion.opinion_repository.add_opinion_to_community.assert_not_called()
+
+    def test_save_opinion_with_write_behind_queue(
+        self, opinion_repository: MagicMock, save_opinion: SaveOpinion
+    ):
+        """Test an opinion is queued when there is a write-behind queue."""
+        save_opinion.write_behind_queue = MagicMock()
+
+        result = save_opinion.execute("community_id", "nonce,tag,cipher_opinion")
+
+        assert result == "Success!"
+        opinion_repository.add_opinion_to_community.assert_not_called()
+        save_opinion.write_behind_queue.enqueue.assert_called_once()
+
+    def test_save_opinion_merges_clock(self, save_opinion: SaveOpinion):
+        """Test the creation date of the opinion is merged into the clock."""
+        save_opinion.clock = MagicMock()
+
+        save_opinion.execute("community_id", "nonce,tag,cipher_opinion")
+
+        save_opinion.clock.update.assert_called_once_with(datetime(1970, 1, 1))
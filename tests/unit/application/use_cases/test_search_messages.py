@@ -0,0 +1,46 @@
+from unittest import mock
+from unittest.mock import MagicMock
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.member import Member
+from src.domain.entities.idea import Idea
+from src.application.use_cases.search_messages import SearchMessages
+
+
+class TestSearchMessages:
+    """Unit test for the use case of searching the messages of a community."""
+
+    @mock.patch(
+        "src.application.interfaces.imessage_search_repository",
+        name="message_search_repository",
+    )
+    def test_search_messages(self, message_search_repository: MagicMock):
+        """Test a page of the search is read from its offset."""
+        idea = Idea("1", "Text", Member("1234", "name", 1024), datetime.now())
+        message_search_repository.search_messages.return_value = [idea]
+        use_case = SearchMessages(message_search_repository)
+
+        result = use_case.execute("1234", "text", 20, 2)
+
+        message_search_repository.search_messages.assert_called_once_with(
+            "1234", "text", 20, 40
+        )
+        assert result == [idea]
+
+    @pytest.mark.parametrize("page_size, page", [(0, 0), (20, -1)])
+    @mock.patch(
+        "src.application.interfaces.imessage_search_repository",
+        name="message_search_repository",
+    )
+    def test_search_messages_with_invalid_page(
+        self, message_search_repository: MagicMock, page_size: int, page: int
+    ):
+        """Test searching an invalid page fails."""
+        use_case = SearchMessages(message_search_repository)
+
+        with pytest.raises(ValueError):
+            use_case.execute("1234", "text", page_size, page)
+
+        message_search_repository.search_messages.assert_not_called()
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock
+import pytest
+
+from src.application.use_cases.send_snapshot import SendSnapshot
+from src.infrastructure.services.compression_service import CompressionService
+from src.domain.entities.member import Member
+from src.domain.entities.snapshot import Snapshot
+from src.presentation.formatting.database_chunk import DatabaseChunk
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+
+
+class TestSendSnapshot:
+    """Test class for the SendSnapshot use case"""
+
+    @pytest.fixture(scope="function", autouse=True, name="snapshot")
+    def create_snapshot(self) -> Snapshot:
+        """Create the snapshot"""
+        return Snapshot("snapshot_id", "id", "hash", 2, [("10.0.0.1", 1234)])
+
+    @pytest.fixture(scope="function", autouse=True, name="send_snapshot_usecase")
+    def create_send_snapshot_usecase(self, snapshot: Snapshot) -> SendSnapshot:
+        """Create the use case"""
+        snapshot_service = MagicMock()
+        snapshot_service.create_snapshot.return_value = snapshot
+        snapshot_service.get_snapshot.return_value = snapshot
+        snapshot_service.read_chunks.side_effect = lambda _, start_index=0: iter(
+            [(0, b"first"), (1, b"second")][start_index:]
+        )
+        symetric_encryption_service = MagicMock()
+        symetric_encryption_service.encrypt_bytes.side_effect = (
+            lambda data, _key, associated_data=b"": b"encrypted:" + data
+        )
+        community_service = MagicMock()
+        community_service.get_community_symetric_key.return_value = "symetric_key"
+        machine_service = MagicMock()
+        machine_service.get_current_user.return_value = Member(
+            "auth_key", "10.0.0.1", 1234
+        )
+
+        return SendSnapshot(
+            snapshot_service,
+            symetric_encryption_service,
+            community_service,
+            machine_service,
+            CompressionService(),
+        )
+
+    @staticmethod
+    def _chunk(index: int, is_last: bool, chunk: bytes) -> MessageDataclass:
+        """Create the expected chunk message"""
+        header = DatabaseChunk.pack_header(index, is_last)
+        return MessageDataclass(
+            MessageHeader.DATABASE_CHUNK, header + b"encrypted:\x00" + chunk
+        )
+
+    def test_send_snapshot(
+        self, send_snapshot_usecase: SendSnapshot, snapshot: Snapshot
+    ):
+        """Test the manifest is sent, followed by every chunk"""
+        client = MagicMock()
+
+        send_snapshot_usecase.send_snapshot(client, "id", "symetric_key", ["zlib"])
+
+        send_snapshot_usecase.snapshot_service.create_snapshot.assert_called_once_with(
+            "id", [("10.0.0.1", 1234)]
+        )
+        assert [call.args[0] for call in client.send_message.call_args_list] == [
+            MessageDataclass(
+                MessageHeader.SNAPSHOT, b"encrypted:" + snapshot.to_str().encode()
+            ),
+            self._chunk(0, False, b"first"),
+            self._chunk(1, True, b"second"),
+        ]
+        send_snapshot_usecase.symetric_encryption_service.encrypt_bytes.assert_any_call(
+            b"\x00second",
+            "symetric_key",
+            b"snapshot_id" + DatabaseChunk.pack_header(1, True),
+        )
+
+    def test_resume_snapshot(self, send_snapshot_usecase: SendSnapshot):
+        """Test a resumed snapshot is sent from the requested chunk"""
+        client = MagicMock()
+        decrypt_bytes = send_snapshot_usecase.symetric_encryption_service.decrypt_bytes
+        decrypt_bytes.return_value = b"snapshot_id,1"
+        message = MessageDataclass(MessageHeader.RESUME_SNAPSHOT, b"request", "id")
+
+        send_snapshot_usecase.execute(client, message)
+
+        decrypt_bytes.assert_called_once_with(b"request", "symetric_key")
+        client.send_message.assert_called_once_with(self._chunk(1, True, b"second"))
+        client.close_connection.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "request_content, snapshot_found",
+        [(b"snapshot_id,2", True), (b"snapshot_id,0", False), (b"snapshot_id", True)],
+    )
+    def test_resume_snapshot_rejected(
+        self,
+        send_snapshot_usecase: SendSnapshot,
+        request_content: bytes,
+        snapshot_found: bool,
+    ):
+        """Test invalid resume requests are rejected"""
+        client = MagicMock()
+        send_snapshot_usecase.symetric_encryption_service.decrypt_bytes.return_value = (
+            request_content
+        )
+        if not snapshot_found:
+            send_snapshot_usecase.snapshot_service.get_snapshot.return_value = None
+        message = MessageDataclass(MessageHeader.RESUME_SNAPSHOT, b"request", "id")
+
+        send_snapshot_usecase.execute(client, message)
+
+        assert client.send_message.call_args.args[0].header == MessageHeader.REJECT
+        client.close_connection.assert_called_once()
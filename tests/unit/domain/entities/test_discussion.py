@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from src.domain.entities.discussion import Discussion
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+
+
+class TestDiscussion:
+    """Test Discussion class"""
+
+    def test_get_opinions(self):
+        """Test the opinions are indexed by the identifier of their parent"""
+        author = Member("1234", "name", 1024)
+        idea = Idea("1", "An idea", author, datetime.now())
+        opinion = Opinion("2", "An opinion", author, datetime.now(), idea)
+        child_1 = Opinion("3", "A child", author, datetime.now(), "2")
+        child_2 = Opinion("4", "A child", author, datetime.now(), opinion)
+
+        discussion = Discussion("1", [opinion, child_1, child_2])
+
+        assert len(discussion) == 3
+        assert discussion.get_opinions("1") == [opinion]
+        assert discussion.get_opinions("2") == [child_1, child_2]
+        assert discussion.get_opinions("3") == []
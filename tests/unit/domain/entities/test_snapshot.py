@@ -0,0 +1,25 @@
+from src.domain.entities.snapshot import Snapshot
+
+
+class TestSnapshot:
+    """Test Snapshot class"""
+
+    def test_to_str_from_str(self):
+        """Test a snapshot is parsed back from its string representation"""
+        snapshot = Snapshot(
+            "abc", "community", "hash", 3, [("127.0.0.1", 1024), ("::1", 1025)]
+        )
+
+        parsed = Snapshot.from_str(snapshot.to_str())
+
+        assert parsed == snapshot
+        assert parsed.community_id == "community"
+        assert parsed.content_hash == "hash"
+        assert parsed.chunk_count == 3
+        assert parsed.sources == [("127.0.0.1", 1024), ("::1", 1025)]
+
+    def test_from_str_without_sources(self):
+        """Test a snapshot without sources"""
+        snapshot = Snapshot.from_str("abc,community,hash,1,")
+
+        assert snapshot.sources == []
@@ -0,0 +1,88 @@
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.domain.entities.community import Community
+from src.infrastructure.repositories.cached_community_repository import (
+    CachedCommunityRepository,
+)
+
+
+class TestCachedCommunityRepository:
+    """Test class for CachedCommunityRepository"""
+
+    @pytest.fixture(scope="function", autouse=True, name="community_repository")
+    @mock.patch(
+        "src.application.interfaces.icommunity_repository",
+        name="mock_community_repository",
+    )
+    def create_community_repository(
+        self, mock_community_repository: MagicMock
+    ) -> MagicMock:
+        """Create a CommunityRepository instance."""
+        mock_community_repository.get_authentication_key_for_community.return_value = (
+            "auth_key"
+        )
+        mock_community_repository.get_community_encryption_key_path.return_value = (
+            "symetric_key_path"
+        )
+        return mock_community_repository
+
+    @pytest.fixture(scope="function", name="cached_community_repository")
+    def create_cached_community_repository(
+        self, community_repository: MagicMock
+    ) -> CachedCommunityRepository:
+        """Create a CachedCommunityRepository instance."""
+        return CachedCommunityRepository(community_repository)
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "get_community",
+            "get_authentication_key_for_community",
+            "get_community_encryption_key_path",
+        ],
+    )
+    def test_lookup_cached(
+        self,
+        cached_community_repository: CachedCommunityRepository,
+        community_repository: MagicMock,
+        method: str,
+    ):
+        """Test a lookup reads the repository once"""
+        first = getattr(cached_community_repository, method)("community")
+        second = getattr(cached_community_repository, method)("community")
+
+        assert first is second
+        getattr(community_repository, method).assert_called_once_with("community")
+        assert cached_community_repository.cache.hits == 1
+        assert cached_community_repository.cache.misses == 1
+
+    def test_add_community_invalidates(
+        self,
+        cached_community_repository: CachedCommunityRepository,
+        community_repository: MagicMock,
+    ):
+        """Test adding a community invalidates its lookups"""
+        community_repository.get_community.return_value = None
+        cached_community_repository.get_community("community")
+        community = Community("community", "name", "description")
+
+        cached_community_repository.add_community(community, "auth_key", "path")
+        community_repository.get_community.return_value = community
+
+        assert cached_community_repository.get_community("community") is community
+        community_repository.add_community.assert_called_once_with(
+            community, "auth_key", "path"
+        )
+
+    def test_get_communities_not_cached(
+        self,
+        cached_community_repository: CachedCommunityRepository,
+        community_repository: MagicMock,
+    ):
+        """Test the communities list is always read from the repository"""
+        cached_community_repository.get_communities()
+        cached_community_repository.get_communities()
+
+        assert community_repository.get_communities.call_count == 2
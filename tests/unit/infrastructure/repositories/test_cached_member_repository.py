@@ -0,0 +1,111 @@
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.domain.entities.member import Member
+from src.infrastructure.repositories.cached_member_repository import (
+    CachedMemberRepository,
+)
+
+
+class TestCachedMemberRepository:
+    """Test class for CachedMemberRepository"""
+
+    @pytest.fixture(scope="function", autouse=True, name="member_repository")
+    @mock.patch(
+        "src.application.interfaces.imember_repository", name="mock_member_repository"
+    )
+    def create_member_repository(self, mock_member_repository: MagicMock) -> MagicMock:
+        """Create a MemberRepository instance."""
+        mock_member_repository.get_member_for_community.return_value = None
+        return mock_member_repository
+
+    @pytest.fixture(scope="function", name="cached_member_repository")
+    def create_cached_member_repository(
+        self, member_repository: MagicMock
+    ) -> CachedMemberRepository:
+        """Create a CachedMemberRepository instance."""
+        return CachedMemberRepository(member_repository)
+
+    @pytest.fixture(scope="function", name="member")
+    def create_member(self) -> Member:
+        """Create a member"""
+        return Member("1234", "127.0.0.1", 1664)
+
+    def test_get_member_cached(
+        self,
+        cached_member_repository: CachedMemberRepository,
+        member_repository: MagicMock,
+    ):
+        """Test a member lookup reads the repository once per key"""
+        cached_member_repository.get_member_for_community("community", "1234")
+        cached_member_repository.get_member_for_community("community", "1234")
+        cached_member_repository.get_member_for_community(
+            "community", ip_address="127.0.0.1"
+        )
+
+        assert member_repository.get_member_for_community.call_count == 2
+        assert cached_member_repository.cache.hits == 1
+        assert cached_member_repository.cache.misses == 2
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("add_member_to_community", ["member"]),
+            ("add_members_bulk", [["member"]]),
+            ("clear_members_relationship", []),
+            ("update_member_relationship", ["1234", "parent"]),
+        ],
+    )
+    def test_write_invalidates(
+        self,
+        cached_member_repository: CachedMemberRepository,
+        member_repository: MagicMock,
+        member: Member,
+        method: str,
+        args: list,
+    ):
+        """Test a write to the members of a community invalidates its lookups"""
+        cached_member_repository.get_member_for_community("community", "1234")
+        cached_member_repository.get_member_for_community("other", "1234")
+
+        getattr(cached_member_repository, method)("community", *args)
+        member_repository.get_member_for_community.return_value = member
+
+        assert (
+            cached_member_repository.get_member_for_community("community", "1234")
+            is member
+        )
+        assert (
+            cached_member_repository.get_member_for_community("other", "1234") is None
+        )
+
+    def test_failed_write_invalidates(
+        self,
+        cached_member_repository: CachedMemberRepository,
+        member_repository: MagicMock,
+        member: Member,
+    ):
+        """Test a failed write invalidates the lookups too"""
+        cached_member_repository.get_member_for_community("community", "1234")
+        member_repository.add_members_bulk.side_effect = RuntimeError()
+
+        with pytest.raises(RuntimeError):
+            cached_member_repository.add_members_bulk("community", [member])
+
+        cached_member_repository.get_member_for_community("community", "1234")
+        assert member_repository.get_member_for_community.call_count == 2
+
+    def test_invalid_lookup_not_cached(
+        self,
+        cached_member_repository: CachedMemberRepository,
+        member_repository: MagicMock,
+    ):
+        """Test a lookup error is raised every time"""
+        member_repository.get_member_for_community.side_effect = ValueError()
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cached_member_repository.get_member_for_community("community")
+
+        assert len(cached_member_repository.cache) == 0
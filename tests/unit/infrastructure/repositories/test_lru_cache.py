@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+from src.infrastructure.repositories.common.lru_cache import LruCache
+
+
+class TestLruCache:
+    """Test class for LruCache"""
+
+    def test_read_through(self):
+        """Test a value is loaded once then served from the cache"""
+        cache = LruCache()
+        loader = MagicMock(return_value="value")
+
+        first = cache.get("community", "key", loader)
+        second = cache.get("community", "key", loader)
+
+        assert first == second == "value"
+        loader.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_none_cached(self):
+        """Test an unknown value (None) is cached too"""
+        cache = LruCache()
+        loader = MagicMock(return_value=None)
+
+        cache.get("community", "key", loader)
+        cache.get("community", "key", loader)
+
+        loader.assert_called_once()
+
+    def test_least_recently_used_evicted(self):
+        """Test the least recently used entry is evicted once the cache is full"""
+        cache = LruCache(max_entries=2)
+        cache.get("community", "a", lambda: 1)
+        cache.get("community", "b", lambda: 2)
+        cache.get("community", "a", lambda: 1)
+
+        cache.get("community", "c", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get("community", "a", lambda: -1) == 1
+        assert cache.get("community", "b", lambda: -1) == -1
+
+    def test_invalidate(self):
+        """Test an invalidation drops the entries of its namespace only"""
+        cache = LruCache()
+        cache.get("community", "key", lambda: 1)
+        cache.get("other", "key", lambda: 1)
+
+        cache.invalidate("community")
+
+        assert cache.get("community", "key", lambda: 2) == 2
+        assert cache.get("other", "key", lambda: 2) == 1
+
+    def test_load_during_invalidation_not_kept(self):
+        """Test a value loaded while its namespace is invalidated is not kept"""
+        cache = LruCache()
+
+        def loader():
+            cache.invalidate("community")
+            return "stale"
+
+        assert cache.get("community", "key", loader) == "stale"
+        assert cache.get("community", "key", lambda: "fresh") == "fresh"
+
+    def test_clear(self):
+        """Test every entry is dropped"""
+        cache = LruCache()
+        cache.get("community", "key", lambda: 1)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("community", "key", lambda: 2) == 2
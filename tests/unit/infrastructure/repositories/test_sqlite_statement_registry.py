@@ -0,0 +1,44 @@
+from unittest import mock
+
+from src.infrastructure.repositories.common.sqlite_statement_registry import (
+    SqliteStatementRegistry,
+)
+
+
+class TestSqliteStatementRegistry:
+    """Test class for SqliteStatementRegistry"""
+
+    def test_normalize(self):
+        """Test a statement is put on one line without repeated spaces"""
+        statement = """
+            SELECT identifier,
+            \tcontent   FROM messages
+            WHERE identifier = ?;"""
+
+        assert (
+            SqliteStatementRegistry().get(statement)
+            == "SELECT identifier, content FROM messages WHERE identifier = ?;"
+        )
+
+    def test_normalized_once(self):
+        """Test a statement is normalized only the first time it is executed"""
+        registry = SqliteStatementRegistry()
+
+        with mock.patch.object(
+            SqliteStatementRegistry, "normalize", wraps=registry.normalize
+        ) as normalize:
+            first = registry.get("SELECT  1;")
+            second = registry.get("SELECT  1;")
+
+        normalize.assert_called_once_with("SELECT  1;")
+        assert first is second
+
+    def test_registry_bounded(self):
+        """Test statements beyond the maximum are normalized but not kept"""
+        registry = SqliteStatementRegistry(max_statements=1)
+
+        registry.get("SELECT  1;")
+        normalized = registry.get("SELECT  2;")
+
+        assert normalized == "SELECT 2;"
+        assert list(registry.statements) == ["SELECT  1;"]
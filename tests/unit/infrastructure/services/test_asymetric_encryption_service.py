@@ -1,6 +1,7 @@
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
+import rsa
 
 from src.infrastructure.services.asymetric_encryption_service import (
     AsymetricEncryptionService,
@@ -138,3 +139,50 @@ class TestAsymetricEncryptionService:
         received_decrypted_data = service.decrypt(ciphertext, private_key)
 
         assert received_decrypted_data == decrypted_data
+
+    @mock.patch("rsa.key.PublicKey.load_pkcs1", name="mock_rsa_public_key_loader")
+    @mock.patch("rsa.pkcs1.encrypt", name="mock_rsa_encrypt")
+    def test_public_key_parsed_once(
+        self,
+        mock_rsa_encrypt: MagicMock,
+        mock_rsa_public_key_loader: MagicMock,
+    ):
+        """Validates that a public key is parsed once for its fingerprint"""
+        mock_rsa_encrypt.return_value = b"encrypted_data"
+        service = AsymetricEncryptionService()
+
+        service.encrypt("text", "key")
+        service.encrypt("other text", "key")
+        service.encrypt("text", "other key")
+
+        assert mock_rsa_public_key_loader.call_count == 2
+
+    @mock.patch("rsa.key.PrivateKey.load_pkcs1", name="mock_rsa_private_key_loader")
+    @mock.patch("rsa.pkcs1.decrypt", name="mock_rsa_decrypt")
+    def test_parsed_keys_bounded(
+        self,
+        mock_rsa_decrypt: MagicMock,
+        mock_rsa_private_key_loader: MagicMock,
+    ):
+        """Validates that the least recently used keys are parsed again"""
+        mock_rsa_decrypt.return_value = b"decrypted_data"
+        service = AsymetricEncryptionService(max_keys=1)
+
+        service.decrypt("73796d", "key")
+        service.decrypt("73796d", "other key")
+        service.decrypt("73796d", "key")
+
+        assert mock_rsa_private_key_loader.call_count == 3
+        assert len(service.keys) == 1
+
+    def test_encrypt_decrypt(self):
+        """Validates that a text encrypted with a public key is decrypted with
+        its private key"""
+        service = AsymetricEncryptionService()
+        public_key, private_key = rsa.newkeys(512)
+        public_key = public_key.save_pkcs1().decode()
+        private_key = private_key.save_pkcs1().decode()
+
+        ciphertext = service.encrypt("text", public_key)
+
+        assert service.decrypt(ciphertext, private_key) == "text"
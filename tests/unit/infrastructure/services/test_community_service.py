@@ -58,6 +58,21 @@ class TestCommunityService:
 
         assert symetric_key == "symetric_key"
 
+    def test_get_community_symetric_key_from_keyring(
+        self,
+        community_service: CommunityService,
+        file_service: MagicMock,
+    ):
+        """Test the key is served by the keyring when there is one."""
+        community_service.keyring = MagicMock()
+        community_service.keyring.get_key.return_value = b"key"
+
+        symetric_key = community_service.get_community_symetric_key("community_id")
+
+        assert symetric_key == b"key"
+        community_service.keyring.get_key.assert_called_once_with("community_id")
+        file_service.read_file.assert_not_called()
+
     def test_is_community_member_auth_key(
         self,
         community_service: CommunityService,
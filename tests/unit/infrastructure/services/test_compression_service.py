@@ -0,0 +1,113 @@
+import pytest
+
+from src.infrastructure.services.compression_service import CompressionService
+
+
+class TestCompressionService:
+    """Test suite for the compression service"""
+
+    @pytest.mark.parametrize("codec", ["lzma", "zlib"])
+    def test_compress_decompress(self, codec: str):
+        """Validates that a compressed text is decompressed unchanged"""
+        service = CompressionService()
+        plaintext = "id,content of the idea,author," * 100
+
+        compressed = service.compress(plaintext, [codec])
+
+        assert compressed.startswith(f"{codec}:")
+        assert len(compressed) < len(plaintext)
+        assert service.decompress(compressed) == plaintext
+
+    def test_compress_prefers_first_supported_codec(self):
+        """Validates that the preferred codec accepted by the peer is used"""
+        service = CompressionService()
+        plaintext = "a" * 1024
+
+        assert service.compress(plaintext).startswith("lzma:")
+        assert service.compress(plaintext, ["zlib", "lzma"]).startswith("lzma:")
+        assert service.compress(plaintext, ["zlib"]).startswith("zlib:")
+
+    @pytest.mark.parametrize("codecs", [[], ["brotli"]])
+    def test_compress_without_accepted_codec(self, codecs: list[str]):
+        """Validates that the text is unchanged when no codec is accepted"""
+        service = CompressionService()
+        plaintext = "a" * 1024
+
+        assert service.compress(plaintext, codecs) == plaintext
+
+    def test_compress_below_threshold(self):
+        """Validates that short texts are not compressed"""
+        service = CompressionService(threshold=512)
+        plaintext = "a" * 511
+
+        assert service.compress(plaintext) == plaintext
+
+    def test_compress_incompressible(self):
+        """Validates that the text is unchanged when compressing does not help"""
+        service = CompressionService(threshold=0)
+        plaintext = "7Gq!x"
+
+        assert service.compress(plaintext) == plaintext
+
+    @pytest.mark.parametrize(
+        "text", ["id,content,author", "lzma is a codec", "unknown:data"]
+    )
+    def test_decompress_uncompressed_text(self, text: str):
+        """Validates that texts not compressed are returned as is"""
+        service = CompressionService()
+
+        assert service.decompress(text) == text
+
+    def test_decompress_invalid_payload(self):
+        """Validates that a corrupted payload raises an error"""
+        service = CompressionService()
+
+        with pytest.raises(ValueError):
+            service.decompress("zlib:bm90IHpsaWI=")
+
+    def test_compress_bytes(self):
+        """Validates that binary data is compressed and decompressed"""
+        service = CompressionService()
+        data = bytes(4096)
+
+        compressed = service.compress_bytes(data)
+
+        assert len(compressed) < len(data)
+        assert service.decompress_bytes(compressed) == data
+
+    def test_compress_bytes_fallback_to_hex(self):
+        """Validates that uncompressed binary data is hexadecimal, as before"""
+        service = CompressionService()
+        data = b"SQLite format 3"
+
+        compressed = service.compress_bytes(data, [])
+
+        assert compressed == data.hex()
+        assert service.decompress_bytes(compressed) == data
+
+    @pytest.mark.parametrize("codec", ["lzma", "zlib"])
+    def test_compress_binary(self, codec: str):
+        """Validates that the binary form is decompressed unchanged"""
+        service = CompressionService()
+        data = bytes(4096)
+
+        envelope = service.compress_binary(data, [codec])
+
+        assert envelope[0] == service.BINARY_CODES[codec]
+        assert len(envelope) < len(data)
+        assert service.decompress_binary(envelope) == data
+
+    def test_compress_binary_below_threshold(self):
+        """Validates that short data is only prefixed"""
+        service = CompressionService()
+
+        assert service.compress_binary(b"data") == b"\x00data"
+        assert service.decompress_binary(b"\x00data") == b"data"
+
+    @pytest.mark.parametrize("envelope", [b"", b"\xffdata", b"\x02not zlib"])
+    def test_decompress_binary_invalid(self, envelope: bytes):
+        """Validates that invalid envelopes raise an error"""
+        service = CompressionService()
+
+        with pytest.raises(ValueError):
+            service.decompress_binary(envelope)
@@ -1,3 +1,4 @@
+import os
 from unittest import mock
 from unittest.mock import mock_open, MagicMock
 import pytest
@@ -124,3 +125,76 @@ class TestFileService:
         file_service.write_file(file_name, "test")
 
         mock_file().write.assert_called_once_with("test")
+
+    def test_read_file_chunks(self, file_name):
+        """Test reading a file by chunks."""
+        with open(file_name, "wb") as file:
+            file.write(b"abcdefg")
+
+        file_service = FileService()
+
+        assert list(file_service.read_file_chunks(file_name, 3)) == [
+            b"abc",
+            b"def",
+            b"g",
+        ]
+
+    def test_read_file_chunks_not_exists(self, temp_folder):
+        """Test reading by chunks a file that does not exist."""
+        file_service = FileService()
+
+        with pytest.raises(FileNotFoundError):
+            list(file_service.read_file_chunks(f"{temp_folder}/invalid_file", 3))
+
+    def test_write_file_atomically(self, file_name, temp_folder):
+        """Test writing a file atomically."""
+        with open(file_name, "wb") as file:
+            file.write(b"previous")
+
+        file_service = FileService()
+        file_service.write_file_atomically(file_name, iter([b"new ", b"content"]))
+
+        with open(file_name, "rb") as file:
+            assert file.read() == b"new content"
+        assert os.listdir(temp_folder) == [os.path.basename(file_name)]
+
+    def test_write_file_atomically_interrupted(self, file_name, temp_folder):
+        """Test the file is left untouched when the chunks fail."""
+        with open(file_name, "wb") as file:
+            file.write(b"previous")
+
+        def chunks():
+            yield b"partial"
+            raise ValueError("interrupted")
+
+        file_service = FileService()
+
+        with pytest.raises(ValueError):
+            file_service.write_file_atomically(file_name, chunks())
+
+        with open(file_name, "rb") as file:
+            assert file.read() == b"previous"
+        assert os.listdir(temp_folder) == [os.path.basename(file_name)]
+
+    def test_read_file_chunks_from_offset(self, file_name):
+        """Test reading a file by chunks from an offset."""
+        with open(file_name, "wb") as file:
+            file.write(b"abcdefg")
+
+        file_service = FileService()
+
+        assert list(file_service.read_file_chunks(file_name, 3, offset=3)) == [
+            b"def",
+            b"g",
+        ]
+
+    def test_remove_file(self, file_name):
+        """Test removing a file, twice."""
+        with open(file_name, "wb") as file:
+            file.write(b"content")
+
+        file_service = FileService()
+        file_service.remove_file(file_name)
+        file_service.remove_file(file_name)
+
+        assert not os.path.exists(file_name)
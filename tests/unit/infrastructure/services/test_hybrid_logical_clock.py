@@ -0,0 +1,70 @@
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.infrastructure.services.hybrid_logical_clock import HybridLogicalClock
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class TestHybridLogicalClock:
+    """Test class for HybridLogicalClock"""
+
+    @pytest.fixture(scope="function", autouse=True, name="physical_clock")
+    @mock.patch(
+        "src.application.interfaces.idatetime_service", name="mock_datetime_service"
+    )
+    def create_physical_clock(self, mock_datetime_service: MagicMock) -> MagicMock:
+        """Create a physical clock stopped at NOW"""
+        mock_datetime_service.get_datetime.return_value = NOW
+        return mock_datetime_service
+
+    @pytest.fixture(scope="function", name="clock")
+    def create_clock(self, physical_clock: MagicMock) -> HybridLogicalClock:
+        """Create a HybridLogicalClock instance"""
+        return HybridLogicalClock(physical_clock)
+
+    def test_get_datetime_physical(
+        self, clock: HybridLogicalClock, physical_clock: MagicMock
+    ):
+        """Test the clock follows the physical clock when it moves forward"""
+        first = clock.get_datetime()
+        physical_clock.get_datetime.return_value = NOW + timedelta(seconds=1)
+
+        assert first == NOW
+        assert clock.get_datetime() == NOW + timedelta(seconds=1)
+
+    def test_get_datetime_monotonic(
+        self, clock: HybridLogicalClock, physical_clock: MagicMock
+    ):
+        """Test the timestamps increase when the physical clock stalls or goes back"""
+        timestamps = [clock.get_datetime() for _ in range(3)]
+        physical_clock.get_datetime.return_value = NOW - timedelta(seconds=1)
+        timestamps.append(clock.get_datetime())
+
+        assert timestamps == [NOW + MICROSECOND * index for index in range(4)]
+
+    def test_update_ahead(self, clock: HybridLogicalClock):
+        """Test a received timestamp ahead of the clock moves it forward"""
+        received = NOW + timedelta(seconds=1)
+
+        assert clock.update(received) == received + MICROSECOND
+        assert clock.get_datetime() == received + 2 * MICROSECOND
+
+    def test_update_behind(self, clock: HybridLogicalClock):
+        """Test a received timestamp behind the clock does not move it back"""
+        clock.get_datetime()
+
+        assert clock.update(NOW - timedelta(seconds=1)) == NOW + MICROSECOND
+
+    def test_update_naive(self, clock: HybridLogicalClock):
+        """Test a naive received timestamp is in UTC"""
+        received = datetime(2024, 1, 1, 0, 0, 1)
+
+        assert clock.update(received) == received.replace(tzinfo=UTC) + MICROSECOND
+
+    def test_update_too_far_ahead(self, clock: HybridLogicalClock):
+        """Test a received timestamp beyond the maximum offset is not merged"""
+        assert clock.update(NOW + timedelta(hours=1)) == NOW
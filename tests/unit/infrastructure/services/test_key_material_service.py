@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.infrastructure.services.key_material_service import KeyMaterialService
+
+
+class TestKeyMaterialService:
+    """Test class for KeyMaterialService"""
+
+    @pytest.fixture(scope="function", name="key_material_service")
+    @mock.patch(
+        "src.application.interfaces.iasymetric_encryption_service", name="encryption"
+    )
+    @mock.patch("src.application.interfaces.ifile_service", name="file_service")
+    def create_key_material_service(
+        self, file_service: MagicMock, encryption: MagicMock
+    ) -> KeyMaterialService:
+        """Create a KeyMaterialService instance"""
+        encryption.generate_keys.return_value = ("public_key", "private_key")
+        return KeyMaterialService("base_path", encryption, file_service)
+
+    def test_get_key_pair_read_once(self, key_material_service: KeyMaterialService):
+        """Test the key pair is read from its files once"""
+        key_material_service.file_service.read_file.side_effect = [
+            "public_key",
+            "private_key",
+        ]
+
+        first = key_material_service.get_key_pair()
+        second = key_material_service.get_key_pair()
+
+        assert first == second == ("public_key", "private_key")
+        assert key_material_service.file_service.read_file.call_count == 2
+        key_material_service.encryption_service.generate_keys.assert_not_called()
+
+    def test_get_key_pair_generated(self, key_material_service: KeyMaterialService):
+        """Test the key pair is generated and saved when there are no files"""
+        key_material_service.file_service.read_file.side_effect = FileNotFoundError
+
+        key_pair = key_material_service.get_key_pair()
+
+        assert key_pair == ("public_key", "private_key")
+        key_material_service.file_service.write_file.assert_has_calls(
+            [
+                mock.call("base_path/encryption_key.pub", "public_key"),
+                mock.call("base_path/encryption_key", "private_key"),
+            ]
+        )
+
+    def test_get_key_pair_single_flight(self, key_material_service: KeyMaterialService):
+        """Test concurrent callers wait for the key pair being generated"""
+        key_material_service.file_service.read_file.side_effect = FileNotFoundError
+        generating = threading.Event()
+        release = threading.Event()
+
+        def generate_keys():
+            generating.set()
+            release.wait(5)
+            return ("public_key", "private_key")
+
+        key_material_service.encryption_service.generate_keys.side_effect = (
+            generate_keys
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(key_material_service.get_key_pair) for _ in range(4)
+            ]
+            generating.wait(5)
+            release.set()
+            key_pairs = [future.result(5) for future in futures]
+
+        assert key_pairs == [("public_key", "private_key")] * 4
+        key_material_service.encryption_service.generate_keys.assert_called_once()
+
+    def test_get_key_pair_retried_after_failure(
+        self, key_material_service: KeyMaterialService
+    ):
+        """Test a failed provisioning is retried by the next caller"""
+        key_material_service.file_service.read_file.side_effect = FileNotFoundError
+        key_material_service.file_service.write_file.side_effect = [
+            OSError(),
+            None,
+            None,
+        ]
+
+        with pytest.raises(OSError):
+            key_material_service.get_key_pair()
+
+        assert key_material_service.get_key_pair() == ("public_key", "private_key")
@@ -0,0 +1,80 @@
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.domain.entities.community import Community
+from src.infrastructure.services.keyring import Keyring
+
+
+class TestKeyring:
+    """Test class for Keyring"""
+
+    @pytest.fixture(scope="function", autouse=True, name="community_repository")
+    @mock.patch(
+        "src.application.interfaces.icommunity_repository",
+        name="mock_community_repository",
+    )
+    def create_community_repository(
+        self, mock_community_repository: MagicMock
+    ) -> MagicMock:
+        """Create a CommunityRepository instance."""
+        mock_community_repository.get_community_encryption_key_path.side_effect = (
+            lambda community_id: f"keys/{community_id}.key"
+        )
+        return mock_community_repository
+
+    @pytest.fixture(scope="function", autouse=True, name="file_service")
+    @mock.patch("src.application.interfaces.ifile_service", name="mock_file_service")
+    def create_file_service(self, mock_file_service: MagicMock) -> MagicMock:
+        """Create a FileService instance."""
+        mock_file_service.read_file.return_value = "6b6579"
+        return mock_file_service
+
+    @pytest.fixture(scope="function", name="keyring")
+    def create_keyring(
+        self, community_repository: MagicMock, file_service: MagicMock
+    ) -> Keyring:
+        """Create a Keyring instance."""
+        return Keyring(community_repository, file_service)
+
+    def test_get_key(self, keyring: Keyring, file_service: MagicMock):
+        """Test a key is read and decoded once"""
+        first = keyring.get_key("community")
+        second = keyring.get_key("community")
+
+        assert first == second == b"key"
+        file_service.read_file.assert_called_once_with("keys/community.key")
+
+    def test_get_key_unknown_community(
+        self, keyring: Keyring, community_repository: MagicMock
+    ):
+        """Test the key of an unknown community is an error"""
+        community_repository.get_community_encryption_key_path.side_effect = None
+        community_repository.get_community_encryption_key_path.return_value = None
+
+        with pytest.raises(ValueError):
+            keyring.get_key("community")
+
+    def test_load(
+        self,
+        keyring: Keyring,
+        community_repository: MagicMock,
+        file_service: MagicMock,
+    ):
+        """Test the keys of every community are loaded, the missing ones skipped"""
+        community_repository.get_communities.return_value = [
+            Community("first", "name", "description"),
+            Community("second", "name", "description"),
+        ]
+        file_service.read_file.side_effect = ["6b6579", FileNotFoundError()]
+
+        keyring.load()
+
+        assert keyring.keys == {"first": b"key"}
+
+    def test_add_key(self, keyring: Keyring, file_service: MagicMock):
+        """Test an added key is served without reading its file"""
+        keyring.add_key("community", "6b6579")
+
+        assert keyring.get_key("community") == b"key"
+        file_service.read_file.assert_not_called()
@@ -1,3 +1,5 @@
+import itertools
+import time
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
@@ -47,6 +49,12 @@ class TestMachineService:
             datetime_service_mock,
         )
 
+    @pytest.fixture(scope="function", autouse=True)
+    def stop_machine_service(self, machine_service: MachineService):
+        """Stop refreshing the IP address after the test."""
+        yield
+        machine_service.stop()
+
     @mock.patch("socket.gethostbyname", name="socket")
     def test_get_ip_address_exists(
         self,
@@ -283,3 +291,90 @@ class TestMachineService:
         machine_service.get_current_user(None)
 
         machine_service.datetime_service.get_datetime.assert_called_once()
+
+    @mock.patch("socket.socket", name="socket_mock")
+    def test_get_ip_address_cached(
+        self, socket_mock: MagicMock, machine_service: MachineService
+    ):
+        """Test the IP address is probed once."""
+        socket_mock.return_value.getsockname.return_value = ["127.0.0.1"]
+
+        ip_addresses = [machine_service.get_ip_address() for _ in range(3)]
+
+        assert ip_addresses == ["127.0.0.1"] * 3
+        socket_mock.assert_called_once()
+
+    def test_get_ip_address_refreshed_on_interfaces_change(
+        self, machine_service: MachineService
+    ):
+        """Test the IP address is probed again when the interfaces change."""
+        machine_service.interfaces_check_interval = 0.01
+        with mock.patch.object(
+            machine_service,
+            "_probe_ip_address",
+            side_effect=["127.0.0.1", "192.168.1.2"],
+        ), mock.patch.object(
+            machine_service,
+            "_get_interfaces",
+            side_effect=itertools.chain(
+                [frozenset()], itertools.repeat(frozenset([(1, "eth0")]))
+            ),
+        ):
+            assert machine_service.get_ip_address() == "127.0.0.1"
+            deadline = time.monotonic() + 5
+            while (
+                machine_service.get_ip_address() == "127.0.0.1"
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+
+        assert machine_service.get_ip_address() == "192.168.1.2"
+
+    def test_get_auth_key_cached(
+        self,
+        machine_service: MachineService,
+    ):
+        """Test the authentication key of a community is read once."""
+        get_authentication_key = (
+            machine_service.community_repository.get_authentication_key_for_community
+        )
+        get_authentication_key.return_value = "abc"
+
+        machine_service.get_auth_key("1234")
+        machine_service.get_auth_key("1234")
+
+        get_authentication_key.assert_called_once_with("1234")
+
+    def test_get_auth_key_unknown_community_not_cached(
+        self,
+        machine_service: MachineService,
+    ):
+        """Test the missing key of a community not joined yet is read again."""
+        get_authentication_key = (
+            machine_service.community_repository.get_authentication_key_for_community
+        )
+        get_authentication_key.return_value = None
+        machine_service.get_auth_key("1234")
+        get_authentication_key.return_value = "abc"
+
+        assert machine_service.get_auth_key("1234") == "abc"
+
+    def test_invalidate(
+        self,
+        machine_service: MachineService,
+    ):
+        """Test an invalidated identity is read again."""
+        get_authentication_key = (
+            machine_service.community_repository.get_authentication_key_for_community
+        )
+        get_authentication_key.return_value = "abc"
+        machine_service.get_auth_key("1234")
+        machine_service.ip_address = "127.0.0.1"
+
+        machine_service.invalidate("1234")
+        machine_service.get_auth_key("1234")
+
+        assert get_authentication_key.call_count == 2
+        assert machine_service.ip_address == "127.0.0.1"
+        machine_service.invalidate()
+        assert machine_service.ip_address is None
@@ -1,6 +1,9 @@
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
+import struct
+import time
 from unittest import mock
 from unittest.mock import MagicMock
+import ntplib
 import pytest
 
 from src.infrastructure.services.ntp_datetime_service import NtpDatetimeService
@@ -9,57 +12,116 @@ from src.infrastructure.services.ntp_datetime_service import NtpDatetimeService
 class TestNtpDatetimeService:
     """Test suite for a datetime service that uses NTP server"""
 
+    @pytest.fixture(scope="function", autouse=True, name="ntp_client")
+    def create_ntp_client(self):
+        """Create an NTP client answering one hour ahead of the system clock"""
+        with mock.patch("ntplib.NTPClient", name="ntpclient_mock") as ntpclient_mock:
+            ntp_client = ntpclient_mock.return_value
+            ntp_client.request.side_effect = lambda *args, **kwargs: MagicMock(
+                dest_time=time.time(), offset=3600.0
+            )
+            yield ntp_client
+
+    @pytest.fixture(scope="function", name="datetime_service")
+    def create_datetime_service(self, ntp_client: MagicMock):
+        """Create an NtpDatetimeService instance"""
+        datetime_service = NtpDatetimeService("pool.ntp.org")
+        yield datetime_service
+        datetime_service.stop()
+
+    @staticmethod
+    def wait_for(condition):
+        """Waits until the condition of the background refresh is met"""
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert condition()
+
     @pytest.mark.parametrize(
         "ntp_server",
         [
-            "",
             "pool.ntp.org",
             "time.google.com",
             "time.cloudflare.com",
             "time.windows.com",
         ],
     )
-    @mock.patch("ntplib.NTPClient", name="ntpclient_mock")
-    def test_get_datetime(self, ntpclient_mock: MagicMock, ntp_server: str):
-        """Should return current time"""
-        ntpclient_mock.request.return_value = MagicMock(tx_time=1614556800.0)
+    def test_get_datetime(self, ntp_client: MagicMock, ntp_server: str):
+        """Should return the time of the NTP server"""
         datetime_service = NtpDatetimeService(ntp_server)
 
         ntp_datetime = datetime_service.get_datetime()
 
-        assert isinstance(ntp_datetime, datetime)
+        datetime_service.stop()
+        expected = datetime.now(UTC) + timedelta(hours=1)
+        assert abs(ntp_datetime - expected) < timedelta(seconds=1)
+        ntp_client.request.assert_called_with(ntp_server, port="ntp", timeout=5)
 
-    @pytest.mark.parametrize(
-        "ntp_server",
-        [
-            "",
-            "pool.ntp.org",
-            "time.google.com",
-            "time.cloudflare.com",
-            "time.windows.com",
-        ],
-    )
-    @mock.patch("ntplib.NTPClient", name="ntpclient_mock")
-    def test_get_datetime_with_exception(
-        self, ntpclient_mock: MagicMock, ntp_server: str
+    def test_get_datetime_requests_once(
+        self, ntp_client: MagicMock, datetime_service: NtpDatetimeService
     ):
-        """Should return epoch time when exception occurs"""
-        ntpclient_mock.return_value.request.side_effect = Exception()
-        datetime_service = NtpDatetimeService(ntp_server)
+        """Should serve the timestamps from the cached offset"""
+        timestamps = [datetime_service.get_datetime() for _ in range(100)]
+
+        assert timestamps == sorted(timestamps)
+        ntp_client.request.assert_called_once()
 
-        datetime = datetime_service.get_datetime()
+    def test_get_datetime_with_exception(self, ntp_client: MagicMock):
+        """Should return the system time when the server does not answer"""
+        ntp_client.request.side_effect = ntplib.NTPException()
+        datetime_service = NtpDatetimeService("pool.ntp.org")
+
+        ntp_datetime = datetime_service.get_datetime()
+
+        datetime_service.stop()
+        assert abs(ntp_datetime - datetime.now(UTC)) < timedelta(seconds=1)
+        assert datetime_service.get_staleness() is None
 
-        assert datetime.isoformat() == "1970-01-01T00:00:01+00:00"
+    def test_refresh_survives_unexpected_error(self, ntp_client: MagicMock):
+        """Should keep refreshing after an unexpected error, such as a malformed
+        answer"""
+        answer = MagicMock(dest_time=time.time(), offset=3600.0)
+        ntp_client.request.side_effect = [struct.error("malformed"), answer]
+        datetime_service = NtpDatetimeService("pool.ntp.org", retry_interval=0.01)
+
+        self.wait_for(lambda: datetime_service.get_staleness() is not None)
+
+        assert datetime_service.thread.is_alive()
+        datetime_service.stop()
+        assert ntp_client.request.call_count == 2
+
+    def test_get_staleness(self, datetime_service: NtpDatetimeService):
+        """Should return the time elapsed since the synchronization"""
+        datetime_service.get_datetime()
 
-    @mock.patch("datetime.datetime", name="datetime_mock")
-    @mock.patch("ntplib.NTPClient", name="ntpclient_mock")
-    def test_get_datetime_with_exception_mocked(
-        self, ntpclient_mock: MagicMock, datetime_mock: MagicMock
+        assert 0 <= datetime_service.get_staleness() < 1
+
+    def test_get_drift(
+        self, ntp_client: MagicMock, datetime_service: NtpDatetimeService
     ):
-        """Should return epoch time when exception occurs"""
-        ntpclient_mock.return_value.request.side_effect = Exception()
-        datetime_service = NtpDatetimeService("pool.ntp.org")
+        """Should measure the drift between two synchronizations"""
+        datetime_service.get_datetime()
+        assert datetime_service.get_drift() is None
+        # 100 seconds apart, the second answer is 100 milliseconds ahead
+        ntp_client.request.side_effect = [
+            MagicMock(dest_time=1000.0, offset=0.0),
+            MagicMock(dest_time=1100.0, offset=0.1),
+        ]
+        datetime_service.reference = None
+
+        with mock.patch("time.monotonic_ns", side_effect=[0, 100 * 10**9]):
+            assert datetime_service.refresh()
+            assert datetime_service.refresh()
 
+        assert datetime_service.get_drift() == pytest.approx(1000)
+
+    def test_set_ntp_server(
+        self, ntp_client: MagicMock, datetime_service: NtpDatetimeService
+    ):
+        """Should synchronize with the new server right away"""
         datetime_service.get_datetime()
 
-        datetime_mock.fromisoformat.assert_called_once_with("1970-01-01T00:00:01+00:00")
+        datetime_service.set_ntp_server("127.0.0.1", 1123)
+
+        self.wait_for(lambda: ntp_client.request.call_count == 2)
+        ntp_client.request.assert_called_with("127.0.0.1", port=1123, timeout=5)
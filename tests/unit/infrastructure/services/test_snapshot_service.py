@@ -0,0 +1,115 @@
+from contextlib import closing
+import hashlib
+import os
+import sqlite3
+from unittest.mock import MagicMock
+import pytest
+
+from src.infrastructure.services.file_service import FileService
+from src.infrastructure.services.snapshot_service import SnapshotService
+
+
+class TestSnapshotService:
+    """Test class for SnapshotService"""
+
+    @pytest.fixture(scope="function", autouse=True, name="snapshot_service")
+    def create_snapshot_service(self, tmp_path) -> SnapshotService:
+        """Create a snapshot service with a community database"""
+        os.makedirs(tmp_path / "snapshots")
+        with closing(sqlite3.connect(tmp_path / "id.sqlite")) as connection:
+            connection.execute("PRAGMA journal_mode=WAL;")
+            connection.execute("CREATE TABLE ideas (content TEXT);")
+            connection.execute("INSERT INTO ideas VALUES ('idea');")
+            connection.commit()
+
+        id_generator = MagicMock()
+        id_generator.generate.side_effect = ["snapshot_1", "snapshot_2"]
+        snapshot_service = SnapshotService(str(tmp_path), FileService(), id_generator)
+        snapshot_service.CHUNK_SIZE = 1024
+        return snapshot_service
+
+    def test_create_snapshot(self, snapshot_service: SnapshotService, tmp_path):
+        """Test the snapshot is a hashed copy of the database"""
+        snapshot = snapshot_service.create_snapshot("id", [("127.0.0.1", 1024)])
+
+        with open(tmp_path / "snapshots" / "snapshot_1.sqlite", "rb") as file:
+            content = file.read()
+        assert snapshot.identifier == "snapshot_1"
+        assert snapshot.content_hash == hashlib.sha256(content).hexdigest()
+        assert snapshot.chunk_count == len(content) // 1024
+        assert snapshot.sources == [("127.0.0.1", 1024)]
+        assert os.listdir(tmp_path / "snapshots") == ["snapshot_1.sqlite"]
+
+    def test_snapshot_includes_uncheckpointed_changes(
+        self, snapshot_service: SnapshotService, tmp_path
+    ):
+        """Test the snapshot holds the changes still in the WAL of the database"""
+        with closing(sqlite3.connect(tmp_path / "id.sqlite")) as connection:
+            connection.execute("PRAGMA wal_autocheckpoint=0;")
+            connection.execute("INSERT INTO ideas VALUES ('new idea');")
+            connection.commit()
+
+            snapshot_service.create_snapshot("id", [])
+
+        with closing(
+            sqlite3.connect(tmp_path / "snapshots" / "snapshot_1.sqlite")
+        ) as connection:
+            rows = connection.execute("SELECT content FROM ideas;").fetchall()
+        assert rows == [("idea",), ("new idea",)]
+
+    def test_snapshot_is_frozen(self, snapshot_service: SnapshotService, tmp_path):
+        """Test the snapshot does not follow the changes of the database"""
+        snapshot = snapshot_service.create_snapshot("id", [])
+        with open(tmp_path / "snapshots" / "snapshot_1.sqlite", "rb") as file:
+            content = file.read()
+        with closing(sqlite3.connect(tmp_path / "id.sqlite")) as connection:
+            connection.execute("INSERT INTO ideas VALUES ('new idea');")
+            connection.commit()
+
+        chunks = [chunk for _, chunk in snapshot_service.read_chunks(snapshot)]
+
+        assert b"".join(chunks) == content
+
+    def test_read_chunks_from_index(self, snapshot_service: SnapshotService):
+        """Test the chunks are read from the requested index"""
+        snapshot = snapshot_service.create_snapshot("id", [])
+
+        chunks = list(snapshot_service.read_chunks(snapshot, 1))
+
+        assert [index for index, _ in chunks] == list(range(1, snapshot.chunk_count))
+        assert all(len(chunk) == 1024 for _, chunk in chunks)
+
+    def test_missing_database(self, snapshot_service: SnapshotService, tmp_path):
+        """Test a snapshot of a missing database fails without leaving a file"""
+        with pytest.raises(FileNotFoundError):
+            snapshot_service.create_snapshot("unknown", [])
+
+        assert os.listdir(tmp_path / "snapshots") == []
+
+    def test_get_snapshot(self, snapshot_service: SnapshotService):
+        """Test a snapshot is kept until the retention expires"""
+        snapshot = snapshot_service.create_snapshot("id", [])
+
+        assert snapshot_service.get_snapshot("snapshot_1") == snapshot
+        assert snapshot_service.get_snapshot("unknown") is None
+
+    def test_expired_snapshot_removed(
+        self, snapshot_service: SnapshotService, tmp_path
+    ):
+        """Test an expired snapshot is forgotten and its file removed"""
+        snapshot_service.retention = 0
+        snapshot_service.create_snapshot("id", [])
+
+        snapshot_service.create_snapshot("id", [])
+
+        assert snapshot_service.get_snapshot("snapshot_1") is None
+        assert os.listdir(tmp_path / "snapshots") == []
+
+    def test_remove_snapshot(self, snapshot_service: SnapshotService, tmp_path):
+        """Test a removed snapshot is forgotten and its file removed"""
+        snapshot_service.create_snapshot("id", [])
+
+        snapshot_service.remove_snapshot("snapshot_1")
+
+        assert snapshot_service.get_snapshot("snapshot_1") is None
+        assert os.listdir(tmp_path / "snapshots") == []
@@ -150,3 +150,68 @@ class TestSymetricEncryptionService:
         received_plaintext = service.decrypt(ciphertext, key, tag, nonce)
 
         assert received_plaintext == plaintext
+
+    def test_encrypt_decrypt_bytes(self):
+        """Validates that an envelope is decrypted back to the plaintext"""
+        service = SymetricEncryptionService()
+        key = service.generate_key()
+        plaintext = b"\x00binary plaintext"
+
+        envelope = service.encrypt_bytes(plaintext, key)
+
+        assert len(envelope) == service.NONCE_SIZE + service.TAG_SIZE + len(plaintext)
+        assert service.decrypt_bytes(envelope, key) == plaintext
+
+    def test_encrypt_decrypt_with_bytes_key(self):
+        """Validates that a decoded key works like its hex string"""
+        service = SymetricEncryptionService()
+        key = service.generate_key()
+
+        envelope = service.encrypt_bytes(b"plaintext", bytes.fromhex(key))
+        nonce, tag, ciphertext = service.encrypt("plaintext", bytes.fromhex(key))
+
+        assert service.decrypt_bytes(envelope, key) == b"plaintext"
+        assert service.decrypt(ciphertext, key, tag, nonce) == "plaintext"
+
+    def test_encrypt_bytes_raises_value_error_with_empty_bytes_key(self):
+        """Validates that an empty decoded key is rejected"""
+        service = SymetricEncryptionService()
+
+        with pytest.raises(ValueError):
+            service.encrypt_bytes(b"plaintext", b"")
+
+    def test_decrypt_bytes_tampered_envelope(self):
+        """Validates that a modified envelope is rejected"""
+        service = SymetricEncryptionService()
+        key = service.generate_key()
+        envelope = bytearray(service.encrypt_bytes(b"plaintext", key))
+        envelope[-1] ^= 1
+
+        with pytest.raises(ValueError):
+            service.decrypt_bytes(bytes(envelope), key)
+
+    @pytest.mark.parametrize("plaintext, key", [(b"", "6b6579"), (b"text", "")])
+    def test_encrypt_bytes_raises_value_error(self, plaintext: bytes, key: str):
+        """Validates that empty plaintexts and keys are rejected"""
+        service = SymetricEncryptionService()
+
+        with pytest.raises(ValueError):
+            service.encrypt_bytes(plaintext, key)
+
+    @pytest.mark.parametrize("envelope, key", [(b"short", "6b6579"), (b"x" * 40, "")])
+    def test_decrypt_bytes_raises_value_error(self, envelope: bytes, key: str):
+        """Validates that short envelopes and empty keys are rejected"""
+        service = SymetricEncryptionService()
+
+        with pytest.raises(ValueError):
+            service.decrypt_bytes(envelope, key)
+
+    def test_decrypt_bytes_associated_data_mismatch(self):
+        """Validates that an envelope is bound to its associated data"""
+        service = SymetricEncryptionService()
+        key = service.generate_key()
+        envelope = service.encrypt_bytes(b"plaintext", key, b"header-0")
+
+        assert service.decrypt_bytes(envelope, key, b"header-0") == b"plaintext"
+        with pytest.raises(ValueError):
+            service.decrypt_bytes(envelope, key, b"header-1")
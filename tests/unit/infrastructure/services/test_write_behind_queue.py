@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+from datetime import datetime
+import threading
+import pytest
+
+from src.domain.entities.idea import Idea
+from src.domain.entities.member import Member
+from src.domain.entities.opinion import Opinion
+from src.infrastructure.services.write_behind_queue import WriteBehindQueue
+
+
+class TestWriteBehindQueue:
+    """Test class for WriteBehindQueue"""
+
+    @pytest.fixture(scope="function", autouse=True, name="write_behind_queue")
+    def create_write_behind_queue(self):
+        """Create a WriteBehindQueue whose linger never ends by itself"""
+        write_behind_queue = WriteBehindQueue(
+            MagicMock(), MagicMock(), MagicMock(), linger=60, max_batch_size=3
+        )
+        yield write_behind_queue
+        write_behind_queue.close()
+
+    @pytest.fixture(scope="function", name="member")
+    def create_member(self) -> Member:
+        """Create a member"""
+        return Member("1234", "127.0.0.1", 1664)
+
+    def test_flush_commits_groups(
+        self, write_behind_queue: WriteBehindQueue, member: Member
+    ):
+        """Test the queued rows of a community are saved by groups"""
+        idea = Idea("1", "An idea", member, datetime.now())
+        opinion = Opinion("2", "An opinion", member, datetime.now(), idea)
+        futures = [
+            write_behind_queue.enqueue("community", idea),
+            write_behind_queue.enqueue("community", opinion),
+        ]
+
+        write_behind_queue.flush("community")
+
+        assert all(future.done() for future in futures)
+        write_behind_queue.idea_repository.add_ideas_bulk.assert_called_once_with(
+            "community", [idea]
+        )
+        write_behind_queue.opinion_repository.add_opinions_bulk.assert_called_once_with(
+            "community", [opinion]
+        )
+        write_behind_queue.member_repository.add_members_bulk.assert_not_called()
+
+    def test_flush_of_other_community(
+        self, write_behind_queue: WriteBehindQueue, member: Member
+    ):
+        """Test a barrier on a community does not commit the others"""
+        future = write_behind_queue.enqueue("community", member)
+
+        write_behind_queue.flush("other")
+
+        assert not future.done()
+        write_behind_queue.member_repository.add_members_bulk.assert_not_called()
+
+    def test_full_group_committed_early(
+        self, write_behind_queue: WriteBehindQueue, member: Member
+    ):
+        """Test a community is committed once max_batch_size rows are waiting"""
+        futures = [
+            write_behind_queue.enqueue("community", member)
+            for _ in range(write_behind_queue.max_batch_size)
+        ]
+
+        assert all(future.result(5) is None for future in futures)
+        write_behind_queue.member_repository.add_members_bulk.assert_called_once_with(
+            "community", [member] * write_behind_queue.max_batch_size
+        )
+
+    def test_linger_window(self, member: Member):
+        """Test queued rows are committed once the linger window is over"""
+        saved = threading.Event()
+        member_repository = MagicMock()
+        member_repository.add_members_bulk.side_effect = lambda *_: saved.set()
+        write_behind_queue = WriteBehindQueue(
+            member_repository, MagicMock(), MagicMock(), linger=0.01
+        )
+
+        write_behind_queue.enqueue("community", member)
+
+        assert saved.wait(5)
+        write_behind_queue.close()
+
+    def test_faulty_row_isolated(
+        self, write_behind_queue: WriteBehindQueue, member: Member
+    ):
+        """Test only the faulty rows of a failed group fail"""
+        valid = Idea("1", "An idea", member, datetime.now())
+        invalid = Idea("2", "c", member, datetime.now())
+
+        def add_ideas_bulk(_, ideas):
+            if invalid in ideas:
+                raise ValueError("Content is too short.")
+
+        write_behind_queue.idea_repository.add_ideas_bulk.side_effect = add_ideas_bulk
+        valid_future = write_behind_queue.enqueue("community", valid)
+        invalid_future = write_behind_queue.enqueue("community", invalid)
+
+        write_behind_queue.flush()
+
+        assert valid_future.result() is None
+        assert isinstance(invalid_future.exception(), ValueError)
+
+    def test_close_commits_queued_rows(
+        self, write_behind_queue: WriteBehindQueue, member: Member
+    ):
+        """Test the queued rows are committed before the queue stops"""
+        future = write_behind_queue.enqueue("community", member)
+
+        write_behind_queue.close()
+
+        assert future.done()
+        with pytest.raises(RuntimeError):
+            write_behind_queue.enqueue("community", member)
@@ -0,0 +1,28 @@
+import pytest
+
+from src.application.exceptions.message_error import MessageError
+from src.presentation.formatting.database_chunk import DatabaseChunk
+
+
+class TestDatabaseChunk:
+    """Test class for DatabaseChunk"""
+
+    @pytest.mark.parametrize("index, is_last", [(0, False), (7, True)])
+    def test_pack_unpack(self, index: int, is_last: bool):
+        """Test the header and the envelope of a chunk are unpacked unchanged"""
+        header = DatabaseChunk.pack_header(index, is_last)
+
+        assert DatabaseChunk.unpack(header + b"envelope") == (
+            index,
+            is_last,
+            header,
+            b"envelope",
+        )
+
+    @pytest.mark.parametrize(
+        "content", ["text", b"", DatabaseChunk.pack_header(0, True)]
+    )
+    def test_unpack_invalid_content(self, content):
+        """Test a content without an envelope is rejected"""
+        with pytest.raises(MessageError):
+            DatabaseChunk.unpack(content)
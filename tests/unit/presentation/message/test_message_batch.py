@@ -0,0 +1,76 @@
+import pytest
+
+from src.application.exceptions.message_error import MessageError
+from src.presentation.formatting.message_batch import MessageBatch
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.message_frame import MessageFrame
+
+
+class TestMessageBatch:
+    """Test class for MessageBatch"""
+
+    def test_pack_unpack(self):
+        """Test the messages of a batch are unpacked unchanged"""
+        messages = [
+            MessageDataclass(MessageHeader.CREATE_IDEA, "idea|content", "id"),
+            MessageDataclass(MessageHeader.CREATE_OPINION, b"\x00opinion", "id"),
+            MessageDataclass(MessageHeader.ADD_MEMBER, "member\ncontent", "id"),
+        ]
+
+        batch = MessageBatch.pack(messages)
+
+        assert batch.header == MessageHeader.BATCH
+        assert batch.community_id == "id"
+        assert MessageBatch.unpack(batch) == messages
+
+    def test_pack_different_communities(self):
+        """Test messages of different communities cannot be packed together"""
+        messages = [
+            MessageDataclass(MessageHeader.CREATE_IDEA, "content", "id"),
+            MessageDataclass(MessageHeader.CREATE_IDEA, "content", "other_id"),
+        ]
+
+        with pytest.raises(MessageError):
+            MessageBatch.pack(messages)
+
+    def test_pack_invalid_header(self):
+        """Test only the batchable messages can be packed"""
+        messages = [MessageDataclass(MessageHeader.PING, "content", "id")]
+
+        with pytest.raises(MessageError):
+            MessageBatch.pack(messages)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            None,
+            b"",
+            "not binary",
+            MessageFrame.encode(MessageDataclass(MessageHeader.CREATE_IDEA, "idea"))[
+                :-1
+            ],
+            MessageFrame.encode(MessageDataclass(MessageHeader.PING, "")),
+            MessageFrame.encode("raw"),
+            b"\xff" * MessageFrame.PREFIX.size,
+        ],
+    )
+    def test_unpack_invalid_content(self, content: str | bytes | None):
+        """Test invalid batches are rejected"""
+        batch = MessageDataclass(MessageHeader.BATCH, content, "id")
+
+        with pytest.raises(MessageError):
+            MessageBatch.unpack(batch)
+
+    def test_coalesce(self):
+        """Test messages are merged by community, batches included"""
+        first = MessageDataclass(MessageHeader.CREATE_IDEA, "first", "id")
+        second = MessageDataclass(MessageHeader.CREATE_OPINION, "second", "id")
+        third = MessageDataclass(MessageHeader.CREATE_IDEA, "third", "other_id")
+        fourth = MessageDataclass(MessageHeader.ADD_MEMBER, "fourth", "id")
+
+        coalesced = MessageBatch.coalesce(
+            [first, MessageBatch.pack([second]), third, fourth]
+        )
+
+        assert coalesced == [MessageBatch.pack([first, second, fourth]), third]
@@ -37,6 +37,13 @@ class TestMessageFormatter:
         with pytest.raises(MessageError):
             formatter.format(invalid_message_data)
 
+    def test_format_binary_message(self, formatter: MessageFormatter):
+        """Test that binary contents are not formatted as strings"""
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, b"envelope", "id")
+
+        with pytest.raises(MessageError):
+            formatter.format(message)
+
     def test_format_message_with_community_id(
         self, formatter: MessageFormatter, message: MessageDataclass
     ):
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from src.presentation.handler.message_handler import MessageHandler
+from src.presentation.formatting.message_batch import MessageBatch
 from src.presentation.formatting.message_dataclass import MessageDataclass
 from src.presentation.formatting.message_header import MessageHeader
 from src.application.exceptions.message_error import MessageError
@@ -127,3 +128,91 @@ class TestMessageHandler:
         mock_client.send_message.assert_called_once_with(
             MessageDataclass(MessageHeader.PONG)
         )
+
+    @mock.patch("src.application.interfaces.iclient_socket", name="mock_client")
+    def test_receive_batch(
+        self, mock_client: MagicMock, message_handler: MessageHandler
+    ):
+        """Test the messages of a batch are applied and the batch relayed once."""
+        batch = MessageBatch.pack(
+            [
+                MessageDataclass(MessageHeader.ADD_MEMBER, "member", "id"),
+                MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id"),
+                MessageDataclass(MessageHeader.CREATE_OPINION, "opinion", "id"),
+            ]
+        )
+        sender = ("127.0.0.1", 1024)
+
+        message_handler.handle_message(sender, mock_client, batch)
+
+        message_handler.community_service.is_community_member.assert_called_once()
+        message_handler.save_member_usecase.execute.assert_called_once_with(
+            "id", "member"
+        )
+        message_handler.save_idea_usecase.execute.assert_called_once_with("id", "idea")
+        message_handler.save_opinion_usecase.execute.assert_called_once_with(
+            "id", "opinion"
+        )
+        message_handler.architecture_manager.share_information.assert_called_once_with(
+            batch, "id", excluded_ip_addresses=["127.0.0.1"]
+        )
+
+    @mock.patch("src.application.interfaces.iclient_socket", name="mock_client")
+    def test_receive_batch_partial_failure(
+        self, mock_client: MagicMock, message_handler: MessageHandler
+    ):
+        """Test only the applied messages of a batch are relayed."""
+        idea = MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id")
+        opinion = MessageDataclass(MessageHeader.CREATE_OPINION, "opinion", "id")
+        message_handler.save_idea_usecase.execute.side_effect = Exception()
+        sender = ("127.0.0.1", 1024)
+
+        with pytest.raises(MessageError):
+            message_handler.handle_message(
+                sender, mock_client, MessageBatch.pack([idea, opinion])
+            )
+
+        message_handler.architecture_manager.share_information.assert_called_once_with(
+            MessageBatch.pack([opinion]), "id", excluded_ip_addresses=["127.0.0.1"]
+        )
+
+    @mock.patch("src.application.interfaces.iclient_socket", name="mock_client")
+    def test_receive_resume_snapshot(
+        self, mock_client: MagicMock, message_handler: MessageHandler
+    ):
+        """Test a snapshot resume request is served and not relayed"""
+        message_handler.send_snapshot_usecase = MagicMock()
+        message = MessageDataclass(MessageHeader.RESUME_SNAPSHOT, b"request", "id")
+        sender = ("127.0.0.1", 1024)
+
+        message_handler.handle_message(sender, mock_client, message)
+
+        message_handler.send_snapshot_usecase.execute.assert_called_once_with(
+            mock_client, message
+        )
+        message_handler.architecture_manager.share_information.assert_not_called()
+
+    @mock.patch("src.application.interfaces.iclient_socket", name="mock_client")
+    def test_wait_for_saved_members(
+        self, mock_client: MagicMock, message_handler: MessageHandler
+    ):
+        """Test the handler only waits for the queued rows after a member"""
+        message_handler.write_behind_queue = MagicMock()
+        sender = ("127.0.0.1", 1024)
+
+        message_handler.handle_message(
+            sender, mock_client, MessageDataclass(MessageHeader.CREATE_IDEA, "", "id")
+        )
+        message_handler.write_behind_queue.flush.assert_not_called()
+        message_handler.handle_message(
+            sender,
+            mock_client,
+            MessageBatch.pack(
+                [
+                    MessageDataclass(MessageHeader.ADD_MEMBER, "member", "id"),
+                    MessageDataclass(MessageHeader.CREATE_IDEA, "idea", "id"),
+                ]
+            ),
+        )
+
+        message_handler.write_behind_queue.flush.assert_called_once_with("id")
@@ -0,0 +1,119 @@
+import threading
+import time
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.application.exceptions.socket_error import SocketError
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_formatter import MessageFormatter
+from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.async_client import AsyncClient
+from src.presentation.network.async_server import AsyncServer
+from src.presentation.network.client import Client
+from src.presentation.network.event_loop import EventLoop
+
+
+def _pong(_sender, client, message: MessageDataclass):
+    """Answers a message with its content"""
+    client.send_message(MessageDataclass(MessageHeader.PONG, message.content))
+
+
+class TestAsyncServer:
+    """Test AsyncServer and AsyncClient on the loopback interface"""
+
+    @pytest.fixture(scope="function", autouse=True, name="event_loop")
+    def create_event_loop(self):
+        """Create the shared event loop"""
+        event_loop = EventLoop()
+        yield event_loop
+        event_loop.stop()
+
+    @pytest.fixture(scope="function", name="server")
+    def create_server(self, event_loop: EventLoop):
+        """Run an AsyncServer on a free port"""
+        message_handler = MagicMock()
+        message_handler.handle_message.side_effect = _pong
+        server = AsyncServer(0, message_handler, MessageFormatter(), event_loop)
+        server_thread = threading.Thread(target=server.run)
+        server_thread.start()
+        while not server.running:
+            time.sleep(0.01)
+        yield server
+        server.stop()
+        server_thread.join()
+
+    def _get_port(self, server: AsyncServer) -> int:
+        """Returns the port the server listens on"""
+        return server.server.sockets[0].getsockname()[1]
+
+    def test_async_client_round_trip(self, server: AsyncServer, event_loop: EventLoop):
+        """Test an async client exchanges messages with the server"""
+        client = AsyncClient(MessageFormatter(), event_loop, timeout=5)
+        client.connect_to_server("127.0.0.1", self._get_port(server))
+
+        client.send_message(MessageDataclass(MessageHeader.PING, "hello", "id"))
+        message, _ = client.receive_message()
+        client.close_connection()
+
+        assert message == MessageDataclass(MessageHeader.PONG, "hello")
+
+    def test_threaded_client_round_trip(self, server: AsyncServer):
+        """Test a blocking client is compatible with the server"""
+        client = Client(MessageFormatter())
+        client.connect_to_server("127.0.0.1", self._get_port(server))
+
+        client.send_message(MessageDataclass(MessageHeader.PING, "x" * 100_000, "id"))
+        message, _ = client.receive_message()
+        client.close_connection()
+
+        assert message.content == "x" * 100_000
+        assert server.message_handler.handle_message.call_count == 1
+
+    def test_several_messages_per_connection(
+        self, server: AsyncServer, event_loop: EventLoop
+    ):
+        """Test the server keeps reading the same connection"""
+        client = AsyncClient(MessageFormatter(), event_loop, timeout=5)
+        client.connect_to_server("127.0.0.1", self._get_port(server))
+
+        replies = []
+        for content in ("first", "second"):
+            client.send_message(MessageDataclass(MessageHeader.PING, content, "id"))
+            message, _ = client.receive_message()
+            replies.append(message.content)
+        client.close_connection()
+
+        assert replies == ["first", "second"]
+        assert server.get_metrics().accepted == 1
+
+    def test_invalid_message_counted(self, server: AsyncServer, event_loop: EventLoop):
+        """Test a message that is not a MessageDataclass is not handled"""
+        client = AsyncClient(MessageFormatter(), event_loop, timeout=5)
+        client.connect_to_server("127.0.0.1", self._get_port(server))
+
+        client.send_message("Hello")
+        with pytest.raises(SocketError):
+            client.receive_message()
+        client.close_connection()
+
+        server.message_handler.handle_message.assert_not_called()
+        assert server.get_metrics().failed == 1
+
+    def test_connect_refused(self, event_loop: EventLoop):
+        """Test a refused connection raises a SocketError"""
+        client = AsyncClient(MessageFormatter(), event_loop, timeout=5)
+
+        with pytest.raises(SocketError):
+            client.connect_to_server("127.0.0.1", 1)
+
+    @mock.patch("src.application.interfaces.imessage_handler", name="message_handler")
+    def test_run_bind_failed(self, message_handler: MagicMock, event_loop: EventLoop):
+        """Test a port already used raises a SocketError"""
+        with mock.patch("asyncio.start_server", side_effect=OSError("Error message")):
+            server = AsyncServer(0, message_handler, MessageFormatter(), event_loop)
+
+            with pytest.raises(SocketError) as error:
+                server.run()
+
+        assert "Error message" in str(error.value)
@@ -0,0 +1,132 @@
+from unittest import mock
+from unittest.mock import MagicMock
+import pytest
+
+from src.application.exceptions.socket_error import SocketError
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.connection_pool import ConnectionPool
+
+
+class TestConnectionPool:
+    """Test ConnectionPool class"""
+
+    @pytest.fixture(scope="function", autouse=True, name="connection_pool")
+    @mock.patch("src.application.interfaces.iclient_factory", name="client_factory")
+    def create_connection_pool(self, client_factory: MagicMock) -> ConnectionPool:
+        """Create a pool whose factory returns a new mock for each client"""
+        client_factory.create_client.side_effect = lambda: MagicMock()
+        return ConnectionPool(client_factory, max_connections_per_peer=1)
+
+    @pytest.fixture(scope="function", autouse=True, name="message")
+    def create_message(self) -> MessageDataclass:
+        """Create a message to send"""
+        return MessageDataclass(MessageHeader.CREATE_IDEA, "content", "id")
+
+    def test_send_connects_once(
+        self, connection_pool: ConnectionPool, message: MessageDataclass
+    ):
+        """Test the connection is reused for the same peer"""
+        connection_pool.send_message("127.0.0.1", 1664, message)
+        connection_pool.send_message("127.0.0.1", 1664, message)
+
+        assert connection_pool.client_factory.create_client.call_count == 1
+        ((client_socket, _),) = connection_pool.idle_connections[("127.0.0.1", 1664)]
+        client_socket.connect_to_server.assert_called_once_with("127.0.0.1", 1664)
+        assert client_socket.send_message.call_count == 2
+
+    def test_send_different_peers(
+        self, connection_pool: ConnectionPool, message: MessageDataclass
+    ):
+        """Test connections are keyed by ip address and port"""
+        connection_pool.send_message("127.0.0.1", 1664, message)
+        connection_pool.send_message("127.0.0.1", 1665, message)
+
+        assert connection_pool.client_factory.create_client.call_count == 2
+
+    def test_reconnect_on_send_failure(
+        self, connection_pool: ConnectionPool, message: MessageDataclass
+    ):
+        """Test a broken warm connection is replaced transparently"""
+        connection_pool.send_message("127.0.0.1", 1664, message)
+        ((broken_socket, _),) = connection_pool.idle_connections[("127.0.0.1", 1664)]
+        broken_socket.send_message.side_effect = SocketError("Broken pipe")
+
+        connection_pool.send_message("127.0.0.1", 1664, message)
+
+        broken_socket.close_connection.assert_called_once()
+        ((new_socket, _),) = connection_pool.idle_connections[("127.0.0.1", 1664)]
+        assert new_socket is not broken_socket
+        new_socket.send_message.assert_called_once_with(message)
+
+    def test_disconnected_connection_not_reused(
+        self, connection_pool: ConnectionPool, message: MessageDataclass
+    ):
+        """Test a connection closed by the peer is dropped"""
+        connection_pool.send_message("127.0.0.1", 1664, message)
+        ((closed_socket, _),) = connection_pool.idle_connections[("127.0.0.1", 1664)]
+        closed_socket.is_connected.return_value = False
+
+        connection_pool.send_message("127.0.0.1", 1664, message)
+
+        closed_socket.close_connection.assert_called_once()
+        assert closed_socket.send_message.call_count == 1
+        assert connection_pool.client_factory.create_client.call_count == 2
+
+    def test_connect_failure_raises(
+        self, connection_pool: ConnectionPool, message: MessageDataclass
+    ):
+        """Test an unreachable peer raises and is not pooled"""
+        client_socket = MagicMock()
+        client_socket.connect_to_server.side_effect = SocketError("Refused")
+        connection_pool.client_factory.create_client.side_effect = None
+        connection_pool.client_factory.create_client.return_value = client_socket
+
+        with pytest.raises(SocketError):
+            connection_pool.send_message("127.0.0.1", 1664, message)
+
+        client_socket.close_connection.assert_called_once()
+        assert ("127.0.0.1", 1664) not in connection_pool.idle_connections
+
+    def test_pool_limit_per_peer(self, connection_pool: ConnectionPool):
+        """Test connections above the limit are closed instead of being kept"""
+        first_socket, second_socket = MagicMock(), MagicMock()
+
+        connection_pool._release(  # pylint: disable=protected-access
+            ("127.0.0.1", 1664), first_socket
+        )
+        connection_pool._release(  # pylint: disable=protected-access
+            ("127.0.0.1", 1664), second_socket
+        )
+
+        assert len(connection_pool.idle_connections[("127.0.0.1", 1664)]) == 1
+        first_socket.close_connection.assert_not_called()
+        second_socket.close_connection.assert_called_once()
+
+    @mock.patch("time.monotonic")
+    def test_evict_idle_connections(
+        self,
+        mock_monotonic: MagicMock,
+        connection_pool: ConnectionPool,
+        message: MessageDataclass,
+    ):
+        """Test connections unused for too long are closed"""
+        mock_monotonic.return_value = 100
+        connection_pool.send_message("127.0.0.1", 1664, message)
+        ((client_socket, _),) = connection_pool.idle_connections[("127.0.0.1", 1664)]
+
+        mock_monotonic.return_value = 100 + connection_pool.idle_timeout
+        connection_pool.evict_idle_connections()
+
+        client_socket.close_connection.assert_called_once()
+        assert not connection_pool.idle_connections
+
+    def test_close(self, connection_pool: ConnectionPool, message: MessageDataclass):
+        """Test closing the pool closes every connection"""
+        connection_pool.send_message("127.0.0.1", 1664, message)
+        ((client_socket, _),) = connection_pool.idle_connections[("127.0.0.1", 1664)]
+
+        connection_pool.close()
+
+        client_socket.close_connection.assert_called_once()
+        assert not connection_pool.idle_connections
@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+
+from src.presentation.network.event_loop import EventLoop
+
+
+class TestEventLoop:
+    """Test EventLoop class"""
+
+    @pytest.fixture(scope="function", autouse=True, name="event_loop")
+    def create_event_loop(self):
+        """Create the event loop and stop it after the test"""
+        event_loop = EventLoop()
+        yield event_loop
+        event_loop.stop()
+
+    def test_run_coroutine(self, event_loop: EventLoop):
+        """Test the result of the coroutine is returned"""
+
+        async def coroutine():
+            return 42
+
+        assert event_loop.run_coroutine(coroutine()) == 42
+
+    def test_run_coroutine_starts_loop(self, event_loop: EventLoop):
+        """Test the loop thread is started on first use"""
+
+        async def coroutine():
+            return event_loop.is_loop_thread()
+
+        assert not event_loop.started
+        assert event_loop.run_coroutine(coroutine())
+        assert event_loop.started
+
+    def test_run_coroutine_exception(self, event_loop: EventLoop):
+        """Test the exception of the coroutine is raised to the caller"""
+
+        async def coroutine():
+            raise ValueError("Error message")
+
+        with pytest.raises(ValueError) as error:
+            event_loop.run_coroutine(coroutine())
+
+        assert "Error message" in str(error.value)
+
+    def test_run_coroutine_timeout(self, event_loop: EventLoop):
+        """Test waiting for a coroutine can time out"""
+
+        async def coroutine():
+            await asyncio.sleep(10)
+
+        with pytest.raises(TimeoutError):
+            event_loop.run_coroutine(coroutine(), timeout=0.05)
+
+    def test_run_coroutine_from_loop_thread(self, event_loop: EventLoop):
+        """Test the loop thread cannot wait for itself"""
+
+        async def inner():
+            return None
+
+        async def coroutine():
+            event_loop.run_coroutine(inner())
+
+        with pytest.raises(RuntimeError):
+            event_loop.run_coroutine(coroutine())
+
+    def test_stop_not_started(self):
+        """Test a loop never started can be stopped"""
+        event_loop = EventLoop()
+
+        event_loop.stop()
+
+        assert not event_loop.started
@@ -0,0 +1,67 @@
+import socket
+import threading
+from unittest.mock import MagicMock
+import pytest
+
+from src.presentation.network.idle_connection_selector import IdleConnectionSelector
+
+
+class TestIdleConnectionSelector:
+    """Test IdleConnectionSelector on socket pairs"""
+
+    @pytest.fixture(scope="function", name="selector")
+    def create_selector(self):
+        """Create a started selector"""
+        selector = IdleConnectionSelector(MagicMock(), keep_alive_timeout=5)
+        selector.start()
+        yield selector
+        selector.stop()
+
+    def test_readable_connection_handed_back(self, selector: IdleConnectionSelector):
+        """Test a parked connection is handed back once the peer writes"""
+        handed_back = threading.Event()
+        selector.on_readable.side_effect = lambda *_: handed_back.set()
+        server_side, peer_side = socket.socketpair()
+
+        assert selector.park(server_side, ("127.0.0.1", 1024))
+        peer_side.send(b"message")
+
+        assert handed_back.wait(5)
+        selector.on_readable.assert_called_once_with(server_side, ("127.0.0.1", 1024))
+        assert server_side.fileno() != -1
+        server_side.close()
+        peer_side.close()
+
+    def test_idle_connection_closed(self):
+        """Test a connection idle for the keep-alive timeout is closed"""
+        selector = IdleConnectionSelector(MagicMock(), keep_alive_timeout=0.05)
+        selector.start()
+        server_side, peer_side = socket.socketpair()
+
+        selector.park(server_side, ("127.0.0.1", 1024))
+        peer_side.settimeout(5)
+
+        assert peer_side.recv(1) == b""
+        selector.stop()
+        selector.on_readable.assert_not_called()
+        peer_side.close()
+
+    def test_stop_closes_parked_connections(self, selector: IdleConnectionSelector):
+        """Test stopping the selector closes the parked connections"""
+        server_side, peer_side = socket.socketpair()
+        selector.park(server_side, ("127.0.0.1", 1024))
+
+        selector.stop()
+
+        assert server_side.fileno() == -1
+        peer_side.close()
+
+    def test_park_after_stop(self, selector: IdleConnectionSelector):
+        """Test a stopped selector does not take connections"""
+        server_side, peer_side = socket.socketpair()
+        selector.stop()
+
+        assert not selector.park(server_side, ("127.0.0.1", 1024))
+        assert server_side.fileno() != -1
+        server_side.close()
+        peer_side.close()
@@ -0,0 +1,126 @@
+import pytest
+
+from src.application.exceptions.message_error import MessageError
+from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_header import MessageHeader
+from src.presentation.network.message_frame import MessageFrame
+
+
+def _decode(frame: bytes) -> MessageDataclass | str:
+    """Decode a whole frame"""
+    prefix_size = MessageFrame.PREFIX.size
+    code, flags, community_id_length, payload_length = MessageFrame.decode_prefix(
+        frame[:prefix_size]
+    )
+    body = frame[prefix_size:]
+    assert len(body) == community_id_length + payload_length
+    return MessageFrame.decode_body(code, flags, community_id_length, body)
+
+
+class TestMessageFrame:
+    """Test MessageFrame class"""
+
+    def test_all_headers_have_a_code(self):
+        """Every message header can be sent on the wire"""
+        assert set(MessageFrame.HEADER_CODES) == set(MessageHeader)
+        assert len(MessageFrame.HEADERS) == len(MessageFrame.HEADER_CODES)
+
+    def test_round_trip_message(self):
+        """A message is decoded back to the same message"""
+        message = MessageDataclass(MessageHeader.CREATE_IDEA, "a|b,c", "community_id")
+
+        assert _decode(MessageFrame.encode(message)) == message
+
+    def test_round_trip_without_content(self):
+        """Content and community id keep being None"""
+        message = MessageDataclass(MessageHeader.PONG)
+
+        assert _decode(MessageFrame.encode(message)) == message
+
+    def test_round_trip_empty_content(self):
+        """Empty content is not confused with missing content"""
+        message = MessageDataclass(MessageHeader.DATA, "", "community_id")
+
+        assert _decode(MessageFrame.encode(message)) == message
+
+    def test_round_trip_binary_content(self):
+        """Bytes content is carried as is and decoded back to bytes"""
+        message = MessageDataclass(MessageHeader.DATABASE, b"\x00\xffdata", "id")
+
+        frame = MessageFrame.encode(message)
+
+        assert frame.endswith(b"\x00\xffdata")
+        assert _decode(frame) == message
+
+    def test_round_trip_empty_binary_content(self):
+        """Empty bytes content stays bytes"""
+        message = MessageDataclass(MessageHeader.DATA, b"", "id")
+
+        assert _decode(MessageFrame.encode(message)) == message
+
+    def test_round_trip_unicode(self):
+        """Non-ascii content is supported"""
+        message = MessageDataclass(MessageHeader.CREATE_OPINION, "idée à débattre", "é")
+
+        assert _decode(MessageFrame.encode(message)) == message
+
+    def test_round_trip_raw_string(self):
+        """Raw strings are carried as is"""
+        assert _decode(MessageFrame.encode("Hello")) == "Hello"
+
+    def test_prefix_lengths(self):
+        """The prefix announces the exact body lengths"""
+        frame = MessageFrame.encode(MessageDataclass(MessageHeader.DATA, "abc", "id"))
+
+        _, _, community_id_length, payload_length = MessageFrame.decode_prefix(
+            frame[: MessageFrame.PREFIX.size]
+        )
+
+        assert community_id_length == 2
+        assert payload_length == 3
+
+    def test_encode_invalid_header(self):
+        """An unknown header cannot be encoded"""
+        with pytest.raises(MessageError):
+            MessageFrame.encode(MessageDataclass("INVALID_HEADER", "content"))
+
+    def test_encode_too_long_community_id(self):
+        """A community id longer than its length field is rejected"""
+        community_id = "a" * (MessageFrame.MAX_COMMUNITY_ID_SIZE + 1)
+
+        with pytest.raises(MessageError, match="community id is too long"):
+            MessageFrame.encode(
+                MessageDataclass(MessageHeader.ACK, "content", community_id)
+            )
+
+    def test_encode_longest_community_id(self):
+        """The longest community id fitting its length field is encoded"""
+        community_id = "a" * MessageFrame.MAX_COMMUNITY_ID_SIZE
+
+        frame = MessageFrame.encode(
+            MessageDataclass(MessageHeader.ACK, "content", community_id)
+        )
+
+        _, _, community_id_length, _ = MessageFrame.decode_prefix(
+            frame[: MessageFrame.PREFIX.size]
+        )
+        assert community_id_length == MessageFrame.MAX_COMMUNITY_ID_SIZE
+
+    def test_decode_unknown_code(self):
+        """An unknown header code is rejected"""
+        prefix = MessageFrame.PREFIX.pack(250, 0, 0, 0)
+
+        with pytest.raises(MessageError):
+            MessageFrame.decode_prefix(prefix)
+
+    def test_decode_too_large_payload(self):
+        """A payload larger than the maximum size is rejected"""
+        prefix = MessageFrame.PREFIX.pack(1, 0, 0, MessageFrame.MAX_PAYLOAD_SIZE + 1)
+
+        with pytest.raises(MessageError):
+            MessageFrame.decode_prefix(prefix)
+
+    def test_decode_invalid_encoding(self):
+        """Invalid utf-8 content is rejected"""
+        with pytest.raises(MessageError):
+            MessageFrame.decode_body(1, MessageFrame.HAS_CONTENT, 0, b"\xff\xfe")
@@ -1,8 +1,13 @@
+import queue
+import threading
+import time
 from unittest import mock
 from unittest.mock import MagicMock
 import pytest
 from src.application.exceptions.socket_error import SocketError
+from src.application.exceptions.connection_closed_error import ConnectionClosedError
 from src.presentation.formatting.message_dataclass import MessageDataclass
+from src.presentation.formatting.message_formatter import MessageFormatter
 from src.presentation.formatting.message_header import MessageHeader
 
 from src.presentation.network.server import Server
@@ -119,8 +124,11 @@ class TestServer:
 
         server.server_socket.accept.assert_called()
 
+    @mock.patch("select.select", return_value=([], [], []))
     @mock.patch("src.presentation.network.client.Client", name="mock_client")
-    def test_server_running_receive_message(self, mock_client: Client, server: Server):
+    def test_server_running_receive_message(
+        self, mock_client: Client, _select: MagicMock, server: Server
+    ):
         """Test server running call accept"""
         mock_running = MagicMock()
         mock_running.side_effect = [True, False]
@@ -153,3 +161,259 @@ class TestServer:
         )
 
         server.message_handler.handle_message.assert_not_called()
+
+    @mock.patch("select.select", return_value=([], [], []))
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_connection_timeout(
+        self, mock_client: Client, _select: MagicMock, server: Server
+    ):
+        """Test accepted connections get the read timeout"""
+        mock_running = MagicMock()
+        mock_running.side_effect = [True, False]
+        server._is_running = mock_running  # pylint: disable=protected-access
+        accepted_socket = MagicMock()
+        server.server_socket.accept.return_value = (accepted_socket, None)
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.DATA, "test"),
+            None,
+        )
+
+        server.run()
+
+        accepted_socket.settimeout.assert_called_once_with(server.connection_timeout)
+
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_handler_error_does_not_stop(
+        self, mock_client: Client, server: Server
+    ):
+        """Test an error in the handler is counted and the connection closed"""
+        mock_running = MagicMock()
+        mock_running.side_effect = [True, False]
+        server._is_running = mock_running  # pylint: disable=protected-access
+        server.server_socket.accept.return_value = (MagicMock(), None)
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.DATA, "test"),
+            None,
+        )
+        server.message_handler.handle_message.side_effect = ValueError("error")
+
+        server.run()
+
+        mock_client.close_connection.assert_called_once()
+        assert server.get_metrics().failed == 1
+
+    @mock.patch("select.select", return_value=([], [], []))
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_pool_handles_connections(
+        self, mock_client: Client, _select: MagicMock, server: Server
+    ):
+        """Test the workers handle every accepted connection"""
+        server.max_workers = 4
+        connections_count = 10
+        mock_running = MagicMock()
+        mock_running.side_effect = [True] * connections_count + [False] * 100
+        server._is_running = mock_running  # pylint: disable=protected-access
+        server.server_socket.accept.return_value = (MagicMock(), None)
+        server.idle_connections = MagicMock()
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.DATA, "test"),
+            None,
+        )
+
+        server.run()
+
+        metrics = server.get_metrics()
+        assert metrics.accepted == connections_count
+        assert metrics.handled + metrics.rejected == connections_count
+        assert metrics.queue_depth == 0
+        assert not server.workers
+        assert server.idle_connections.park.call_count == metrics.handled
+        server.idle_connections.stop.assert_called_once()
+
+    @mock.patch("select.select", return_value=([], [], []))
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_pool_parks_idle_connection(
+        self, mock_client: Client, mock_select: MagicMock, server: Server
+    ):
+        """Test a worker parks an idle connection instead of waiting for it"""
+        server.max_workers = 1
+        server.idle_connections = MagicMock()
+        accepted_socket = MagicMock()
+        accepted_socket.fileno.return_value = 3
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.CREATE_IDEA, "content"),
+            None,
+        )
+
+        server._handle_connection(  # pylint: disable=protected-access
+            accepted_socket, ("127.0.0.1", 1024)
+        )
+
+        mock_select.assert_called_once_with([accepted_socket], [], [], 0)
+        server.idle_connections.park.assert_called_once_with(
+            accepted_socket, ("127.0.0.1", 1024)
+        )
+        mock_client.close_connection.assert_not_called()
+
+    @mock.patch("select.select", return_value=([], [], []))
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_pool_closes_connection_not_parked(
+        self, mock_client: Client, _select: MagicMock, server: Server
+    ):
+        """Test an idle connection is closed once the server is stopping"""
+        server.max_workers = 1
+        server.idle_connections = MagicMock()
+        server.idle_connections.park.return_value = False
+        accepted_socket = MagicMock()
+        accepted_socket.fileno.return_value = 3
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.CREATE_IDEA, "content"),
+            None,
+        )
+
+        server._handle_connection(  # pylint: disable=protected-access
+            accepted_socket, ("127.0.0.1", 1024)
+        )
+
+        mock_client.close_connection.assert_called_once()
+
+    def test_server_pool_idle_connections_do_not_hold_workers(self):
+        """Test warm connections left idle do not delay the other peers"""
+        handled = threading.Event()
+        message_handler = MagicMock()
+        message_handler.handle_message.side_effect = lambda *_: handled.set()
+        server = Server(0, message_handler, MessageFormatter(), max_workers=2)
+        server_thread = threading.Thread(target=server.run)
+        server_thread.start()
+        while not server.running:
+            time.sleep(0.01)
+        port = server.server_socket.getsockname()[1]
+
+        clients = []
+        for _ in range(3):
+            peer = Client(MessageFormatter(), timeout=5)
+            peer.connect_to_server("127.0.0.1", port)
+            clients.append(peer)
+        for peer in clients[:2]:
+            peer.send_message(MessageDataclass(MessageHeader.CREATE_IDEA, "warm"))
+        while server.get_metrics().handled < 2:
+            time.sleep(0.01)
+        handled.clear()
+
+        clients[2].send_message(MessageDataclass(MessageHeader.CREATE_IDEA, "cold"))
+
+        assert handled.wait(server.keep_alive_timeout / 2)
+        clients[0].send_message(MessageDataclass(MessageHeader.CREATE_IDEA, "again"))
+        while server.get_metrics().handled < 4:
+            time.sleep(0.01)
+        for peer in clients:
+            peer.close_connection()
+        server.stop()
+        server_thread.join()
+
+    def test_server_pool_rejects_when_full(self, server: Server):
+        """Test connections are rejected when the pending queue is full"""
+        server.max_workers = 1
+        server.pending_connections = queue.Queue(1)
+        server.pending_connections.put((MagicMock(), None))
+        rejected_socket = MagicMock()
+
+        server._dispatch_connection(  # pylint: disable=protected-access
+            rejected_socket, ("127.0.0.1", 1024)
+        )
+
+        rejected_socket.close.assert_called_once()
+        assert server.get_metrics().rejected == 1
+        assert server.get_metrics().queue_depth == 1
+
+    def test_server_pool_queue_depth(self, server: Server):
+        """Test the maximum queue depth is recorded"""
+        server.max_workers = 1
+
+        for _ in range(3):
+            server._dispatch_connection(  # pylint: disable=protected-access
+                MagicMock(), ("127.0.0.1", 1024)
+            )
+
+        assert server.get_metrics().max_queue_depth == 3
+
+    @mock.patch("select.select")
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_keeps_reading_connection(
+        self, mock_client: Client, mock_select: MagicMock, server: Server
+    ):
+        """Test several messages are handled on the same connection"""
+        mock_running = MagicMock()
+        mock_running.side_effect = [True, False]
+        server._is_running = mock_running  # pylint: disable=protected-access
+        accepted_socket = MagicMock()
+        accepted_socket.fileno.return_value = 3
+        server.server_socket.accept.return_value = (accepted_socket, None)
+        mock_select.return_value = ([accepted_socket], [], [])
+        mock_client.return_value = mock_client
+        mock_client.receive_message.side_effect = [
+            (MessageDataclass(MessageHeader.CREATE_IDEA, "first"), None),
+            (MessageDataclass(MessageHeader.CREATE_IDEA, "second"), None),
+            ConnectionClosedError("Connection closed by peer"),
+        ]
+
+        server.run()
+
+        assert server.message_handler.handle_message.call_count == 2
+        mock_client.close_connection.assert_called_once()
+        assert server.get_metrics().failed == 0
+
+    @mock.patch("select.select")
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_stops_reading_idle_connection(
+        self, mock_client: Client, mock_select: MagicMock, server: Server
+    ):
+        """Test an idle connection is closed after the keep-alive timeout"""
+        mock_running = MagicMock()
+        mock_running.side_effect = [True, False]
+        server._is_running = mock_running  # pylint: disable=protected-access
+        accepted_socket = MagicMock()
+        accepted_socket.fileno.return_value = 3
+        server.server_socket.accept.return_value = (accepted_socket, None)
+        mock_select.return_value = ([], [], [])
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.CREATE_IDEA, "content"),
+            None,
+        )
+
+        server.run()
+
+        mock_select.assert_called_once_with(
+            [accepted_socket], [], [], server.keep_alive_timeout
+        )
+        assert server.message_handler.handle_message.call_count == 1
+        mock_client.close_connection.assert_called_once()
+
+    @mock.patch("select.select")
+    @mock.patch("src.presentation.network.client.Client", name="mock_client")
+    def test_server_stops_reading_closed_connection(
+        self, mock_client: Client, mock_select: MagicMock, server: Server
+    ):
+        """Test the connection is not read after the handler closed it"""
+        mock_running = MagicMock()
+        mock_running.side_effect = [True, False]
+        server._is_running = mock_running  # pylint: disable=protected-access
+        accepted_socket = MagicMock()
+        accepted_socket.fileno.return_value = -1
+        server.server_socket.accept.return_value = (accepted_socket, None)
+        mock_client.return_value = mock_client
+        mock_client.receive_message.return_value = (
+            MessageDataclass(MessageHeader.INVITATION),
+            None,
+        )
+
+        server.run()
+
+        mock_select.assert_not_called()
+        assert server.message_handler.handle_message.call_count == 1